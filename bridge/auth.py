@@ -1,29 +1,73 @@
 """토큰 기반 인증 모듈"""
 
+import hashlib
+import hmac
 import json
+import logging
 import os
 from pathlib import Path
 
+from bridge.tokens import TokenEntry, TokenRegistry, hash_token
+
+logger = logging.getLogger(__name__)
+
 
 class Authenticator:
     """토큰 기반 인증
 
     환경변수(OKXUS_AUTH_TOKEN) 우선, 설정 파일(bridge/config.json) 폴백으로 토큰 로드.
+    토큰 레지스트리(bridge/tokens.json)가 있으면 여기에 등록된 토큰도 인증한다.
     """
 
-    def __init__(self, token: str | None = None):
+    PRIMARY_LABEL = "default"
+
+    def __init__(
+        self,
+        token: str | None = None,
+        config: dict | None = None,
+        registry: TokenRegistry | None = None,
+    ):
         """토큰을 직접 전달하거나, 환경변수 또는 설정 파일에서 로드한다.
 
         Args:
             token: 직접 전달할 인증 토큰. None이면 환경변수/설정 파일에서 로드.
+            config: 이미 파싱된 설정. 주어지면 config.json을 다시 읽지 않는다.
+            registry: 다중 토큰 레지스트리. 토큰이 등록되어 있으면
+                단일 토큰 없이도 동작한다.
+
+        Raises:
+            ValueError: 단일 토큰도, 레지스트리 토큰도 없는 경우.
         """
+        self._registry = registry
         if token is not None:
             self._token = token
         else:
-            self._token = self._load_token()
+            try:
+                self._token = self._load_token(config)
+            except ValueError:
+                if registry is None or len(registry) == 0:
+                    raise
+                self._token = ""
+        self._primary: TokenEntry | None = None
+        self._primary_hash = ""
+        if self._token:
+            self._primary_hash = hash_token(self._token)
+            self._primary = TokenEntry.from_hash(self._primary_hash, label=self.PRIMARY_LABEL)
+        # 재개 티켓 등 파생 키의 원천 — 단일 토큰이 없으면 레지스트리 옆 키 파일
+        self._secret = self._token.encode("utf-8") if self._token else self._registry_secret()
 
-    def _load_token(self) -> str:
-        """환경변수 → 설정 파일 순서로 토큰을 로드한다.
+    def _registry_secret(self) -> bytes:
+        """레지스트리의 공유 키. 읽거나 만들 수 없으면 프로세스 수명 동안만 유효한 키."""
+        if self._registry is None:
+            return os.urandom(32)
+        try:
+            return self._registry.ticket_secret()
+        except OSError as e:
+            logger.warning("재개 티켓 키 파일 사용 불가 — 이 프로세스에서만 유효한 키 사용: %s", e)
+            return os.urandom(32)
+
+    def _load_token(self, config: dict | None = None) -> str:
+        """환경변수 → 설정(파싱된 config 또는 설정 파일) 순서로 토큰을 로드한다.
 
         Returns:
             로드된 토큰 문자열.
@@ -36,14 +80,15 @@ class Authenticator:
         if env_token:
             return env_token
 
-        # 2) 설정 파일에서 로드
-        config_path = Path(__file__).parent / "config.json"
-        if config_path.exists():
-            with open(config_path, "r", encoding="utf-8") as f:
-                config = json.load(f)
-            file_token = config.get("auth_token")
-            if file_token:
-                return file_token
+        # 2) 설정에서 로드 (파싱된 config가 없으면 설정 파일)
+        if config is None:
+            config_path = Path(__file__).parent / "config.json"
+            if config_path.exists():
+                with open(config_path, "r", encoding="utf-8") as f:
+                    config = json.load(f)
+        file_token = (config or {}).get("auth_token")
+        if file_token:
+            return file_token
 
         raise ValueError(
             "인증 토큰을 찾을 수 없습니다. "
@@ -59,4 +104,46 @@ class Authenticator:
         Returns:
             토큰이 유효하면 True, 아니면 False.
         """
-        return client_token == self._token
+        return self.identify(client_token) is not None
+
+    def identify(self, client_token: str) -> TokenEntry | None:
+        """토큰에 해당하는 항목(label, namespace, 쿼터)을 찾는다.
+
+        단일 토큰은 해시를 상수 시간으로 비교하고, 레지스트리는 해시로 O(1) 조회한다.
+
+        Returns:
+            유효한 토큰이면 TokenEntry, 아니면 None.
+        """
+        if not client_token:
+            return None
+        client_hash = hash_token(client_token)
+        if self._primary is not None and hmac.compare_digest(client_hash, self._primary_hash):
+            return self._primary
+        if self._registry is not None:
+            return self._registry.lookup_hash(client_hash)
+        return None
+
+    def entry(self, token_id: str) -> TokenEntry | None:
+        """token_id의 현재 항목 (삭제된 토큰이면 None)."""
+        if self._primary is not None and token_id == self._primary.token_id:
+            return self._primary
+        if self._registry is not None:
+            return self._registry.get(token_id)
+        return None
+
+    def reload(self) -> set[str] | None:
+        """토큰 레지스트리 파일이 바뀌었으면 다시 읽는다.
+
+        Returns:
+            바뀌지 않았으면 None, 다시 읽었으면 삭제된 token_id 집합.
+        """
+        if self._registry is None:
+            return None
+        return self._registry.reload_if_changed()
+
+    def derive_key(self, purpose: str) -> bytes:
+        """토큰에서 용도별 비밀 키를 파생한다 (재개 티켓 서명 등).
+
+        토큰이 바뀌면 파생 키도 바뀌므로 이전 키로 서명한 값은 모두 무효가 된다.
+        """
+        return hmac.new(self._secret, purpose.encode("utf-8"), hashlib.sha256).digest()
@@ -1,20 +1,27 @@
 """pyautogui를 사용한 Kiro IDE 자동화 모듈
 
 Kiro IDE 창 활성화, 클립보드를 통한 메시지 전송, 프로세스 실행 상태 확인을 담당한다.
+
+전송은 고정 sleep 대신 입력 파이프라인(bridge.input_pipeline)으로 실행한다.
+Kiro 창이 이미 포커스되어 있으면 활성화를 건너뛰고, 활성화했으면 창이 실제로
+활성 상태가 될 때까지만 짧게 확인한다. 단계 사이 대기는 전송 결과
+(record_outcome)로 학습하며, 단계별 소요 시간은 stats()로 볼 수 있다.
+
+동기 메서드는 블로킹이므로, asyncio 코드에서는
+UI 액터 스레드에서 실행하는 send_message_async를 사용한다.
+pyautogui/pyperclip은 처음 사용할 때 로드된다 (bridge.gui).
 """
 
 import logging
 import subprocess
-import time
 
-import pyautogui
-import pyperclip
+from bridge.input_pipeline import AdaptiveDelay, GuiBackend, PyAutoGuiBackend, StepTimings
+from bridge.ui_actor import UIActor, get_actor
 
 logger = logging.getLogger(__name__)
 
-# pyautogui 안전 설정
-pyautogui.FAILSAFE = True
-pyautogui.PAUSE = 0.3
+ACTIVATION_TIMEOUT = 1.0  # 활성화 후 창이 활성 상태가 되기를 기다리는 최대 시간 (초)
+READY_POLL = 0.02  # 활성 상태 확인 간격 (초)
 
 
 class KiroAutomation:
@@ -27,29 +34,46 @@ class KiroAutomation:
     KIRO_WINDOW_TITLE = "Kiro"
     KIRO_PROCESS_NAME = "Kiro"
 
+    def __init__(self, actor: UIActor | None = None, backend: GuiBackend | None = None) -> None:
+        """
+        Args:
+            actor: 비동기 호출에 사용할 UI 액터. None이면 프로세스 공용 액터 사용.
+            backend: GUI 조작 백엔드. None이면 pyautogui/pyperclip.
+        """
+        self._actor = actor
+        self._backend = backend or PyAutoGuiBackend()
+        self._delays = {
+            # 활성 상태 확인 후 입력란이 키 입력을 받기까지의 여유 (기존 고정 0.5초)
+            "activate": AdaptiveDelay(initial=0.1, floor=0.0, ceiling=0.5),
+            # 붙여넣기가 입력란에 반영되기까지의 대기 (기존 고정 0.3초)
+            "paste": AdaptiveDelay(initial=0.3, floor=0.02, ceiling=1.0),
+        }
+        self._timings = StepTimings()
+        self._activated = False  # 마지막 전송에서 활성화를 했는지 (학습 대상 판단)
+
     def activate_kiro_window(self) -> bool:
         """Kiro IDE 창을 찾아 활성화한다.
 
-        pyautogui.getWindowsWithTitle()로 Kiro 창을 검색하고,
-        찾은 창을 포커스 및 활성화한다.
+        Kiro 창을 검색하여 복원·활성화한 뒤, 창이 활성 상태가 될 때까지
+        READY_POLL 간격으로 확인한다 (최대 ACTIVATION_TIMEOUT).
 
         Returns:
             활성화 성공 시 True, 실패 시 False.
         """
         try:
-            windows = pyautogui.getWindowsWithTitle(self.KIRO_WINDOW_TITLE)
-            if not windows:
+            kiro_window = self._backend.find_window(self.KIRO_WINDOW_TITLE)
+            if kiro_window is None:
                 logger.warning("Kiro IDE 창을 찾을 수 없습니다.")
                 return False
 
-            kiro_window = windows[0]
-
             # 최소화 상태이면 복원
             if kiro_window.isMinimized:
                 kiro_window.restore()
 
             kiro_window.activate()
-            time.sleep(0.5)
+            if not self._wait_until_active(kiro_window):
+                logger.warning("Kiro IDE 창 활성 상태 확인 시간 초과 — 계속 진행")
+            self._backend.sleep(self._delays["activate"].value)
 
             logger.info("Kiro IDE 창 활성화 완료")
             return True
@@ -60,9 +84,9 @@ class KiroAutomation:
     def send_message(self, message: str) -> bool:
         """클립보드에 메시지를 복사한 후 Kiro IDE 채팅창에 붙여넣기 및 Enter 입력.
 
-        1. Kiro IDE 창이 활성화되지 않은 상태이면 활성화한다 (Req 2.5).
-        2. pyperclip으로 클립보드에 메시지를 복사한다 (Req 2.2).
-        3. Ctrl+V로 붙여넣기 후 Enter 키를 입력한다 (Req 2.3).
+        1. Kiro IDE 창이 포커스되어 있지 않으면 활성화한다 (Req 2.5).
+        2. 클립보드에 메시지를 복사한다 (Req 2.2).
+        3. Ctrl+V로 붙여넣기 후 학습된 대기 시간만큼 기다려 Enter 키를 입력한다 (Req 2.3).
 
         Args:
             message: Kiro IDE에 전송할 메시지 텍스트.
@@ -70,26 +94,86 @@ class KiroAutomation:
         Returns:
             전송 성공 시 True, 실패 시 False.
         """
+        backend, timings = self._backend, self._timings
+        started = backend.now()
         try:
             # Kiro 창 활성화 (Req 2.5)
-            if not self.activate_kiro_window():
+            with timings.step("focus", backend):
+                focused = self._ensure_focus()
+            if not focused:
                 logger.error("Kiro IDE 창 활성화 실패로 메시지 전송 불가")
                 return False
 
             # 클립보드에 메시지 복사 (Req 2.2)
-            pyperclip.copy(message)
+            with timings.step("copy", backend):
+                backend.copy(message)
 
             # Ctrl+V 붙여넣기 후 Enter (Req 2.3)
-            pyautogui.hotkey("ctrl", "v")
-            time.sleep(0.3)
-            pyautogui.press("enter")
-
+            with timings.step("paste", backend):
+                backend.hotkey("ctrl", "v")
+            with timings.step("settle", backend):
+                backend.sleep(self._delays["paste"].value)
+            with timings.step("enter", backend):
+                backend.press("enter")
+
+            timings.add("total", backend.now() - started)
             logger.info("메시지 전송 완료: %s", message[:50])
             return True
         except Exception as e:
             logger.error("메시지 전송 실패: %s", e)
             return False
 
+    def record_outcome(self, ok: bool) -> None:
+        """마지막 전송이 실제로 Kiro 입력란에 들어갔는지 알려 대기 시간을 학습한다.
+
+        Args:
+            ok: 전송한 프롬프트가 채팅에 나타났으면 True.
+        """
+        self._delays["paste"].record(ok)
+        if self._activated:
+            self._delays["activate"].record(ok)
+        if not ok:
+            logger.warning(
+                "전송 확인 실패 — 입력 대기 시간 증가 (paste %.0f ms)", self._delays["paste"].value * 1000
+            )
+
+    def stats(self) -> dict:
+        """단계별 소요 시간과 학습된 대기 시간."""
+        return {
+            "steps": self._timings.summary(),
+            "delays": {name: delay.summary() for name, delay in self._delays.items()},
+        }
+
+    def _ensure_focus(self) -> bool:
+        """이미 Kiro 창이 포커스되어 있으면 활성화를 건너뛴다."""
+        try:
+            focused = self.KIRO_WINDOW_TITLE in self._backend.active_title()
+        except Exception as e:
+            logger.debug("활성 창 확인 실패: %s", e)
+            focused = False
+        self._activated = not focused
+        return focused or self.activate_kiro_window()
+
+    def _wait_until_active(self, window) -> bool:
+        deadline = self._backend.now() + ACTIVATION_TIMEOUT
+        while not window.isActive:
+            if self._backend.now() >= deadline:
+                return False
+            self._backend.sleep(READY_POLL)
+        return True
+
+    async def send_message_async(self, message: str) -> bool:
+        """send_message를 UI 액터 스레드에서 실행한다 (이벤트 루프 비차단).
+
+        Args:
+            message: Kiro IDE에 전송할 메시지 텍스트.
+
+        Returns:
+            전송 성공 시 True, 실패 시 False.
+        """
+        actor = self._actor or get_actor()
+        return await actor.call(self.send_message, message)
+
     def is_kiro_running(self) -> bool:
         """Kiro IDE 프로세스가 실행 중인지 확인한다.
 
@@ -0,0 +1,437 @@
+"""핫 패스 마이크로벤치마크
+
+기능 테스트(test_*.py)로는 잡히지 않는 성능 회귀를 릴리스 전에 확인한다.
+네트워크·디스플레이 없이 실행되며, 결과는 버전별 JSON 기준값
+(bridge/bench_baselines/<label>.json)으로 저장하고 compare로 비교한다.
+
+사용법:
+    python -m bridge.bench run                      # 결과 출력
+    python -m bridge.bench run --save 1.1.0         # 기준값 저장
+    python -m bridge.bench compare                  # 가장 최근 기준값과 비교
+    python -m bridge.bench compare --baseline 1.0.0 --threshold 0.15 -k server
+
+측정 방식:
+- 각 벤치마크는 한 라운드가 ROUND_TARGET 초 정도 되도록 반복 횟수를 먼저 맞추고,
+  ROUNDS번 측정하여 연산당 최소 시간(ns)을 대표값으로 쓴다 (중앙값도 기록).
+  최솟값은 다른 프로세스·GC 간섭의 영향을 가장 적게 받는다.
+- 측정 중에는 GC와 로깅을 끈다.
+- compare는 (현재 − 기준) / 기준이 threshold를 넘으면 실패(종료 코드 1)한다.
+  NOISE_FLOOR_NS보다 작은 차이는 무시한다.
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable
+
+BASELINE_DIR = Path(__file__).parent / "bench_baselines"
+SCHEMA = 1
+ROUNDS = 9
+ROUND_TARGET = 0.02  # 라운드당 목표 시간 (초)
+DEFAULT_THRESHOLD = 0.25  # 허용 회귀 비율
+NOISE_FLOOR_NS = 50.0  # 이보다 작은 절대 차이는 회귀로 보지 않음
+
+# setup() -> (run(n): 연산을 n번 실행, teardown 또는 None)
+Setup = Callable[[], tuple[Callable[[int], None], Callable[[], None] | None]]
+BENCHMARKS: dict[str, Setup] = {}
+
+
+def benchmark(name: str) -> Callable[[Setup], Setup]:
+    """벤치마크 setup 함수를 등록한다."""
+
+    def register(setup: Setup) -> Setup:
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+@dataclass
+class BenchResult:
+    """벤치마크 하나의 측정 결과"""
+    name: str
+    ns_per_op: float  # 라운드 중 최소
+    median_ns: float
+    iterations: int  # 라운드당 반복 횟수
+    rounds: int
+
+
+# ----------------------------------------------------------------------
+# 벤치마크
+# ----------------------------------------------------------------------
+
+
+class _NullSocket:
+    """보내는 프레임을 버리는 WebSocket 대역"""
+
+    async def send(self, data: str) -> None:
+        pass
+
+
+class _InlineActor:
+    """UI 액터 대신 현재 스레드에서 바로 실행"""
+
+    async def call(self, fn, *args, **kwargs):
+        return fn(*args, **kwargs)
+
+
+def _bench_server() -> tuple[object, Callable[[], None]]:
+    """임시 inbox/outbox를 쓰는 BridgeServer와 정리 함수.
+
+    BridgeServer는 생성 시 file_io 기본 디렉토리를 만들므로, 실제 bridge/inbox와
+    bridge/outbox 대신 임시 디렉토리를 가리키게 한 뒤 생성한다.
+    """
+    from bridge import file_io
+    from bridge.auth import Authenticator
+    from bridge.kiro_pool import KiroPool, KiroWorker
+    from bridge.server import BridgeServer
+
+    tmp = tempfile.TemporaryDirectory()
+    saved = file_io.INBOX_DIR, file_io.OUTBOX_DIR
+    file_io.INBOX_DIR, file_io.OUTBOX_DIR = Path(tmp.name) / "inbox", Path(tmp.name) / "outbox"
+    server = BridgeServer(
+        authenticator=Authenticator(token="bench-token"),
+        kiro_pool=KiroPool([KiroWorker("default", Path(tmp.name))]),
+    )
+
+    def cleanup() -> None:
+        file_io.INBOX_DIR, file_io.OUTBOX_DIR = saved
+        tmp.cleanup()
+
+    return server, cleanup
+
+
+def _server_bench(raw: str) -> tuple[Callable[[int], None], Callable[[], None]]:
+    server, cleanup = _bench_server()
+    ws = _NullSocket()
+    loop = asyncio.new_event_loop()
+
+    async def batch(n: int) -> None:
+        for _ in range(n):
+            await server._route_message(ws, raw)
+
+    def teardown() -> None:
+        loop.close()
+        cleanup()
+
+    return (lambda n: loop.run_until_complete(batch(n))), teardown
+
+
+@benchmark("server.route_heartbeat")
+def _route_heartbeat():
+    return _server_bench(json.dumps({"type": "heartbeat", "payload": {}, "timestamp": 0}))
+
+
+@benchmark("server.route_status")
+def _route_status():
+    return _server_bench(json.dumps({"type": "status_request", "payload": {}, "timestamp": 0}))
+
+
+@benchmark("server.send_response_4k")
+def _send_response():
+    from bridge.models import ResponseType
+
+    server, cleanup = _bench_server()
+    ws = _NullSocket()
+    payload = {"message_id": uuid.uuid4().hex, "content": "응답 본문 line\n" * 256, "credits": 1}
+    loop = asyncio.new_event_loop()
+
+    async def batch(n: int) -> None:
+        for _ in range(n):
+            await server._send(ws, ResponseType.KIRO_RESPONSE, payload)
+
+    def teardown() -> None:
+        loop.close()
+        cleanup()
+
+    return (lambda n: loop.run_until_complete(batch(n))), teardown
+
+
+@benchmark("file_io.write_read_roundtrip")
+def _file_roundtrip():
+    from bridge import file_io
+
+    tmp = tempfile.TemporaryDirectory()
+    inbox, outbox = Path(tmp.name) / "inbox", Path(tmp.name) / "outbox"
+    file_io.ensure_dirs("", inbox, outbox)
+    reply = json.dumps({"content": "ok " * 200}, ensure_ascii=False)
+
+    def run(n: int) -> None:
+        for i in range(n):
+            message_id = f"bench-{i}"
+            file_io.write_message(message_id, "프롬프트 " * 50, inbox_dir=inbox, outbox_dir=outbox)
+            (outbox / f"{message_id}.json").write_text(reply, encoding="utf-8")
+            file_io.read_response(message_id, outbox_dir=outbox)
+            file_io.cleanup_inbox(message_id, inbox_dir=inbox)
+
+    return run, tmp.cleanup
+
+
+@benchmark("auth.validate")
+def _auth_validate():
+    from bridge.auth import Authenticator
+
+    auth = Authenticator(token="bench-token-" + "x" * 32)
+    tokens = ["bench-token-" + "x" * 32, "wrong-token"]
+
+    def run(n: int) -> None:
+        validate = auth.validate
+        for i in range(n):
+            validate(tokens[i & 1])
+
+    return run, None
+
+
+def _conversation(size: int = 1 << 20) -> str:
+    text = "".join(f"user: 질문 {i}\nkiro: 답변 {i} " + "내용 " * 40 + "\n" for i in range(size // 100))
+    return text[:size]
+
+
+@benchmark("monitor.extract_reply_1mb")
+def _extract_reply():
+    from bridge.monitor import extract_new_reply
+
+    # 긴 대화(1MB) 끝에 새 응답 — 앵커가 예상 위치에 있는 일반적인 경우
+    baseline = _conversation()
+    current = baseline + "user: 새 질문\nkiro: " + "새 응답 " * 500
+
+    def run(n: int) -> None:
+        for _ in range(n):
+            extract_new_reply(baseline, current, "새 질문")
+
+    return run, None
+
+
+@benchmark("monitor.extract_reply_shifted_1mb")
+def _extract_reply_shifted():
+    from bridge.monitor import extract_new_reply
+
+    # 앞부분이 잘려(스크롤/가상화) 앵커를 전체에서 다시 찾는 경우
+    baseline = _conversation()
+    current = baseline[64 * 1024:] + "user: 새 질문\nkiro: " + "새 응답 " * 500
+
+    def run(n: int) -> None:
+        for _ in range(n):
+            extract_new_reply(baseline, current, "새 질문")
+
+    return run, None
+
+
+@benchmark("monitor.poll_stable_1mb")
+def _poll_stable():
+    from bridge.clock import VirtualClock
+    from bridge.monitor import ResponseMonitor
+
+    # baseline 없이 이미 끝난 1MB 대화를 폴링 — 안정 판정까지 매 폴링의 직전 스냅샷 비교.
+    # 클립보드에서 읽을 때처럼 내용은 같고 객체는 다른 문자열을 번갈아 돌려준다
+    first = _conversation()
+    snapshots = (first, "".join([first[:1], first[1:]]))
+    clock = VirtualClock()
+    monitor = ResponseMonitor(actor=_InlineActor(), clock=clock)
+    polls = iter(range(1 << 62))
+    monitor._read_chat_text = lambda: snapshots[next(polls) & 1]
+    loop = asyncio.new_event_loop()
+
+    async def batch(n: int) -> None:
+        for _ in range(n):
+            await clock.run(monitor.wait_for_response(timeout=60))
+
+    return (lambda n: loop.run_until_complete(batch(n))), loop.close
+
+
+@benchmark("automation.send_message_fake")
+def _send_message():
+    from bridge.automation import KiroAutomation
+    from bridge.input_pipeline import FakeBackend
+
+    backend = FakeBackend()
+    backend.focused = "Kiro"
+    automation = KiroAutomation(backend=backend)
+
+    def run(n: int) -> None:
+        for _ in range(n):
+            automation.send_message("hello kiro")
+        backend.sent.clear()
+
+    return run, None
+
+
+# ----------------------------------------------------------------------
+# 측정 / 저장 / 비교
+# ----------------------------------------------------------------------
+
+
+def measure(name: str, rounds: int = ROUNDS, round_target: float = ROUND_TARGET) -> BenchResult:
+    """벤치마크 하나를 측정한다."""
+    run, teardown = BENCHMARKS[name]()
+    try:
+        # 반복 횟수 보정: 한 라운드가 round_target 이상이 되도록 두 배씩 늘린다
+        iterations = 1
+        while True:
+            started = time.perf_counter()
+            run(iterations)
+            elapsed = time.perf_counter() - started
+            if elapsed >= round_target or iterations >= 1 << 20:
+                break
+            iterations *= 2
+
+        samples = []
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for _ in range(rounds):
+                started = time.perf_counter()
+                run(iterations)
+                samples.append((time.perf_counter() - started) * 1e9 / iterations)
+        finally:
+            if gc_enabled:
+                gc.enable()
+    finally:
+        if teardown is not None:
+            teardown()
+    return BenchResult(name, round(min(samples), 1), round(statistics.median(samples), 1), iterations, rounds)
+
+
+def run_all(
+    pattern: str = "", rounds: int = ROUNDS, round_target: float = ROUND_TARGET
+) -> list[BenchResult]:
+    """이름에 pattern이 들어간 벤치마크를 모두 측정한다."""
+    logging.disable(logging.CRITICAL)
+    try:
+        return [
+            measure(name, rounds, round_target) for name in sorted(BENCHMARKS) if pattern in name
+        ]
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+def save_baseline(results: list[BenchResult], label: str, directory: Path = BASELINE_DIR) -> Path:
+    """결과를 <label>.json 기준값으로 저장한다."""
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{label}.json"
+    data = {
+        "schema": SCHEMA,
+        "label": label,
+        "created": time.time(),
+        "python": platform.python_version(),
+        "machine": f"{platform.system()}-{platform.machine()}",
+        "results": {r.name: asdict(r) for r in results},
+    }
+    path.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    return path
+
+
+def load_baseline(label: str | None = None, directory: Path = BASELINE_DIR) -> dict:
+    """기준값을 읽는다. label이 없으면 가장 최근(created) 기준값.
+
+    Raises:
+        FileNotFoundError: 기준값이 없는 경우.
+        ValueError: 지원하지 않는 schema.
+    """
+    if label is not None:
+        path = Path(label) if label.endswith(".json") else directory / f"{label}.json"
+        data = json.loads(path.read_text(encoding="utf-8"))
+    else:
+        candidates = [json.loads(p.read_text(encoding="utf-8")) for p in directory.glob("*.json")]
+        if not candidates:
+            raise FileNotFoundError(f"기준값이 없습니다: {directory}")
+        data = max(candidates, key=lambda d: d.get("created", 0))
+    if data.get("schema") != SCHEMA:
+        raise ValueError(f"지원하지 않는 기준값 schema: {data.get('schema')}")
+    return data
+
+
+def compare(
+    results: list[BenchResult], baseline: dict, threshold: float = DEFAULT_THRESHOLD
+) -> tuple[list[dict], bool]:
+    """현재 결과를 기준값과 비교한다.
+
+    Returns:
+        ([{"name", "baseline_ns", "current_ns", "change", "status"}], 회귀 여부)
+        status는 "ok" | "regressed" | "improved" | "new".
+    """
+    rows, regressed = [], False
+    reference = baseline.get("results", {})
+    for result in results:
+        base = reference.get(result.name)
+        if base is None:
+            rows.append({"name": result.name, "baseline_ns": None, "current_ns": result.ns_per_op,
+                         "change": None, "status": "new"})
+            continue
+        base_ns = base["ns_per_op"]
+        change = (result.ns_per_op - base_ns) / base_ns if base_ns else 0.0
+        status = "ok"
+        if abs(result.ns_per_op - base_ns) >= NOISE_FLOOR_NS:
+            if change > threshold:
+                status, regressed = "regressed", True
+            elif change < -threshold:
+                status = "improved"
+        rows.append({"name": result.name, "baseline_ns": base_ns, "current_ns": result.ns_per_op,
+                     "change": round(change, 3), "status": status})
+    return rows, regressed
+
+
+def _format_ns(ns: float | None) -> str:
+    if ns is None:
+        return "-"
+    if ns >= 1e6:
+        return f"{ns / 1e6:.2f} ms"
+    if ns >= 1e3:
+        return f"{ns / 1e3:.2f} µs"
+    return f"{ns:.0f} ns"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m bridge.bench", description="Bridge 마이크로벤치마크")
+    sub = parser.add_subparsers(dest="command", required=True)
+    run_parser = sub.add_parser("run", help="측정하고 결과 출력")
+    run_parser.add_argument("--save", metavar="LABEL", help="기준값으로 저장 (예: 1.1.0)")
+    compare_parser = sub.add_parser("compare", help="기준값과 비교 (회귀 시 종료 코드 1)")
+    compare_parser.add_argument("--baseline", metavar="LABEL", help="기준값 label 또는 .json 경로 (기본: 최신)")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="허용 회귀 비율")
+    for sub_parser in (run_parser, compare_parser):
+        sub_parser.add_argument("-k", dest="pattern", default="", help="이름에 포함된 벤치마크만")
+        sub_parser.add_argument("--rounds", type=int, default=ROUNDS)
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        try:
+            baseline = load_baseline(args.baseline)
+        except (OSError, ValueError) as e:
+            print(f"[Bench] 기준값 읽기 실패: {e}")
+            return 2
+
+    results = run_all(args.pattern, args.rounds)
+
+    if args.command == "run":
+        for r in results:
+            print(f"{r.name:36s} {_format_ns(r.ns_per_op):>12s}  (median {_format_ns(r.median_ns)}, n={r.iterations})")
+        if args.save:
+            print(f"[Bench] 기준값 저장: {save_baseline(results, args.save)}")
+        return 0
+
+    rows, regressed = compare(results, baseline, args.threshold)
+    print(f"[Bench] 기준값 {baseline['label']} ({baseline['machine']}, Python {baseline['python']})")
+    for row in rows:
+        change = f"{row['change']:+.1%}" if row["change"] is not None else ""
+        print(
+            f"{row['name']:36s} {_format_ns(row['baseline_ns']):>12s} → {_format_ns(row['current_ns']):>12s}"
+            f"  {change:>8s}  {row['status']}"
+        )
+    if regressed:
+        print(f"[Bench] 회귀 발견 (허용 {args.threshold:.0%})")
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+"""응답 본문 저장소 모듈 (지연 전송용)
+
+lazy_bodies 모드에서는 긴 Kiro 응답을 바로 보내지 않고, 짧은 미리보기와
+본문 해시/크기만 보낸다. 본문은 SHA-256 해시를 이름으로 하는 파일
+(bridge/bodies/ab/abcd...)에 한 번만 저장되며 — 같은 본문은 중복 저장되지 않는다 —
+앱이 fetch_body로 필요한 구간만 받아간다.
+
+본문을 저장할 때 소유자(token_id)마다 빈 표시 파일(<해시>.<소유자 키>)을 함께 두고,
+fetch_body는 요청한 토큰의 표시가 있을 때만 본문을 돌려준다 — 다른 토큰이 해시를
+알아내도 읽을 수 없다. 표시 파일도 본문과 같은 보관 기간으로 정리된다.
+
+구간(offset/length)은 UTF-8 바이트 기준이다. 글자 중간에서 잘리지 않도록
+시작/끝을 글자 경계로 맞추며, 응답의 end를 다음 요청의 offset으로 쓰면 된다.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+BODY_DIR = Path(__file__).parent / "bodies"
+PREVIEW_CHARS = 280  # 미리보기 글자 수
+MIN_LAZY_BYTES = 1024  # 이보다 짧은 응답은 미리보기 없이 그대로 보낸다
+MAX_CHUNK = 64 * 1024  # fetch_body 한 번에 보내는 최대 바이트
+BODY_TTL = 7 * 24 * 3600  # 마지막 저장 이후 보관 기간 (초)
+
+_DIGEST_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+def _is_continuation(byte: int) -> bool:
+    return byte & 0xC0 == 0x80
+
+
+class BodyStore:
+    """해시 주소 기반 응답 본문 저장소"""
+
+    def __init__(
+        self,
+        root: Path = BODY_DIR,
+        preview_chars: int = PREVIEW_CHARS,
+        min_bytes: int = MIN_LAZY_BYTES,
+    ) -> None:
+        """
+        Args:
+            root: 본문 파일 디렉토리.
+            preview_chars: 미리보기 글자 수.
+            min_bytes: 지연 전송할 최소 본문 크기 (바이트).
+        """
+        self._root = root
+        self._preview_chars = preview_chars
+        self._min_bytes = min_bytes
+
+    def put(self, text: str, owner: str = "") -> tuple[str, int]:
+        """본문을 저장한다. 이미 같은 본문이 있으면 쓰지 않는다.
+
+        Args:
+            text: 본문.
+            owner: 본문을 읽을 수 있는 token_id ("" 이면 소유자 표시 없음).
+
+        Returns:
+            (SHA-256 hex, 바이트 크기)
+        """
+        data = text.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._path(digest)
+        if path.exists():
+            os.utime(path)  # 보관 기간 연장
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        if owner:
+            self._owner_path(digest, owner).touch()
+        return digest, len(data)
+
+    def describe(self, text: str, owner: str = "") -> dict | None:
+        """지연 전송용 미리보기 payload를 만든다 (owner는 put과 같다).
+
+        Returns:
+            {"preview", "body_hash", "body_size", "truncated"} 또는
+            본문이 min_bytes보다 짧으면 None (그대로 보낸다).
+
+        Raises:
+            OSError: 본문 저장 실패.
+        """
+        if len(text.encode("utf-8")) < self._min_bytes:
+            return None
+        digest, size = self.put(text, owner)
+        return {
+            "preview": text[: self._preview_chars],
+            "body_hash": digest,
+            "body_size": size,
+            "truncated": True,
+        }
+
+    def read(
+        self, digest: str, offset: int = 0, length: int = MAX_CHUNK, owner: str | None = None
+    ) -> tuple[str, int, int, int]:
+        """본문의 한 구간을 읽는다.
+
+        Args:
+            digest: 본문 해시.
+            offset: 시작 바이트 (글자 경계로 맞춤).
+            length: 최대 바이트 수 (MAX_CHUNK 이하로 제한).
+            owner: 요청한 token_id. None이 아니면 그 토큰으로 저장된 본문만 읽는다.
+
+        Returns:
+            (구간 텍스트, 실제 시작 바이트, 끝 바이트(다음 offset), 전체 크기)
+
+        Raises:
+            ValueError: 잘못된 해시.
+            FileNotFoundError: 저장되지 않았거나 만료된 본문, 또는 owner의 본문이 아님.
+        """
+        if not _DIGEST_RE.match(digest):
+            raise ValueError(f"잘못된 본문 해시: {digest[:16]}")
+        if owner is not None and not self._owner_path(digest, owner).exists():
+            # 다른 토큰의 본문은 없는 것과 구분하지 않는다
+            raise FileNotFoundError(digest)
+        length = max(1, min(int(length), MAX_CHUNK))
+        with self._path(digest).open("rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            start = min(max(0, int(offset)), size)
+            f.seek(start)
+            # 끝 경계 확인을 위해 UTF-8 최대 길이(4)만큼 더 읽는다
+            chunk = f.read(length + 4)
+        skip = 0
+        while skip < min(3, len(chunk)) and _is_continuation(chunk[skip]):
+            skip += 1
+        end = min(length, len(chunk))
+        while end > skip and end < len(chunk) and _is_continuation(chunk[end]):
+            end -= 1
+        if end <= skip < len(chunk):
+            # length가 한 글자보다 짧으면 한 글자는 보낸다 (진행 보장)
+            end = skip + 1
+            while end < len(chunk) and _is_continuation(chunk[end]):
+                end += 1
+        return chunk[skip:end].decode("utf-8"), start + skip, start + end, size
+
+    def prune(self, max_age: float = BODY_TTL) -> int:
+        """오래된 본문 파일을 삭제한다.
+
+        Returns:
+            삭제한 파일 수.
+        """
+        if not self._root.exists():
+            return 0
+        cutoff = time.time() - max_age
+        removed = 0
+        for path in self._root.glob("*/*"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                continue
+        if removed:
+            logger.info("오래된 응답 본문 %d개 삭제", removed)
+        return removed
+
+    def _path(self, digest: str) -> Path:
+        return self._root / digest[:2] / digest
+
+    def _owner_path(self, digest: str, owner: str) -> Path:
+        key = hashlib.sha256(owner.encode("utf-8")).hexdigest()[:16]
+        return self._root / digest[:2] / f"{digest}.{key}"
@@ -0,0 +1,183 @@
+"""WebSocket 연결 내 논리 채널 다중화 모듈
+
+하나의 WebSocket 연결 안에서 여러 대화를 채널 ID로 구분한다.
+각 채널은 자신만의 FIFO 대기열과 처리 태스크를 가지므로:
+
+- 같은 채널의 프롬프트는 보낸 순서대로 처리·응답된다 (채널별 순서 보장).
+- 다른 채널의 프롬프트는 서로 기다리지 않는다 (채널 간 독립).
+- 채널별 window(미처리 프롬프트 상한)로 흐름 제어를 한다.
+
+채널은 재연결 없이 channel_open / channel_close 메시지로 열고 닫는다.
+채널 ID가 없는 메시지는 기본 채널(DEFAULT_CHANNEL)로 처리된다.
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+from bridge.limits import payload_size
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHANNEL = "0"
+DEFAULT_WINDOW = 4  # 채널당 미처리(대기 + 처리 중) 프롬프트 상한
+MAX_CHANNELS = 16  # 연결당 채널 수 상한
+
+ChannelHandler = Callable[[str, dict], Awaitable[None]]
+
+
+class ChannelError(Exception):
+    """채널 열기/전송 실패 (클라이언트에 ERROR로 전달됨)"""
+
+
+class Channel:
+    """단일 논리 채널 - 순서 보장 대기열과 처리 태스크"""
+
+    def __init__(self, channel_id: str, window: int, handler: ChannelHandler) -> None:
+        self.channel_id = channel_id
+        self.window = window
+        self._handler = handler
+        self._queue: asyncio.Queue[dict] = asyncio.Queue()
+        self._in_flight = 0
+        self.queued_bytes = 0  # 아직 처리를 시작하지 않은 프롬프트 바이트 (메모리 계정용)
+        self._task = asyncio.create_task(self._run())
+
+    @property
+    def outstanding(self) -> int:
+        """대기 중 + 처리 중인 프롬프트 수."""
+        return self._queue.qsize() + self._in_flight
+
+    @property
+    def credits(self) -> int:
+        """window 내에서 추가로 보낼 수 있는 프롬프트 수."""
+        return max(self.window - self.outstanding, 0)
+
+    def submit(self, msg: dict) -> None:
+        """메시지를 채널 대기열에 넣는다.
+
+        Raises:
+            ChannelError: window가 가득 찬 경우.
+        """
+        if self.outstanding >= self.window:
+            raise ChannelError(f"채널 {self.channel_id} 대기열이 가득 찼습니다 (window={self.window})")
+        self._queue.put_nowait(msg)
+        self.queued_bytes += _content_size(msg)
+
+    def take_queued(self) -> list[dict]:
+        """아직 처리를 시작하지 않은 메시지를 대기열에서 꺼내 반환한다."""
+        taken: list[dict] = []
+        while not self._queue.empty():
+            msg = self._queue.get_nowait()
+            self.queued_bytes -= _content_size(msg)
+            taken.append(msg)
+        return taken
+
+    def close(self) -> int:
+        """처리 태스크를 중단하고 아직 시작하지 않은 메시지 수를 반환한다."""
+        dropped = self._queue.qsize()
+        self._task.cancel()
+        return dropped
+
+    async def _run(self) -> None:
+        while True:
+            msg = await self._queue.get()
+            self.queued_bytes -= _content_size(msg)
+            self._in_flight += 1
+            try:
+                await self._handler(self.channel_id, msg)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.error("채널 %s 처리 오류: %s", self.channel_id, exc)
+            finally:
+                self._in_flight -= 1
+
+
+def _content_size(msg: dict) -> int:
+    content = msg.get("payload", {}).get("content", "")
+    return payload_size(content) if isinstance(content, str) else 0
+
+
+class ChannelMux:
+    """연결 하나에 속한 채널 집합"""
+
+    def __init__(self, handler: ChannelHandler) -> None:
+        """
+        Args:
+            handler: 채널 메시지를 처리하는 코루틴 (channel_id, msg).
+        """
+        self._handler = handler
+        self._channels: dict[str, Channel] = {}
+        self.open(DEFAULT_CHANNEL)
+
+    def __contains__(self, channel_id: str) -> bool:
+        return channel_id in self._channels
+
+    def get(self, channel_id: str) -> Channel | None:
+        return self._channels.get(channel_id)
+
+    def channel_ids(self) -> list[str]:
+        return list(self._channels)
+
+    @property
+    def queued_bytes(self) -> int:
+        """모든 채널 대기열의 프롬프트 바이트."""
+        return sum(channel.queued_bytes for channel in self._channels.values())
+
+    def open(self, channel_id: str, window: int = DEFAULT_WINDOW) -> Channel:
+        """채널을 연다. 이미 열려 있으면 window만 갱신한다.
+
+        Raises:
+            ChannelError: 채널 수 상한 초과 또는 잘못된 window.
+        """
+        if window < 1:
+            raise ChannelError("window는 1 이상이어야 합니다")
+        channel = self._channels.get(channel_id)
+        if channel is not None:
+            channel.window = window
+            return channel
+        if len(self._channels) >= MAX_CHANNELS:
+            raise ChannelError(f"채널 수 상한 초과 ({MAX_CHANNELS})")
+        channel = Channel(channel_id, window, self._handler)
+        self._channels[channel_id] = channel
+        logger.info("채널 열림: %s (window=%d)", channel_id, window)
+        return channel
+
+    def close(self, channel_id: str) -> int:
+        """채널을 닫고 버려진 대기 메시지 수를 반환한다.
+
+        Raises:
+            ChannelError: 열려 있지 않은 채널.
+        """
+        channel = self._channels.pop(channel_id, None)
+        if channel is None:
+            raise ChannelError(f"열려 있지 않은 채널: {channel_id}")
+        dropped = channel.close()
+        logger.info("채널 닫힘: %s (대기 %d건 폐기)", channel_id, dropped)
+        return dropped
+
+    def submit(self, channel_id: str, msg: dict) -> Channel:
+        """채널 대기열에 메시지를 넣는다.
+
+        Raises:
+            ChannelError: 열려 있지 않은 채널 또는 window 초과.
+        """
+        channel = self._channels.get(channel_id)
+        if channel is None:
+            raise ChannelError(f"열려 있지 않은 채널: {channel_id}")
+        channel.submit(msg)
+        return channel
+
+    def take_queued(self) -> list[tuple[str, dict]]:
+        """모든 채널에서 처리 전 메시지를 꺼낸다 — (channel_id, msg) 목록."""
+        return [
+            (channel_id, msg)
+            for channel_id, channel in self._channels.items()
+            for msg in channel.take_queued()
+        ]
+
+    def close_all(self) -> None:
+        """연결 종료 시 모든 채널의 처리 태스크를 중단한다."""
+        for channel in self._channels.values():
+            channel.close()
+        self._channels.clear()
@@ -0,0 +1,13 @@
+"""Bridge 비동기 클라이언트 SDK
+
+    from bridge.client import BridgeClient
+
+    async with BridgeClient("ws://127.0.0.1:8765", token) as client:
+        reply = await client.ask("안녕")
+
+명령줄:
+    python -m bridge.client send "프롬프트" ...
+    python -m bridge.client status
+"""
+
+from bridge.client.core import AuthError, BridgeClient, ClientError, ConnectionLost, Reply, Request
@@ -0,0 +1,146 @@
+"""Bridge 클라이언트 명령줄
+
+    python -m bridge.client send "첫 번째 프롬프트" "두 번째 프롬프트"
+    cat prompts.txt | python -m bridge.client send -        # 한 줄에 프롬프트 하나
+    python -m bridge.client send --json --channel a "..."  # JSON Lines 출력
+    python -m bridge.client status
+
+프롬프트는 한 연결로 한꺼번에 보내고(파이프라이닝), 응답은 도착하는 순서대로
+stdout에 쓴다. 진행 상황(-v)과 오류는 stderr로 간다. 하나라도 실패하면 종료 코드 1.
+
+주소와 토큰은 --url/--token, 환경 변수 BRIDGE_URL/BRIDGE_TOKEN, config.json 순으로 정한다.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+from bridge.channels import DEFAULT_CHANNEL, DEFAULT_WINDOW
+from bridge.client.core import BridgeClient, ClientError
+
+
+def _defaults() -> tuple[str, str]:
+    """config.json 기준 기본 주소와 토큰."""
+    from bridge.main import load_config
+
+    config = load_config()
+    host = config.get("host", "127.0.0.1")
+    if host == "0.0.0.0":
+        host = "127.0.0.1"
+    return f"ws://{host}:{config.get('port', 8765)}", config.get("auth_token", "")
+
+
+def _prompts(args: argparse.Namespace) -> list[str]:
+    if not args.prompts or args.prompts == ["-"]:
+        return [line.rstrip("\n") for line in sys.stdin if line.strip()]
+    return args.prompts
+
+
+def _progress(frame: dict) -> None:
+    kind = frame.get("type")
+    payload = frame.get("payload", {})
+    if kind == "message_ack":
+        state = f"보관 {payload.get('position')}번" if payload.get("parked") else f"eta {payload.get('eta')}s"
+        print(f"[client] ACK {payload.get('message_id')} ({state})", file=sys.stderr)
+    elif kind == "progress":
+        print(f"[client] 대기 {payload.get('message_id')} {payload.get('elapsed')}s", file=sys.stderr)
+
+
+async def _send(args: argparse.Namespace, client: BridgeClient) -> int:
+    prompts = _prompts(args)
+    if not prompts:
+        print("[client] 보낼 프롬프트가 없습니다", file=sys.stderr)
+        return 2
+    if args.channel != DEFAULT_CHANNEL or args.window != DEFAULT_WINDOW:
+        await client.open_channel(args.channel, args.window)
+
+    async def one(index: int, request) -> tuple[int, object]:
+        try:
+            return index, await asyncio.wait_for(request.result(), args.timeout)
+        except (ClientError, asyncio.TimeoutError) as exc:
+            return index, exc
+
+    # 보내는 동안 먼저 도착한 응답도 바로 출력되도록 전송과 대기를 함께 돌린다
+    waiting: list[asyncio.Task] = []
+    for index, content in enumerate(prompts, 1):
+        request = await client.submit(content, args.channel)
+        waiting.append(asyncio.create_task(one(index, request)))
+
+    failed = 0
+    for finished in asyncio.as_completed(waiting):
+        index, outcome = await finished
+        if isinstance(outcome, Exception):
+            failed += 1
+            error = str(outcome) or "응답 대기 시간 초과"
+            if args.json:
+                print(json.dumps({"index": index, "error": error}, ensure_ascii=False), flush=True)
+            print(f"[client] #{index} 실패: {error}", file=sys.stderr)
+            continue
+        if args.json:
+            record = {
+                "index": index,
+                "message_id": outcome.message_id,
+                "elapsed": round(outcome.elapsed, 3),
+                "content": outcome.content,
+            }
+            print(json.dumps(record, ensure_ascii=False), flush=True)
+        elif len(prompts) == 1:
+            print(outcome.content, flush=True)
+        else:
+            print(f"── #{index} {outcome.message_id} ({outcome.elapsed:.1f}s)", flush=True)
+            print(outcome.content, flush=True)
+    return 1 if failed else 0
+
+
+async def _main(args: argparse.Namespace) -> int:
+    client = BridgeClient(
+        args.url,
+        args.token,
+        link=args.link,
+        max_attempts=args.max_attempts,
+        on_event=_progress if args.verbose else None,
+    )
+    try:
+        await client.connect()
+    except (ClientError, OSError, asyncio.TimeoutError) as exc:
+        print(f"[client] 연결 실패: {exc}", file=sys.stderr)
+        return 1
+    try:
+        if args.command == "status":
+            print(json.dumps(await client.status(), ensure_ascii=False, indent=2))
+            return 0
+        return await _send(args, client)
+    finally:
+        await client.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m bridge.client", description="OKXUS Bridge 클라이언트")
+    parser.add_argument("--url", default=os.environ.get("BRIDGE_URL"), help="Bridge 주소 (ws://host:port)")
+    parser.add_argument("--token", default=os.environ.get("BRIDGE_TOKEN"), help="인증 토큰")
+    parser.add_argument("--link", choices=["cellular", "wifi", "lan"], help="링크 종류 (압축 설정)")
+    parser.add_argument("--max-attempts", dest="max_attempts", type=int, default=10, help="연속 재연결 실패 상한")
+    parser.add_argument("-v", "--verbose", action="store_true", help="ACK/진행 상황을 stderr로 출력")
+    commands = parser.add_subparsers(dest="command", required=True)
+    send = commands.add_parser("send", help="프롬프트를 보내고 응답을 출력")
+    send.add_argument("prompts", nargs="*", help="프롬프트 (없거나 -이면 stdin에서 한 줄씩)")
+    send.add_argument("--channel", default=DEFAULT_CHANNEL)
+    send.add_argument("--window", type=int, default=DEFAULT_WINDOW, help="채널 동시 처리 상한")
+    send.add_argument("--timeout", type=float, default=None, help="프롬프트별 응답 대기 (초)")
+    send.add_argument("--json", action="store_true", help="JSON Lines로 출력")
+    commands.add_parser("status", help="Bridge 상태 출력")
+    args = parser.parse_args(argv)
+    if args.url is None or args.token is None:
+        url, token = _defaults()
+        args.url = args.url or url
+        args.token = args.token or token
+    try:
+        return asyncio.run(_main(args))
+    except KeyboardInterrupt:
+        return 130
+
+
+if __name__ == "__main__":
+    sys.exit(main())
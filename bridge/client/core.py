@@ -0,0 +1,610 @@
+"""Bridge 비동기 클라이언트
+
+models.py의 JSON 프로토콜을 직접 다루지 않고 노트북/CI 스크립트나 부하 테스트에서
+Bridge를 쓸 수 있게 한다.
+
+- 인증: 토큰 auth 메시지, 이후 재연결은 재개 티켓(?ticket=)으로 auth 왕복을 생략.
+  같은 client_id를 이어받으므로 끊긴 동안 도착한 응답도 재연결 시 전달된다.
+- heartbeat: HEARTBEAT_INTERVAL마다 보내고, HEARTBEAT_TIMEOUT 동안 아무 프레임도
+  받지 못하면 죽은 연결로 보고 끊은 뒤 재연결한다.
+- 재연결: 지수 백오프(+지터). 재시작(1012)은 바로, 토큰 폐기(1008)·인증 실패는 중단.
+- 파이프라이닝: 응답을 기다리지 않고 여러 프롬프트를 한 소켓으로 보낸다. 채널별
+  window를 넘지 않도록 클라이언트에서 기다린다 (서버 ChannelError 방지).
+- 대응: 프롬프트마다 request_id를 붙여 ACK/거절을 대응시키고, ACK의 message_id로
+  kiro_response/progress/타임아웃 ERROR를 대응시킨다. ACK를 받지 못한 채 끊긴
+  프롬프트는 재연결 후 같은 request_id로 다시 보낸다 — 서버가 이미 받은 프롬프트면
+  다시 실행하지 않고 원래 ACK를 돌려준다. 그 ACK보다 먼저 도착한 응답(재연결 시
+  전달된 미전달 응답)은 message_id별로 잠시 보관했다가 ACK를 받으면 처리하고,
+  응답이 끊기기 직전에 보내져 유실된 경우에는 ClientError로 실패시킨다.
+- 지연 전송: 미리보기만 온 긴 응답은 fetch_body로 본문을 받아 완성한다.
+
+    async with BridgeClient("ws://127.0.0.1:8765", token) as client:
+        requests = [await client.submit(p) for p in prompts]   # 파이프라이닝
+        for reply in asyncio.as_completed([r.result() for r in requests]):
+            print((await reply).content)
+"""
+
+import asyncio
+import json
+import logging
+import random
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable
+from urllib.parse import quote
+
+import websockets
+
+from bridge.channels import DEFAULT_CHANNEL, DEFAULT_WINDOW
+from bridge.models import MessageType, ResponseType
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_INTERVAL = 30.0  # heartbeat 전송 간격 (초)
+HEARTBEAT_TIMEOUT = 90.0  # 이 시간 동안 수신이 없으면 연결을 끊고 재연결 (초)
+AUTH_TIMEOUT = 10.0  # 연결 + 인증 응답 대기 (초)
+BACKOFF_INITIAL = 0.5  # 첫 재연결 대기 (초)
+BACKOFF_MAX = 30.0  # 재연결 대기 상한 (초)
+TICKET_MARGIN = 30.0  # 만료까지 이보다 적게 남은 재개 티켓은 쓰지 않는다 (초)
+RESTART_CLOSE_CODE = 1012  # BridgeServer.RESTART_CLOSE_CODE — 바로 재연결
+REVOKED_CLOSE_CODE = 1008  # BridgeServer.REVOKED_CLOSE_CODE — 재연결하지 않음
+UNMATCHED_LIMIT = 64  # ACK 전에 도착한 응답을 보관하는 message_id 수
+
+EventCallback = Callable[[dict], None]
+
+# message_id로 요청에 대응되는 프레임 (ACK보다 먼저 오면 보관)
+_REQUEST_EVENTS = frozenset(
+    t.value for t in (ResponseType.KIRO_RESPONSE, ResponseType.PROGRESS, ResponseType.UNPARKED, ResponseType.ERROR)
+)
+
+
+class ClientError(Exception):
+    """요청 실패 (Bridge ERROR 응답, 재연결 포기, 클라이언트 종료)"""
+
+
+class AuthError(ClientError):
+    """인증 실패 또는 토큰 폐기 — 재연결하지 않는다"""
+
+
+class ConnectionLost(ClientError):
+    """응답을 받기 전에 연결이 끊김 (status, fetch_body 등 단발 요청)"""
+
+
+@dataclass
+class Reply:
+    """완료된 프롬프트 응답"""
+    message_id: str
+    content: str
+    channel: str
+    elapsed: float  # 처음 보낸 뒤 응답까지 (초)
+
+
+@dataclass
+class Request:
+    """보낸 프롬프트 하나 — result()로 응답을 기다린다"""
+    request_id: str
+    content: str
+    channel: str
+    sent_at: float = 0.0
+    message_id: str = ""  # ACK를 받으면 채워짐
+    parked: bool = False  # Kiro 중단으로 보관 중
+    eta: float | None = None
+    attempts: int = 0  # 전송 횟수 (재연결 후 재전송 포함)
+    future: asyncio.Future = field(default=None, repr=False)
+    released: bool = field(default=False, repr=False)  # 채널 window 반납 여부
+
+    def done(self) -> bool:
+        return self.future.done()
+
+    async def result(self) -> Reply:
+        """응답을 기다린다.
+
+        Raises:
+            ClientError: Bridge가 거절했거나 응답 대기 시간이 초과된 경우.
+        """
+        return await asyncio.shield(self.future)
+
+
+class BridgeClient:
+    """인증·heartbeat·재연결·파이프라이닝을 처리하는 Bridge 클라이언트"""
+
+    def __init__(
+        self,
+        url: str,
+        token: str,
+        *,
+        client_id: str | None = None,
+        link: str | None = None,
+        heartbeat_interval: float = HEARTBEAT_INTERVAL,
+        heartbeat_timeout: float = HEARTBEAT_TIMEOUT,
+        backoff_initial: float = BACKOFF_INITIAL,
+        backoff_max: float = BACKOFF_MAX,
+        max_attempts: int = 0,
+        fetch_bodies: bool = True,
+        on_event: EventCallback | None = None,
+    ) -> None:
+        """
+        Args:
+            url: Bridge 주소 (ws:// 또는 wss://).
+            token: 인증 토큰.
+            client_id: 이어받을 client_id (이전 실행의 미전달 응답 수신용).
+            link: 링크 종류 (cellular/wifi/lan) — 서버 압축 설정 선택.
+            heartbeat_interval: heartbeat 전송 간격 (초).
+            heartbeat_timeout: 수신이 없을 때 연결을 끊기까지의 시간 (초).
+            backoff_initial: 첫 재연결 대기 (초).
+            backoff_max: 재연결 대기 상한 (초).
+            max_attempts: 연속 재연결 실패 상한 (0이면 무제한).
+            fetch_bodies: 미리보기만 온 응답의 본문을 받아 올지 여부.
+            on_event: 수신한 프레임(heartbeat 제외)마다 호출되는 콜백.
+        """
+        self.url = url
+        self.client_id = client_id
+        self.session = ""
+        self.reconnects = 0
+        self._token = token
+        self._link = link
+        self._heartbeat_interval = heartbeat_interval
+        self._heartbeat_timeout = heartbeat_timeout
+        self._backoff_initial = backoff_initial
+        self._backoff_max = backoff_max
+        self._max_attempts = max_attempts
+        self._fetch_bodies = fetch_bodies
+        self._on_event = on_event
+        self._ticket = ""
+        self._ticket_expires = 0.0
+        self._ws: websockets.ClientConnection | None = None
+        self._ready = asyncio.Event()
+        self._closing = False
+        self._runner: asyncio.Task | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self._send_lock = asyncio.Lock()
+        self._last_seen = 0.0
+        # 요청 대응 테이블
+        self._requests: dict[str, Request] = {}
+        self._by_message: dict[str, Request] = {}
+        # 대응하는 요청이 아직 없는 message_id별 프레임 (ACK보다 먼저 온 응답)
+        self._unmatched: OrderedDict[str, list[dict]] = OrderedDict()
+        # 채널 흐름 제어 (서버 ChannelMux와 같은 window)
+        self._windows: dict[str, int] = {DEFAULT_CHANNEL: DEFAULT_WINDOW}
+        self._outstanding: dict[str, int] = {}
+        self._credit = asyncio.Condition()
+        # 단발 요청 대기
+        self._status_waiters: list[asyncio.Future] = []
+        self._channel_waiters: dict[str, asyncio.Future] = {}
+        self._body_waiters: dict[str, asyncio.Future] = {}
+
+    async def __aenter__(self) -> "BridgeClient":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    @property
+    def connected(self) -> bool:
+        return self._ready.is_set()
+
+    async def connect(self) -> None:
+        """연결하고 인증한다. 이후 끊기면 백그라운드에서 재연결한다.
+
+        Raises:
+            AuthError: 토큰이 거절된 경우.
+            OSError, websockets.WebSocketException, TimeoutError: 첫 연결 실패.
+        """
+        self._closing = False
+        await self._open()
+        self._runner = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """연결을 닫는다. 응답을 기다리던 요청은 ClientError로 끝난다."""
+        self._closing = True
+        ws = self._ws  # 수신 루프가 취소되며 _ws를 비우므로 먼저 잡아 둔다
+        if self._runner is not None:
+            self._runner.cancel()
+            await asyncio.gather(self._runner, return_exceptions=True)
+            self._runner = None
+        for task in list(self._tasks):
+            task.cancel()
+        if ws is not None:
+            await ws.close()
+        self._ws = None
+        self._ready.clear()
+        self._fail_all(ClientError("클라이언트 종료"))
+
+    async def submit(self, content: str, channel: str = DEFAULT_CHANNEL) -> Request:
+        """프롬프트를 보낸다 (응답을 기다리지 않음).
+
+        채널 window가 가득 차 있으면 자리가 날 때까지 기다린다. 연결이 끊긴 동안에는
+        보관했다가 재연결 후 보낸다.
+        """
+        async with self._credit:
+            await self._credit.wait_for(
+                lambda: self._outstanding.get(channel, 0) < self._windows.get(channel, DEFAULT_WINDOW)
+            )
+            self._outstanding[channel] = self._outstanding.get(channel, 0) + 1
+        request = Request(
+            request_id=f"req-{uuid.uuid4().hex[:12]}",
+            content=content,
+            channel=channel,
+            sent_at=time.monotonic(),
+            future=asyncio.get_running_loop().create_future(),
+        )
+        # result()를 부르지 않은 요청의 실패가 "never retrieved" 경고로 남지 않도록
+        request.future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._requests[request.request_id] = request
+        if self._ready.is_set():
+            async with self._send_lock:
+                await self._send_prompt(request)
+        return request
+
+    async def ask(self, content: str, channel: str = DEFAULT_CHANNEL, timeout: float | None = None) -> Reply:
+        """프롬프트를 보내고 응답을 기다린다.
+
+        Raises:
+            ClientError: 거절 또는 서버 측 응답 대기 시간 초과.
+            TimeoutError: timeout 안에 응답이 없는 경우 (요청은 계속 진행됨).
+        """
+        request = await self.submit(content, channel)
+        return await asyncio.wait_for(request.result(), timeout)
+
+    async def open_channel(self, channel: str, window: int = DEFAULT_WINDOW) -> int:
+        """논리 채널을 연다 (이미 열려 있으면 window만 갱신). 적용된 window를 반환한다.
+
+        Raises:
+            ClientError: 채널 수 상한 초과 등 서버 거절.
+            ConnectionLost: 응답 전에 연결이 끊긴 경우.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._channel_waiters[channel] = future
+        await self._send_frame(MessageType.CHANNEL_OPEN, {"window": window}, channel=channel)
+        payload = await future
+        async with self._credit:
+            self._windows[channel] = payload["window"]
+            self._credit.notify_all()
+        return payload["window"]
+
+    async def status(self) -> dict:
+        """Bridge 상태(status 응답의 status 항목)를 조회한다."""
+        future = asyncio.get_running_loop().create_future()
+        self._status_waiters.append(future)
+        await self._send_frame(MessageType.STATUS_REQUEST, {})
+        return await future
+
+    async def fetch_body(self, digest: str) -> str:
+        """미리보기로 받은 응답의 전체 본문을 구간 단위로 받아 합친다.
+
+        Raises:
+            ClientError: 본문이 없거나 만료된 경우.
+            ConnectionLost: 받는 도중 연결이 끊긴 경우.
+        """
+        parts: list[str] = []
+        offset = 0
+        while True:
+            future = asyncio.get_running_loop().create_future()
+            self._body_waiters[digest] = future
+            await self._send_frame(MessageType.FETCH_BODY, {"hash": digest, "offset": offset})
+            body = await future
+            parts.append(body["content"])
+            offset = body["end"]
+            if offset >= body["size"]:
+                return "".join(parts)
+
+    def stats(self) -> dict:
+        """진행 중인 요청 수와 재연결 횟수 (부하 테스트용)."""
+        return {
+            "connected": self.connected,
+            "in_flight": len(self._requests),
+            "unacked": sum(1 for r in self._requests.values() if not r.message_id),
+            "parked": sum(1 for r in self._requests.values() if r.parked),
+            "reconnects": self.reconnects,
+        }
+
+    # ------------------------------------------------------------------
+    # 연결 관리
+    # ------------------------------------------------------------------
+
+    async def _open(self) -> None:
+        """연결하고 AUTH_RESULT를 받을 때까지 기다린다. ACK 없는 프롬프트는 다시 보낸다."""
+        use_ticket = bool(self._ticket) and self._ticket_expires - TICKET_MARGIN > time.time()
+        url = self.url
+        if use_ticket:
+            url += f"{'&' if '?' in url else '?'}ticket={quote(self._ticket)}"
+            if self._link:
+                url += f"&link={quote(self._link)}"
+        ws = await websockets.connect(url, open_timeout=AUTH_TIMEOUT)
+        try:
+            if not use_ticket:
+                await ws.send(json.dumps(self._auth_frame()))
+            while True:
+                frame = json.loads(await asyncio.wait_for(ws.recv(), timeout=AUTH_TIMEOUT))
+                if frame.get("type") == ResponseType.ERROR.value:
+                    raise AuthError(frame.get("payload", {}).get("error", "인증 실패"))
+                if frame.get("type") != ResponseType.AUTH_RESULT.value:
+                    continue
+                payload = frame.get("payload", {})
+                if payload.get("success"):
+                    break
+                if payload.get("fallback") == "auth":
+                    # 티켓 만료/무효 — 같은 연결에서 토큰으로 재인증
+                    self._ticket = ""
+                    await ws.send(json.dumps(self._auth_frame()))
+                    continue
+                raise AuthError(payload.get("error", "인증 실패"))
+        except BaseException:
+            await ws.close()
+            raise
+
+        self.client_id = payload.get("client_id", self.client_id)
+        self.session = payload.get("session", "")
+        self._ticket = payload.get("resume_ticket", "")
+        self._ticket_expires = payload.get("ticket_expires", 0.0)
+        self._ws = ws
+        self._last_seen = time.monotonic()
+        logger.info("Bridge 연결: %s (%s, resumed=%s)", self.url, self.client_id, payload.get("resumed"))
+
+        # 새 연결의 채널을 다시 열고, ACK를 받지 못한 프롬프트를 보낸 순서대로 재전송
+        async with self._send_lock:
+            self._ready.set()
+            for channel, window in self._windows.items():
+                if channel != DEFAULT_CHANNEL or window != DEFAULT_WINDOW:
+                    await ws.send(json.dumps(self._frame(MessageType.CHANNEL_OPEN, {"window": window}, channel)))
+            for request in [r for r in self._requests.values() if not r.message_id]:
+                await self._send_prompt(request)
+
+    async def _run(self) -> None:
+        """수신 루프를 돌리고, 끊기면 백오프하며 재연결한다."""
+        while True:
+            code = await self._serve()
+            if self._closing:
+                return
+            if code == REVOKED_CLOSE_CODE:
+                self._fail_all(AuthError("토큰이 폐기되었습니다"))
+                return
+            attempt = 0
+            while True:
+                delay = 0.0 if code == RESTART_CLOSE_CODE and attempt == 0 else self._backoff(attempt)
+                await asyncio.sleep(delay)
+                try:
+                    await self._open()
+                    break
+                except AuthError as exc:
+                    logger.error("재인증 실패: %s", exc)
+                    self._fail_all(exc)
+                    return
+                except (OSError, websockets.WebSocketException, asyncio.TimeoutError) as exc:
+                    attempt += 1
+                    logger.warning("재연결 실패 (%d회): %s", attempt, exc)
+                    if self._max_attempts and attempt >= self._max_attempts:
+                        self._fail_all(ClientError(f"재연결 실패 ({attempt}회)"))
+                        return
+            self.reconnects += 1
+
+    async def _serve(self) -> int | None:
+        """연결이 끊길 때까지 프레임을 처리한다. close code를 반환한다."""
+        ws = self._ws
+        heartbeat = asyncio.create_task(self._heartbeat_loop(ws))
+        try:
+            async for raw in ws:
+                self._last_seen = time.monotonic()
+                try:
+                    frame = json.loads(raw)
+                except json.JSONDecodeError:
+                    logger.warning("잘못된 JSON 프레임 무시")
+                    continue
+                self._on_frame(frame)
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            heartbeat.cancel()
+            self._ready.clear()
+            self._ws = None
+            self._fail_waiters(ConnectionLost("연결이 끊겼습니다"))
+        code = ws.close_code
+        if not self._closing:
+            logger.warning("Bridge 연결 끊김 (code=%s)", code)
+        return code
+
+    async def _heartbeat_loop(self, ws: websockets.ClientConnection) -> None:
+        while True:
+            await asyncio.sleep(self._heartbeat_interval)
+            if time.monotonic() - self._last_seen > self._heartbeat_timeout:
+                logger.warning("heartbeat 응답 없음 — 연결을 끊고 재연결")
+                ws.transport.abort()
+                return
+            try:
+                async with self._send_lock:
+                    await ws.send(json.dumps(self._frame(MessageType.HEARTBEAT, {})))
+            except websockets.ConnectionClosed:
+                return
+
+    def _backoff(self, attempt: int) -> float:
+        """지수 백오프에 ±50% 지터 (여러 클라이언트가 동시에 몰리지 않도록)."""
+        delay = min(self._backoff_initial * (2**attempt), self._backoff_max)
+        return delay * random.uniform(0.5, 1.5)
+
+    # ------------------------------------------------------------------
+    # 전송
+    # ------------------------------------------------------------------
+
+    def _auth_frame(self) -> dict:
+        payload = {"token": self._token}
+        if self.client_id:
+            payload["client_id"] = self.client_id
+        if self._link:
+            payload["link"] = self._link
+        return self._frame(MessageType.AUTH, payload)
+
+    @staticmethod
+    def _frame(message_type: MessageType, payload: dict, channel: str | None = None) -> dict:
+        frame = {"type": message_type.value, "payload": payload, "timestamp": time.time()}
+        if channel is not None:
+            frame["channel"] = channel
+        return frame
+
+    async def _send_frame(self, message_type: MessageType, payload: dict, channel: str | None = None) -> None:
+        """단발 요청 전송 (연결될 때까지 기다림)."""
+        await self._ready.wait()
+        async with self._send_lock:
+            try:
+                await self._ws.send(json.dumps(self._frame(message_type, payload, channel)))
+            except (websockets.ConnectionClosed, AttributeError) as exc:
+                raise ConnectionLost("연결이 끊겼습니다") from exc
+
+    async def _send_prompt(self, request: Request) -> None:
+        """프롬프트 전송 (_send_lock 안에서 호출). 실패하면 재연결 후 다시 보낸다."""
+        if self._ws is None:
+            return
+        request.attempts += 1
+        payload = {"content": request.content, "request_id": request.request_id}
+        try:
+            await self._ws.send(json.dumps(self._frame(MessageType.MESSAGE, payload, request.channel)))
+        except websockets.ConnectionClosed:
+            pass
+
+    # ------------------------------------------------------------------
+    # 수신
+    # ------------------------------------------------------------------
+
+    def _on_frame(self, frame: dict, notify: bool = True) -> None:
+        frame_type = frame.get("type")
+        if frame_type == ResponseType.HEARTBEAT.value:
+            return
+        payload = frame.get("payload", {})
+        request = self._requests.get(payload.get("request_id", "")) or self._by_message.get(
+            payload.get("message_id", "")
+        )
+
+        if request is None and frame_type in _REQUEST_EVENTS and payload.get("message_id"):
+            self._stash(payload["message_id"], frame)
+        elif frame_type == ResponseType.MESSAGE_ACK.value and request is not None:
+            request.message_id = payload["message_id"]
+            request.parked = bool(payload.get("parked"))
+            request.eta = payload.get("eta")
+            self._by_message[request.message_id] = request
+            if request.parked:
+                # 보관된 프롬프트는 서버 채널 window를 차지하지 않는다
+                self._release(request)
+            early = self._unmatched.pop(request.message_id, [])
+            for stashed in early:
+                self._on_frame(stashed, notify=False)
+            answered = any(f.get("type") == ResponseType.KIRO_RESPONSE.value for f in early)
+            if payload.get("done") and not answered and not request.done():
+                # 서버는 이미 응답을 보냈지만 끊기면서 받지 못했다 — 다시 실행되지 않는다
+                self._fail(request, ClientError("이미 처리된 프롬프트의 응답이 연결 끊김으로 유실되었습니다"))
+        elif frame_type == ResponseType.KIRO_RESPONSE.value and request is not None:
+            if "content" in payload:
+                self._finish(request, payload["content"])
+            elif self._fetch_bodies and "body_hash" in payload:
+                self._spawn(self._complete_lazy(request, payload["body_hash"]))
+            else:
+                self._finish(request, payload.get("preview", ""))
+        elif frame_type == ResponseType.PROGRESS.value and request is not None:
+            request.eta = payload.get("eta", request.eta)
+        elif frame_type == ResponseType.UNPARKED.value and request is not None:
+            request.parked = False
+        elif frame_type == ResponseType.ERROR.value:
+            self._on_error(frame, request)
+        elif frame_type == ResponseType.STATUS.value and self._status_waiters:
+            self._resolve(self._status_waiters.pop(0), payload.get("status", {}))
+        elif frame_type == ResponseType.CHANNEL_OPENED.value:
+            self._resolve(self._channel_waiters.pop(str(frame.get("channel")), None), payload)
+        elif frame_type == ResponseType.BODY.value:
+            self._resolve(self._body_waiters.pop(payload.get("hash", ""), None), payload)
+
+        if notify and self._on_event is not None:
+            try:
+                self._on_event(frame)
+            except Exception as exc:
+                logger.error("on_event 콜백 오류: %s", exc)
+
+    def _stash(self, message_id: str, frame: dict) -> None:
+        """아직 ACK를 받지 못한 요청의 프레임일 수 있으므로 잠시 보관한다."""
+        self._unmatched.setdefault(message_id, []).append(frame)
+        self._unmatched.move_to_end(message_id)
+        while len(self._unmatched) > UNMATCHED_LIMIT:
+            self._unmatched.popitem(last=False)
+
+    def _on_error(self, frame: dict, request: Request | None) -> None:
+        payload = frame.get("payload", {})
+        error = ClientError(payload.get("error", "알 수 없는 오류"))
+        if request is not None:
+            self._fail(request, error)
+        elif payload.get("hash") in self._body_waiters:
+            self._resolve(self._body_waiters.pop(payload["hash"]), error=error)
+        elif str(frame.get("channel")) in self._channel_waiters:
+            self._resolve(self._channel_waiters.pop(str(frame.get("channel"))), error=error)
+        else:
+            logger.warning("Bridge 오류: %s", error)
+
+    async def _complete_lazy(self, request: Request, digest: str) -> None:
+        """미리보기 응답의 본문을 받아 요청을 완료한다. 도중에 끊기면 재연결 후 다시 받는다."""
+        while True:
+            try:
+                content = await self.fetch_body(digest)
+            except ConnectionLost:
+                continue
+            except ClientError as exc:
+                self._fail(request, exc)
+                return
+            self._finish(request, content)
+            return
+
+    # ------------------------------------------------------------------
+    # 요청 완료
+    # ------------------------------------------------------------------
+
+    def _finish(self, request: Request, content: str) -> None:
+        self._forget(request)
+        reply = Reply(request.message_id, content, request.channel, time.monotonic() - request.sent_at)
+        self._resolve(request.future, reply)
+
+    def _fail(self, request: Request, error: ClientError) -> None:
+        self._forget(request)
+        self._resolve(request.future, error=error)
+
+    def _forget(self, request: Request) -> None:
+        self._requests.pop(request.request_id, None)
+        self._by_message.pop(request.message_id, None)
+        self._release(request)
+
+    def _release(self, request: Request) -> None:
+        """요청이 차지한 채널 window 자리를 반납한다."""
+        if request.released:
+            return
+        request.released = True
+        self._outstanding[request.channel] -= 1
+        self._spawn(self._notify_credit())
+
+    async def _notify_credit(self) -> None:
+        async with self._credit:
+            self._credit.notify_all()
+
+    def _fail_all(self, error: ClientError) -> None:
+        for request in list(self._requests.values()):
+            self._fail(request, error)
+        self._fail_waiters(error)
+
+    def _fail_waiters(self, error: ClientError) -> None:
+        """연결에 묶인 단발 요청(status, channel_open, fetch_body)을 실패 처리한다."""
+        waiters = self._status_waiters + list(self._channel_waiters.values()) + list(self._body_waiters.values())
+        self._status_waiters = []
+        self._channel_waiters = {}
+        self._body_waiters = {}
+        for future in waiters:
+            self._resolve(future, error=error)
+
+    @staticmethod
+    def _resolve(future: asyncio.Future | None, result=None, error: Exception | None = None) -> None:
+        if future is None or future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
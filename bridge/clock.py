@@ -0,0 +1,172 @@
+"""주입 가능한 시계 모듈
+
+ResponseMonitor, KiroPool(응답 대기, 워커 상태의 RETRY_AFTER/HEARTBEAT_STALE 판정),
+file_io.wait_for_response, BridgeServer의 주기 루프(heartbeat, progress, 보관 배정,
+토큰 갱신), StatusFeed(상태 push 간격), watcher.poll_inbox는
+폴링 간격·타임아웃·안정 판정·쿨다운을 시간으로 판단한다. time/asyncio를 직접 부르는 대신
+Clock을 받아 쓰면, 테스트와 시뮬레이션에서 VirtualClock으로 바꿔 몇 시간짜리
+흐름을 실제로 기다리지 않고 결정적으로 실행할 수 있다.
+
+- RealClock: time.monotonic / time.time / asyncio.sleep / time.sleep.
+- VirtualClock: 수동으로 진행하는 가상 시계.
+    - sleep(코루틴)은 가상 시각이 마감에 도달할 때까지 잠든다.
+    - advance(초)는 그 사이 마감이 된 sleep을 시각 순서대로 깨우며 진행한다.
+    - run(코루틴)은 모든 태스크가 가상 sleep에서 쉬고 있으면 다음 마감으로
+      바로 건너뛰며 코루틴을 끝까지 실행한다.
+    - sleep_blocking(동기 호출자용)은 그 시간만큼 시계를 바로 진행한다.
+
+    clock = VirtualClock()
+    monitor = ResponseMonitor(actor=fake_actor, clock=clock)
+    text = await clock.run(monitor.wait_for_response(timeout=600))
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Awaitable, Protocol, TypeVar
+
+T = TypeVar("T")
+
+SETTLE_YIELDS = 20  # 깨운 태스크가 다음 sleep까지 진행하도록 양보하는 횟수
+VIRTUAL_EPOCH = 1_700_000_000.0  # VirtualClock.time()의 기준 시각 (epoch 초)
+
+
+class Clock(Protocol):
+    """시간 측정과 대기"""
+
+    def monotonic(self) -> float: ...
+
+    def time(self) -> float: ...
+
+    async def sleep(self, seconds: float) -> None: ...
+
+    def sleep_blocking(self, seconds: float) -> None: ...
+
+
+class RealClock:
+    """실제 시계"""
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def time(self) -> float:
+        return time.time()
+
+    async def sleep(self, seconds: float) -> None:
+        await asyncio.sleep(seconds)
+
+    def sleep_blocking(self, seconds: float) -> None:
+        time.sleep(seconds)
+
+
+REAL_CLOCK = RealClock()
+
+
+class VirtualClock:
+    """수동으로 진행하는 가상 시계 (테스트·시뮬레이션용)"""
+
+    def __init__(self, start: float = 0.0, epoch: float = VIRTUAL_EPOCH) -> None:
+        """
+        Args:
+            start: monotonic()의 시작 값 (초).
+            epoch: monotonic()이 0일 때의 time() 값 (epoch 초).
+        """
+        self._now = start
+        self._epoch = epoch
+        self._sleepers: list[tuple[float, int, asyncio.Future]] = []
+        self._order = itertools.count()  # 같은 마감은 잠든 순서대로 깨운다
+
+    def monotonic(self) -> float:
+        return self._now
+
+    def time(self) -> float:
+        return self._epoch + self._now
+
+    @property
+    def sleepers(self) -> int:
+        """가상 sleep 중인 태스크 수."""
+        return sum(1 for _, _, future in self._sleepers if not future.done())
+
+    def next_deadline(self) -> float | None:
+        """가장 이른 sleep 마감 (없으면 None)."""
+        self._drop_cancelled()
+        return self._sleepers[0][0] if self._sleepers else None
+
+    async def sleep(self, seconds: float) -> None:
+        if seconds <= 0:
+            await asyncio.sleep(0)
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._sleepers, (self._now + seconds, next(self._order), future))
+        await future
+
+    def sleep_blocking(self, seconds: float) -> None:
+        """동기 호출자의 대기 — 기다리지 않고 시계를 진행한다."""
+        self._now += max(seconds, 0.0)
+        self._wake_due()
+
+    async def advance(self, seconds: float) -> None:
+        """seconds만큼 시간을 진행하며, 그 사이 마감된 sleep을 시각 순서대로 깨운다.
+
+        깨운 태스크가 다시 sleep하면 그 마감도 같은 진행 안에서 처리된다.
+        """
+        target = self._now + seconds
+        await self._settle()
+        while True:
+            deadline = self.next_deadline()
+            if deadline is None or deadline > target:
+                break
+            self._now = max(self._now, deadline)
+            self._wake_due()
+            await self._settle()
+        self._now = max(self._now, target)
+
+    async def run(self, awaitable: Awaitable[T], limit: float | None = None) -> T:
+        """awaitable을 끝까지 실행한다. 모두 가상 sleep 중이면 다음 마감으로 건너뛴다.
+
+        Args:
+            awaitable: 실행할 코루틴/퓨처.
+            limit: 가상 시간 상한 (초). 넘으면 awaitable을 취소하고 TimeoutError.
+
+        Raises:
+            TimeoutError: limit 안에 끝나지 않은 경우.
+        """
+        task = asyncio.ensure_future(awaitable)
+        end = None if limit is None else self._now + limit
+        try:
+            while True:
+                await self._settle()
+                if task.done():
+                    return task.result()
+                deadline = self.next_deadline()
+                if deadline is None:
+                    # 가상 sleep이 아닌 실제 I/O(스레드, 소켓)를 기다리는 중
+                    await asyncio.wait([task], timeout=0.001)
+                    continue
+                if end is not None and deadline > end:
+                    self._now = end
+                    raise TimeoutError(f"가상 시간 {limit}초 안에 끝나지 않음")
+                self._now = max(self._now, deadline)
+                self._wake_due()
+        finally:
+            if not task.done():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
+    # ------------------------------------------------------------------
+
+    def _wake_due(self) -> None:
+        while self._sleepers and self._sleepers[0][0] <= self._now:
+            _, _, future = heapq.heappop(self._sleepers)
+            if not future.done():
+                future.set_result(None)
+
+    def _drop_cancelled(self) -> None:
+        while self._sleepers and self._sleepers[0][2].done():
+            heapq.heappop(self._sleepers)
+
+    @staticmethod
+    async def _settle() -> None:
+        for _ in range(SETTLE_YIELDS):
+            await asyncio.sleep(0)
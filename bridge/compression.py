@@ -0,0 +1,209 @@
+"""메시지 압축 정책 모듈 (permessage-deflate)
+
+websockets 기본 설정은 모든 메시지를 같은 설정으로 압축한다. 이 모듈은
+permessage-deflate 확장을 감싸서 다음을 결정한다.
+
+- 크기 기준: min_size보다 작은 메시지(heartbeat, ACK 등)는 압축하지 않고 보낸다.
+  RFC 7692는 메시지 단위로 압축 여부(RSV1)를 정할 수 있게 한다.
+- 연결별 설정: 인증 시 앱이 알린 링크 종류(link=cellular/wifi/lan)에 따라
+  압축 레벨, 크기 기준, 압축 창 크기(window bits)를 바꾼다. 새 설정은 다음
+  메시지부터 적용된다.
+- 자동 해제: 압축해도 거의 줄지 않는 연결(POOR_RATIO 이상)은 압축을 멈춰
+  CPU만 쓰는 일을 막는다.
+- 통계: 연결별로 압축 전/후 송수신 바이트를 세어 상태 응답에 합계를 보고한다.
+
+설정 (config.json):
+    "compression": {"enabled": true, "min_size": 256, "level": 6, "window_bits": 15}
+
+프리셋 사전(zdict)은 permessage-deflate에 협상 방법이 없어 앱 쪽
+압축 해제기가 쓸 수 없으므로 지원하지 않는다. 대신 context takeover를
+유지하여 앞선 응답이 다음 응답의 사전 역할을 한다.
+"""
+
+import logging
+import zlib
+from dataclasses import dataclass, field, fields
+from typing import Any, Sequence
+
+from websockets.extensions.base import Extension, ServerExtensionFactory
+from websockets.extensions.permessage_deflate import PerMessageDeflate, ServerPerMessageDeflateFactory
+from websockets.frames import CONT, CTRL_OPCODES, Frame
+from websockets.typing import ExtensionParameter
+
+logger = logging.getLogger(__name__)
+
+MIN_SIZE = 256  # 이보다 작은 메시지는 압축하지 않음 (바이트)
+DEFAULT_LEVEL = 6
+POOR_RATIO = 0.9  # 압축 후/전 비율이 이 이상이면 압축 효과 없음
+ADAPT_AFTER = 16  # 자동 해제 판단 전 압축 메시지 수
+
+# 링크 종류별 설정 — 셀룰러는 바이트가 비싸고, LAN은 CPU/지연이 더 중요
+LINK_PROFILES: dict[str, dict[str, int]] = {
+    "cellular": {"level": 9, "min_size": 128},
+    "wifi": {"level": 5, "min_size": 512},
+    "lan": {"level": 1, "min_size": 4096, "window_bits": 12},
+}
+
+
+@dataclass
+class CompressionStats:
+    """압축 전(raw)/후(wire) 바이트 통계"""
+    raw_out: int = 0
+    wire_out: int = 0
+    raw_in: int = 0
+    wire_in: int = 0
+    compressed: int = 0  # 압축하여 보낸 메시지 수
+    skipped: int = 0  # 압축하지 않고 보낸 메시지 수
+
+    def add(self, other: "CompressionStats") -> None:
+        for item in fields(self):
+            setattr(self, item.name, getattr(self, item.name) + getattr(other, item.name))
+
+    def summary(self) -> dict:
+        result = {item.name: getattr(self, item.name) for item in fields(self)}
+        result["saved_out"] = round(1 - self.wire_out / self.raw_out, 3) if self.raw_out else 0.0
+        result["saved_in"] = round(1 - self.wire_in / self.raw_in, 3) if self.raw_in else 0.0
+        return result
+
+
+class AdaptiveDeflate(PerMessageDeflate):
+    """크기 기준·연결별 설정·자동 해제·통계를 더한 permessage-deflate"""
+
+    def __init__(self, *args: Any, min_size: int = MIN_SIZE, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.min_size = min_size
+        self.stats = CompressionStats()
+        self.negotiated_window_bits = self.local_max_window_bits
+        self.disabled = False
+        self._passthrough = False
+        self._reconfigure = False
+        # 자동 해제 판단용 — 압축한 메시지만의 전/후 바이트
+        self._compressed_raw = 0
+        self._compressed_wire = 0
+
+    def configure(self, level: int | None = None, min_size: int | None = None, window_bits: int | None = None) -> None:
+        """압축 설정을 바꾼다. 다음 메시지부터 적용된다.
+
+        window_bits는 협상된 값 이하(9~)로 제한된다 — 더 작은 창으로 압축한
+        데이터는 상대가 그대로 풀 수 있다.
+        """
+        if min_size is not None:
+            self.min_size = min_size
+        if level is not None:
+            self.compress_settings = {**self.compress_settings, "level": level}
+        if window_bits is not None:
+            self.local_max_window_bits = max(9, min(window_bits, self.negotiated_window_bits))
+        self._reconfigure = True
+
+    def encode(self, frame: Frame) -> Frame:
+        if frame.opcode in CTRL_OPCODES:
+            return frame
+        if frame.opcode is not CONT:
+            self._passthrough = self.disabled or len(frame.data) < self.min_size
+            if self._passthrough:
+                self.stats.skipped += 1
+        if self._passthrough:
+            self.stats.raw_out += len(frame.data)
+            self.stats.wire_out += len(frame.data)
+            return frame
+
+        if self._reconfigure and frame.opcode is not CONT:
+            # 메시지 경계에서 압축기를 새로 만든다 (이전 창을 참조하지 않을 뿐 유효함)
+            self.encoder = zlib.compressobj(wbits=-self.local_max_window_bits, **self.compress_settings)
+            self._reconfigure = False
+
+        encoded = super().encode(frame)
+        self.stats.raw_out += len(frame.data)
+        self.stats.wire_out += len(encoded.data)
+        self._compressed_raw += len(frame.data)
+        self._compressed_wire += len(encoded.data)
+        if frame.fin:
+            self.stats.compressed += 1
+            self._adapt()
+        return encoded
+
+    def decode(self, frame: Frame, *, max_size: int | None = None) -> Frame:
+        decoded = super().decode(frame, max_size=max_size)
+        if frame.opcode not in CTRL_OPCODES:
+            self.stats.wire_in += len(frame.data)
+            self.stats.raw_in += len(decoded.data)
+        return decoded
+
+    def _adapt(self) -> None:
+        if self.stats.compressed < ADAPT_AFTER or self.disabled:
+            return
+        ratio = self._compressed_wire / self._compressed_raw if self._compressed_raw else 0.0
+        if ratio >= POOR_RATIO:
+            self.disabled = True
+            logger.info("압축 효과 없음 — 이 연결의 압축 중지 (%.2f)", ratio)
+
+
+class AdaptiveDeflateFactory(ServerPerMessageDeflateFactory):
+    """협상 결과로 AdaptiveDeflate를 만드는 서버 확장 팩토리"""
+
+    def __init__(self, policy: "CompressionPolicy") -> None:
+        super().__init__(
+            server_max_window_bits=policy.window_bits if policy.window_bits < 15 else None,
+            compress_settings={"level": policy.level, "memLevel": policy.mem_level},
+        )
+        self.policy = policy
+
+    def process_request_params(
+        self,
+        params: Sequence[ExtensionParameter],
+        accepted_extensions: Sequence[Extension],
+    ) -> tuple[list[ExtensionParameter], PerMessageDeflate]:
+        response, negotiated = super().process_request_params(params, accepted_extensions)
+        extension = AdaptiveDeflate(
+            negotiated.remote_no_context_takeover,
+            negotiated.local_no_context_takeover,
+            negotiated.remote_max_window_bits,
+            negotiated.local_max_window_bits,
+            dict(negotiated.compress_settings),
+            min_size=self.policy.min_size,
+        )
+        return response, extension
+
+
+@dataclass
+class CompressionPolicy:
+    """서버 전체 압축 기본값과 연결별 적용"""
+    enabled: bool = True
+    min_size: int = MIN_SIZE
+    level: int = DEFAULT_LEVEL
+    window_bits: int = 15
+    mem_level: int = 8
+    profiles: dict[str, dict[str, int]] = field(default_factory=lambda: dict(LINK_PROFILES))
+
+    @classmethod
+    def from_config(cls, config: dict) -> "CompressionPolicy":
+        """config.json의 compression 항목으로 정책을 만든다."""
+        section = config.get("compression", {})
+        return cls(
+            enabled=section.get("enabled", True),
+            min_size=section.get("min_size", MIN_SIZE),
+            level=section.get("level", DEFAULT_LEVEL),
+            window_bits=max(9, min(section.get("window_bits", 15), 15)),
+        )
+
+    def extensions(self) -> list[ServerExtensionFactory]:
+        """websockets.serve(extensions=...)에 넘길 확장 팩토리 목록."""
+        return [AdaptiveDeflateFactory(self)] if self.enabled else []
+
+    def apply(self, websocket: object, link: str | None) -> None:
+        """연결에 링크 종류별 설정을 적용한다 (알 수 없는 링크는 기본값 유지)."""
+        extension = extension_of(websocket)
+        profile = self.profiles.get(link or "")
+        if extension is None or profile is None:
+            return
+        extension.configure(**profile)
+        logger.debug("압축 설정 적용: link=%s %s", link, profile)
+
+
+def extension_of(websocket: object) -> AdaptiveDeflate | None:
+    """연결에 협상된 AdaptiveDeflate 확장 (압축 미협상이면 None)."""
+    protocol = getattr(websocket, "protocol", None)
+    for extension in getattr(protocol, "extensions", None) or []:
+        if isinstance(extension, AdaptiveDeflate):
+            return extension
+    return None
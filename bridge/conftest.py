@@ -0,0 +1,140 @@
+"""Bridge 서버 통합 테스트 공용 fixture와 도우미
+
+서버를 띄우는 테스트 모듈은 TEST_PORT(모듈마다 다른 포트)와 TEST_TOKEN을 모듈
+변수로 두고 server fixture를 쓴다. 서버 구성이 다르면 그 모듈에서
+server_options fixture(BridgeServer 추가 인자)나 worker fixture를 다시 정의한다.
+
+프롬프트/응답/상태 조회는 bridge.client.BridgeClient(client, open_client)로 보내고,
+프레임 형식 자체를 확인하는 테스트만 인증된 raw WebSocket(connect)과
+frame/next_frame 도우미를 쓴다.
+"""
+
+import asyncio
+import json
+import time
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+import websockets
+
+from bridge import file_io, kiro_pool
+from bridge.auth import Authenticator
+from bridge.client import BridgeClient, Request
+from bridge.kiro_pool import KiroWorker
+from bridge.server import BridgeServer
+from bridge.test_kiro_pool import fake_kiro
+
+TEST_HOST = "127.0.0.1"
+
+
+def frame(msg_type: str, channel: str | None = None, **payload) -> str:
+    """클라이언트 → 서버 프레임 (JSON 문자열)."""
+    data = {"type": msg_type, "payload": payload, "timestamp": time.time()}
+    if channel is not None:
+        data["channel"] = channel
+    return json.dumps(data)
+
+
+async def next_frame(ws, frame_type: str | None = None, timeout: float = 5) -> dict:
+    """다음 프레임을 받는다. frame_type을 주면 그 타입이 올 때까지 건너뛴다."""
+    while True:
+        data = json.loads(await asyncio.wait_for(ws.recv(), timeout=timeout))
+        if frame_type is None or data["type"] == frame_type:
+            return data
+
+
+async def wait_ack(request: Request) -> str:
+    """요청의 ACK(message_id)를 기다린다."""
+    while not request.message_id:
+        await asyncio.sleep(0.01)
+    return request.message_id
+
+
+def kiro_reply(message_id: str, content: str, outbox: Path | None = None) -> None:
+    """Kiro 응답 파일을 쓴다 (기본 outbox는 io_dirs가 바꾼 file_io.OUTBOX_DIR)."""
+    path = (outbox or file_io.OUTBOX_DIR) / f"{message_id}.json"
+    path.write_text(json.dumps({"content": content}), encoding="utf-8")
+
+
+@pytest.fixture
+def io_dirs(tmp_path, monkeypatch):
+    """inbox/outbox를 임시 디렉토리로 교체한다."""
+    monkeypatch.setattr(file_io, "INBOX_DIR", tmp_path / "inbox")
+    monkeypatch.setattr(file_io, "OUTBOX_DIR", tmp_path / "outbox")
+    file_io.ensure_dirs()
+    return tmp_path
+
+
+@pytest.fixture
+def worker(tmp_path, monkeypatch):
+    """임시 디렉토리의 Kiro 워커 (응답 파일을 빠르게 확인)."""
+    monkeypatch.setattr(kiro_pool, "POLL_INTERVAL", 0.01)
+    return KiroWorker("kiro", tmp_path / "kiro")
+
+
+@pytest_asyncio.fixture
+async def kiro(worker):
+    """worker의 inbox에 "ok:<프롬프트>"로 답하는 가짜 Kiro."""
+    task = asyncio.create_task(fake_kiro(worker))
+    yield task
+    task.cancel()
+
+
+@pytest.fixture
+def server_options() -> dict:
+    """BridgeServer 추가 인자 — 모듈에서 다시 정의하여 구성을 바꾼다."""
+    return {}
+
+
+@pytest.fixture
+def bridge_url(request) -> str:
+    return f"ws://{TEST_HOST}:{request.module.TEST_PORT}"
+
+
+@pytest_asyncio.fixture
+async def server(request, io_dirs, server_options):
+    srv = BridgeServer(authenticator=Authenticator(token=request.module.TEST_TOKEN), **server_options)
+    await srv.start(TEST_HOST, request.module.TEST_PORT)
+    yield srv
+    await srv.stop()
+
+
+@pytest_asyncio.fixture
+async def open_client(request, bridge_url):
+    """연결된 BridgeClient를 만드는 함수 (BridgeClient 인자를 받음). 테스트가 끝나면 닫는다."""
+    clients: list[BridgeClient] = []
+
+    async def _open(**kwargs) -> BridgeClient:
+        client = BridgeClient(bridge_url, request.module.TEST_TOKEN, **kwargs)
+        await client.connect()
+        clients.append(client)
+        return client
+
+    yield _open
+    for client in clients:
+        await client.close()
+
+
+@pytest_asyncio.fixture
+async def client(server, open_client) -> BridgeClient:
+    return await open_client()
+
+
+@pytest_asyncio.fixture
+async def connect(request, bridge_url):
+    """인증한 raw WebSocket을 여는 함수 — (ws, AUTH_RESULT 프레임). 테스트가 끝나면 닫는다."""
+    sockets = []
+
+    async def _connect(client_id: str | None = None):
+        ws = await websockets.connect(bridge_url)
+        sockets.append(ws)
+        payload = {"token": request.module.TEST_TOKEN}
+        if client_id:
+            payload["client_id"] = client_id
+        await ws.send(frame("auth", **payload))
+        return ws, await next_frame(ws)
+
+    yield _connect
+    for ws in sockets:
+        await ws.close()
@@ -2,56 +2,115 @@
 
 inbox/  - Bridge가 메시지를 쓰면 Kiro hook이 읽어감
 outbox/ - Kiro가 응답을 쓰면 Bridge가 읽어감
+
+토큰별 namespace가 있으면 inbox/<namespace>/, outbox/<namespace>/를 사용한다.
+inbox 파일의 "reply_to"에 응답을 써야 할 outbox 경로(상대 경로)가 들어 있다.
 """
 
-import asyncio
 import json
 import logging
 import os
 import time
 from pathlib import Path
 
+from bridge.clock import REAL_CLOCK, Clock
+
 logger = logging.getLogger(__name__)
 
 BASE_DIR = Path(__file__).parent
 INBOX_DIR = BASE_DIR / "inbox"
 OUTBOX_DIR = BASE_DIR / "outbox"
+DEFAULT_RESPONSE_TIMEOUT = 120  # 호출자가 timeout을 주지 않을 때의 대기 시간 (초)
+RESPONSE_POLL_INTERVAL = 1.0  # outbox 확인 간격 (초)
 
 
-def ensure_dirs() -> None:
-    """inbox/outbox 디렉토리 생성."""
-    INBOX_DIR.mkdir(exist_ok=True)
-    OUTBOX_DIR.mkdir(exist_ok=True)
+def ensure_dirs(
+    namespace: str = "", inbox_dir: Path | None = None, outbox_dir: Path | None = None
+) -> None:
+    """inbox/outbox 디렉토리 생성.
 
-
-def write_message(message_id: str, content: str) -> Path:
+    inbox_dir/outbox_dir를 생략하면 기본 디렉토리(INBOX_DIR/OUTBOX_DIR)를 사용한다.
+    Kiro 워커 풀에서는 워커마다 자신의 디렉토리를 넘긴다.
+    """
+    inbox_dir = inbox_dir or INBOX_DIR
+    outbox_dir = outbox_dir or OUTBOX_DIR
+    inbox_dir.mkdir(parents=True, exist_ok=True)
+    outbox_dir.mkdir(parents=True, exist_ok=True)
+    if namespace:
+        (inbox_dir / namespace).mkdir(exist_ok=True)
+        (outbox_dir / namespace).mkdir(exist_ok=True)
+
+
+def write_message(
+    message_id: str,
+    content: str,
+    namespace: str = "",
+    inbox_dir: Path | None = None,
+    outbox_dir: Path | None = None,
+) -> Path:
     """inbox에 메시지 파일을 작성한다.
 
     Args:
         message_id: 고유 메시지 ID.
         content: 메시지 내용.
+        namespace: 토큰별 하위 디렉토리 (빈 값이면 최상위).
+        inbox_dir: inbox 디렉토리 (기본값 INBOX_DIR).
+        outbox_dir: 응답을 쓸 outbox 디렉토리 (기본값 OUTBOX_DIR).
 
     Returns:
         작성된 파일 경로.
     """
-    ensure_dirs()
-    filepath = INBOX_DIR / f"{message_id}.json"
+    inbox_dir = inbox_dir or INBOX_DIR
+    outbox_dir = outbox_dir or OUTBOX_DIR
+    ensure_dirs(namespace, inbox_dir, outbox_dir)
+    filepath = inbox_dir / namespace / f"{message_id}.json"
     data = {
         "id": message_id,
         "content": content,
         "timestamp": time.time(),
+        "reply_to": (Path(outbox_dir.name) / namespace / f"{message_id}.json").as_posix(),
     }
     filepath.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
     logger.info("메시지 작성: %s", filepath.name)
     return filepath
 
 
-async def wait_for_response(message_id: str, timeout: int = 120) -> str:
+def read_response(
+    message_id: str, namespace: str = "", outbox_dir: Path | None = None
+) -> str | None:
+    """outbox에 응답 파일이 있으면 읽고 삭제한다 (대기하지 않음).
+
+    Returns:
+        응답 텍스트. 아직 없거나 읽기에 실패하면 None.
+    """
+    response_path = (outbox_dir or OUTBOX_DIR) / namespace / f"{message_id}.json"
+    if not response_path.exists():
+        return None
+    try:
+        data = json.loads(response_path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError) as e:
+        logger.warning("응답 파일 읽기 실패, 재시도: %s", e)
+        return None
+    # 읽은 후 삭제
+    response_path.unlink(missing_ok=True)
+    return data.get("content", "")
+
+
+async def wait_for_response(
+    message_id: str,
+    timeout: float = DEFAULT_RESPONSE_TIMEOUT,
+    namespace: str = "",
+    outbox_dir: Path | None = None,
+    clock: Clock | None = None,
+) -> str:
     """outbox에서 응답 파일이 생길 때까지 대기한다.
 
     Args:
         message_id: 대기할 메시지 ID.
         timeout: 최대 대기 시간 (초).
+        namespace: 토큰별 하위 디렉토리 (빈 값이면 최상위).
+        outbox_dir: outbox 디렉토리 (기본값 OUTBOX_DIR).
+        clock: 폴링·타임아웃에 쓸 시계 (기본값 실제 시계).
 
     Returns:
         응답 텍스트.
@@ -59,30 +118,25 @@ async def wait_for_response(message_id: str, timeout: int = 120) -> str:
     Raises:
         TimeoutError: 시간 내 응답 없음.
     """
-    ensure_dirs()
-    response_path = OUTBOX_DIR / f"{message_id}.json"
-    start = time.monotonic()
+    outbox_dir = outbox_dir or OUTBOX_DIR
+    outbox_dir.mkdir(parents=True, exist_ok=True)
+    clock = clock or REAL_CLOCK
+    start = clock.monotonic()
 
     while True:
-        elapsed = time.monotonic() - start
+        elapsed = clock.monotonic() - start
         if elapsed >= timeout:
             raise TimeoutError(f"응답 대기 시간 초과 ({timeout}초)")
 
-        if response_path.exists():
-            try:
-                data = json.loads(response_path.read_text(encoding="utf-8"))
-                content = data.get("content", "")
-                # 읽은 후 삭제
-                response_path.unlink(missing_ok=True)
-                logger.info("응답 수신: %s (%.1f초)", message_id, elapsed)
-                return content
-            except (json.JSONDecodeError, OSError) as e:
-                logger.warning("응답 파일 읽기 실패, 재시도: %s", e)
+        content = read_response(message_id, namespace, outbox_dir)
+        if content is not None:
+            logger.info("응답 수신: %s (%.1f초)", message_id, elapsed)
+            return content
 
-        await asyncio.sleep(1.0)
+        await clock.sleep(RESPONSE_POLL_INTERVAL)
 
 
-def cleanup_inbox(message_id: str) -> None:
+def cleanup_inbox(message_id: str, namespace: str = "", inbox_dir: Path | None = None) -> None:
     """처리 완료된 inbox 파일을 삭제한다."""
-    filepath = INBOX_DIR / f"{message_id}.json"
+    filepath = (inbox_dir or INBOX_DIR) / namespace / f"{message_id}.json"
     filepath.unlink(missing_ok=True)
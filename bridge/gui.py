@@ -0,0 +1,93 @@
+"""GUI 자동화 모듈 지연 로드
+
+pyautogui/pyperclip은 import가 느리고 디스플레이(X 서버 등)가 필요하다.
+Bridge 서버 시작에는 필요 없으므로, 실제로 키 입력·클립보드를 처음 사용할 때
+import한다.
+
+    pyautogui = lazy_import("pyautogui", on_load=_configure)
+
+LazyModule은 속성 접근/설정/삭제를 실제 모듈에 위임하므로
+patch("bridge.monitor.pyautogui.hotkey") 같은 테스트 패치도 그대로 동작한다.
+모듈을 불러올 수 없으면 첫 사용 시 ImportError가 발생한다.
+"""
+
+import importlib
+import logging
+import threading
+import time
+from types import ModuleType
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class LazyModule:
+    """첫 속성 접근 시 실제 모듈을 import하는 프록시"""
+
+    def __init__(self, name: str, on_load: Callable[[ModuleType], None] | None = None) -> None:
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_on_load", on_load)
+        object.__setattr__(self, "_module", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    @property
+    def loaded(self) -> bool:
+        """실제 모듈이 이미 import되었는지 여부."""
+        return self._module is not None
+
+    def load(self) -> ModuleType:
+        """실제 모듈을 import하여 반환한다 (최초 1회).
+
+        Raises:
+            ImportError: 모듈이 없거나 초기화에 실패한 경우 (디스플레이 없음 등).
+        """
+        module = self._module
+        if module is not None:
+            return module
+        with self._lock:
+            if self._module is None:
+                started = time.perf_counter()
+                try:
+                    module = importlib.import_module(self._name)
+                    if self._on_load is not None:
+                        self._on_load(module)
+                except ImportError:
+                    raise
+                except Exception as e:  # pyautogui는 디스플레이가 없으면 KeyError 등을 낸다
+                    raise ImportError(f"{self._name} 로드 실패: {e}") from e
+                object.__setattr__(self, "_module", module)
+                logger.debug("%s 로드 (%.0f ms)", self._name, (time.perf_counter() - started) * 1000)
+            return self._module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.load(), attr)
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        setattr(self.load(), attr, value)
+
+    def __delattr__(self, attr: str) -> None:
+        delattr(self.load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_import(name: str, on_load: Callable[[ModuleType], None] | None = None) -> LazyModule:
+    """지연 로드 모듈 프록시를 만든다.
+
+    Args:
+        name: import할 모듈 이름.
+        on_load: 최초 로드 직후 호출되는 초기화 함수 (설정값 적용 등).
+    """
+    return LazyModule(name, on_load)
+
+
+def _configure_pyautogui(module: ModuleType) -> None:
+    # pyautogui 안전 설정
+    module.FAILSAFE = True
+    module.PAUSE = 0.3
+
+
+pyautogui = lazy_import("pyautogui", on_load=_configure_pyautogui)
+pyperclip = lazy_import("pyperclip")
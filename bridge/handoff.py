@@ -0,0 +1,164 @@
+"""무중단 재시작(핸드오프) 모듈
+
+실행 중인 Bridge(이전 프로세스)가 UNIX 소켓으로 새 프로세스의 인수 요청을 받으면:
+
+1. 새 연결/메시지를 돌려보내고 대기 요청 테이블을 pending.json에 저장한다.
+2. 리스닝 소켓 fd를 SCM_RIGHTS로 새 프로세스에 넘긴다.
+3. 기존 클라이언트를 1012(Service Restart)로 닫고 종료한다.
+
+새 프로세스(python -m bridge --takeover)는 받은 소켓으로 바로 서비스를 시작하고,
+pending.json의 outbox 대기를 이어받아 클라이언트가 같은 client_id로
+재연결하면 응답을 전달한다. 커널 backlog에 쌓인 연결은 유실되지 않는다.
+
+SCM_RIGHTS(socket.send_fds)를 지원하지 않는 플랫폼(Windows)에서는 비활성화된다.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+from pathlib import Path
+from typing import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = Path(__file__).parent
+HANDOFF_SOCKET_PATH = BASE_DIR / "handoff.sock"
+PENDING_PATH = BASE_DIR / "pending.json"
+
+_TAKEOVER_REQUEST = b"TAKEOVER\n"
+_TAKEOVER_REPLY = b"LISTENER"
+
+
+def supports_handoff() -> bool:
+    """현재 플랫폼이 UNIX 소켓 fd 전달(SCM_RIGHTS)을 지원하는지 확인한다."""
+    return hasattr(socket, "AF_UNIX") and hasattr(socket, "send_fds")
+
+
+def save_pending(snapshot: dict, path: Path = PENDING_PATH) -> None:
+    """드레인 스냅샷을 파일에 저장한다 (임시 파일 후 교체).
+
+    Args:
+        snapshot: BridgeServer.drain()이 반환한 스냅샷.
+        path: 저장할 파일 경로.
+    """
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(snapshot, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, path)
+    logger.info("대기 요청 저장: %s (%d건)", path.name, len(snapshot.get("pending", [])))
+
+
+def load_pending(path: Path = PENDING_PATH) -> dict:
+    """저장된 스냅샷을 읽고 파일을 삭제한다.
+
+    Returns:
+        스냅샷 딕셔너리. 파일이 없거나 손상되었으면 빈 스냅샷.
+    """
+    if not path.exists():
+        return {"pending": [], "undelivered": {}}
+    try:
+        snapshot = json.loads(path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError) as e:
+        logger.warning("대기 요청 파일 읽기 실패: %s", e)
+        snapshot = {"pending": [], "undelivered": {}}
+    path.unlink(missing_ok=True)
+    return snapshot
+
+
+class HandoffListener:
+    """이전 프로세스 측: 새 프로세스의 인수 요청을 기다리는 UNIX 소켓 서버"""
+
+    def __init__(
+        self,
+        on_takeover: Callable[[], Awaitable[socket.socket | None]],
+        on_handed_off: Callable[[], None] | None = None,
+        path: Path = HANDOFF_SOCKET_PATH,
+    ) -> None:
+        """
+        Args:
+            on_takeover: 인수 요청 시 호출되는 코루틴. 드레인을 수행하고
+                넘겨줄 리스닝 소켓을 반환한다.
+            on_handed_off: 소켓 전달 완료 후 호출되는 콜백.
+            path: UNIX 소켓 경로.
+        """
+        self._on_takeover = on_takeover
+        self._on_handed_off = on_handed_off
+        self._path = path
+        self._sock: socket.socket | None = None
+        self._task: asyncio.Task | None = None
+        self.handed_off = False
+
+    def start(self) -> None:
+        """UNIX 소켓을 열고 인수 요청 대기를 시작한다."""
+        self._path.unlink(missing_ok=True)
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.bind(str(self._path))
+        self._sock.listen(1)
+        self._sock.setblocking(False)
+        self._task = asyncio.create_task(self._serve())
+        logger.info("핸드오프 대기: %s", self._path)
+
+    async def close(self) -> None:
+        """인수 대기를 중단하고 소켓 파일을 정리한다."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if self._sock is not None:
+            self._sock.close()
+            # 인수한 새 프로세스가 같은 경로에 소켓을 열었으므로 삭제하지 않는다
+            if not self.handed_off:
+                self._path.unlink(missing_ok=True)
+
+    async def _serve(self) -> None:
+        loop = asyncio.get_running_loop()
+        while not self.handed_off:
+            conn, _ = await loop.sock_accept(self._sock)
+            with conn:
+                try:
+                    request = await asyncio.wait_for(loop.sock_recv(conn, 64), timeout=5)
+                    if request != _TAKEOVER_REQUEST:
+                        continue
+                    listener = await self._on_takeover()
+                    if listener is None:
+                        continue
+                    conn.setblocking(True)
+                    socket.send_fds(conn, [_TAKEOVER_REPLY], [listener.fileno()])
+                except (OSError, asyncio.TimeoutError) as e:
+                    logger.error("핸드오프 처리 실패: %s", e)
+                    continue
+            logger.info("리스닝 소켓 전달 완료")
+            print("[Bridge] 리스닝 소켓을 새 프로세스에 전달")
+            self.handed_off = True
+            if self._on_handed_off is not None:
+                self._on_handed_off()
+
+
+def request_takeover(path: Path = HANDOFF_SOCKET_PATH, timeout: float = 30.0) -> socket.socket:
+    """새 프로세스 측: 실행 중인 Bridge에 인수를 요청하고 리스닝 소켓을 받는다.
+
+    Args:
+        path: 이전 프로세스의 UNIX 소켓 경로.
+        timeout: 응답 대기 시간 (초).
+
+    Returns:
+        이전 프로세스가 넘겨준 리스닝 소켓 (논블로킹).
+
+    Raises:
+        OSError: 연결 실패 또는 fd를 받지 못한 경우.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.settimeout(timeout)
+        conn.connect(str(path))
+        conn.sendall(_TAKEOVER_REQUEST)
+        msg, fds, _flags, _addr = socket.recv_fds(conn, 64, 1)
+    if msg != _TAKEOVER_REPLY or not fds:
+        for fd in fds:
+            os.close(fd)
+        raise OSError("핸드오프 응답에 리스닝 소켓이 없습니다")
+    sock = socket.socket(fileno=fds[0])
+    sock.setblocking(False)
+    return sock
@@ -0,0 +1,223 @@
+"""대화 기록 저장소 모듈
+
+프롬프트와 Kiro 응답을 SQLite(bridge/history.db)에 저장하여, 새 기기나
+재설치한 앱도 Bridge에서 기록을 받아볼 수 있게 한다.
+
+- 기록은 토큰(token_id)별로 분리되며, 같은 토큰의 모든 기기가 공유한다.
+- history_page: id 기준 커서 페이지 (최신순). 앱은 화면에 보이는 구간만 받는다.
+- history_search: FTS5 전문 검색 (prompt/response). 검색어는 단어별 접두어
+  일치로 처리하여 "코드"로 "코드를"도 찾는다. SQLite에 FTS5가 없으면 LIKE로 대체한다.
+
+멀티 워커 모드에서도 WAL 모드로 같은 파일을 공유한다. 다른 워커가 쓰는 동안에는
+잠금을 기다릴 수 있으므로(busy timeout 5초), 이벤트 루프에서는 defer()로 전용
+스레드에 넘겨 순서대로 실행한다.
+"""
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HISTORY_PATH = Path(__file__).parent / "history.db"
+PAGE_SIZE = 30  # 기본 페이지 크기
+MAX_PAGE_SIZE = 200
+
+_COLUMNS = ("id", "message_id", "channel", "prompt", "response", "status", "created_at", "completed_at")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    message_id   TEXT NOT NULL UNIQUE,
+    token_id     TEXT NOT NULL,
+    channel      TEXT NOT NULL,
+    prompt       TEXT NOT NULL,
+    response     TEXT,
+    status       TEXT NOT NULL DEFAULT 'pending',
+    created_at   REAL NOT NULL,
+    completed_at REAL
+);
+CREATE INDEX IF NOT EXISTS history_token ON history (token_id, id);
+"""
+
+# history 테이블을 원본으로 하는 external content FTS5 인덱스 — 트리거로 동기화
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS history_fts USING fts5(
+    prompt, response, content='history', content_rowid='id', tokenize='unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS history_ai AFTER INSERT ON history BEGIN
+    INSERT INTO history_fts (rowid, prompt, response) VALUES (new.id, new.prompt, new.response);
+END;
+CREATE TRIGGER IF NOT EXISTS history_ad AFTER DELETE ON history BEGIN
+    INSERT INTO history_fts (history_fts, rowid, prompt, response)
+    VALUES ('delete', old.id, old.prompt, old.response);
+END;
+CREATE TRIGGER IF NOT EXISTS history_au AFTER UPDATE ON history BEGIN
+    INSERT INTO history_fts (history_fts, rowid, prompt, response)
+    VALUES ('delete', old.id, old.prompt, old.response);
+    INSERT INTO history_fts (rowid, prompt, response) VALUES (new.id, new.prompt, new.response);
+END;
+"""
+
+
+class HistoryStore:
+    """토큰별 대화 기록 저장 및 페이지/검색 조회"""
+
+    def __init__(self, db_path: Path | str = DEFAULT_HISTORY_PATH) -> None:
+        """기록 DB에 연결하고 스키마를 만든다.
+
+        Args:
+            db_path: SQLite 파일 경로.
+        """
+        # 호출 스레드와 defer() 전용 스레드가 함께 쓰므로 defer 쪽은 잠금으로 직렬화
+        self._conn = sqlite3.connect(str(db_path), timeout=5.0, isolation_level=None, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        try:
+            self._conn.executescript(_FTS_SCHEMA)
+            self.fts = True
+        except sqlite3.OperationalError as e:
+            logger.warning("FTS5 사용 불가 — LIKE 검색으로 대체: %s", e)
+            self.fts = False
+        self._lock = threading.Lock()
+        self._worker: ThreadPoolExecutor | None = None
+
+    def close(self) -> None:
+        """미처리 defer 호출을 마친 뒤 연결을 닫는다."""
+        if self._worker is not None:
+            self._worker.shutdown(wait=True)
+        self._conn.close()
+
+    def defer(self, method: str, *args) -> asyncio.Future:
+        """기록·조회 메서드를 전용 스레드에서 호출 순서대로 실행한다.
+
+        이벤트 루프를 막지 않으며, 조회도 같은 스레드로 넘기므로 앞서 넘긴 기록이
+        반영된 결과를 받는다. 예외(sqlite3.Error 등)는 반환한 Future로 전달된다.
+
+        Args:
+            method: 메서드 이름 (record_prompt, page, search 등).
+            *args: 메서드 인자.
+        """
+        if self._worker is None:
+            self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="history")
+        call = getattr(self, method)
+
+        def _run():
+            with self._lock:
+                return call(*args)
+
+        return asyncio.get_running_loop().run_in_executor(self._worker, _run)
+
+    # ------------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------------
+
+    def record_prompt(
+        self,
+        message_id: str,
+        token_id: str,
+        prompt: str,
+        channel: str = "0",
+        created_at: float | None = None,
+    ) -> None:
+        """프롬프트를 응답 대기(pending) 상태로 기록한다."""
+        self._conn.execute(
+            "INSERT OR IGNORE INTO history (message_id, token_id, channel, prompt, created_at)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (message_id, token_id, channel, prompt, time.time() if created_at is None else created_at),
+        )
+
+    def record_response(self, message_id: str, response: str) -> None:
+        """Kiro 응답을 기록한다."""
+        self._conn.execute(
+            "UPDATE history SET response = ?, status = 'done', completed_at = ? WHERE message_id = ?",
+            (response, time.time(), message_id),
+        )
+
+    def record_error(self, message_id: str, error: str) -> None:
+        """응답 실패(타임아웃 등)를 기록한다."""
+        self._conn.execute(
+            "UPDATE history SET response = ?, status = 'error', completed_at = ? WHERE message_id = ?",
+            (error, time.time(), message_id),
+        )
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def page(self, token_id: str, before: int | None = None, limit: int = PAGE_SIZE) -> tuple[list[dict], int | None]:
+        """최신순으로 한 페이지를 조회한다.
+
+        Args:
+            token_id: 기록 소유 토큰.
+            before: 이전 페이지의 next_cursor (이 id보다 오래된 기록). None이면 최신부터.
+            limit: 페이지 크기 (MAX_PAGE_SIZE 이하로 제한).
+
+        Returns:
+            (기록 목록, 다음 페이지 커서 — 더 없으면 None)
+        """
+        limit = _clamp(limit)
+        rows = self._conn.execute(
+            f"SELECT {_select()} FROM history WHERE token_id = ? AND id < ? ORDER BY id DESC LIMIT ?",
+            (token_id, _cursor(before), limit + 1),
+        ).fetchall()
+        return _paginate(rows, limit)
+
+    def search(
+        self, token_id: str, query: str, before: int | None = None, limit: int = PAGE_SIZE
+    ) -> tuple[list[dict], int | None]:
+        """prompt/response 전문 검색 (최신순, 커서 페이지).
+
+        검색어의 단어를 모두 포함하는(AND) 기록을 찾으며, 결과에는 일치 부분을
+        [ ]로 표시한 snippet이 포함된다.
+        """
+        terms = query.split()
+        if not terms:
+            return [], None
+        limit = _clamp(limit)
+        if self.fts:
+            match = " ".join('"' + term.replace('"', '""') + '"*' for term in terms)
+            rows = self._conn.execute(
+                f"SELECT {_select('h.')}, snippet(history_fts, -1, '[', ']', '…', 12) AS snippet"
+                " FROM history_fts JOIN history h ON h.id = history_fts.rowid"
+                " WHERE history_fts MATCH ? AND h.token_id = ? AND h.id < ?"
+                " ORDER BY h.id DESC LIMIT ?",
+                (match, token_id, _cursor(before), limit + 1),
+            ).fetchall()
+        else:
+            clauses = " AND ".join("(prompt LIKE ? ESCAPE '\\' OR response LIKE ? ESCAPE '\\')" for _ in terms)
+            params: list = []
+            for term in terms:
+                pattern = "%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+                params += [pattern, pattern]
+            rows = self._conn.execute(
+                f"SELECT {_select()} FROM history WHERE token_id = ? AND id < ? AND {clauses}"
+                " ORDER BY id DESC LIMIT ?",
+                (token_id, _cursor(before), *params, limit + 1),
+            ).fetchall()
+        return _paginate(rows, limit)
+
+
+def _select(prefix: str = "") -> str:
+    return ", ".join(prefix + column for column in _COLUMNS)
+
+
+def _clamp(limit: int) -> int:
+    return max(1, min(int(limit), MAX_PAGE_SIZE))
+
+
+def _cursor(before: int | None) -> int:
+    # 커서가 없으면 가장 최신부터 — AUTOINCREMENT id는 항상 이보다 작다
+    return int(before) if before is not None else 2**63 - 1
+
+
+def _paginate(rows: list[sqlite3.Row], limit: int) -> tuple[list[dict], int | None]:
+    items = [dict(row) for row in rows[:limit]]
+    next_cursor = items[-1]["id"] if len(rows) > limit else None
+    return items, next_cursor
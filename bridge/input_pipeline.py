@@ -0,0 +1,241 @@
+"""Kiro 입력 파이프라인 구성 요소
+
+KiroAutomation.send_message는 창 확인 → 활성화 → 복사 → 붙여넣기 → 대기 → Enter
+단계로 실행된다. 고정 sleep(활성화 0.5초, 붙여넣기 후 0.3초, 매 호출 PAUSE 0.3초)
+대신 이 모듈의 도구를 쓴다.
+
+- GuiBackend: 창/클립보드/키 입력/시간 함수를 한 객체로 묶는다. 기본은
+  pyautogui/pyperclip(PyAutoGuiBackend)이고, FakeBackend로 바꾸면 디스플레이 없는
+  Linux에서도 파이프라인을 실행·측정할 수 있다.
+- AdaptiveDelay: 단계 사이 대기 시간을 전송 결과로 학습한다. 연속 성공하면 줄이고,
+  실패하면 늘리며, 실패했던 값 근처 아래로는 다시 내려가지 않는다.
+- StepTimings: 단계별 소요 시간을 최근 WINDOW개 보관하여 p50/p95를 보고한다.
+"""
+
+import contextlib
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Protocol
+
+from bridge.gui import pyautogui, pyperclip
+
+logger = logging.getLogger(__name__)
+
+WINDOW = 50  # 보관할 최근 표본 수
+SHRINK_AFTER = 5  # 이 횟수만큼 연속 성공하면 대기 시간을 줄인다
+SHRINK_FACTOR = 0.8
+GROW_FACTOR = 2.0
+SAFETY_MARGIN = 1.25  # 실패했던 대기 시간 대비 최소 여유
+
+
+class GuiBackend(Protocol):
+    """입력 파이프라인이 사용하는 GUI 조작"""
+
+    def find_window(self, title: str) -> Any | None: ...
+
+    def active_title(self) -> str: ...
+
+    def copy(self, text: str) -> None: ...
+
+    def hotkey(self, *keys: str) -> None: ...
+
+    def press(self, key: str) -> None: ...
+
+    def sleep(self, seconds: float) -> None: ...
+
+    def now(self) -> float: ...
+
+
+class PyAutoGuiBackend:
+    """pyautogui/pyperclip 기반 실제 백엔드
+
+    키 입력마다 붙는 pyautogui.PAUSE는 파이프라인이 필요한 대기만 직접 하므로
+    키 입력 동안 0으로 둔다 (다른 모듈의 설정은 그대로).
+    """
+
+    def find_window(self, title: str) -> Any | None:
+        windows = pyautogui.getWindowsWithTitle(title)
+        return windows[0] if windows else None
+
+    def active_title(self) -> str:
+        return pyautogui.getActiveWindowTitle() or ""
+
+    def copy(self, text: str) -> None:
+        pyperclip.copy(text)
+
+    def hotkey(self, *keys: str) -> None:
+        with self._unpaused():
+            pyautogui.hotkey(*keys)
+
+    def press(self, key: str) -> None:
+        with self._unpaused():
+            pyautogui.press(key)
+
+    def sleep(self, seconds: float) -> None:
+        time.sleep(seconds)
+
+    def now(self) -> float:
+        return time.perf_counter()
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _unpaused() -> Iterator[None]:
+        previous = pyautogui.PAUSE
+        pyautogui.PAUSE = 0
+        try:
+            yield
+        finally:
+            pyautogui.PAUSE = previous
+
+
+@dataclass
+class FakeWindow:
+    """FakeBackend의 창"""
+    title: str
+    backend: "FakeBackend"
+    isMinimized: bool = False
+
+    @property
+    def isActive(self) -> bool:
+        return self.backend.now() >= self.backend.active_at and self.backend.focused == self.title
+
+    def restore(self) -> None:
+        self.isMinimized = False
+
+    def activate(self) -> None:
+        self.backend.focused = self.title
+        self.backend.active_at = self.backend.now() + self.backend.activation_latency
+
+
+class FakeBackend:
+    """가상 시간으로 동작하는 GUI 백엔드 (측정·테스트용)
+
+    - activation_latency: activate() 후 창이 실제로 활성화되기까지 걸리는 시간.
+    - paste_latency: 붙여넣기가 입력란에 반영되기까지 걸리는 시간. 그 전에
+      Enter가 눌리면 빈 입력이 전송된 것으로 보고 전송 실패로 기록한다.
+    - key_cost: 키 입력/복사 한 번의 비용.
+    sleep은 실제로 기다리지 않고 가상 시계만 진행한다.
+    """
+
+    def __init__(
+        self,
+        title: str = "Kiro",
+        activation_latency: float = 0.05,
+        paste_latency: float = 0.04,
+        key_cost: float = 0.005,
+    ) -> None:
+        self.activation_latency = activation_latency
+        self.paste_latency = paste_latency
+        self.key_cost = key_cost
+        self.clock = 0.0
+        self.focused = ""
+        self.active_at = 0.0
+        self.window = FakeWindow(title, self)
+        self.clipboard = ""
+        self.sent: list[str] = []
+        self.lost: list[str] = []
+        self._pasted_at: float | None = None
+
+    def find_window(self, title: str) -> FakeWindow | None:
+        return self.window if title in self.window.title else None
+
+    def active_title(self) -> str:
+        return self.focused if self.now() >= self.active_at else ""
+
+    def copy(self, text: str) -> None:
+        self.clock += self.key_cost
+        self.clipboard = text
+
+    def hotkey(self, *keys: str) -> None:
+        self.clock += self.key_cost
+        if keys == ("ctrl", "v"):
+            self._pasted_at = self.clock
+
+    def press(self, key: str) -> None:
+        self.clock += self.key_cost
+        if key != "enter" or self._pasted_at is None:
+            return
+        landed = self.window.isActive and self.clock - self._pasted_at >= self.paste_latency
+        (self.sent if landed else self.lost).append(self.clipboard)
+        self._pasted_at = None
+
+    def sleep(self, seconds: float) -> None:
+        self.clock += max(0.0, seconds)
+
+    def now(self) -> float:
+        return self.clock
+
+
+class AdaptiveDelay:
+    """전송 결과로 학습하는 단계 사이 대기 시간"""
+
+    def __init__(self, initial: float, floor: float, ceiling: float) -> None:
+        """
+        Args:
+            initial: 시작 값 (초). 기존 고정 sleep 값을 쓴다.
+            floor: 학습으로 내려갈 수 있는 최솟값.
+            ceiling: 실패로 늘어날 수 있는 최댓값.
+        """
+        self.value = initial
+        self._floor = floor
+        self._ceiling = ceiling
+        self._safe_floor = floor  # 실패했던 값 × SAFETY_MARGIN
+        self._streak = 0
+        self._outcomes: deque[bool] = deque(maxlen=WINDOW)
+
+    @property
+    def success_rate(self) -> float | None:
+        if not self._outcomes:
+            return None
+        return sum(self._outcomes) / len(self._outcomes)
+
+    def record(self, ok: bool) -> None:
+        """현재 값으로 실행한 결과를 기록하고 값을 조정한다."""
+        self._outcomes.append(ok)
+        if ok:
+            self._streak += 1
+            if self._streak >= SHRINK_AFTER:
+                self._streak = 0
+                self.value = max(self._safe_floor, self.value * SHRINK_FACTOR)
+            return
+        self._streak = 0
+        self._safe_floor = min(self._ceiling, max(self._safe_floor, self.value * SAFETY_MARGIN))
+        self.value = min(self._ceiling, max(self._safe_floor, self.value * GROW_FACTOR))
+
+    def summary(self) -> dict:
+        rate = self.success_rate
+        return {
+            "delay_ms": round(self.value * 1000, 1),
+            "success_rate": round(rate, 3) if rate is not None else None,
+        }
+
+
+@dataclass
+class StepTimings:
+    """단계별 소요 시간 (최근 WINDOW개)"""
+    samples: dict[str, deque[float]] = field(default_factory=dict)
+
+    @contextlib.contextmanager
+    def step(self, name: str, backend: GuiBackend) -> Iterator[None]:
+        started = backend.now()
+        try:
+            yield
+        finally:
+            self.add(name, backend.now() - started)
+
+    def add(self, name: str, seconds: float) -> None:
+        self.samples.setdefault(name, deque(maxlen=WINDOW)).append(seconds)
+
+    def summary(self) -> dict:
+        """{단계: {"count", "p50_ms", "p95_ms"}}"""
+        result = {}
+        for name, values in self.samples.items():
+            ordered = sorted(values)
+            result[name] = {
+                "count": len(ordered),
+                "p50_ms": round(ordered[len(ordered) // 2] * 1000, 1),
+                "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 1),
+            }
+        return result
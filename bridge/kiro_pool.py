@@ -0,0 +1,300 @@
+"""Kiro 워커 풀 모듈
+
+여러 Kiro IDE 인스턴스(워커)를 각자의 inbox/outbox 디렉토리로 운영하여
+프롬프트를 동시에 처리한다.
+
+- 라우팅 정책:
+  - "least_loaded": 처리 중인 요청이 가장 적은 정상 워커.
+  - "sticky": 같은 대화(세션/채널)는 같은 워커로 — Kiro 쪽 대화 맥락 유지.
+    고정된 워커가 비정상이면 least_loaded로 다시 고정한다.
+- 상태 확인: 연속 타임아웃이 MAX_FAILURES 이상이거나, heartbeat를 켠 워커의
+  heartbeat 파일(watcher가 갱신)이 없거나 HEARTBEAT_STALE보다 오래되면 비정상.
+  워커마다 watcher를 하나씩 실행한다 (python -m bridge.watcher --worker kiro-1).
+  비정상 워커는 RETRY_AFTER 후 한 건씩 다시 시도한다.
+- 페일오버: 응답 대기 중 워커가 비정상이 되면, 아직 응답이 없는 프롬프트를
+  정상 워커의 inbox로 옮겨 이어서 기다린다.
+
+설정 (config.json):
+    "kiro_workers": [
+        {"name": "kiro-1", "dir": "kiro1", "heartbeat": true},
+        {"name": "kiro-2", "dir": "kiro2", "heartbeat": true}
+    ],
+    "kiro_policy": "sticky"
+
+kiro_workers가 없으면 기존 bridge/inbox, bridge/outbox를 쓰는 워커 하나로 동작한다.
+heartbeat는 기본으로 켜져 있어(watcher가 갱신) Kiro 중단을 타임아웃 전에 감지한다.
+"kiro_heartbeat": false(전체) 또는 워커별 "heartbeat": false로 끌 수 있다.
+
+상태 판정(RETRY_AFTER, HEARTBEAT_STALE)과 응답 대기는 모두 풀의 Clock으로 한다.
+BridgeServer는 자신의 시계를 use_clock으로 넘기므로, VirtualClock에서는 heartbeat
+파일의 mtime도 가상 시각(clock.time())으로 맞춰야 한다.
+"""
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+
+from bridge import file_io
+from bridge.clock import REAL_CLOCK, Clock
+
+logger = logging.getLogger(__name__)
+
+POLICIES = ("least_loaded", "sticky")
+MAX_FAILURES = 2  # 연속 타임아웃 횟수 — 이상이면 비정상
+RETRY_AFTER = 60.0  # 비정상 워커를 다시 시도하기까지 대기 (초)
+HEARTBEAT_STALE = 30.0  # heartbeat 파일이 이보다 오래되면 비정상 (초)
+POLL_INTERVAL = 1.0  # outbox 확인 간격 (초)
+
+
+class KiroUnavailable(Exception):
+    """정상 상태의 Kiro 워커가 하나도 없음"""
+
+
+class KiroWorker:
+    """Kiro IDE 인스턴스 하나 — 자신의 inbox/outbox와 상태"""
+
+    def __init__(
+        self, name: str, base_dir: Path | None = None, heartbeat: bool = False, clock: Clock | None = None
+    ) -> None:
+        """
+        Args:
+            name: 워커 이름 (로그/상태 표시용).
+            base_dir: inbox/, outbox/, heartbeat가 있는 디렉토리.
+                None이면 기본 bridge/inbox, bridge/outbox를 사용한다.
+            heartbeat: True이면 heartbeat 파일 갱신 여부로 상태를 확인한다.
+                파일이 없으면(watcher 미실행) 비정상으로 본다.
+            clock: 실패 시각·heartbeat 경과 판정에 쓸 시계. None이면 실제 시계.
+        """
+        self.name = name
+        self.base_dir = base_dir
+        self.heartbeat = heartbeat
+        self.clock = clock or REAL_CLOCK
+        self.in_flight = 0
+        self.failures = 0
+        self._failed_at = 0.0
+
+    @property
+    def inbox_dir(self) -> Path:
+        return self.base_dir / "inbox" if self.base_dir is not None else file_io.INBOX_DIR
+
+    @property
+    def outbox_dir(self) -> Path:
+        return self.base_dir / "outbox" if self.base_dir is not None else file_io.OUTBOX_DIR
+
+    @property
+    def heartbeat_path(self) -> Path:
+        return self.inbox_dir.parent / "heartbeat"
+
+    def healthy(self, now: float | None = None) -> bool:
+        """워커가 요청을 받을 수 있는 상태인지 확인한다."""
+        now = self.clock.time() if now is None else now
+        if self.failures >= MAX_FAILURES and now - self._failed_at < RETRY_AFTER:
+            return False
+        if not self.heartbeat:
+            return True
+        try:
+            beat = self.heartbeat_path.stat().st_mtime
+        except FileNotFoundError:
+            return False  # watcher가 실행되지 않음 — 프롬프트를 읽을 주체가 없다
+        return now - beat < HEARTBEAT_STALE
+
+    def record_success(self) -> None:
+        self.failures = 0
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._failed_at = self.clock.time()
+
+    def write(self, message_id: str, content: str, namespace: str = "") -> None:
+        file_io.write_message(message_id, content, namespace, self.inbox_dir, self.outbox_dir)
+
+    def read(self, message_id: str, namespace: str = "") -> str | None:
+        return file_io.read_response(message_id, namespace, self.outbox_dir)
+
+    def cleanup(self, message_id: str, namespace: str = "") -> None:
+        file_io.cleanup_inbox(message_id, namespace, self.inbox_dir)
+
+    def summary(self) -> dict:
+        return {"in_flight": self.in_flight, "failures": self.failures, "healthy": self.healthy()}
+
+
+@dataclass
+class _Assignment:
+    worker: KiroWorker
+    content: str
+    namespace: str
+
+
+class KiroPool:
+    """Kiro 워커 선택, 요청 배정, 응답 대기 및 페일오버"""
+
+    def __init__(
+        self, workers: list[KiroWorker], policy: str = "least_loaded", clock: Clock | None = None
+    ) -> None:
+        """
+        Args:
+            workers: Kiro 워커 목록.
+            policy: 라우팅 정책 (POLICIES).
+            clock: 상태 판정·응답 대기에 쓸 시계. 주어지면 모든 워커에도 적용한다.
+
+        Raises:
+            ValueError: 워커가 없거나 알 수 없는 정책.
+        """
+        if not workers:
+            raise ValueError("Kiro 워커가 하나 이상 필요합니다")
+        if policy not in POLICIES:
+            raise ValueError(f"알 수 없는 라우팅 정책: {policy}")
+        self.policy = policy
+        self._workers = {worker.name: worker for worker in workers}
+        self._affinity: dict[str, str] = {}
+        self._assignments: dict[str, _Assignment] = {}
+        self._rotation = 0
+        self.clock: Clock = REAL_CLOCK
+        if clock is not None:
+            self.use_clock(clock)
+
+    def use_clock(self, clock: Clock) -> None:
+        """풀과 모든 워커가 쓸 시계를 바꾼다 (BridgeServer가 자신의 시계를 넘긴다)."""
+        self.clock = clock
+        for worker in self._workers.values():
+            worker.clock = clock
+
+    @classmethod
+    def from_config(cls, config: dict, base_dir: Path = file_io.BASE_DIR) -> "KiroPool":
+        """config.json의 kiro_workers/kiro_policy/kiro_heartbeat로 풀을 만든다."""
+        entries = config.get("kiro_workers") or []
+        heartbeat = config.get("kiro_heartbeat", True)
+        workers = [
+            KiroWorker(
+                entry["name"],
+                base_dir / entry.get("dir", entry["name"]),
+                heartbeat=entry.get("heartbeat", heartbeat),
+            )
+            for entry in entries
+        ] or [KiroWorker("default", heartbeat=heartbeat)]
+        return cls(workers, config.get("kiro_policy", "least_loaded"))
+
+    def workers(self) -> list[KiroWorker]:
+        return list(self._workers.values())
+
+    def worker_of(self, message_id: str) -> str | None:
+        """요청이 배정된 워커 이름."""
+        assignment = self._assignments.get(message_id)
+        return assignment.worker.name if assignment is not None else None
+
+    def select(self, conversation: str = "", exclude: KiroWorker | None = None) -> KiroWorker:
+        """정책에 따라 워커를 고른다.
+
+        Raises:
+            KiroUnavailable: 정상 워커가 없는 경우.
+        """
+        now = self.clock.time()
+        candidates = [w for w in self._workers.values() if w is not exclude and w.healthy(now)]
+        if not candidates:
+            raise KiroUnavailable("사용 가능한 Kiro 워커가 없습니다")
+
+        if self.policy == "sticky" and conversation:
+            pinned = self._workers.get(self._affinity.get(conversation, ""))
+            if pinned in candidates:
+                return pinned
+
+        # 처리 중 요청이 가장 적은 워커 — 동률이면 돌아가며 배정
+        self._rotation += 1
+        offset = self._rotation % len(candidates)
+        rotated = candidates[offset:] + candidates[:offset]
+        worker = min(rotated, key=lambda w: w.in_flight)
+        if self.policy == "sticky" and conversation:
+            self._affinity[conversation] = worker.name
+        return worker
+
+    def submit(self, message_id: str, content: str, namespace: str = "", conversation: str = "") -> KiroWorker:
+        """워커를 골라 inbox에 프롬프트를 쓴다.
+
+        Raises:
+            KiroUnavailable: 정상 워커가 없는 경우.
+            OSError: 파일 작성 실패.
+        """
+        worker = self.select(conversation)
+        worker.write(message_id, content, namespace)
+        self._assign(message_id, worker, content, namespace)
+        return worker
+
+    def attach(self, message_id: str, worker_name: str, content: str, namespace: str = "") -> None:
+        """이미 inbox에 쓰인 요청을 워커에 다시 연결한다 (핸드오프 인수용).
+
+        워커 이름을 모르면 첫 번째 워커로 연결한다.
+        """
+        worker = self._workers.get(worker_name) or next(iter(self._workers.values()))
+        self._assign(message_id, worker, content, namespace)
+
+    async def wait(self, message_id: str, timeout: float) -> str:
+        """배정된 워커의 outbox에서 응답을 기다린다.
+
+        대기 중 워커가 비정상이 되면 다른 정상 워커로 프롬프트를 옮긴다.
+        폴링 간격과 타임아웃은 풀의 시계로 잰다.
+
+        Args:
+            message_id: 배정된 요청 ID.
+            timeout: 최대 대기 시간 (초).
+
+        Raises:
+            KeyError: 배정되지 않은 요청.
+            TimeoutError: 시간 내 응답 없음 (배정 워커의 실패로 기록).
+        """
+        clock = self.clock
+        assignment = self._assignments[message_id]
+        start = clock.monotonic()
+        while True:
+            worker = assignment.worker
+            content = worker.read(message_id, assignment.namespace)
+            if content is not None:
+                worker.record_success()
+                logger.info("응답 수신: %s ← %s (%.1f초)", message_id, worker.name, clock.monotonic() - start)
+                return content
+            if clock.monotonic() - start >= timeout:
+                worker.record_failure()
+                raise TimeoutError(f"응답 대기 시간 초과 ({timeout}초)")
+            if not worker.healthy():
+                self._failover(message_id, assignment)
+            await clock.sleep(POLL_INTERVAL)
+
+    def release(self, message_id: str) -> None:
+        """요청 배정을 해제하고 inbox 파일을 정리한다."""
+        assignment = self._assignments.pop(message_id, None)
+        if assignment is None:
+            return
+        assignment.worker.in_flight -= 1
+        assignment.worker.cleanup(message_id, assignment.namespace)
+
+    def detach(self, message_id: str) -> None:
+        """inbox 파일은 남기고 배정만 해제한다 (드레인 시 새 프로세스가 이어받음)."""
+        assignment = self._assignments.pop(message_id, None)
+        if assignment is not None:
+            assignment.worker.in_flight -= 1
+
+    def running(self) -> bool:
+        """정상 워커가 하나라도 있는지 (상태 보고의 kiro_running)."""
+        now = self.clock.time()
+        return any(worker.healthy(now) for worker in self._workers.values())
+
+    def summary(self) -> dict:
+        """워커별 상태 (상태 보고용)."""
+        return {name: worker.summary() for name, worker in self._workers.items()}
+
+    def _assign(self, message_id: str, worker: KiroWorker, content: str, namespace: str) -> None:
+        worker.in_flight += 1
+        self._assignments[message_id] = _Assignment(worker, content, namespace)
+
+    def _failover(self, message_id: str, assignment: _Assignment) -> None:
+        dead = assignment.worker
+        try:
+            target = self.select(exclude=dead)
+        except KiroUnavailable:
+            return  # 옮길 곳이 없으면 원래 워커에서 계속 기다린다
+        target.write(message_id, assignment.content, assignment.namespace)
+        dead.cleanup(message_id, assignment.namespace)
+        dead.in_flight -= 1
+        target.in_flight += 1
+        assignment.worker = target
+        logger.warning("페일오버: %s %s → %s", message_id, dead.name, target.name)
+        print(f"[Bridge] Kiro 워커 {dead.name} 비정상 — {message_id}를 {target.name}로 이동")
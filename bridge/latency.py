@@ -0,0 +1,95 @@
+"""Kiro 응답 지연 통계 및 적응형 타임아웃 모듈
+
+프롬프트를 종류(text/code)와 크기 구간으로 분류하여 최근 응답 시간을 보관하고,
+이를 바탕으로 요청별 예상 완료 시간(eta)과 대기 마감 시간(deadline)을 계산한다.
+
+- 표본이 부족한 구간은 전체 표본, 그래도 부족하면 기본 타임아웃을 사용한다.
+- deadline = p95 × DEADLINE_FACTOR, [MIN_TIMEOUT, MAX_TIMEOUT]로 제한.
+- 타임아웃된 요청은 마감 시간의 1.5배를 표본으로 기록하여, 긴 생성이
+  반복해서 잘리지 않도록 다음 deadline을 늘린다.
+"""
+
+import statistics
+from collections import deque
+
+SIZE_BUCKETS = (256, 1024, 4096)  # 프롬프트 길이 구간 경계 (문자 수)
+WINDOW = 50  # 구간별 보관 표본 수
+MIN_SAMPLES = 5  # 통계를 신뢰하기 위한 최소 표본 수
+DEADLINE_FACTOR = 2.0
+MIN_TIMEOUT = 60.0
+MAX_TIMEOUT = 900.0
+
+
+def classify(content: str) -> tuple[str, int]:
+    """프롬프트를 (종류, 크기 구간)으로 분류한다.
+
+    Returns:
+        ("code" | "text", 구간 번호 0..len(SIZE_BUCKETS)).
+    """
+    kind = "code" if "```" in content or content.count("\n") >= 10 else "text"
+    size = len(content)
+    bucket = sum(1 for edge in SIZE_BUCKETS if size >= edge)
+    return kind, bucket
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(int(round(pct * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+class LatencyTracker:
+    """프롬프트 분류별 응답 시간 롤링 통계"""
+
+    def __init__(self, default_timeout: float) -> None:
+        """
+        Args:
+            default_timeout: 표본이 부족할 때 사용할 타임아웃 (초).
+        """
+        self._default_timeout = default_timeout
+        self._buckets: dict[tuple[str, int], deque[float]] = {}
+        self._all: deque[float] = deque(maxlen=WINDOW * 4)
+
+    def record(self, content: str, elapsed: float) -> None:
+        """응답 완료까지 걸린 시간을 기록한다."""
+        key = classify(content)
+        self._buckets.setdefault(key, deque(maxlen=WINDOW)).append(elapsed)
+        self._all.append(elapsed)
+
+    def record_timeout(self, content: str, deadline: float) -> None:
+        """타임아웃된 요청을 마감 시간보다 긴 표본으로 기록한다."""
+        self.record(content, min(deadline * 1.5, MAX_TIMEOUT))
+
+    def _samples(self, content: str) -> list[float] | None:
+        bucket = self._buckets.get(classify(content))
+        if bucket is not None and len(bucket) >= MIN_SAMPLES:
+            return list(bucket)
+        if len(self._all) >= MIN_SAMPLES:
+            return list(self._all)
+        return None
+
+    def estimate(self, content: str) -> float | None:
+        """예상 완료 시간(중앙값, 초). 표본이 부족하면 None."""
+        samples = self._samples(content)
+        if samples is None:
+            return None
+        return statistics.median(samples)
+
+    def deadline(self, content: str) -> float:
+        """요청별 대기 마감 시간(초)."""
+        samples = self._samples(content)
+        if samples is None:
+            return self._default_timeout
+        deadline = _percentile(samples, 0.95) * DEADLINE_FACTOR
+        return min(max(deadline, MIN_TIMEOUT), MAX_TIMEOUT)
+
+    def summary(self) -> dict:
+        """구간별 표본 수와 중앙값 (상태 보고용)."""
+        return {
+            f"{kind}/{bucket}": {
+                "samples": len(samples),
+                "median": round(statistics.median(samples), 2),
+            }
+            for (kind, bucket), samples in sorted(self._buckets.items())
+            if samples
+        }
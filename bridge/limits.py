@@ -0,0 +1,184 @@
+"""연결별 메모리 계정과 상한 모듈
+
+클라이언트 하나가 Bridge에 쌓아 둘 수 있는 데이터를 제한하여, 폭주하는
+클라이언트 하나가 집 PC를 스왑으로 밀어내지 못하게 한다.
+
+연결별로 세는 것:
+- inbound: 처리 중인 수신 프레임 바이트. websockets 내부 수신 대기열은
+  max_queue × max_frame으로 제한된다 (넘으면 TCP 수신을 멈춰 백프레셔).
+- outbound: send에 넘겼지만 아직 끝나지 않은 바이트 + 전송 버퍼 바이트.
+  느린 클라이언트는 send가 drain을 기다리며 여기에 쌓인다.
+- pending: 채널 대기열·Kiro 응답 대기·보관(parked) 중인 프롬프트 바이트.
+
+상한 (config.json "limits"):
+    "limits": {"max_frame": 1048576, "max_queue": 16, "max_outbound": 4194304,
+               "max_pending": 1048576, "budget": 268435456}
+
+- max_pending을 넘는 새 프롬프트는 ERROR로 거절한다 (백프레셔 — 응답을 받은 뒤 다시 보냄).
+- max_outbound를 넘는 연결은 close code 1013(Try Again Later)으로 끊는다.
+- 프로세스 전체(budget)를 넘으면 새 프롬프트를 거절하고, 전송 버퍼가 가장 큰
+  연결부터 끊는다.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+MAX_FRAME = 1 << 20  # 수신 프레임 최대 크기 (websockets max_size)
+MAX_QUEUE = 16  # 수신 대기열 프레임 수 (websockets max_queue)
+MAX_OUTBOUND = 4 << 20  # 연결당 전송 대기 바이트 상한
+MAX_PENDING = 1 << 20  # 연결당 처리 대기 프롬프트 바이트 상한
+BUDGET = 256 << 20  # 프로세스 전체 상한
+SHED_CLOSE_CODE = 1013  # Try Again Later
+
+
+def payload_size(text: str) -> int:
+    """프롬프트/응답 텍스트의 바이트 크기 (UTF-8)."""
+    return len(text.encode("utf-8")) if text else 0
+
+
+@dataclass
+class MemoryLimits:
+    """메모리 상한 설정 (바이트)"""
+    max_frame: int = MAX_FRAME
+    max_queue: int = MAX_QUEUE
+    max_outbound: int = MAX_OUTBOUND
+    max_pending: int = MAX_PENDING
+    budget: int = BUDGET
+
+    @classmethod
+    def from_config(cls, config: dict) -> "MemoryLimits":
+        """config.json의 limits 항목으로 상한을 만든다 (없는 항목은 기본값)."""
+        section = config.get("limits", {})
+        return cls(**{name: int(section[name]) for name in cls.__dataclass_fields__ if name in section})
+
+    def serve_options(self) -> dict:
+        """websockets.serve에 넘길 수신 제한."""
+        return {"max_size": self.max_frame, "max_queue": self.max_queue}
+
+
+class ByteTally:
+    """client_id별 바이트 합계와 전체 합계를 함께 유지하는 카운터
+
+    항목을 넣고 뺄 때 크기를 더하고 빼므로, 조회할 때 대기열을 다시 훑거나
+    텍스트를 다시 인코딩하지 않는다.
+    """
+
+    def __init__(self) -> None:
+        self.total = 0
+        self._by_client: dict[str, int] = {}
+
+    def add(self, client_id: str, size: int) -> None:
+        self.total += size
+        self._by_client[client_id] = self._by_client.get(client_id, 0) + size
+
+    def remove(self, client_id: str, size: int) -> None:
+        self.total -= size
+        left = self._by_client.get(client_id, 0) - size
+        if left > 0:
+            self._by_client[client_id] = left
+        else:
+            self._by_client.pop(client_id, None)
+
+    def of(self, client_id: str) -> int:
+        return self._by_client.get(client_id, 0)
+
+    def clear(self) -> None:
+        self.total = 0
+        self._by_client.clear()
+
+
+@dataclass
+class ConnectionUsage:
+    """연결 하나의 버퍼 사용량 (바이트)"""
+    inbound: int = 0
+    outbound: int = 0  # send 진행 중인 바이트 (전송 버퍼는 transport에서 따로 조회)
+
+
+class MemoryAccountant:
+    """연결별 inbound/outbound 계정과 상한 초과 연결 끊기"""
+
+    def __init__(self, limits: MemoryLimits | None = None) -> None:
+        self.limits = limits or MemoryLimits()
+        self.shed = 0  # 상한 초과로 끊은 연결 수
+        self._usage: dict[Any, ConnectionUsage] = {}
+        self._buffered = 0  # 모든 연결의 inbound + outbound
+        self._closing: set[asyncio.Task] = set()
+
+    def open(self, websocket: Any) -> None:
+        self._usage.setdefault(websocket, ConnectionUsage())
+
+    def close(self, websocket: Any) -> None:
+        usage = self._usage.pop(websocket, None)
+        if usage is not None:
+            self._buffered -= usage.inbound + usage.outbound
+
+    def usage(self, websocket: Any) -> ConnectionUsage | None:
+        return self._usage.get(websocket)
+
+    @property
+    def buffered(self) -> int:
+        """모든 연결의 inbound + outbound 합계."""
+        return self._buffered
+
+    def add_inbound(self, websocket: Any, size: int) -> None:
+        usage = self._usage.get(websocket)
+        if usage is not None:
+            usage.inbound += size
+            self._buffered += size
+
+    def add_outbound(self, websocket: Any, size: int) -> None:
+        usage = self._usage.get(websocket)
+        if usage is not None:
+            usage.outbound += size
+            self._buffered += size
+
+    @staticmethod
+    def transport_buffer(websocket: Any) -> int:
+        """커널에 넘기지 못하고 transport에 남은 전송 바이트."""
+        transport = getattr(websocket, "transport", None)
+        try:
+            return transport.get_write_buffer_size() if transport is not None else 0
+        except (AttributeError, RuntimeError):
+            return 0
+
+    def outbound(self, websocket: Any) -> int:
+        usage = self._usage.get(websocket)
+        return (usage.outbound if usage is not None else 0) + self.transport_buffer(websocket)
+
+    def admit_outbound(self, websocket: Any, size: int) -> bool:
+        """size 바이트를 더 보내도 되는지 확인한다.
+
+        연결 상한을 넘으면 그 연결을, 프로세스 예산을 넘으면 전송 대기가 가장 큰
+        연결을 끊는다. 끊긴 연결이 websocket 자신이면 False.
+        """
+        if websocket not in self._usage:
+            return True
+        if self.outbound(websocket) + size > self.limits.max_outbound:
+            self.disconnect(websocket, "outbound buffer limit")
+            return False
+        if self._buffered + size > self.limits.budget:
+            heaviest = max(self._usage, key=self.outbound)
+            self.disconnect(heaviest, "memory budget")
+            return heaviest is not websocket
+        return True
+
+    def disconnect(self, websocket: Any, reason: str) -> None:
+        """상한 초과 연결을 close code 1013으로 끊는다 (close 핸드셰이크는 백그라운드)."""
+        usage = self._usage.pop(websocket, None)
+        if usage is None:
+            return  # 이미 끊는 중
+        self._buffered -= usage.inbound + usage.outbound
+        self.shed += 1
+        logger.warning("메모리 상한 초과 연결 종료 (%s): %s", reason, getattr(websocket, "remote_address", "?"))
+        print(f"[Bridge] 메모리 상한 초과 연결 종료 ({reason})")
+        task = asyncio.create_task(websocket.close(code=SHED_CLOSE_CODE, reason=reason))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    def snapshot(self, websocket: Any) -> dict:
+        usage = self._usage.get(websocket) or ConnectionUsage()
+        return {"inbound": usage.inbound, "outbound": usage.outbound + self.transport_buffer(websocket)}
@@ -0,0 +1,204 @@
+"""이벤트 루프 지연(lag) 측정과 블로킹 호출 탐지 모듈
+
+Bridge는 asyncio 루프 위에서 동기 호출(file_io 디스크 쓰기, print, ResponseMonitor의
+pyautogui 호출 등)을 그대로 실행한다. 이 호출이 길어지면 모든 연결의 heartbeat와
+응답 전달이 함께 멈추지만, 지금까지는 그것을 알 방법이 없었다.
+
+- 측정: 루프 안의 ticker가 INTERVAL마다 깨어나, 예정 시각보다 늦은 만큼(lag)을
+  히스토그램과 최근 표본에 기록한다. 루프가 쉬고 있으면 lag은 0에 가깝다.
+- 탐지: 별도 watchdog 스레드가 ticker의 마지막 박동을 확인하여, 루프가
+  stall_threshold 이상 멈춰 있으면 sys._current_frames()로 루프 스레드의 스택을
+  떠 둔다. ticker가 다시 깨어나면 그 스택으로 멈춤을 코드 위치에 귀속시킨다.
+- 비용: 0.1초마다 sleep 한 번과 스레드 wait 한 번 — 운영 중 켜 두어도 된다.
+
+설정 (config.json "loop_monitor"):
+    "loop_monitor": {"enabled": true, "interval": 0.1, "stall_threshold": 0.1}
+
+요약은 상태 응답의 loop 항목으로 제공된다 (멈춤은 코드 위치만, 전체 스택은 서버 로그에만).
+"""
+
+import asyncio
+import bisect
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, deque
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+INTERVAL = 0.1  # ticker 주기 (초)
+STALL_THRESHOLD = 0.1  # 이 이상 늦으면 멈춤(stall)으로 기록 (초)
+HISTOGRAM_EDGES_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+SAMPLE_WINDOW = 1024  # 백분위 계산용 최근 표본 수
+RECENT_STALLS = 20  # 보관할 최근 멈춤 수
+TOP_LOCATIONS = 5  # 요약에 넣을 멈춤 위치 수
+STACK_DEPTH = 30  # 캡처할 스택 깊이
+
+_PACKAGE_DIR = Path(__file__).resolve().parent
+_ROOT_DIR = _PACKAGE_DIR.parent
+
+
+@dataclass
+class Stall:
+    """한 번의 루프 멈춤"""
+    at: float  # 멈춤이 끝난 시각 (epoch)
+    duration: float  # 초
+    location: str  # 멈춤을 일으킨 코드 위치 ("unknown"이면 스택 캡처 전에 풀림)
+
+    def to_dict(self) -> dict:
+        return {"at": self.at, "duration": round(self.duration, 4), "location": self.location}
+
+
+def attribute(stack: traceback.StackSummary) -> str:
+    """스택에서 멈춤의 원인으로 볼 코드 위치를 고른다.
+
+    표준 라이브러리·서드파티 안쪽(pathlib, pyautogui 등)보다 그것을 부른 Bridge 코드가
+    고칠 곳이므로, 가장 안쪽의 Bridge 프레임을 고른다. 없으면 가장 안쪽 프레임.
+    """
+    for frame in reversed(stack):
+        path = Path(frame.filename).resolve()
+        if path.is_relative_to(_PACKAGE_DIR) and path.name != "loop_health.py":
+            return f"{path.relative_to(_ROOT_DIR).as_posix()}:{frame.lineno} ({frame.name})"
+    if stack:
+        frame = stack[-1]
+        return f"{frame.filename}:{frame.lineno} ({frame.name})"
+    return "unknown"
+
+
+class LoopMonitor:
+    """이벤트 루프 lag 히스토그램과 멈춤 위치 기록"""
+
+    def __init__(
+        self,
+        interval: float = INTERVAL,
+        stall_threshold: float = STALL_THRESHOLD,
+        enabled: bool = True,
+    ) -> None:
+        """
+        Args:
+            interval: ticker 주기 (초).
+            stall_threshold: 멈춤으로 기록할 최소 lag (초).
+            enabled: False면 start가 아무것도 하지 않는다.
+        """
+        self.interval = interval
+        self.stall_threshold = stall_threshold
+        self.enabled = enabled
+        self._histogram = [0] * (len(HISTOGRAM_EDGES_MS) + 1)
+        self._samples: deque[float] = deque(maxlen=SAMPLE_WINDOW)
+        self._count = 0
+        self._max = 0.0
+        self._stalls: deque[Stall] = deque(maxlen=RECENT_STALLS)
+        self._stall_count = 0
+        self._by_location: Counter[str] = Counter()
+        self._worst: dict[str, float] = {}
+        self._ticker: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopping = threading.Event()
+        self._loop_thread = 0
+        # watchdog 스레드와 공유 — 단일 속성 대입만 하므로 잠금이 필요 없다
+        self._beat = 0.0
+        self._capture: tuple[float, traceback.StackSummary] | None = None
+
+    @classmethod
+    def from_config(cls, config: dict) -> "LoopMonitor":
+        """config.json의 loop_monitor 항목으로 모니터를 만든다."""
+        section = config.get("loop_monitor", {})
+        return cls(
+            interval=float(section.get("interval", INTERVAL)),
+            stall_threshold=float(section.get("stall_threshold", STALL_THRESHOLD)),
+            enabled=bool(section.get("enabled", True)),
+        )
+
+    def start(self) -> None:
+        """현재 실행 중인 루프에서 측정을 시작한다."""
+        if not self.enabled or self._ticker is not None:
+            return
+        self._loop_thread = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stopping.clear()
+        self._ticker = asyncio.create_task(self._tick_loop())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._watchdog.start()
+
+    def stop(self) -> None:
+        """측정을 멈춘다 (기록은 유지)."""
+        if self._ticker is not None:
+            self._ticker.cancel()
+            self._ticker = None
+        self._stopping.set()
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1.0)
+            self._watchdog = None
+
+    def record(self, lag: float, stack: traceback.StackSummary | None = None) -> None:
+        """lag 표본 하나를 기록한다. 임계값을 넘으면 멈춤으로도 기록한다."""
+        self._count += 1
+        self._samples.append(lag)
+        self._max = max(self._max, lag)
+        self._histogram[bisect.bisect_right(HISTOGRAM_EDGES_MS, lag * 1000)] += 1
+        if lag < self.stall_threshold:
+            return
+        location = attribute(stack) if stack is not None else "unknown"
+        self._stalls.append(Stall(time.time(), lag, location))
+        self._stall_count += 1
+        self._by_location[location] += 1
+        self._worst[location] = max(self._worst.get(location, 0.0), lag)
+        # 전체 스택(절대 경로 포함)은 서버 로그에만 남기고 상태 응답에는 위치만 보낸다
+        logger.warning(
+            "이벤트 루프 %.0fms 멈춤 — %s\n%s", lag * 1000, location, "".join(stack.format()) if stack else ""
+        )
+
+    def summary(self) -> dict:
+        """상태 응답용 요약 (시간 단위는 ms)."""
+        ordered = sorted(self._samples)
+
+        def percentile(pct: float) -> float:
+            if not ordered:
+                return 0.0
+            return round(ordered[min(int(pct * len(ordered)), len(ordered) - 1)] * 1000, 2)
+
+        labels = [f"<{edge}ms" for edge in HISTOGRAM_EDGES_MS] + [f">={HISTOGRAM_EDGES_MS[-1]}ms"]
+        return {
+            "running": self._ticker is not None,
+            "samples": self._count,
+            "p50_ms": percentile(0.5),
+            "p99_ms": percentile(0.99),
+            "max_ms": round(self._max * 1000, 2),
+            "histogram": {label: count for label, count in zip(labels, self._histogram) if count},
+            "stalls": self._stall_count,
+            "stall_threshold_ms": round(self.stall_threshold * 1000, 2),
+            "top": [
+                {"location": location, "count": count, "max_ms": round(self._worst[location] * 1000, 2)}
+                for location, count in self._by_location.most_common(TOP_LOCATIONS)
+            ],
+            "recent": [stall.to_dict() for stall in self._stalls],
+        }
+
+    # ------------------------------------------------------------------
+
+    async def _tick_loop(self) -> None:
+        while True:
+            beat = time.monotonic()
+            self._beat = beat
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.monotonic() - beat - self.interval)
+            capture = self._capture
+            stack = capture[1] if capture is not None and capture[0] == beat else None
+            self.record(lag, stack)
+
+    def _watch(self) -> None:
+        """루프가 멈춰 있으면 루프 스레드의 스택을 떠 둔다 (멈춤 하나당 한 번)."""
+        captured = 0.0
+        while not self._stopping.wait(self.stall_threshold / 2):
+            beat = self._beat
+            if beat == captured or time.monotonic() - beat - self.interval < self.stall_threshold:
+                continue
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is None:
+                continue
+            self._capture = (beat, traceback.extract_stack(frame, limit=STACK_DEPTH))
+            captured = beat
@@ -6,18 +6,31 @@
     python -m bridge.main
     또는
     python bridge/main.py
+
+    python -m bridge --workers 4 --uvloop   # 멀티 워커 (SO_REUSEPORT)
+    python -m bridge --takeover             # 실행 중인 Bridge를 무중단 교체
+    python -m bridge --startup-profile      # import/초기화 단계별 시간 출력
+
+GUI 자동화 모듈(pyautogui/pyperclip)은 서버 시작 시 import하지 않는다 (bridge.gui).
+기능 모듈(websockets, sqlite3, zlib 등)도 필요한 함수 안에서 import하므로,
+이 모듈을 import하는 것만으로는 설정/로깅 외에 아무것도 로드하지 않는다.
 """
 
+import argparse
 import asyncio
+import contextlib
 import json
 import logging
 import signal
 import sys
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from bridge.auth import Authenticator
-from bridge.file_io import ensure_dirs
-from bridge.server import BridgeServer
+if TYPE_CHECKING:
+    from bridge.auth import Authenticator
+    from bridge.handoff import HandoffListener
+    from bridge.server import BridgeServer
 
 logger = logging.getLogger("bridge")
 
@@ -26,6 +39,33 @@ DEFAULT_HOST = "0.0.0.0"
 DEFAULT_PORT = 8765
 
 
+class StartupProfile:
+    """시작 단계별 소요 시간 기록 (--startup-profile)"""
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self.steps: list[tuple[str, float]] = []
+        self._started = time.perf_counter()
+
+    @contextlib.contextmanager
+    def step(self, label: str):
+        """with 블록의 소요 시간을 label로 기록한다."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps.append((label, time.perf_counter() - started))
+
+    def report(self) -> None:
+        """기록된 단계별 시간을 출력한다 (비활성화 시 무시)."""
+        if not self.enabled:
+            return
+        total = time.perf_counter() - self._started
+        print(f"[Bridge] 시작 프로파일 (총 {total * 1000:.1f} ms)")
+        for label, elapsed in self.steps:
+            print(f"[Bridge]   {label:<24} {elapsed * 1000:8.1f} ms")
+
+
 def load_config() -> dict:
     """config.json에서 설정을 로드한다.
 
@@ -47,6 +87,8 @@ def load_config() -> dict:
         "auth_token": "",
         "ngrok": {"enabled": False},
         "log_level": "INFO",
+        "workers": 1,
+        "uvloop": False,
     }
 
 
@@ -102,46 +144,105 @@ async def start_ngrok(port: int, ngrok_config: dict) -> str | None:
         return None
 
 
-async def main() -> None:
-    """Bridge 서버를 시작한다."""
-    config = load_config()
-    setup_logging(config.get("log_level", "INFO"))
+async def start_tls_listener(server, config: dict, host: str) -> str | None:
+    """config.json의 tls 설정으로 TLS 리스너를 열고 LAN 엔드포인트를 알린다.
 
-    host = config.get("host", DEFAULT_HOST)
-    port = config.get("port", DEFAULT_PORT)
+    SO_REUSEPORT 소켓으로 바인딩하므로 핸드오프 중 이전 프로세스가 아직
+    같은 포트를 열고 있어도 시작할 수 있다.
 
-    # 모듈 초기화
+    Args:
+        server: BridgeServer 인스턴스.
+        config: 파싱된 설정.
+        host: 바인딩할 호스트 주소.
+
+    Returns:
+        등록한 wss:// URL, TLS 비활성 또는 실패 시 None.
+    """
+    tls_config = config.get("tls", {})
+    if not tls_config.get("enabled", False):
+        return None
+    from bridge.tls import DEFAULT_TLS_PORT, build_ssl_context, tls_endpoint
+    from bridge.workers import create_reuseport_socket
+
+    port = tls_config.get("port", DEFAULT_TLS_PORT)
+    try:
+        context = build_ssl_context(tls_config, CONFIG_PATH.parent)
+        sock = create_reuseport_socket(host, port)
+        await server.start_tls(context, host, port, sock=sock)
+    except (OSError, ValueError) as e:
+        logger.error("TLS 리스너 시작 실패: %s", e)
+        print(f"[Bridge] TLS 리스너 시작 실패 — ws://만 사용: {e}")
+        return None
+    url = tls_endpoint(tls_config)
+    server.advertise("lan", url)
+    print(f"[Bridge] LAN 엔드포인트: {url}")
+    return url
+
+
+def build_authenticator(config: dict) -> "Authenticator":
+    """설정에서 Authenticator를 생성한다.
+
+    config.json의 auth_token이 기본값이 아니면 그대로 사용하고,
+    아니면 환경변수 또는 config.json에서 자동 로드한다.
+    tokens_file(기본 bridge/tokens.json)의 다중 토큰도 함께 인증한다.
+    토큰이 하나도 없으면 프로세스를 종료한다.
+    """
+    from bridge.auth import Authenticator
+    from bridge.tokens import TokenRegistry
+
+    registry = TokenRegistry(CONFIG_PATH.parent / config.get("tokens_file", "tokens.json"))
     token = config.get("auth_token", "")
     if token and token != "change-me-to-a-secure-token":
-        auth = Authenticator(token=token)
-    else:
-        # 환경변수 또는 config.json 자동 로드
-        try:
-            auth = Authenticator()
-        except ValueError as e:
-            print(f"[Bridge] 인증 설정 오류: {e}")
-            sys.exit(1)
+        return Authenticator(token=token, registry=registry)
+    # 환경변수 또는 이미 파싱된 config에서 로드 (config.json 재파싱 없음)
+    try:
+        return Authenticator(config=config, registry=registry)
+    except ValueError as e:
+        print(f"[Bridge] 인증 설정 오류: {e}")
+        sys.exit(1)
 
-    # 파일 기반 통신 디렉토리 생성
-    ensure_dirs()
-    print("[Bridge] 파일 기반 통신 모드 (inbox/outbox)")
 
-    server = BridgeServer(authenticator=auth)
+def build_server(config: dict, worker_index: int | None = None, shared_state=None) -> "BridgeServer":
+    """설정으로 BridgeServer를 만든다 (단일 프로세스와 멀티 워커 공통).
 
-    # 서버 시작
-    await server.start(host, port)
+    Args:
+        config: 파싱된 설정.
+        worker_index: 멀티 워커 모드의 워커 번호. 주어지면 보관 파일을
+            워커 번호별로 나눈다 — 재시작된 같은 번호의 워커가 이어받는다.
+        shared_state: 워커 간 공유 상태 (멀티 워커 모드).
 
-    # ngrok 터널 (선택)
-    ngrok_config = config.get("ngrok", {})
-    if ngrok_config.get("enabled", False):
-        await start_ngrok(port, ngrok_config)
-    else:
-        print(f"[Bridge] 로컬 전용 모드 — ws://{host}:{port}")
+    Returns:
+        시작 전의 BridgeServer.
+    """
+    from bridge.body_store import BodyStore
+    from bridge.compression import CompressionPolicy
+    from bridge.history import HistoryStore
+    from bridge.kiro_pool import KiroPool
+    from bridge.limits import MemoryLimits
+    from bridge.loop_health import LoopMonitor
+    from bridge.parking import PARKING_PATH, ParkingLot
+    from bridge.server import BridgeServer
+
+    parking_path = PARKING_PATH if worker_index is None else PARKING_PATH.with_name(f"parking-w{worker_index}.json")
+    return BridgeServer(
+        authenticator=build_authenticator(config),
+        shared_state=shared_state,
+        kiro_pool=KiroPool.from_config(config),
+        parking=ParkingLot(parking_path),
+        history=HistoryStore() if config.get("history", True) else None,
+        bodies=BodyStore() if config.get("lazy_bodies", False) else None,
+        compression=CompressionPolicy.from_config(config),
+        limits=MemoryLimits.from_config(config),
+        loop_monitor=LoopMonitor.from_config(config),
+        sessions=config.get("sessions", True),
+        resume_tickets=config.get("resume_tickets", True),
+    )
 
-    print("[Bridge] 준비 완료. Ctrl+C로 종료.")
 
-    # 종료 시그널 대기
-    stop_event = asyncio.Event()
+async def wait_for_shutdown(stop_event: asyncio.Event | None = None) -> None:
+    """SIGINT/SIGTERM을 받거나 stop_event가 설정될 때까지 대기한다."""
+    if stop_event is None:
+        stop_event = asyncio.Event()
 
     def _signal_handler() -> None:
         print("\n[Bridge] 종료 신호 수신...")
@@ -159,13 +260,182 @@ async def main() -> None:
         await stop_event.wait()
     except KeyboardInterrupt:
         pass
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """명령행 인자를 파싱한다.
+
+    Args:
+        argv: 인자 목록. None이면 sys.argv[1:] 사용.
+
+    Returns:
+        파싱된 인자. 지정되지 않은 값은 None (config.json 값 사용).
+    """
+    parser = argparse.ArgumentParser(prog="python -m bridge", description="OKXUS Bridge 서버")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="워커 프로세스 수 (0 = CPU 코어 수, 기본값: config.json의 workers 또는 1)",
+    )
+    parser.add_argument(
+        "--uvloop",
+        action="store_true",
+        default=None,
+        help="uvloop 이벤트 루프 사용 (설치된 경우)",
+    )
+    parser.add_argument(
+        "--takeover",
+        action="store_true",
+        help="실행 중인 Bridge의 리스닝 소켓과 대기 요청을 인수하여 무중단 재시작",
+    )
+    parser.add_argument(
+        "--startup-profile",
+        action="store_true",
+        help="import/설정/바인딩/ngrok 단계별 시작 시간을 출력",
+    )
+    return parser.parse_args(argv)
+
+
+async def main(
+    config: dict | None = None,
+    takeover: bool = False,
+    profile: StartupProfile | None = None,
+) -> None:
+    """Bridge 서버를 시작한다 (단일 프로세스 모드).
+
+    ngrok 터널 연결은 서버 바인딩과 동시에 진행된다.
+
+    Args:
+        config: 파싱된 설정. None이면 config.json에서 로드한다.
+        takeover: True이면 실행 중인 Bridge에서 리스닝 소켓과
+            대기 요청을 인수한다.
+        profile: 시작 단계별 시간 기록. None이면 기록만 하고 출력하지 않는다.
+    """
+    if profile is None:
+        profile = StartupProfile()
+    if config is None:
+        with profile.step("load config"):
+            config = load_config()
+    setup_logging(config.get("log_level", "INFO"))
+
+    host = config.get("host", DEFAULT_HOST)
+    port = config.get("port", DEFAULT_PORT)
+
+    # 서버 모듈(websockets 포함)은 필요할 때 import
+    with profile.step("import server"):
+        import bridge.server  # noqa: F401 — import 시간을 init과 나눠서 측정
+        from bridge.file_io import ensure_dirs
+        from bridge.handoff import HandoffListener, load_pending, request_takeover, save_pending, supports_handoff
+
+    # 모듈 초기화
+    with profile.step("init"):
+        # 파일 기반 통신 디렉토리 생성
+        ensure_dirs()
+        server = build_server(config)
+    print("[Bridge] 파일 기반 통신 모드 (inbox/outbox)")
+
+    # 무중단 재시작: 이전 프로세스에서 소켓/대기 요청 인수
+    sock = None
+    if takeover:
+        try:
+            sock = request_takeover()
+            server.adopt(load_pending())
+            print("[Bridge] 이전 프로세스에서 리스닝 소켓 인수 완료")
+        except OSError as e:
+            print(f"[Bridge] 인수 실패 — 새로 바인딩합니다: {e}")
+
+    # ngrok 터널 (선택) — 바인딩과 겹쳐서 진행
+    ngrok_config = config.get("ngrok", {})
+    ngrok_task: asyncio.Task | None = None
+    if ngrok_config.get("enabled", False):
+        ngrok_task = asyncio.create_task(start_ngrok(port, ngrok_config))
+
+    # 서버 시작
+    try:
+        with profile.step("bind"):
+            await server.start(host, port, sock=sock)
+        with profile.step("tls"):
+            await start_tls_listener(server, config, host)
+    except BaseException:
+        if ngrok_task is not None:
+            ngrok_task.cancel()
+        raise
+
+    stop_event = asyncio.Event()
+    handoff: "HandoffListener | None" = None
+    if supports_handoff() and config.get("handoff", True):
+
+        async def _on_takeover():
+            listener = server.listening_socket()
+            save_pending(server.drain())
+            return listener
+
+        handoff = HandoffListener(_on_takeover, on_handed_off=stop_event.set)
+        handoff.start()
+
+    if ngrok_task is not None:
+        with profile.step("ngrok (after bind)"):
+            ngrok_url = await ngrok_task
+        if ngrok_url:
+            server.advertise("ngrok", ngrok_url.replace("https://", "wss://").replace("http://", "ws://"))
+    else:
+        print(f"[Bridge] 로컬 전용 모드 — ws://{host}:{port}")
+
+    print("[Bridge] 준비 완료. Ctrl+C로 종료.")
+    profile.report()
+
+    try:
+        await wait_for_shutdown(stop_event)
     finally:
-        await server.stop()
-        print("[Bridge] 종료 완료.")
+        if handoff is not None:
+            await handoff.close()
+        if handoff is not None and handoff.handed_off:
+            await server.close_for_restart()
+            print("[Bridge] 새 프로세스로 핸드오프 완료.")
+        else:
+            await server.stop()
+            print("[Bridge] 종료 완료.")
+
+
+def run(argv: list[str] | None = None) -> None:
+    """명령행 진입점. 워커 수에 따라 단일/멀티 프로세스로 실행한다."""
+    from bridge.workers import install_uvloop, per_process_features, resolve_worker_count, run_workers
+
+    args = parse_args(argv)
+    profile = StartupProfile(enabled=args.startup_profile)
+    with profile.step("load config"):
+        config = load_config()
+
+    requested = args.workers if args.workers is not None else config.get("workers", 1)
+    use_uvloop = args.uvloop if args.uvloop is not None else config.get("uvloop", False)
+    workers = resolve_worker_count(requested)
+    if args.takeover and workers > 1:
+        print("[Bridge] --takeover는 단일 워커 모드에서만 지원 — 워커 1개로 실행")
+        workers = 1
+    if workers > 1 and (features := per_process_features(config)):
+        print(
+            f"[Bridge] {', '.join(features)} 사용 중 — 이 상태는 워커 간에 공유되지 않으므로 워커 1개로 실행 "
+            "(멀티 워커는 config.json에서 모두 false로)"
+        )
+        workers = 1
 
+    if workers > 1:
+        from bridge.file_io import ensure_dirs
 
-if __name__ == "__main__":
+        setup_logging(config.get("log_level", "INFO"))
+        ensure_dirs()
+        profile.report()
+        run_workers(config, workers, use_uvloop=use_uvloop)
+        return
+
+    if use_uvloop:
+        install_uvloop()
     try:
-        asyncio.run(main())
+        asyncio.run(main(config, takeover=args.takeover, profile=profile))
     except KeyboardInterrupt:
         pass
+
+
+if __name__ == "__main__":
+    run()
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from enum import Enum
 
+from bridge.limits import payload_size
+
 
 class MessageType(Enum):
     """클라이언트 → 서버 메시지 타입"""
@@ -8,6 +10,15 @@ class MessageType(Enum):
     MESSAGE = "message"
     STATUS_REQUEST = "status_request"
     HEARTBEAT = "heartbeat"
+    CHANNEL_OPEN = "channel_open"
+    CHANNEL_CLOSE = "channel_close"
+    SUBSCRIBE = "subscribe"
+    UNSUBSCRIBE = "unsubscribe"
+    SUBSCRIBE_STATUS = "subscribe_status"
+    UNSUBSCRIBE_STATUS = "unsubscribe_status"
+    HISTORY_PAGE = "history_page"
+    HISTORY_SEARCH = "history_search"
+    FETCH_BODY = "fetch_body"
 
 
 class ResponseType(Enum):
@@ -18,6 +29,18 @@ class ResponseType(Enum):
     STATUS = "status"
     ERROR = "error"
     HEARTBEAT = "heartbeat"
+    CHANNEL_OPENED = "channel_opened"
+    CHANNEL_CLOSED = "channel_closed"
+    SUBSCRIBED = "subscribed"
+    UNSUBSCRIBED = "unsubscribed"
+    SESSION_PROMPT = "session_prompt"
+    PROGRESS = "progress"
+    STATUS_SNAPSHOT = "status_snapshot"
+    STATUS_DELTA = "status_delta"
+    UNPARKED = "unparked"
+    HISTORY_PAGE = "history_page"
+    HISTORY_SEARCH = "history_search"
+    BODY = "body"
 
 
 @dataclass
@@ -42,3 +65,23 @@ class BridgeStatus:
     kiro_running: bool
     connected_clients: int
     uptime: float
+
+
+@dataclass
+class PendingRequest:
+    """Kiro 응답을 기다리는 요청 (재시작 핸드오프 시 영속화 대상)"""
+    message_id: str
+    client_id: str
+    content: str
+    created_at: float
+    channel: str = "0"
+    session: str = ""
+    timeout: float = 300.0
+    namespace: str = ""  # 토큰별 inbox/outbox 하위 디렉토리
+    token_id: str = ""
+    worker: str = ""  # 배정된 Kiro 워커 이름
+    size: int = 0  # content UTF-8 바이트 — 생성 시 한 번 계산 (메모리 계정용)
+
+    def __post_init__(self) -> None:
+        if not self.size:
+            self.size = payload_size(self.content)
@@ -2,19 +2,69 @@
 
 Kiro IDE가 응답을 생성하는 동안 상태를 모니터링하고,
 응답이 완료되면 텍스트를 읽어서 반환한다.
+
+클립보드/키 입력은 UI 액터 스레드에서 실행되므로 폴링 중에도
+이벤트 루프가 멈추지 않는다.
+
+프롬프트 전송 전 채팅 텍스트(baseline)를 잡아두면, 전체 대화 대신
+baseline 이후에 새로 생긴 응답 부분만 반환한다.
 """
 
-import asyncio
 import logging
-import time
-
-import pyautogui
-import pyperclip
 
+from bridge.clock import REAL_CLOCK, Clock
+from bridge.gui import pyautogui, pyperclip
 from bridge.models import ResponseType, ServerMessage
+from bridge.ui_actor import UIActor, get_actor
 
 logger = logging.getLogger(__name__)
 
+ANCHOR_LEN = 256  # baseline 끝에서 잘라 현재 텍스트에서 찾을 앵커 길이 (문자)
+ANCHOR_SLACK = 1024  # 앵커를 찾을 때 baseline 길이 기준 앞뒤 허용 오차 (문자)
+
+
+def extract_new_reply(baseline: str, current: str, prompt: str | None = None) -> str | None:
+    """baseline 이후 새로 추가된 텍스트(새 응답)만 추출한다.
+
+    baseline의 마지막 ANCHOR_LEN 문자를 앵커로 삼아, 현재 텍스트에서
+    baseline 끝이 있어야 할 위치를 먼저 확인하고, 없으면 그 주변
+    (ANCHOR_SLACK)만 뒤에서부터 검색한다.
+    따라서 비용은 대화 전체 길이가 아니라 새 응답 길이에 비례한다.
+    주변에서 찾지 못하면(스크롤/가상화로 앞부분이 잘린 경우) 뒤에서부터
+    전체를 한 번 더 검색한다.
+
+    Args:
+        baseline: 프롬프트 전송 전 채팅 텍스트.
+        current: 현재 채팅 텍스트.
+        prompt: 전송한 프롬프트. 새 텍스트 앞에 에코되어 있으면 제거한다.
+
+    Returns:
+        새 응답 텍스트. 앵커를 찾지 못하면 None (호출자가 전체 텍스트로 폴백).
+    """
+    if not baseline:
+        new = current
+    else:
+        anchor = baseline[-ANCHOR_LEN:]
+        expected = len(baseline) - len(anchor)
+        start = max(expected - ANCHOR_SLACK, 0)
+        end = expected + len(anchor) + ANCHOR_SLACK
+        if current.startswith(anchor, expected):
+            pos = expected
+        else:
+            pos = current.rfind(anchor, start, end)
+            if pos < 0:
+                pos = current.rfind(anchor)
+                if pos < 0:
+                    return None
+        new = current[pos + len(anchor):]
+
+    new = new.lstrip()
+    if prompt:
+        stripped_prompt = prompt.strip()
+        if stripped_prompt and new.startswith(stripped_prompt):
+            new = new[len(stripped_prompt):].lstrip()
+    return new.rstrip()
+
 
 class ResponseMonitor:
     """Kiro IDE 응답 모니터링
@@ -26,7 +76,14 @@ class ResponseMonitor:
     POLL_INTERVAL = 1.0  # 폴링 간격 (초)
     STABLE_THRESHOLD = 3.0  # 텍스트 변화 없이 안정된 것으로 판단하는 시간 (초)
 
-    def __init__(self) -> None:
+    def __init__(self, actor: UIActor | None = None, clock: Clock | None = None) -> None:
+        """
+        Args:
+            actor: UI 조작을 실행할 액터. None이면 프로세스 공용 액터 사용.
+            clock: 폴링 간격·안정 판정에 쓸 시계. None이면 실제 시계.
+        """
+        self._actor = actor
+        self._clock = clock or REAL_CLOCK
         self._responding = False
         self._last_snapshot: str | None = None
         self._last_change_time: float = 0.0
@@ -39,7 +96,23 @@ class ResponseMonitor:
         """
         return self._responding
 
-    async def wait_for_response(self, timeout: int = 60) -> str:
+    async def capture_baseline(self) -> str:
+        """프롬프트 전송 전 채팅 텍스트를 읽는다 (wait_for_response의 baseline).
+
+        Raises:
+            RuntimeError: 텍스트 읽기에 실패한 경우.
+        """
+        baseline = await self._get_actor().call(self._read_chat_text)
+        if baseline is None:
+            raise RuntimeError("응답 텍스트 읽기 실패")
+        return baseline
+
+    async def wait_for_response(
+        self,
+        timeout: int = 60,
+        baseline: str | None = None,
+        prompt: str | None = None,
+    ) -> str:
         """응답 완료까지 대기 후 텍스트를 반환한다 (Req 3.1, 3.2).
 
         Kiro IDE 채팅 영역의 텍스트를 주기적으로 읽어서 변화를 감지한다.
@@ -47,6 +120,9 @@ class ResponseMonitor:
 
         Args:
             timeout: 최대 대기 시간 (초). 기본값 60초.
+            baseline: 프롬프트 전송 전 텍스트 (capture_baseline). 주어지면
+                새 응답 부분만 반환하고, 앵커를 찾지 못하면 전체 텍스트를 반환한다.
+            prompt: 전송한 프롬프트 (새 텍스트 앞의 에코 제거용).
 
         Returns:
             Kiro IDE의 응답 텍스트.
@@ -55,25 +131,88 @@ class ResponseMonitor:
             TimeoutError: 지정된 시간 내에 응답이 완료되지 않은 경우.
             RuntimeError: 응답 텍스트 읽기에 실패한 경우 (Req 3.4).
         """
+        return await self._poll_until_stable(
+            timeout, first_snapshot=None, baseline=baseline, prompt=prompt
+        )
+
+    async def send_and_wait(self, automation, message: str, timeout: int = 60) -> str:
+        """baseline 읽기, 메시지 전송, 첫 스냅샷 읽기를 한 번의 액터 배치로
+        실행한 뒤 새 응답 부분만 반환한다.
+
+        세 조작 사이에 다른 모니터의 클립보드 조작이 끼어들지 않는다.
+
+        Args:
+            automation: send_message(message) -> bool을 제공하는 KiroAutomation.
+            message: 전송할 메시지.
+            timeout: 최대 대기 시간 (초).
+
+        Raises:
+            RuntimeError: 메시지 전송 또는 응답 텍스트 읽기에 실패한 경우.
+        """
+        baseline, sent, first = await self._get_actor().batch(
+            self._read_chat_text,
+            lambda: automation.send_message(message),
+            self._read_chat_text,
+        )
+        if not sent:
+            raise RuntimeError("메시지 전송 실패")
+        if baseline is None or first is None:
+            raise RuntimeError("응답 텍스트 읽기 실패")
+        # 전송 직후 채팅이 바뀌었으면 입력이 들어간 것 — 입력 대기 시간 학습
+        record_outcome = getattr(automation, "record_outcome", None)
+        if record_outcome is not None:
+            record_outcome(first != baseline)
+        return await self._poll_until_stable(
+            timeout, first_snapshot=first, baseline=baseline, prompt=message
+        )
+
+    def _get_actor(self) -> UIActor:
+        if self._actor is None:
+            self._actor = get_actor()
+        return self._actor
+
+    async def _poll_until_stable(
+        self,
+        timeout: float,
+        first_snapshot: str | None,
+        baseline: str | None = None,
+        prompt: str | None = None,
+    ) -> str:
+        """텍스트가 STABLE_THRESHOLD 동안 변하지 않을 때까지 폴링한다.
+
+        baseline이 있으면 매 폴링마다 새 응답 부분만 추출하여 비교하므로
+        비교 비용이 대화 길이가 아닌 응답 길이에 비례한다.
+        """
         self._responding = True
         self._last_snapshot = None
-        self._last_change_time = time.monotonic()
-        start_time = time.monotonic()
+        self._last_change_time = self._clock.monotonic()
+        start_time = self._clock.monotonic()
+        pending_first = first_snapshot
 
         try:
             while True:
-                elapsed = time.monotonic() - start_time
+                elapsed = self._clock.monotonic() - start_time
                 if elapsed >= timeout:
                     raise TimeoutError(
                         f"응답 대기 시간 초과 ({timeout}초)"
                     )
 
-                snapshot = self._read_chat_text()
+                if pending_first is not None:
+                    snapshot, pending_first = pending_first, None
+                else:
+                    snapshot = await self._get_actor().call(self._read_chat_text)
 
                 if snapshot is None:
                     raise RuntimeError("응답 텍스트 읽기 실패")
 
-                now = time.monotonic()
+                if baseline is not None:
+                    reply = extract_new_reply(baseline, snapshot, prompt)
+                    if reply is None:
+                        logger.warning("응답 앵커 찾기 실패 — 전체 텍스트 사용")
+                    else:
+                        snapshot = reply
+
+                now = self._clock.monotonic()
 
                 if snapshot != self._last_snapshot:
                     # 텍스트가 변경됨 — 아직 응답 생성 중
@@ -84,7 +223,7 @@ class ResponseMonitor:
                     logger.info("응답 완료 감지 (%.1f초 경과)", elapsed)
                     return snapshot
 
-                await asyncio.sleep(self.POLL_INTERVAL)
+                await self._clock.sleep(self.POLL_INTERVAL)
         finally:
             self._responding = False
 
@@ -128,5 +267,5 @@ class ResponseMonitor:
         return ServerMessage(
             type=ResponseType.ERROR,
             payload={"error": error},
-            timestamp=time.time(),
+            timestamp=self._clock.time(),
         )
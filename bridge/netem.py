@@ -0,0 +1,301 @@
+"""모바일 네트워크 조건 에뮬레이터 (TCP 프록시)
+
+로컬 테스트는 루프백 지연·무제한 대역폭이라 heartbeat 간격, 재연결 비용,
+응답 청크 크기를 실제 LTE+ngrok 환경 기준으로 판단할 수 없다. 이 모듈은
+BridgeServer 앞에 두는 TCP 프록시로, WebSocket 프레임은 건드리지 않고 다음을 주입한다.
+
+- latency / jitter: 방향별 단방향 지연. 지터가 있어도 TCP처럼 순서는 유지된다.
+- 대역폭: 방향별 상한 (up_kbps: 앱→Bridge, down_kbps: Bridge→앱).
+  방향마다 전달 중인 바이트를 대략 대역폭×지연(BDP)까지만 들고 있고, 넘으면
+  소켓 읽기를 멈춰 보내는 쪽에 TCP 배압이 걸린다 — 느린 링크 뒤에서 Bridge의
+  전송 버퍼가 실제처럼 쌓인다.
+- 손실: 패킷 손실 자체 대신, TCP가 재전송하는 동안 생기는 멈춤(stall)을
+  loss 확률로 청크마다 넣는다.
+- 주기적 끊김: disconnect_every초(± 20%)마다 연결을 끊는다 (망 전환, 터널 재연결).
+
+벤치마크 하네스에서:
+
+    proxy = NetemProxy(PROFILES["lte"])
+    await proxy.start("127.0.0.1", 8775, "127.0.0.1", 8765)
+    ...  # ws://127.0.0.1:8775 로 접속하여 측정
+    proxy.update(latency=0.3)   # 실행 중 조건 변경
+    proxy.disconnect_all()
+    print(proxy.stats.summary())
+    await proxy.stop()
+
+명령줄:
+    python -m bridge.netem --profile lte --listen 8775 --target 127.0.0.1:8765
+"""
+
+import argparse
+import asyncio
+import dataclasses
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+CHUNK = 16 * 1024  # 한 번에 읽는 최대 바이트 (StreamReader 버퍼 상한도 이 값)
+MIN_IN_FLIGHT = CHUNK  # 방향별 전달 중 바이트 상한의 최솟값 — 지연이 0이어도 진행되도록
+DISCONNECT_SPREAD = 0.2  # 주기적 끊김 간격의 무작위 폭 (±)
+
+
+@dataclass
+class LinkProfile:
+    """링크 조건 (시간은 초, 대역폭은 kbit/s, 0이면 무제한)"""
+    latency: float = 0.0
+    jitter: float = 0.0
+    up_kbps: float = 0.0
+    down_kbps: float = 0.0
+    loss: float = 0.0  # 청크당 멈춤 확률
+    stall: float = 0.2  # 멈춤 길이 (재전송 타임아웃 근사)
+    disconnect_every: float = 0.0  # 0이면 끊지 않음
+
+
+# ngrok 엣지 경유 왕복을 포함한 대략적인 값
+PROFILES: dict[str, LinkProfile] = {
+    "loopback": LinkProfile(),
+    "wifi": LinkProfile(latency=0.015, jitter=0.005, up_kbps=20_000, down_kbps=50_000),
+    "lte": LinkProfile(latency=0.045, jitter=0.015, up_kbps=5_000, down_kbps=20_000, loss=0.005),
+    "3g": LinkProfile(latency=0.15, jitter=0.05, up_kbps=750, down_kbps=1_600, loss=0.02, stall=0.4),
+    "edge": LinkProfile(latency=0.3, jitter=0.1, up_kbps=120, down_kbps=240, loss=0.03, stall=0.8),
+    "flaky-lte": LinkProfile(
+        latency=0.06, jitter=0.03, up_kbps=3_000, down_kbps=10_000, loss=0.02, disconnect_every=30.0
+    ),
+}
+
+
+@dataclass
+class ProxyStats:
+    """프록시 누적 통계"""
+    connections: int = 0
+    bytes_up: int = 0  # 앱 → Bridge
+    bytes_down: int = 0  # Bridge → 앱
+    stalls: int = 0
+    disconnects: int = 0  # 주입한 끊김 수
+    peak_in_flight: int = 0  # 한 방향이 들고 있던 최대 바이트
+
+    def summary(self) -> dict:
+        return dataclasses.asdict(self)
+
+
+@dataclass
+class _Pipe:
+    """한 방향의 지연 큐와 대역폭 상태"""
+    direction: str  # "up" | "down"
+    queue: asyncio.Queue = field(default_factory=asyncio.Queue)
+    last_due: float = 0.0
+    next_free: float = 0.0
+    in_flight: int = 0  # 읽었지만 아직 보내지 않은 바이트
+    space: asyncio.Event = field(default_factory=asyncio.Event)  # in_flight가 줄면 set
+
+
+class NetemProxy:
+    """지연·대역폭·멈춤·끊김을 주입하는 TCP 프록시"""
+
+    def __init__(self, profile: LinkProfile | None = None, seed: int | None = None) -> None:
+        """
+        Args:
+            profile: 링크 조건. None이면 loopback(조건 없음).
+            seed: 지터/손실 난수 시드 (재현 가능한 측정용).
+        """
+        self.profile = dataclasses.replace(profile or LinkProfile())
+        self.stats = ProxyStats()
+        self._random = random.Random(seed)
+        self._server: asyncio.AbstractServer | None = None
+        self._target: tuple[str, int] = ("127.0.0.1", 0)
+        self._connections: set[asyncio.Task] = set()
+        self._writers: dict[asyncio.Task, tuple[asyncio.StreamWriter, asyncio.StreamWriter]] = {}
+
+    @property
+    def port(self) -> int:
+        """실제 수신 포트 (start에 0을 주었을 때 확인용)."""
+        return self._server.sockets[0].getsockname()[1] if self._server else 0
+
+    async def start(self, listen_host: str, listen_port: int, target_host: str, target_port: int) -> None:
+        """프록시를 시작한다."""
+        self._target = (target_host, target_port)
+        self._server = await asyncio.start_server(self._handle, listen_host, listen_port, limit=CHUNK)
+        logger.info(
+            "netem 프록시 %s:%d → %s:%d (%s)", listen_host, self.port, target_host, target_port, self.profile
+        )
+
+    async def stop(self) -> None:
+        """수신을 멈추고 모든 연결을 닫는다."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for task in list(self._connections):
+            task.cancel()
+        if self._connections:
+            await asyncio.gather(*self._connections, return_exceptions=True)
+
+    def update(self, **changes: float) -> None:
+        """실행 중 링크 조건을 바꾼다 (다음 청크부터 적용).
+
+        Raises:
+            TypeError: LinkProfile에 없는 항목.
+        """
+        self.profile = dataclasses.replace(self.profile, **changes)
+
+    def disconnect_all(self) -> int:
+        """현재 연결을 모두 끊는다. 끊은 연결 수를 반환한다."""
+        count = 0
+        for client, upstream in list(self._writers.values()):
+            client.transport.abort()
+            upstream.transport.abort()
+            count += 1
+        self.stats.disconnects += count
+        return count
+
+    # ------------------------------------------------------------------
+
+    async def _handle(self, client_reader: asyncio.StreamReader, client_writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        try:
+            upstream_reader, upstream_writer = await asyncio.open_connection(*self._target, limit=CHUNK)
+        except OSError as e:
+            logger.warning("netem 대상 연결 실패: %s", e)
+            client_writer.close()
+            return
+        self.stats.connections += 1
+        self._connections.add(task)
+        self._writers[task] = (client_writer, upstream_writer)
+        up, down = _Pipe("up"), _Pipe("down")
+        readers = [
+            asyncio.create_task(self._read(client_reader, up)),
+            asyncio.create_task(self._read(upstream_reader, down)),
+        ]
+        writers = [
+            asyncio.create_task(self._write(up, upstream_writer)),
+            asyncio.create_task(self._write(down, client_writer)),
+        ]
+        if self.profile.disconnect_every > 0:
+            writers.append(asyncio.create_task(self._disconnect_later(client_writer, upstream_writer)))
+        workers = readers + writers
+        try:
+            # 한쪽 방향이 지연된 데이터까지 다 전달하고 끝나면 (EOF, 끊김) 연결 전체를 정리한다
+            await asyncio.wait(writers, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            # 소켓을 먼저 닫는다 — 정리 중에 다시 취소되어도 양쪽이 끊김을 알 수 있도록
+            for writer in (client_writer, upstream_writer):
+                writer.close()
+            self._writers.pop(task, None)
+            self._connections.discard(task)
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    def in_flight_limit(self, direction: str) -> int | None:
+        """방향별 전달 중 바이트 상한 — 대역폭 × 왕복 지연 (대역폭 무제한이면 None)."""
+        profile = self.profile
+        kbps = profile.up_kbps if direction == "up" else profile.down_kbps
+        if kbps <= 0:
+            return None
+        rtt = 2 * (profile.latency + profile.jitter)
+        return max(MIN_IN_FLIGHT, int(kbps * 1000 / 8 * rtt))
+
+    async def _read(self, reader: asyncio.StreamReader, pipe: _Pipe) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            # 링크가 가득 차면 읽지 않는다 — 소켓 버퍼가 차서 보내는 쪽이 막힌다
+            while (limit := self.in_flight_limit(pipe.direction)) is not None and pipe.in_flight >= limit:
+                pipe.space.clear()
+                await pipe.space.wait()
+            try:
+                data = await reader.read(CHUNK)
+            except ConnectionError:
+                data = b""
+            profile = self.profile
+            delay = max(0.0, profile.latency + self._random.uniform(-profile.jitter, profile.jitter))
+            # 지터가 있어도 순서는 유지 (TCP)
+            due = max(loop.time() + delay, pipe.last_due)
+            pipe.last_due = due
+            pipe.in_flight += len(data)
+            self.stats.peak_in_flight = max(self.stats.peak_in_flight, pipe.in_flight)
+            await pipe.queue.put((due, data))
+            if not data:
+                return
+
+    async def _write(self, pipe: _Pipe, writer: asyncio.StreamWriter) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            due, data = await pipe.queue.get()
+            if not data:
+                if writer.can_write_eof():
+                    writer.write_eof()
+                return
+            profile = self.profile
+            if profile.loss > 0 and self._random.random() < profile.loss:
+                self.stats.stalls += 1
+                due += profile.stall
+            kbps = profile.up_kbps if pipe.direction == "up" else profile.down_kbps
+            if kbps > 0:
+                # 직렬화 지연: 앞선 청크가 다 나간 뒤부터 len/속도만큼
+                pipe.next_free = max(pipe.next_free, due) + len(data) * 8 / (kbps * 1000)
+                due = pipe.next_free
+            wait = due - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            writer.write(data)
+            await writer.drain()
+            pipe.in_flight -= len(data)
+            pipe.space.set()
+            if pipe.direction == "up":
+                self.stats.bytes_up += len(data)
+            else:
+                self.stats.bytes_down += len(data)
+
+    async def _disconnect_later(self, client: asyncio.StreamWriter, upstream: asyncio.StreamWriter) -> None:
+        every = self.profile.disconnect_every
+        await asyncio.sleep(every * self._random.uniform(1 - DISCONNECT_SPREAD, 1 + DISCONNECT_SPREAD))
+        self.stats.disconnects += 1
+        client.transport.abort()
+        upstream.transport.abort()
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    profile = dataclasses.replace(PROFILES[args.profile])
+    for name in ("latency", "jitter", "up_kbps", "down_kbps", "loss", "disconnect_every"):
+        value = getattr(args, name)
+        if value is not None:
+            profile = dataclasses.replace(profile, **{name: value})
+    host, _, port = args.target.rpartition(":")
+    proxy = NetemProxy(profile, seed=args.seed)
+    await proxy.start(args.host, args.listen, host or "127.0.0.1", int(port))
+    print(f"[Bridge] netem {args.profile}: ws://{args.host}:{proxy.port} → {args.target}")
+    started = time.monotonic()
+    try:
+        while True:
+            await asyncio.sleep(10)
+            print(f"[Bridge] netem {time.monotonic() - started:.0f}s {proxy.stats.summary()}")
+    finally:
+        await proxy.stop()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m bridge.netem", description="모바일 네트워크 조건 에뮬레이터")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="lte")
+    parser.add_argument("--host", default="127.0.0.1", help="수신 주소")
+    parser.add_argument("--listen", type=int, default=8775, help="수신 포트")
+    parser.add_argument("--target", default="127.0.0.1:8765", help="Bridge 주소 host:port")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--latency", type=float, help="단방향 지연 (초)")
+    parser.add_argument("--jitter", type=float)
+    parser.add_argument("--up-kbps", dest="up_kbps", type=float)
+    parser.add_argument("--down-kbps", dest="down_kbps", type=float)
+    parser.add_argument("--loss", type=float, help="청크당 멈춤 확률")
+    parser.add_argument("--disconnect-every", dest="disconnect_every", type=float, help="주기적 끊김 간격 (초)")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [netem] %(message)s", datefmt="%H:%M:%S")
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
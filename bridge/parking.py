@@ -0,0 +1,122 @@
+"""Kiro 중단 시 프롬프트 보관(주차) 모듈
+
+정상 Kiro 워커가 없을 때 받은 프롬프트를 inbox에 쓰지 않고 순서대로 보관한다.
+보관 중에는 응답 대기 타이머가 돌지 않으며, 클라이언트는 ACK로
+parked=True와 대기 순번(position)을 받는다.
+
+Kiro가 복구되면 BridgeServer가 보관된 프롬프트를 앞에서부터 일정 간격으로
+꺼내 워커에 배정한다 — 복구 직후 재시도가 한꺼번에 몰리지 않는다.
+
+path를 지정하면 변경 시마다 파일에 저장(임시 파일 후 교체)하여
+Bridge가 재시작되어도 보관된 프롬프트를 잃지 않는다.
+"""
+
+import dataclasses
+import json
+import logging
+import os
+from collections import deque
+from pathlib import Path
+
+from bridge.limits import ByteTally
+from bridge.models import PendingRequest
+
+logger = logging.getLogger(__name__)
+
+PARKING_PATH = Path(__file__).parent / "parking.json"
+
+
+class ParkingLot:
+    """보관된 프롬프트의 FIFO 대기열"""
+
+    def __init__(self, path: Path | None = None) -> None:
+        """
+        Args:
+            path: 저장 파일 경로. None이면 메모리에만 보관한다.
+        """
+        self._path = path
+        self._queue: deque[PendingRequest] = deque()
+        self._bytes = ByteTally()
+        self.reload()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def park(self, pending: PendingRequest) -> int:
+        """프롬프트를 대기열 끝에 보관한다.
+
+        Returns:
+            대기 순번 (1부터).
+        """
+        self._queue.append(pending)
+        self._bytes.add(pending.client_id, pending.size)
+        self._save()
+        return len(self._queue)
+
+    def peek(self) -> PendingRequest | None:
+        """가장 먼저 보관된 프롬프트 (꺼내지 않음)."""
+        return self._queue[0] if self._queue else None
+
+    def pop(self) -> PendingRequest | None:
+        """가장 먼저 보관된 프롬프트를 꺼낸다."""
+        if not self._queue:
+            return None
+        pending = self._queue.popleft()
+        self._bytes.remove(pending.client_id, pending.size)
+        self._save()
+        return pending
+
+    def count_for(self, token_id: str) -> int:
+        """토큰별 보관 수 (쿼터 확인용)."""
+        return sum(1 for pending in self._queue if pending.token_id == token_id)
+
+    def payload_bytes(self, client_id: str | None = None) -> int:
+        """보관 중인 프롬프트 바이트 (client_id가 없으면 전체, 메모리 계정용)."""
+        return self._bytes.total if client_id is None else self._bytes.of(client_id)
+
+    def position_of(self, client_id: str) -> int:
+        """client_id의 가장 앞선 보관 프롬프트 순번 (없으면 0)."""
+        for index, pending in enumerate(self._queue):
+            if pending.client_id == client_id:
+                return index + 1
+        return 0
+
+    def holds(self, message_id: str) -> bool:
+        """message_id의 프롬프트가 보관 중인지 (재전송 중복 확인용)."""
+        return any(pending.message_id == message_id for pending in self._queue)
+
+    def token_of(self, client_id: str) -> str | None:
+        """client_id의 보관 프롬프트를 보낸 토큰 (없으면 None)."""
+        for pending in self._queue:
+            if pending.client_id == client_id:
+                return pending.token_id
+        return None
+
+    def reload(self) -> None:
+        """저장 파일에서 대기열을 다시 읽는다 (재시작/핸드오프 인수 시)."""
+        if self._path is None or not self._path.exists():
+            return
+        try:
+            items = json.loads(self._path.read_text(encoding="utf-8"))
+            self._queue = deque(PendingRequest(**item) for item in items)
+        except (OSError, ValueError, TypeError) as e:
+            logger.error("보관 프롬프트 파일 읽기 실패: %s", e)
+            return
+        self._bytes.clear()
+        for pending in self._queue:
+            self._bytes.add(pending.client_id, pending.size)
+        if self._queue:
+            logger.info("보관 프롬프트 %d건 복원", len(self._queue))
+
+    def _save(self) -> None:
+        if self._path is None:
+            return
+        if not self._queue:
+            self._path.unlink(missing_ok=True)
+            return
+        tmp = self._path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps([dataclasses.asdict(p) for p in self._queue], ensure_ascii=False),
+            encoding="utf-8",
+        )
+        os.replace(tmp, self._path)
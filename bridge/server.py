@@ -7,68 +7,342 @@ BridgeServer는 WebSocket 서버를 시작하고, 클라이언트 연결을 처
 """
 
 import asyncio
+import dataclasses
 import json
 import logging
+import socket
+import sqlite3
+import ssl
 import time
 import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from urllib.parse import parse_qs, urlsplit
 
 import websockets
 
 from bridge.auth import Authenticator
-from bridge.file_io import cleanup_inbox, ensure_dirs, wait_for_response, write_message
+from bridge.body_store import MAX_CHUNK, BodyStore
+from bridge.channels import DEFAULT_CHANNEL, DEFAULT_WINDOW, ChannelError, ChannelMux
+from bridge.clock import REAL_CLOCK, Clock
+from bridge.compression import CompressionPolicy, CompressionStats, extension_of
+from bridge.file_io import ensure_dirs
+from bridge.history import PAGE_SIZE, HistoryStore
+from bridge.kiro_pool import KiroPool, KiroUnavailable, KiroWorker
+from bridge.latency import LatencyTracker
+from bridge.limits import ByteTally, MemoryAccountant, MemoryLimits, payload_size
+from bridge.loop_health import LoopMonitor
 from bridge.models import (
     BridgeStatus,
     MessageType,
+    PendingRequest,
     ResponseType,
     ServerMessage,
 )
+from bridge.parking import ParkingLot
+from bridge.sessions import SessionHub
+from bridge.shared_state import SharedState
+from bridge.status_feed import StatusFeed
+from bridge.tickets import TicketSigner
+from bridge.tokens import TokenEntry
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class ClientConnection:
+    """인증된 연결 하나의 상태"""
+    websocket: websockets.WebSocketServerProtocol
+    client_id: str
+    session: str
+    mux: ChannelMux | None = None
+    token_id: str = ""
+
+
 class BridgeServer:
     """WebSocket 서버 - 모바일 앱과의 통신 담당"""
 
     HEARTBEAT_INTERVAL = 30  # heartbeat 전송 간격 (초)
-    KIRO_RESPONSE_TIMEOUT = 300  # Kiro 응답 대기 시간 (초)
+    KIRO_RESPONSE_TIMEOUT = 300  # Kiro 응답 기본 대기 시간 — 지연 통계가 쌓이기 전까지 사용 (초)
+    PROGRESS_INTERVAL = 10  # 응답 대기 중 진행 상황(progress) 전송 간격 (초)
+    ADOPT_MIN_TIMEOUT = 30  # 핸드오프로 인수한 요청의 최소 잔여 대기 시간 (초)
+    RESTART_CLOSE_CODE = 1012  # 재시작 시 클라이언트에 보내는 close code (Service Restart)
+    REVOKED_CLOSE_CODE = 1008  # 토큰이 레지스트리에서 삭제되었을 때 close code (Policy Violation)
+    TOKEN_RELOAD_INTERVAL = 2  # 토큰 레지스트리 파일 변경 확인 간격 (초)
+    STATUS_MIN_INTERVAL = 1.0  # 상태 delta 전송 최소 간격 (초)
+    PARKING_CHECK_INTERVAL = 1.0  # 보관 중일 때 Kiro 복구 확인 간격 (초)
+    PARKING_DRAIN_INTERVAL = 2.0  # 복구 후 보관 프롬프트를 하나씩 배정하는 간격 (초)
+    BODY_PRUNE_INTERVAL = 3600.0  # 오래된 응답 본문 정리 간격 (초)
+    DEDUP_WINDOW = 256  # client_id마다 ACK를 기억하는 최근 request_id 수 (재전송 중복 제거)
+    DEDUP_CLIENTS = 1024  # ACK를 기억하는 최근 client_id 수 (연결이 끊긴 뒤에도 유지)
 
     def __init__(
         self,
         authenticator: Authenticator,
+        shared_state: SharedState | None = None,
+        kiro_pool: KiroPool | None = None,
+        parking: ParkingLot | None = None,
+        history: HistoryStore | None = None,
+        bodies: BodyStore | None = None,
+        compression: CompressionPolicy | None = None,
+        limits: MemoryLimits | None = None,
+        loop_monitor: LoopMonitor | None = None,
+        clock: Clock | None = None,
+        sessions: bool = True,
+        resume_tickets: bool = True,
     ) -> None:
+        """
+        sessions, resume_tickets는 이 프로세스 메모리에만 있는 클라이언트 상태를 쓴다 —
+        멀티 워커에서는 재연결이 다른 워커로 가면 이어지지 않으므로 둘 다 끈다.
+
+        Args:
+            sessions: False이면 같은 토큰 기기 간 세션 팬아웃과 client_id 재개를 하지 않는다.
+                재연결마다 새 client_id를 받고, 연결이 끊긴 동안의 응답은 보관하지 않는다.
+            resume_tickets: False이면 재개 티켓을 발급하지 않는다 (매번 토큰 인증).
+        """
         self._auth = authenticator
+        self._sessions_enabled = sessions
+        self._resume_tickets = resume_tickets
+        self._shared = shared_state
+        # 응답 대기·타임아웃, Kiro 워커 상태 판정, heartbeat/progress/보관 배정/토큰 갱신/
+        # 상태 push 주기의 시계 (테스트에서 VirtualClock으로 교체)
+        self._clock = clock or REAL_CLOCK
+        # Kiro 워커 풀 — 기본값은 bridge/inbox, bridge/outbox를 쓰는 단일 워커
+        self._kiro = kiro_pool or KiroPool([KiroWorker("default")])
+        self._kiro.use_clock(self._clock)
+        # 재연결 시 핸드셰이크 인증용 재개 티켓 (토큰 파생 키로 서명)
+        self._tickets = TicketSigner(authenticator.derive_key("resume-ticket"))
         self._clients: set[websockets.WebSocketServerProtocol] = set()
         self._authenticated: set[websockets.WebSocketServerProtocol] = set()
         self._start_time: float = 0.0
         self._server: websockets.WebSocketServer | None = None
+        self._tls_server: websockets.WebSocketServer | None = None
+        # 클라이언트에 알리는 접속 엔드포인트 (종류 → URL, 예: lan/ngrok)
+        self._endpoints: dict[str, str] = {}
+        # client_id → 현재 연결 (재연결 시 같은 client_id로 이어받음)
+        self._client_ids: dict[str, websockets.WebSocketServerProtocol] = {}
+        # client_id → 처음 사용한 token_id (다른 토큰이 같은 ID로 응답을 가로채지 못하게)
+        self._client_owners: dict[str, str] = {}
+        # "token_id:client_id" → request_id → 보낸 ACK (ACK를 못 받고 재전송한 프롬프트를
+        # 다시 실행하지 않도록). 응답이 끝나 client_id를 놓아준 뒤에도 재전송이 올 수 있어
+        # 연결과 무관하게 최근 DEDUP_CLIENTS개를 유지하고, 토큰까지 맞아야 재사용한다.
+        self._accepted: OrderedDict[str, OrderedDict[str, dict]] = OrderedDict()
+        # 인증된 연결별 상태 (client_id, 공유 세션, 논리 채널)
+        self._connections: dict[websockets.WebSocketServerProtocol, ClientConnection] = {}
+        # 같은 토큰 기기 간 공유 세션 팬아웃
+        self._sessions = SessionHub()
+        # 응답 대기 중인 요청 테이블과 outbox 대기 태스크
+        self._pending: dict[str, PendingRequest] = {}
+        self._waiters: dict[str, asyncio.Task] = {}
+        # 연결이 끊긴 client_id로 전달하지 못한 메시지 (재연결 시 전달)
+        self._undelivered: dict[str, list[dict]] = {}
+        # 응답 대기·미전달 바이트 (넣고 뺄 때 갱신 — 프롬프트마다 다시 세지 않음)
+        self._waiting_bytes = ByteTally()
+        self._undelivered_bytes = ByteTally()
+        self._draining = False
+        self._drain_rejects: list[asyncio.Task] = []  # 드레인 시 처리 전 프롬프트에 보내는 ERROR
+        # 프롬프트 분류별 응답 시간 통계 → 요청별 deadline/eta
+        self._latency = LatencyTracker(self.KIRO_RESPONSE_TIMEOUT)
+        # 토큰별 연결 수 / 응답 대기 요청 수 (쿼터 확인용)
+        self._token_connections: dict[str, int] = {}
+        self._token_pending: dict[str, int] = {}
+        self._reload_task: asyncio.Task | None = None
+        # Kiro 중단 중 받은 프롬프트 보관 — 기본값은 메모리 보관
+        self._parking = parking if parking is not None else ParkingLot()
+        self._parking_task: asyncio.Task | None = None
+        # 토큰별 대화 기록 (None이면 기록/조회 비활성)
+        self._history = history
+        # 지연 전송 모드 — 긴 응답은 미리보기만 보내고 본문은 fetch_body로 제공
+        self._bodies = bodies
+        self._prune_task: asyncio.Task | None = None
+        # permessage-deflate 정책 — 작은 프레임은 압축 생략, 링크별 레벨, 바이트 통계
+        self._compression = compression or CompressionPolicy()
+        self._compression_totals = CompressionStats()  # 종료된 연결의 누적 통계
+        # 연결별 수신/전송/대기 바이트 계정과 상한
+        self._memory = MemoryAccountant(limits)
+        # 이벤트 루프 lag 히스토그램과 블로킹 호출 위치
+        self._loop_monitor = loop_monitor or LoopMonitor()
+        # 상태 구독자에게 변경분(delta)만 모아서 push
+        self._status_feed = StatusFeed(
+            self._status_fields,
+            self._send_status_delta,
+            min_interval=self.STATUS_MIN_INTERVAL,
+            clock=self._clock,
+            common=self._status_common,
+        )
         ensure_dirs()
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
-    async def start(self, host: str = "0.0.0.0", port: int = 8765) -> None:
+    async def start(
+        self,
+        host: str = "0.0.0.0",
+        port: int = 8765,
+        sock: socket.socket | None = None,
+    ) -> None:
         """WebSocket 서버를 시작한다 (Req 5.1).
 
         Args:
             host: 바인딩할 호스트 주소.
             port: 바인딩할 포트 번호.
+            sock: 이미 바인딩된 리스닝 소켓 (멀티 워커 SO_REUSEPORT용).
+                지정하면 host/port 대신 이 소켓을 사용한다.
         """
         self._start_time = time.time()
-        self._server = await websockets.serve(
-            self.handle_connection, host, port
-        )
+        if sock is not None:
+            self._server = await websockets.serve(self.handle_connection, sock=sock, **self._serve_options())
+        else:
+            self._server = await websockets.serve(self.handle_connection, host, port, **self._serve_options())
+        self._reload_task = asyncio.create_task(self._token_reload_loop())
+        self._parking_task = asyncio.create_task(self._parking_loop())
+        self._status_feed.start()
+        self._loop_monitor.start()
+        if self._bodies is not None:
+            self._prune_task = asyncio.create_task(self._body_prune_loop())
         logger.info("Bridge 서버 시작 — ws://%s:%s", host, port)
         print(f"[Bridge] 서버 시작 — ws://{host}:{port}")
 
+    async def start_tls(
+        self,
+        ssl_context: ssl.SSLContext,
+        host: str = "0.0.0.0",
+        port: int = 8766,
+        sock: socket.socket | None = None,
+    ) -> None:
+        """같은 핸들러로 TLS(wss://) 리스너를 추가로 연다 (LAN/VPN 직접 접속용).
+
+        Args:
+            ssl_context: bridge.tls.build_ssl_context로 만든 서버 컨텍스트.
+            host: 바인딩할 호스트 주소.
+            port: 바인딩할 포트 번호.
+            sock: 이미 바인딩된 리스닝 소켓. 지정하면 host/port 대신 사용한다.
+        """
+        options = {"ssl": ssl_context, **self._serve_options()}
+        if sock is not None:
+            self._tls_server = await websockets.serve(self.handle_connection, sock=sock, **options)
+        else:
+            self._tls_server = await websockets.serve(self.handle_connection, host, port, **options)
+        logger.info("TLS 리스너 시작 — wss://%s:%s", host, port)
+        print(f"[Bridge] TLS 리스너 시작 — wss://{host}:{port}")
+
+    def advertise(self, kind: str, url: str) -> None:
+        """클라이언트에 알릴 접속 엔드포인트를 등록한다.
+
+        인증 응답과 상태 응답의 endpoints로 전달되어, 앱이 같은 네트워크에서는
+        LAN 주소로, 밖에서는 ngrok 주소로 접속할 수 있게 한다.
+
+        Args:
+            kind: 엔드포인트 종류 ("lan", "ngrok" 등).
+            url: ws:// 또는 wss:// URL.
+        """
+        self._endpoints[kind] = url
+        logger.info("엔드포인트 등록: %s → %s", kind, url)
+
     async def stop(self) -> None:
         """서버를 정상 종료한다."""
+        for task in (self._reload_task, self._parking_task, self._prune_task):
+            if task is not None:
+                task.cancel()
+        self._status_feed.close()
+        self._loop_monitor.stop()
+        for task in list(self._waiters.values()):
+            task.cancel()
+        if self._tls_server is not None:
+            self._tls_server.close()
+            await self._tls_server.wait_closed()
         if self._server is not None:
             self._server.close()
             await self._server.wait_closed()
             logger.info("Bridge 서버 종료")
             print("[Bridge] 서버 종료")
 
+    def listening_socket(self) -> socket.socket | None:
+        """현재 리스닝 소켓을 반환한다 (핸드오프 시 fd 전달용)."""
+        if self._server is None:
+            return None
+        sockets = list(self._server.server.sockets)
+        return sockets[0] if sockets else None
+
+    def drain(self) -> dict:
+        """재시작 핸드오프를 위해 요청 처리를 멈추고 상태를 스냅샷한다.
+
+        이후 새 연결과 메시지는 돌려보내고, 대기 중인 요청 테이블과
+        미전달 메시지를 반환한 뒤 outbox 대기 태스크를 취소한다. inbox 파일은 정리하지
+        않으므로 새 프로세스가 같은 message_id로 응답을 이어받는다.
+        채널 대기열에서 아직 처리를 시작하지 않은 프롬프트(ACK 전)는 꺼내서
+        request_id를 담은 ERROR로 돌려준다 — close_for_restart가 연결을 닫기 전에 전송된다.
+
+        Returns:
+            {"pending": [...], "undelivered": {...}, "owners": {...}, "accepted": {...}} 형태의 스냅샷.
+        """
+        self._draining = True
+        snapshot = {
+            "pending": [dataclasses.asdict(p) for p in self._pending.values()],
+            "undelivered": {cid: list(msgs) for cid, msgs in self._undelivered.items()},
+            "owners": dict(self._client_owners),
+            "accepted": {key: dict(acks) for key, acks in self._accepted.items()},
+        }
+        for task in list(self._waiters.values()):
+            task.cancel()
+        for websocket, conn in list(self._connections.items()):
+            if conn.mux is None:
+                continue
+            for channel, msg in conn.mux.take_queued():
+                reject = self._send(
+                    websocket,
+                    ResponseType.ERROR,
+                    {"error": "Bridge 재시작 중 — 재연결 후 다시 보내주세요", **self._request_ref(msg)},
+                    channel=channel,
+                )
+                self._drain_rejects.append(asyncio.create_task(reject))
+        logger.info(
+            "드레인: 대기 요청 %d건 스냅샷, 처리 전 프롬프트 %d건 거절",
+            len(snapshot["pending"]),
+            len(self._drain_rejects),
+        )
+        return snapshot
+
+    async def close_for_restart(self) -> None:
+        """드레인 이후 모든 클라이언트를 1012(Service Restart)로 닫고 종료한다."""
+        if self._drain_rejects:
+            await asyncio.gather(*self._drain_rejects, return_exceptions=True)
+            self._drain_rejects.clear()
+        for ws in list(self._clients):
+            try:
+                await ws.close(code=self.RESTART_CLOSE_CODE, reason="bridge restart")
+            except websockets.ConnectionClosed:
+                pass
+        await self.stop()
+
+    def adopt(self, snapshot: dict) -> None:
+        """이전 프로세스의 스냅샷을 인수하여 outbox 대기를 재개한다.
+
+        Args:
+            snapshot: drain()이 반환한 스냅샷.
+        """
+        now = self._clock.time()
+        self._client_owners.update(snapshot.get("owners", {}))
+        for key, acks in snapshot.get("accepted", {}).items():
+            self._accepted[key] = OrderedDict(acks)
+        for entry in snapshot.get("pending", []):
+            pending = PendingRequest(**entry)
+            self._client_owners.setdefault(pending.client_id, pending.token_id)
+            self._kiro.attach(pending.message_id, pending.worker, pending.content, pending.namespace)
+            remaining = pending.timeout - (now - pending.created_at)
+            self._track(pending, max(remaining, self.ADOPT_MIN_TIMEOUT))
+        for client_id, messages in snapshot.get("undelivered", {}).items():
+            for message in messages:
+                self._buffer_undelivered(client_id, message)
+        # 보관 프롬프트는 파일로 넘겨받는다 — 이전 프로세스가 드레인 직전에 보관한 것까지
+        self._parking.reload()
+        logger.info(
+            "핸드오프 인수: 대기 요청 %d건, 미전달 %d건",
+            len(snapshot.get("pending", [])),
+            sum(len(m) for m in self._undelivered.values()),
+        )
+
     async def handle_connection(
         self, websocket: websockets.WebSocketServerProtocol
     ) -> None:
@@ -76,22 +350,46 @@ class BridgeServer:
 
         연결 수립 후 인증을 검증하고, 인증 성공 시 메시지를 라우팅한다.
         """
+        if self._draining:
+            # 핸드오프 중 — 새 프로세스로 재연결하도록 즉시 종료
+            await websocket.close(code=self.RESTART_CLOSE_CODE, reason="bridge restart")
+            return
+
         self._clients.add(websocket)
         remote = websocket.remote_address
+        client_key = str(id(websocket))
         logger.info("클라이언트 연결: %s", remote)
         print(f"[Bridge] 클라이언트 연결: {remote}")
         self._log_status()
 
         heartbeat_task: asyncio.Task | None = None
+        conn: ClientConnection | None = None
         try:
             # 첫 메시지는 반드시 auth여야 한다
-            if not await self._authenticate(websocket):
+            conn = await self._authenticate(websocket)
+            if conn is None:
                 return
 
+            client_id = conn.client_id
+            conn.mux = ChannelMux(
+                lambda channel, msg: self._handle_message(websocket, msg, channel)
+            )
+            self._connections[websocket] = conn
+            self._memory.open(websocket)
+            self._token_connections[conn.token_id] = self._token_connections.get(conn.token_id, 0) + 1
             self._authenticated.add(websocket)
+            self._client_ids[client_id] = websocket
+            if conn.session:
+                self._sessions.subscribe(conn.session, websocket)
+            if self._shared is not None:
+                await self._shared.defer("register_client", client_key, str(remote))
+            self._status_feed.mark_dirty()
             logger.info("클라이언트 인증 성공: %s", remote)
             print(f"[Bridge] 클라이언트 인증 성공: {remote}")
 
+            # 재연결 전 전달하지 못한 응답 전송
+            await self._flush_undelivered(client_id)
+
             # heartbeat 태스크 시작 (Req 1.2)
             heartbeat_task = asyncio.create_task(
                 self._heartbeat_loop(websocket)
@@ -99,7 +397,11 @@ class BridgeServer:
 
             # 메시지 수신 루프
             async for raw in websocket:
-                await self._route_message(websocket, raw)
+                self._memory.add_inbound(websocket, len(raw))
+                try:
+                    await self._route_message(websocket, raw)
+                finally:
+                    self._memory.add_inbound(websocket, -len(raw))
 
         except websockets.ConnectionClosed:
             logger.info("클라이언트 연결 종료: %s", remote)
@@ -109,22 +411,48 @@ class BridgeServer:
         finally:
             if heartbeat_task is not None:
                 heartbeat_task.cancel()
+            extension = extension_of(websocket)
+            if extension is not None:
+                self._compression_totals.add(extension.stats)
+            if self._connections.pop(websocket, None) is not None:
+                self._token_connections[conn.token_id] -= 1
+            self._memory.close(websocket)
+            if conn is not None:
+                if conn.mux is not None:
+                    conn.mux.close_all()
+                if self._client_ids.get(conn.client_id) is websocket:
+                    del self._client_ids[conn.client_id]
+                    self._release_client_id(conn.client_id)
+            self._sessions.unsubscribe_all(websocket)
+            self._status_feed.unsubscribe(websocket)
             self._clients.discard(websocket)
             self._authenticated.discard(websocket)
+            if self._shared is not None:
+                self._shared.defer("unregister_client", client_key)
+            self._status_feed.mark_dirty()
             self._log_status()
 
-    async def broadcast(self, message: dict) -> None:
-        """인증된 모든 클라이언트에 메시지를 전송한다.
+    async def broadcast(
+        self,
+        message: dict,
+        targets: set[websockets.WebSocketServerProtocol] | None = None,
+    ) -> None:
+        """메시지를 한 번 인코딩하여 여러 클라이언트에 전송한다.
 
         Args:
             message: 전송할 메시지 딕셔너리.
+            targets: 전송 대상. None이면 인증된 모든 클라이언트.
         """
         data = json.dumps(message)
+        await self._broadcast_raw(data, self._authenticated if targets is None else targets)
+
+    async def _broadcast_raw(
+        self, data: str, targets: set[websockets.WebSocketServerProtocol]
+    ) -> None:
+        """이미 인코딩된 프레임을 대상 전원에게 전송한다."""
         disconnected: list[websockets.WebSocketServerProtocol] = []
-        for ws in self._authenticated:
-            try:
-                await ws.send(data)
-            except websockets.ConnectionClosed:
+        for ws in list(targets):
+            if not await self._write(ws, data):
                 disconnected.append(ws)
         for ws in disconnected:
             self._clients.discard(ws)
@@ -136,38 +464,186 @@ class BridgeServer:
 
     async def _authenticate(
         self, websocket: websockets.WebSocketServerProtocol
-    ) -> bool:
-        """첫 메시지로 인증을 수행한다 (Req 6.1, 6.2).
+    ) -> ClientConnection | None:
+        """핸드셰이크 또는 첫 메시지로 인증을 수행한다 (Req 6.1, 6.2).
+
+        핸드셰이크에 재개 티켓(?ticket= / X-Resume-Ticket)이나
+        Authorization: Bearer 토큰이 있으면 auth 메시지 없이 바로 인증한다.
+        티켓이 만료·위조되었으면 fallback="auth"로 알리고 같은 연결에서
+        auth 메시지를 기다린다.
+
+        auth payload에 이전 AUTH_RESULT의 client_id가 있으면 같은 ID를
+        이어받아, 연결이 끊긴 동안 도착한 응답을 받을 수 있다. 다른 토큰이
+        쓰던 client_id는 이어받지 않고 새 ID를 발급한다 (_claim_client_id).
+        같은 토큰의 기기들은 하나의 공유 세션에 묶인다.
 
         Returns:
-            인증 성공 시 True, 실패 시 False (연결 종료됨).
+            인증 성공 시 연결 상태, 실패 시 None (연결 종료됨).
         """
         try:
+            ticket, header_token, header_client_id = self._handshake_credentials(websocket)
+            link = self._query_param(websocket, "link")
+            if ticket:
+                resumed = self._tickets.verify(ticket) if self._resume_tickets else None
+                entry = self._auth.entry(resumed.token_id) if resumed is not None else None
+                if resumed is not None and entry is not None:
+                    return await self._accept(
+                        websocket, resumed.client_id, entry, session=resumed.session, resumed=True, link=link
+                    )
+                await self._send(
+                    websocket,
+                    ResponseType.AUTH_RESULT,
+                    {"success": False, "error": "Invalid resume ticket", "fallback": "auth"},
+                )
+            elif header_token:
+                entry = self._auth.identify(header_token)
+                if entry is not None:
+                    return await self._accept(websocket, header_client_id, entry, link=link)
+                await self._send(websocket, ResponseType.AUTH_RESULT, {"success": False, "error": "Invalid token"})
+                await websocket.close()
+                return None
+
             raw = await asyncio.wait_for(websocket.recv(), timeout=10)
             msg = json.loads(raw)
 
             if msg.get("type") != MessageType.AUTH.value:
                 await self._send(websocket, ResponseType.ERROR, {"error": "첫 메시지는 auth여야 합니다"})
                 await websocket.close()
-                return False
+                return None
 
-            token = msg.get("payload", {}).get("token", "")
-            if self._auth.validate(token):
-                await self._send(websocket, ResponseType.AUTH_RESULT, {"success": True})
-                return True
+            payload = msg.get("payload", {})
+            token = payload.get("token", "")
+            entry = self._auth.identify(token)
+            if entry is not None:
+                return await self._accept(websocket, payload.get("client_id"), entry, link=payload.get("link") or link)
             else:
                 await self._send(websocket, ResponseType.AUTH_RESULT, {"success": False, "error": "Invalid token"})
                 await websocket.close()
-                return False
+                return None
 
         except asyncio.TimeoutError:
             await self._send(websocket, ResponseType.ERROR, {"error": "인증 타임아웃"})
             await websocket.close()
-            return False
+            return None
         except (json.JSONDecodeError, Exception) as exc:
             logger.error("인증 처리 오류: %s", exc)
             await websocket.close()
-            return False
+            return None
+
+    @staticmethod
+    def _handshake_credentials(
+        websocket: websockets.WebSocketServerProtocol,
+    ) -> tuple[str | None, str | None, str | None]:
+        """핸드셰이크 요청에서 (재개 티켓, Bearer 토큰, client_id)를 꺼낸다.
+
+        토큰은 로그에 남지 않도록 헤더로만 받고, 티켓과 client_id는
+        헤더를 설정할 수 없는 클라이언트를 위해 쿼리로도 받는다.
+        """
+        request = getattr(websocket, "request", None)
+        if request is None:
+            return None, None, None
+        query = parse_qs(urlsplit(request.path).query)
+        ticket = request.headers.get("X-Resume-Ticket") or query.get("ticket", [None])[0]
+        client_id = query.get("client_id", [None])[0]
+        token = None
+        authorization = request.headers.get("Authorization", "")
+        if authorization.startswith("Bearer "):
+            token = authorization[len("Bearer "):].strip()
+        return ticket, token, client_id
+
+    @staticmethod
+    def _query_param(websocket: websockets.WebSocketServerProtocol, name: str) -> str | None:
+        """핸드셰이크 요청 URL의 쿼리 값."""
+        request = getattr(websocket, "request", None)
+        if request is None:
+            return None
+        return parse_qs(urlsplit(request.path).query).get(name, [None])[0]
+
+    async def _accept(
+        self,
+        websocket: websockets.WebSocketServerProtocol,
+        client_id: str | None,
+        entry: TokenEntry,
+        session: str | None = None,
+        resumed: bool = False,
+        link: str | None = None,
+    ) -> ClientConnection | None:
+        """인증 성공 AUTH_RESULT(새 재개 티켓 포함)를 보내고 연결 상태를 만든다.
+
+        토큰의 동시 연결 수 쿼터를 넘으면 실패를 보내고 연결을 닫는다.
+        link(cellular/wifi/lan)가 주어지면 해당 압축 설정을 연결에 적용한다.
+        """
+        if entry.max_connections and self._token_connections.get(entry.token_id, 0) >= entry.max_connections:
+            await self._send(
+                websocket,
+                ResponseType.AUTH_RESULT,
+                {"success": False, "error": f"연결 수 상한 초과 ({entry.max_connections})"},
+            )
+            await websocket.close()
+            return None
+        if self._sessions_enabled:
+            client_id = self._claim_client_id(client_id, entry.token_id)
+            session = session or entry.session
+        else:
+            # 이전 연결의 상태가 다른 워커에 있을 수 있으므로 이어받지 않는다
+            client_id, session = self._claim_client_id(None, entry.token_id), ""
+        self._compression.apply(websocket, link)
+        result = {
+            "success": True,
+            "client_id": client_id,
+            "session": session,
+            "seq": self._sessions.last_seq(session),
+            "resumed": resumed,
+            "endpoints": self._endpoint_list(),
+        }
+        if self._resume_tickets:
+            ticket, expires_at = self._tickets.issue(client_id, session, token_id=entry.token_id)
+            result.update(resume_ticket=ticket, ticket_expires=expires_at)
+        await self._send(websocket, ResponseType.AUTH_RESULT, result)
+        logger.info("토큰 인증: %s (%s)", entry.label, client_id)
+        return ClientConnection(
+            websocket=websocket, client_id=client_id, session=session, token_id=entry.token_id
+        )
+
+    def _claim_client_id(self, requested: str | None, token_id: str) -> str:
+        """요청한 client_id를 토큰에 묶어 반환한다.
+
+        처음 보는 ID이거나 같은 토큰이 쓰던 ID면 그대로 쓰고, 다른 토큰의
+        ID면(미전달 응답·대기 요청·진행 상황을 가로채려는 경우) 새 ID를 발급한다.
+        """
+        if requested:
+            owner = self._client_owners.get(requested) or self._parking.token_of(requested)
+            if owner is None or owner == token_id:
+                self._client_owners[requested] = token_id
+                return requested
+            logger.warning("다른 토큰의 client_id 요청 — 새 ID 발급: %s", requested)
+        client_id = f"cli-{uuid.uuid4().hex[:12]}"
+        self._client_owners[client_id] = token_id
+        return client_id
+
+    def _release_client_id(self, client_id: str) -> None:
+        """연결이 끊긴 client_id에 남은 응답·요청이 없으면 토큰 소유 기록을 지운다."""
+        if client_id in self._undelivered or self._parking.position_of(client_id):
+            return
+        if any(pending.client_id == client_id for pending in self._pending.values()):
+            return
+        self._client_owners.pop(client_id, None)
+
+    async def _token_reload_loop(self) -> None:
+        """토큰 레지스트리 파일 변경을 반영하고, 삭제된 토큰의 연결만 닫는다."""
+        while True:
+            await self._clock.sleep(self.TOKEN_RELOAD_INTERVAL)
+            removed = self._auth.reload()
+            if not removed:
+                continue
+            for ws, conn in list(self._connections.items()):
+                if conn.token_id in removed:
+                    try:
+                        await ws.close(code=self.REVOKED_CLOSE_CODE, reason="token revoked")
+                    except websockets.ConnectionClosed:
+                        pass
+            logger.info("토큰 삭제 반영: %d개", len(removed))
+            print(f"[Bridge] 토큰 레지스트리 갱신 — 삭제된 토큰 {len(removed)}개의 연결 종료")
 
     async def _route_message(
         self, websocket: websockets.WebSocketServerProtocol, raw: str
@@ -186,7 +662,29 @@ class BridgeServer:
         elif msg_type == MessageType.STATUS_REQUEST.value:
             await self._handle_status_request(websocket)
         elif msg_type == MessageType.MESSAGE.value:
-            await self._handle_message(websocket, msg)
+            await self._submit_message(websocket, msg)
+        elif msg_type == MessageType.CHANNEL_OPEN.value:
+            await self._handle_channel_open(websocket, msg)
+        elif msg_type == MessageType.CHANNEL_CLOSE.value:
+            await self._handle_channel_close(websocket, msg)
+        elif msg_type == MessageType.SUBSCRIBE.value:
+            await self._handle_subscribe(websocket, msg)
+        elif msg_type == MessageType.UNSUBSCRIBE.value:
+            await self._handle_unsubscribe(websocket)
+        elif msg_type == MessageType.SUBSCRIBE_STATUS.value:
+            await self._send(
+                websocket,
+                ResponseType.STATUS_SNAPSHOT,
+                {"status": self._status_feed.subscribe(websocket), "uptime": time.time() - self._start_time},
+            )
+        elif msg_type == MessageType.HISTORY_PAGE.value:
+            await self._handle_history(websocket, msg, search=False)
+        elif msg_type == MessageType.HISTORY_SEARCH.value:
+            await self._handle_history(websocket, msg, search=True)
+        elif msg_type == MessageType.FETCH_BODY.value:
+            await self._handle_fetch_body(websocket, msg)
+        elif msg_type == MessageType.UNSUBSCRIBE_STATUS.value:
+            self._status_feed.unsubscribe(websocket)
         else:
             await self._send(websocket, ResponseType.ERROR, {"error": f"알 수 없는 메시지 타입: {msg_type}"})
 
@@ -201,8 +699,8 @@ class BridgeServer:
     ) -> None:
         """상태 요청에 BridgeStatus를 반환한다 (Req 5.2)."""
         status = BridgeStatus(
-            kiro_running=True,  # 파일 기반 통신에서는 항상 True
-            connected_clients=len(self._authenticated),
+            kiro_running=self._kiro.running(),
+            connected_clients=self._connected_count(),
             uptime=time.time() - self._start_time,
         )
         await self._send(
@@ -213,60 +711,717 @@ class BridgeServer:
                     "kiro_running": status.kiro_running,
                     "connected_clients": status.connected_clients,
                     "uptime": status.uptime,
+                    "latency": self._latency.summary(),
+                    "kiro_workers": self._kiro.summary(),
+                    "parked": len(self._parking),
+                    "endpoints": self._endpoint_list(),
+                    "compression": self._compression_summary(),
+                    "memory": self._memory_status(websocket),
+                    "loop": self._loop_monitor.summary(),
                 }
             },
         )
 
-    async def _handle_message(
+    async def _handle_history(
+        self, websocket: websockets.WebSocketServerProtocol, msg: dict, search: bool
+    ) -> None:
+        """대화 기록 페이지/검색 요청에 응답한다.
+
+        payload: {"before": 커서(선택), "limit": 페이지 크기(선택), "query": 검색어(search만)}
+        응답의 next_cursor를 다음 요청의 before로 보내면 이전 기록을 이어서 받는다.
+        """
+        response_type = ResponseType.HISTORY_SEARCH if search else ResponseType.HISTORY_PAGE
+        if self._history is None:
+            await self._send(websocket, ResponseType.ERROR, {"error": "대화 기록 저장이 비활성화되어 있습니다"})
+            return
+        conn = self._connections.get(websocket)
+        token_id = conn.token_id if conn is not None else ""
+        payload = msg.get("payload", {})
+        try:
+            before = payload.get("before")
+            before = int(before) if before is not None else None
+            limit = int(payload.get("limit", PAGE_SIZE))
+        except (TypeError, ValueError):
+            await self._send(websocket, ResponseType.ERROR, {"error": "잘못된 before/limit 값"})
+            return
+        query = str(payload.get("query", ""))
+        try:
+            if search:
+                items, next_cursor = await self._history.defer("search", token_id, query, before, limit)
+            else:
+                items, next_cursor = await self._history.defer("page", token_id, before, limit)
+        except sqlite3.Error as exc:
+            logger.error("대화 기록 조회 실패: %s", exc)
+            await self._send(websocket, ResponseType.ERROR, {"error": "대화 기록 조회 실패"})
+            return
+        result = {"items": self._lazy_history(items, token_id), "next_cursor": next_cursor}
+        if search:
+            result["query"] = query
+        await self._send(websocket, response_type, result)
+
+    def _lazy_history(self, items: list[dict], token_id: str) -> list[dict]:
+        """지연 전송 모드에서는 기록의 긴 응답도 미리보기와 본문 해시/크기만 보낸다.
+
+        본문은 다시 저장되므로(이미 있으면 보관 기간만 연장) 정리된 뒤에도 fetch_body로 받을 수 있다.
+        """
+        if self._bodies is None:
+            return items
+        for item in items:
+            if item.get("status") != "done" or not item.get("response"):
+                continue
+            try:
+                lazy = self._bodies.describe(item["response"], token_id)
+            except OSError as exc:
+                logger.error("기록 본문 저장 실패 — 전체 전송: %s", exc)
+                continue
+            if lazy is not None:
+                item["response"] = lazy.pop("preview")
+                item.update(lazy)
+        return items
+
+    async def _body_prune_loop(self) -> None:
+        """오래된 응답 본문을 시작 시와 BODY_PRUNE_INTERVAL마다 정리한다 (디렉토리 순회는 스레드에서)."""
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                await loop.run_in_executor(None, self._bodies.prune)
+            except OSError as exc:
+                logger.error("응답 본문 정리 실패: %s", exc)
+            await self._clock.sleep(self.BODY_PRUNE_INTERVAL)
+
+    async def _handle_fetch_body(
+        self, websocket: websockets.WebSocketServerProtocol, msg: dict
+    ) -> None:
+        """미리보기로 보낸 응답 본문의 한 구간을 보낸다.
+
+        payload: {"hash": 본문 해시, "offset": 시작 바이트(선택), "length": 최대 바이트(선택)}
+        응답 body의 end가 size보다 작으면 end를 offset으로 다시 요청한다.
+        이 연결의 토큰으로 저장된 본문만 보낸다.
+        """
+        payload = msg.get("payload", {})
+        digest = str(payload.get("hash", ""))
+        if self._bodies is None:
+            await self._send(
+                websocket, ResponseType.ERROR, {"error": "본문 지연 전송이 비활성화되어 있습니다", "hash": digest}
+            )
+            return
+        try:
+            conn = self._connections.get(websocket)
+            content, start, end, size = self._bodies.read(
+                digest,
+                payload.get("offset", 0),
+                payload.get("length", MAX_CHUNK),
+                owner=conn.token_id if conn is not None else "",
+            )
+        except (TypeError, ValueError) as exc:
+            await self._send(websocket, ResponseType.ERROR, {"error": str(exc), "hash": digest})
+            return
+        except FileNotFoundError:
+            await self._send(websocket, ResponseType.ERROR, {"error": "본문이 없거나 만료되었습니다", "hash": digest})
+            return
+        await self._send(
+            websocket,
+            ResponseType.BODY,
+            {"hash": digest, "content": content, "offset": start, "end": end, "size": size},
+        )
+
+    def _write_history(self, method: str, *args) -> None:
+        """대화 기록을 전용 스레드에서 저장한다. 실패해도 메시지 처리는 계속한다."""
+        if self._history is None:
+            return
+        self._history.defer(method, *args).add_done_callback(self._log_history_failure)
+
+    @staticmethod
+    def _log_history_failure(future: asyncio.Future) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            logger.error("대화 기록 저장 실패: %s", future.exception())
+
+    async def _submit_message(
+        self, websocket: websockets.WebSocketServerProtocol, msg: dict
+    ) -> None:
+        """메시지를 채널 대기열에 넣는다. 처리는 채널 태스크가 순서대로 수행한다."""
+        channel = str(msg.get("channel", DEFAULT_CHANNEL))
+        mux = self._mux_of(websocket)
+        if mux is None:
+            return
+        content = msg.get("payload", {}).get("content", "")
+        ref = self._request_ref(msg)
+        error = self._admit_prompt(websocket, payload_size(content) if isinstance(content, str) else 0)
+        if error is not None:
+            await self._send(websocket, ResponseType.ERROR, {"error": error, **ref}, channel=channel)
+            return
+        try:
+            mux.submit(channel, msg)
+        except ChannelError as exc:
+            await self._send(websocket, ResponseType.ERROR, {"error": str(exc), **ref}, channel=channel)
+
+    async def _handle_channel_open(
+        self, websocket: websockets.WebSocketServerProtocol, msg: dict
+    ) -> None:
+        """논리 채널을 연다 (이미 열려 있으면 window만 갱신)."""
+        channel_id = str(msg.get("channel", ""))
+        window = msg.get("payload", {}).get("window", DEFAULT_WINDOW)
+        mux = self._mux_of(websocket)
+        if mux is None:
+            return
+        if not channel_id:
+            await self._send(websocket, ResponseType.ERROR, {"error": "channel이 필요합니다"})
+            return
+        try:
+            channel = mux.open(channel_id, int(window))
+        except (ChannelError, TypeError, ValueError) as exc:
+            await self._send(websocket, ResponseType.ERROR, {"error": str(exc)}, channel=channel_id)
+            return
+        await self._send(
+            websocket,
+            ResponseType.CHANNEL_OPENED,
+            {"window": channel.window, "credits": channel.credits},
+            channel=channel_id,
+        )
+
+    async def _handle_channel_close(
         self, websocket: websockets.WebSocketServerProtocol, msg: dict
+    ) -> None:
+        """논리 채널을 닫는다. 아직 시작하지 않은 프롬프트는 폐기된다."""
+        channel_id = str(msg.get("channel", ""))
+        mux = self._mux_of(websocket)
+        if mux is None:
+            return
+        try:
+            dropped = mux.close(channel_id)
+        except ChannelError as exc:
+            await self._send(websocket, ResponseType.ERROR, {"error": str(exc)}, channel=channel_id)
+            return
+        await self._send(
+            websocket, ResponseType.CHANNEL_CLOSED, {"dropped": dropped}, channel=channel_id
+        )
+
+    async def _handle_subscribe(
+        self, websocket: websockets.WebSocketServerProtocol, msg: dict
+    ) -> None:
+        """공유 세션 팬아웃을 (재)구독하고 since 이후 놓친 이벤트를 재전송한다."""
+        conn = self._connections.get(websocket)
+        if conn is None:
+            return
+        if not conn.session:
+            await self._send(websocket, ResponseType.ERROR, {"error": "공유 세션이 비활성화되어 있습니다"})
+            return
+        since = msg.get("payload", {}).get("since")
+        seq = self._sessions.subscribe(conn.session, websocket)
+        await self._send(
+            websocket, ResponseType.SUBSCRIBED, {"session": conn.session, "seq": seq}
+        )
+        if isinstance(since, int):
+            for data in self._sessions.replay(conn.session, since):
+                await self._broadcast_raw(data, {websocket})
+
+    async def _handle_unsubscribe(
+        self, websocket: websockets.WebSocketServerProtocol
+    ) -> None:
+        """공유 세션 팬아웃 수신을 중단한다 (자기 요청의 응답은 계속 받음)."""
+        conn = self._connections.get(websocket)
+        if conn is None:
+            return
+        self._sessions.unsubscribe(conn.session, websocket)
+        await self._send(
+            websocket, ResponseType.UNSUBSCRIBED, {"session": conn.session}
+        )
+
+    async def _handle_message(
+        self,
+        websocket: websockets.WebSocketServerProtocol,
+        msg: dict,
+        channel: str = DEFAULT_CHANNEL,
     ) -> None:
         """메시지를 파일 기반으로 Kiro IDE에 전달하고 응답을 반환한다.
 
         1. inbox/에 메시지 파일 작성
         2. Kiro hook이 파일을 감지하여 처리
         3. outbox/에서 응답 파일 대기 후 클라이언트에 전달
+
+        채널 태스크에서 호출되며, 응답까지 기다리므로 같은 채널의 다음
+        프롬프트는 이 응답 이후에 처리된다.
+
+        정상 Kiro 워커가 없으면 프롬프트를 보관(parked)하고 순번과 함께
+        ACK를 보낸 뒤 바로 반환한다. 보관 중에는 응답 대기 타이머가 돌지 않으며,
+        Kiro가 복구되면 _parking_loop가 순서대로 배정한다.
+
+        같은 client_id에서 이미 받은 request_id가 다시 오면(ACK를 받지 못한 채 끊겨
+        재전송한 경우) Kiro에 다시 보내지 않고 원래 ACK를 duplicate로 다시 보낸다.
+        done은 응답 전송까지 끝났는지 — 끊기기 직전에 보낸 응답은 유실됐을 수 있다.
         """
         content = msg.get("payload", {}).get("content", "")
+        ref = self._request_ref(msg)
         if not content:
-            await self._send(websocket, ResponseType.ERROR, {"error": "메시지 내용이 비어있습니다"})
+            await self._send(
+                websocket, ResponseType.ERROR, {"error": "메시지 내용이 비어있습니다", **ref}, channel=channel
+            )
+            return
+        if self._draining:
+            await self._send(
+                websocket,
+                ResponseType.ERROR,
+                {"error": "Bridge 재시작 중 — 재연결 후 다시 보내주세요", **ref},
+                channel=channel,
+            )
+            return
+
+        conn = self._connections.get(websocket)
+        if conn is not None and ref:
+            accepted = self._accepted.get(f"{conn.token_id}:{conn.client_id}", {}).get(ref["request_id"])
+            if accepted is not None:
+                message_id = accepted["message_id"]
+                done = message_id not in self._pending and not self._parking.holds(message_id)
+                logger.info("재전송 프롬프트 — ACK 재전송: %s (완료=%s)", message_id, done)
+                await self._send(
+                    websocket,
+                    ResponseType.MESSAGE_ACK,
+                    {**accepted, "duplicate": True, "done": done},
+                    channel=channel,
+                )
+                return
+        token_id = conn.token_id if conn is not None else ""
+        entry = self._auth.entry(token_id)
+        waiting = self._token_pending.get(token_id, 0) + self._parking.count_for(token_id)
+        if entry is not None and entry.max_pending and waiting >= entry.max_pending:
+            await self._send(
+                websocket,
+                ResponseType.ERROR,
+                {"error": f"응답 대기 요청 상한 초과 ({entry.max_pending})", **ref},
+                channel=channel,
+            )
             return
 
         # 고유 메시지 ID 생성
         message_id = f"msg-{uuid.uuid4().hex[:12]}"
+        client_id = conn.client_id if conn is not None else ""
+        session = conn.session if conn is not None else ""
+        pending = PendingRequest(
+            message_id=message_id,
+            client_id=client_id,
+            content=content,
+            created_at=self._clock.time(),
+            channel=channel,
+            session=session,
+            namespace=entry.namespace if entry is not None else "",
+            token_id=token_id,
+        )
 
-        # inbox에 메시지 작성
-        try:
-            write_message(message_id, content)
-        except OSError as exc:
-            logger.error("메시지 파일 작성 실패: %s", exc)
-            await self._send(websocket, ResponseType.ERROR, {"error": "메시지 파일 작성 실패"})
+        # Kiro 워커를 골라 inbox에 메시지 작성 — 이미 보관 중인 프롬프트가 있으면
+        # 순서를 지키기 위해 그 뒤에 보관한다
+        parked = len(self._parking) > 0
+        if not parked:
+            try:
+                self._dispatch(pending)
+            except KiroUnavailable as exc:
+                logger.warning("Kiro 워커 없음 — 프롬프트 보관: %s", exc)
+                parked = True
+            except OSError as exc:
+                logger.error("메시지 파일 작성 실패: %s", exc)
+                await self._send(
+                    websocket, ResponseType.ERROR, {"error": "메시지 파일 작성 실패", **ref}, channel=channel
+                )
+                return
+
+        mux = self._mux_of(websocket)
+        credits = mux.get(channel).credits if mux is not None and channel in mux else 0
+        if parked:
+            position = self._parking.park(pending)
+            self._status_feed.mark_dirty()
+            ack = {
+                "success": True,
+                "message_id": message_id,
+                "credits": credits,
+                "parked": True,
+                "position": position,
+                **ref,
+            }
+            logger.info("프롬프트 보관: %s (순번 %d)", message_id, position)
+            print(f"[Bridge] Kiro 응답 없음 — 프롬프트 보관: {message_id} (순번 {position})")
+        else:
+            # 지연 통계 기반 예상 완료 시간(eta)과 대기 마감(deadline) 포함
+            ack = {
+                "success": True,
+                "message_id": message_id,
+                "credits": credits,
+                "eta": self._latency.estimate(content),
+                "deadline": pending.timeout,
+                **ref,
+            }
+            logger.info("메시지 전달 완료: %s → inbox", message_id)
+            print(f"[Bridge] 메시지 → inbox: {message_id} ({content[:50]}...)")
+        if ref and conn is not None:
+            self._remember_ack(f"{token_id}:{client_id}", ack)
+        await self._send(websocket, ResponseType.MESSAGE_ACK, ack, channel=channel)
+        self._write_history("record_prompt", message_id, token_id, content, channel, pending.created_at)
+
+        # 같은 세션의 다른 기기에 프롬프트 공유
+        if session:
+            data, targets = self._sessions.publish(
+                session,
+                self._frame(
+                    ResponseType.SESSION_PROMPT,
+                    {"content": content, "message_id": message_id, "client_id": client_id},
+                ),
+                exclude=websocket,
+            )
+            await self._broadcast_raw(data, targets)
+
+        if parked:
             return
 
-        # 전송 완료 확인
-        await self._send(websocket, ResponseType.MESSAGE_ACK, {"success": True})
-        logger.info("메시지 전달 완료: %s → inbox", message_id)
-        print(f"[Bridge] 메시지 → inbox: {message_id} ({content[:50]}...)")
+        # Kiro 응답 대기 (outbox에서) — 태스크로 분리하여 드레인 시 취소 가능
+        task = self._track(pending, pending.timeout)
+        await asyncio.wait([task])
 
-        # Kiro 응답 대기 (outbox에서)
+    def _dispatch(self, pending: PendingRequest) -> KiroWorker:
+        """요청을 Kiro 워커 inbox에 쓰고 대기 시작 시각과 deadline을 정한다.
+
+        Raises:
+            KiroUnavailable: 정상 워커가 없는 경우.
+            OSError: 파일 작성 실패.
+        """
+        # 같은 대화는 sticky 정책 시 같은 워커
+        conversation = f"{pending.session}/{pending.channel}" if pending.session else ""
+        worker = self._kiro.submit(pending.message_id, pending.content, pending.namespace, conversation=conversation)
+        if self._shared is not None:
+            self._shared.defer("enqueue", pending.message_id)
+        pending.worker = worker.name
+        # 보관되어 있던 시간은 응답 시간 통계와 대기 시간에서 제외
+        pending.created_at = self._clock.time()
+        pending.timeout = self._latency.deadline(pending.content)
+        return worker
+
+    async def _parking_loop(self) -> None:
+        """Kiro가 복구되면 보관된 프롬프트를 보관 순서대로 배정한다.
+
+        복구 직후 한꺼번에 몰리지 않도록 PARKING_DRAIN_INTERVAL마다 하나씩 배정하며,
+        배정 시 요청한 기기에 unparked(eta/deadline 포함)를 보낸다.
+        """
+        while True:
+            await self._clock.sleep(self.PARKING_CHECK_INTERVAL)
+            while not self._draining and (pending := self._parking.peek()) is not None:
+                try:
+                    self._dispatch(pending)
+                except KiroUnavailable:
+                    break
+                except OSError as exc:
+                    logger.error("보관 프롬프트 파일 작성 실패: %s", exc)
+                    self._parking.pop()
+                    await self._deliver(
+                        pending.client_id,
+                        ResponseType.ERROR,
+                        {"error": "메시지 파일 작성 실패", "message_id": pending.message_id},
+                        channel=pending.channel,
+                    )
+                    continue
+                self._parking.pop()
+                await self._deliver(
+                    pending.client_id,
+                    ResponseType.UNPARKED,
+                    {
+                        "message_id": pending.message_id,
+                        "eta": self._latency.estimate(pending.content),
+                        "deadline": pending.timeout,
+                        "remaining": len(self._parking),
+                    },
+                    channel=pending.channel,
+                )
+                self._track(pending, pending.timeout)
+                logger.info("보관 프롬프트 배정: %s → %s", pending.message_id, pending.worker)
+                print(f"[Bridge] 보관 프롬프트 → inbox: {pending.message_id} (남은 {len(self._parking)}건)")
+                await self._clock.sleep(self.PARKING_DRAIN_INTERVAL)
+
+    def _track(self, pending: PendingRequest, timeout: float) -> asyncio.Task:
+        """요청을 대기 테이블에 등록하고 outbox 대기 태스크를 시작한다."""
+        self._pending[pending.message_id] = pending
+        self._waiting_bytes.add(pending.client_id, pending.size)
+        self._token_pending[pending.token_id] = self._token_pending.get(pending.token_id, 0) + 1
+        task = asyncio.create_task(self._await_response(pending, timeout))
+        self._waiters[pending.message_id] = task
+        self._status_feed.mark_dirty()
+        return task
+
+    async def _await_response(self, pending: PendingRequest, timeout: float) -> None:
+        """outbox 응답을 기다려 요청한 client_id에 전달한다.
+
+        대기 중에는 PROGRESS_INTERVAL마다 progress 프레임으로 경과 시간과
+        예상 완료 시간을 알려 클라이언트가 재시도 여부를 판단할 수 있게 한다.
+        """
+        message_id = pending.message_id
+        progress_task = asyncio.create_task(self._progress_loop(pending))
         try:
-            response_text = await wait_for_response(message_id, timeout=self.KIRO_RESPONSE_TIMEOUT)
-            # inbox 파일 정리
-            cleanup_inbox(message_id)
+            response_text = await self._wait_outbox(message_id, timeout)
+        except TimeoutError:
+            self._latency.record_timeout(pending.content, pending.timeout)
+            self._kiro.release(message_id)
+            self._forget(message_id)
+            self._write_history("record_error", message_id, "Kiro 응답 대기 시간 초과")
+            await self._publish_result(
+                pending,
+                ResponseType.ERROR,
+                {"error": "Kiro 응답 대기 시간 초과", "message_id": message_id},
+            )
+            logger.warning("Kiro 응답 타임아웃: %s", message_id)
+            return
+        except asyncio.CancelledError:
+            # 드레인(핸드오프) 또는 서버 종료 — inbox는 새 프로세스가 이어받는다
+            self._kiro.detach(message_id)
+            self._forget(message_id)
+            return
+        finally:
+            progress_task.cancel()
+
+        self._latency.record(pending.content, self._clock.time() - pending.created_at)
+
+        # inbox 파일 정리
+        self._kiro.release(message_id)
+        self._forget(message_id)
+        self._write_history("record_response", message_id, response_text)
+        payload = self._response_payload(message_id, response_text, pending.token_id)
+        await self._publish_result(pending, ResponseType.KIRO_RESPONSE, payload)
+        logger.info("Kiro 응답 전달 완료: %s", message_id)
+        print(f"[Bridge] Kiro 응답 → 모바일: {message_id}")
+
+    def _response_payload(self, message_id: str, response_text: str, token_id: str) -> dict:
+        """KIRO_RESPONSE payload — 지연 전송 모드에서 긴 응답은 미리보기와 해시/크기만.
+
+        본문은 요청한 토큰(token_id) 소유로 저장되어 그 토큰만 fetch_body로 읽는다.
+        """
+        if self._bodies is not None:
+            try:
+                lazy = self._bodies.describe(response_text, token_id)
+            except OSError as exc:
+                logger.error("응답 본문 저장 실패 — 전체 전송: %s", exc)
+                lazy = None
+            if lazy is not None:
+                return {"message_id": message_id, **lazy}
+        return {"content": response_text, "message_id": message_id}
+
+    async def _progress_loop(self, pending: PendingRequest) -> None:
+        """응답 대기 중 요청한 기기에 진행 상황(keep-alive 겸)을 주기적으로 보낸다."""
+        eta = self._latency.estimate(pending.content)
+        while True:
+            await self._clock.sleep(self.PROGRESS_INTERVAL)
+            websocket = self._client_ids.get(pending.client_id)
+            if websocket is None:
+                continue
+            elapsed = self._clock.time() - pending.created_at
             await self._send(
                 websocket,
-                ResponseType.KIRO_RESPONSE,
-                {"content": response_text},
+                ResponseType.PROGRESS,
+                {
+                    "message_id": pending.message_id,
+                    "elapsed": round(elapsed, 1),
+                    "eta": eta,
+                    "deadline": pending.timeout,
+                },
+                channel=pending.channel,
             )
-            logger.info("Kiro 응답 전달 완료: %s", message_id)
-            print(f"[Bridge] Kiro 응답 → 모바일: {message_id}")
-        except TimeoutError:
-            cleanup_inbox(message_id)
+
+    def _forget(self, message_id: str) -> None:
+        """대기 테이블에서 요청을 제거한다."""
+        pending = self._pending.pop(message_id, None)
+        if pending is not None:
+            self._token_pending[pending.token_id] -= 1
+            self._waiting_bytes.remove(pending.client_id, pending.size)
+        self._waiters.pop(message_id, None)
+        self._status_feed.mark_dirty()
+
+    def _mux_of(self, websocket: websockets.WebSocketServerProtocol) -> ChannelMux | None:
+        """연결의 채널 다중화기를 반환한다."""
+        conn = self._connections.get(websocket)
+        return conn.mux if conn is not None else None
+
+    async def _publish_result(
+        self, pending: PendingRequest, response_type: ResponseType, payload: dict
+    ) -> None:
+        """요청 결과를 세션 구독자 전원에게 한 번 인코딩하여 발행한다.
+
+        요청한 기기가 세션 구독자에 없으면(구독 해제 또는 연결 끊김)
+        _deliver로 따로 전달하거나 재연결 시까지 보관한다.
+        """
+        if not pending.session:
+            await self._deliver(pending.client_id, response_type, payload, channel=pending.channel)
+            return
+        data, targets = self._sessions.publish(
+            pending.session, self._frame(response_type, payload, pending.channel)
+        )
+        await self._broadcast_raw(data, targets)
+        requester = self._client_ids.get(pending.client_id)
+        if requester is None or requester not in targets:
+            await self._deliver(pending.client_id, response_type, payload, channel=pending.channel)
+
+    async def _deliver(
+        self,
+        client_id: str,
+        response_type: ResponseType,
+        payload: dict,
+        channel: str | None = None,
+    ) -> None:
+        """client_id의 현재 연결로 전송하고, 연결이 없으면 재연결 시까지 보관한다.
+
+        세션이 꺼져 있으면 같은 client_id로 재연결하지 않으므로 보관하지 않는다.
+        """
+        websocket = self._client_ids.get(client_id)
+        if websocket is None and not self._sessions_enabled:
+            logger.info("연결 끊김 — 응답 폐기: %s (%s)", client_id, response_type.value)
+            return
+        if websocket is None:
+            self._buffer_undelivered(
+                client_id, {"type": response_type.value, "payload": payload, "channel": channel}
+            )
+            logger.info("미전달 보관: %s (%s)", client_id, response_type.value)
+            return
+        await self._send(websocket, response_type, payload, channel=channel)
+
+    def _buffer_undelivered(self, client_id: str, message: dict) -> None:
+        """미전달 메시지를 보관한다. 응답 크기는 여기서 한 번만 세어 함께 저장한다."""
+        if "size" not in message:
+            message["size"] = payload_size(message["payload"].get("content", ""))
+        self._undelivered.setdefault(client_id, []).append(message)
+        self._undelivered_bytes.add(client_id, message["size"])
+
+    async def _flush_undelivered(self, client_id: str) -> None:
+        """보관된 미전달 메시지를 재연결한 클라이언트에 전송한다."""
+        messages = self._undelivered.pop(client_id, [])
+        self._undelivered_bytes.remove(client_id, self._undelivered_bytes.of(client_id))
+        websocket = self._client_ids.get(client_id)
+        for message in messages:
             await self._send(
                 websocket,
-                ResponseType.ERROR,
-                {"error": "Kiro 응답 대기 시간 초과"},
+                ResponseType(message["type"]),
+                message["payload"],
+                channel=message.get("channel"),
             )
-            logger.warning("Kiro 응답 타임아웃: %s", message_id)
+        if messages:
+            logger.info("미전달 메시지 %d건 전달: %s", len(messages), client_id)
+
+    async def _wait_outbox(self, message_id: str, timeout: float) -> str:
+        """배정된 Kiro 워커의 outbox 응답을 기다린다. 공유 큐가 있으면 완료 시 제거한다."""
+        try:
+            return await self._kiro.wait(message_id, timeout)
+        finally:
+            if self._shared is not None:
+                self._shared.defer("complete", message_id)
+
+    def _status_common(self) -> dict:
+        """모든 상태 구독자에게 같은 현재 상태 — flush마다 한 번 계산 (SQLite 조회, heartbeat 파일 확인)."""
+        return {
+            "connected_clients": self._connected_count(),
+            "kiro_running": self._kiro.running(),
+            "queue_depth": self._shared.queue_depth() if self._shared is not None else len(self._pending),
+            "in_flight": sum(worker.in_flight for worker in self._kiro.workers()),
+            "parked": len(self._parking),
+        }
+
+    def _status_fields(self, websocket: websockets.WebSocketServerProtocol) -> dict:
+        """상태 구독자 하나에게만 해당하는 현재 상태 (대기 순번)."""
+        conn = self._connections.get(websocket)
+        queue_position = 0
+        if conn is not None:
+            # 이 클라이언트의 가장 오래된 대기 요청 앞에 있는 요청 수 + 1 (없으면 0)
+            for index, pending in enumerate(self._pending.values()):
+                if pending.client_id == conn.client_id:
+                    queue_position = index + 1
+                    break
+        return {"queue_position": queue_position}
+
+    async def _send_status_delta(
+        self, websocket: websockets.WebSocketServerProtocol, changes: dict
+    ) -> None:
+        await self._send(websocket, ResponseType.STATUS_DELTA, {"changes": changes})
+
+    def _remember_ack(self, key: str, ack: dict) -> None:
+        """request_id로 보낸 ACK를 기억한다 (client_id마다 최근 DEDUP_WINDOW개)."""
+        acks = self._accepted.setdefault(key, OrderedDict())
+        self._accepted.move_to_end(key)
+        acks[ack["request_id"]] = ack
+        if len(acks) > self.DEDUP_WINDOW:
+            acks.popitem(last=False)
+        if len(self._accepted) > self.DEDUP_CLIENTS:
+            self._accepted.popitem(last=False)
+
+    @staticmethod
+    def _request_ref(msg: dict) -> dict:
+        """클라이언트가 프롬프트에 붙인 request_id — ACK/ERROR payload에 그대로 돌려준다.
+
+        message_id는 처리 시작 시 서버가 정하므로, 파이프라이닝하는 클라이언트는
+        이 값으로 ACK와 거절(ERROR)을 자기 요청에 대응시킨다.
+        """
+        request_id = msg.get("payload", {}).get("request_id")
+        return {"request_id": request_id} if isinstance(request_id, str) and request_id else {}
+
+    def _serve_options(self) -> dict:
+        """websockets.serve 공통 옵션 (압축 확장, 수신 프레임 크기/대기열 상한)."""
+        return {
+            "compression": None,
+            "extensions": self._compression.extensions(),
+            **self._memory.limits.serve_options(),
+        }
+
+    def _pending_bytes(self, websocket: websockets.WebSocketServerProtocol) -> int:
+        """연결이 Bridge에 맡겨 둔 프롬프트 바이트 (채널 대기열 + 응답 대기 + 보관)."""
+        conn = self._connections.get(websocket)
+        if conn is None:
+            return 0
+        queued = conn.mux.queued_bytes if conn.mux is not None else 0
+        waiting = self._waiting_bytes.of(conn.client_id)
+        return queued + waiting + self._parking.payload_bytes(conn.client_id)
+
+    def _memory_total(self) -> int:
+        """프로세스 전체 계정 바이트 (버퍼 + 대기 프롬프트 + 보관 + 미전달 응답)."""
+        queued = sum(conn.mux.queued_bytes for conn in self._connections.values() if conn.mux is not None)
+        waiting = self._waiting_bytes.total
+        undelivered = self._undelivered_bytes.total
+        return self._memory.buffered + queued + waiting + self._parking.payload_bytes() + undelivered
+
+    def _admit_prompt(self, websocket: websockets.WebSocketServerProtocol, size: int) -> str | None:
+        """새 프롬프트를 받을 수 있는지 확인한다. 거절 사유 또는 None."""
+        limits = self._memory.limits
+        if self._pending_bytes(websocket) + size > limits.max_pending:
+            return f"처리 대기 프롬프트 크기 상한 초과 ({limits.max_pending} bytes) — 응답을 받은 뒤 다시 보내주세요"
+        if self._memory_total() + size > limits.budget:
+            logger.warning("메모리 예산 초과 — 새 프롬프트 거절")
+            return "Bridge 메모리 한도 초과 — 잠시 후 다시 보내주세요"
+        return None
+
+    def _memory_status(self, websocket: websockets.WebSocketServerProtocol) -> dict:
+        """상태 응답의 memory 항목 — 같은 토큰 연결들의 사용량과 프로세스 합계."""
+        conn = self._connections.get(websocket)
+        token_id = conn.token_id if conn is not None else None
+        limits = self._memory.limits
+        return {
+            "connections": [
+                {"client_id": c.client_id, **self._memory.snapshot(ws), "pending": self._pending_bytes(ws)}
+                for ws, c in self._connections.items()
+                if c.token_id == token_id
+            ],
+            "total": self._memory_total(),
+            "budget": limits.budget,
+            "max_outbound": limits.max_outbound,
+            "max_pending": limits.max_pending,
+            "shed": self._memory.shed,
+        }
+
+    def _compression_summary(self) -> dict:
+        """압축 전/후 송수신 바이트 합계 (종료된 연결 + 현재 연결)."""
+        totals = CompressionStats()
+        totals.add(self._compression_totals)
+        for websocket in self._clients:
+            extension = extension_of(websocket)
+            if extension is not None:
+                totals.add(extension.stats)
+        return totals.summary()
+
+    def _endpoint_list(self) -> list[dict]:
+        return [{"kind": kind, "url": url} for kind, url in self._endpoints.items()]
+
+    def _connected_count(self) -> int:
+        """인증된 클라이언트 수 (멀티 워커 모드에서는 전체 워커 합계)."""
+        if self._shared is not None:
+            return self._shared.client_count()
+        return len(self._authenticated)
 
     async def _heartbeat_loop(
         self, websocket: websockets.WebSocketServerProtocol
@@ -274,7 +1429,7 @@ class BridgeServer:
         """주기적으로 heartbeat를 전송한다 (Req 1.2)."""
         try:
             while True:
-                await asyncio.sleep(self.HEARTBEAT_INTERVAL)
+                await self._clock.sleep(self.HEARTBEAT_INTERVAL)
                 await self._send(websocket, ResponseType.HEARTBEAT, {})
         except (asyncio.CancelledError, websockets.ConnectionClosed):
             pass
@@ -284,22 +1439,50 @@ class BridgeServer:
         websocket: websockets.WebSocketServerProtocol,
         response_type: ResponseType,
         payload: dict,
+        channel: str | None = None,
     ) -> None:
         """ServerMessage를 JSON으로 직렬화하여 전송한다."""
+        await self._write(websocket, json.dumps(self._frame(response_type, payload, channel)))
+
+    async def _write(self, websocket: websockets.WebSocketServerProtocol, data: str) -> bool:
+        """전송 계정과 상한을 적용하여 프레임을 보낸다.
+
+        Returns:
+            전송했으면 True, 연결이 닫혔거나 상한 초과로 끊었으면 False.
+        """
+        size = len(data)
+        if not self._memory.admit_outbound(websocket, size):
+            return False
+        self._memory.add_outbound(websocket, size)
+        try:
+            await websocket.send(data)
+            return True
+        except websockets.ConnectionClosed:
+            return False
+        finally:
+            self._memory.add_outbound(websocket, -size)
+
+    @staticmethod
+    def _frame(
+        response_type: ResponseType, payload: dict, channel: str | None = None
+    ) -> dict:
+        """ServerMessage를 전송 프레임 딕셔너리로 변환한다.
+
+        channel이 주어지면 프레임 최상위에 "channel" 필드를 추가한다.
+        """
         message = ServerMessage(
             type=response_type,
             payload=payload,
             timestamp=time.time(),
         )
-        data = json.dumps({
+        frame = {
             "type": message.type.value,
             "payload": message.payload,
             "timestamp": message.timestamp,
-        })
-        try:
-            await websocket.send(data)
-        except websockets.ConnectionClosed:
-            pass
+        }
+        if channel is not None:
+            frame["channel"] = channel
+        return frame
 
     def _log_status(self) -> None:
         """현재 연결 상태를 콘솔에 출력한다 (Req 5.2)."""
@@ -0,0 +1,115 @@
+"""공유 세션 팬아웃 모듈
+
+같은 토큰으로 연결한 기기들(폰, 태블릿 등)을 하나의 세션으로 묶어,
+프롬프트와 Kiro 응답을 세션 구독자 전원에게 한 번씩 발행한다.
+
+- 프레임은 발행 시 한 번만 JSON 인코딩되어 모든 구독자에게 같은 바이트로 전송된다.
+- 세션마다 최근 이벤트를 seq 번호와 함께 보관하여, 늦게 들어온 기기가
+  subscribe(since=seq)로 놓친 이벤트를 따라잡을 수 있다.
+- 클라이언트는 payload의 message_id로 중복 수신을 걸러낸다.
+"""
+
+import json
+import logging
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+REPLAY_SIZE = 50  # 세션당 보관하는 최근 이벤트 수
+
+
+def default_session(token_id: str) -> str:
+    """토큰의 기본 세션 ID (token_id는 토큰 해시 앞부분이라 원문은 노출되지 않음)."""
+    return f"tok-{token_id}"
+
+
+class _Session:
+    def __init__(self, replay_size: int) -> None:
+        self.subscribers: set = set()
+        self.seq = 0
+        self.log: deque[tuple[int, str]] = deque(maxlen=replay_size)
+
+
+class SessionHub:
+    """세션별 구독자 집합과 재전송 로그"""
+
+    def __init__(self, replay_size: int = REPLAY_SIZE) -> None:
+        self._replay_size = replay_size
+        self._sessions: dict[str, _Session] = {}
+        self._memberships: dict[object, set[str]] = {}
+
+    def _session(self, session_id: str) -> _Session:
+        session = self._sessions.get(session_id)
+        if session is None:
+            session = self._sessions[session_id] = _Session(self._replay_size)
+        return session
+
+    def subscribe(self, session_id: str, subscriber: object) -> int:
+        """세션을 구독한다.
+
+        Returns:
+            세션의 현재 마지막 seq.
+        """
+        session = self._session(session_id)
+        session.subscribers.add(subscriber)
+        self._memberships.setdefault(subscriber, set()).add(session_id)
+        return session.seq
+
+    def unsubscribe(self, session_id: str, subscriber: object) -> None:
+        """세션 구독을 해제한다."""
+        session = self._sessions.get(session_id)
+        if session is not None:
+            session.subscribers.discard(subscriber)
+        self._memberships.get(subscriber, set()).discard(session_id)
+
+    def unsubscribe_all(self, subscriber: object) -> None:
+        """연결 종료 시 모든 세션에서 구독을 해제한다."""
+        for session_id in self._memberships.pop(subscriber, set()):
+            session = self._sessions.get(session_id)
+            if session is not None:
+                session.subscribers.discard(subscriber)
+
+    def sessions_of(self, subscriber: object) -> set[str]:
+        """구독자가 속한 세션 ID 집합."""
+        return set(self._memberships.get(subscriber, set()))
+
+    def subscribers(self, session_id: str) -> set:
+        """세션의 현재 구독자 집합 (복사본)."""
+        session = self._sessions.get(session_id)
+        return set(session.subscribers) if session is not None else set()
+
+    def last_seq(self, session_id: str) -> int:
+        session = self._sessions.get(session_id)
+        return session.seq if session is not None else 0
+
+    def publish(
+        self, session_id: str, frame: dict, exclude: object | None = None
+    ) -> tuple[str, set]:
+        """세션에 이벤트를 발행한다.
+
+        frame에 "session"과 "seq"를 붙여 한 번만 인코딩하고 재전송 로그에 남긴다.
+
+        Args:
+            session_id: 발행할 세션.
+            frame: 전송할 프레임 딕셔너리 (type/payload/timestamp...).
+            exclude: 전송 대상에서 제외할 구독자 (예: 프롬프트를 보낸 기기).
+
+        Returns:
+            (인코딩된 프레임, 전송 대상 구독자 집합).
+        """
+        session = self._session(session_id)
+        session.seq += 1
+        data = json.dumps({**frame, "session": session_id, "seq": session.seq})
+        session.log.append((session.seq, data))
+        targets = session.subscribers - {exclude} if exclude is not None else set(session.subscribers)
+        return data, targets
+
+    def replay(self, session_id: str, since: int) -> list[str]:
+        """since 이후에 발행된 이벤트 프레임 목록을 반환한다.
+
+        로그 보관 범위를 벗어난 이벤트는 포함되지 않는다.
+        """
+        session = self._sessions.get(session_id)
+        if session is None:
+            return []
+        return [data for seq, data in session.log if seq > since]
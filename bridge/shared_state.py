@@ -0,0 +1,158 @@
+"""멀티 워커 공유 상태 모듈
+
+여러 Bridge 워커 프로세스가 같은 포트를 공유할 때, 연결된 클라이언트 목록과
+메시지 큐(inbox → outbox 대기 목록)를 SQLite 파일 하나로 조정한다.
+
+SQLite WAL 모드를 사용하므로 워커 간 동시 읽기/쓰기가 가능하며,
+별도 브로커 프로세스 없이 같은 PC의 프로세스끼리만 공유한다.
+
+다른 워커가 쓰는 동안에는 쓰기가 잠금을 기다릴 수 있으므로, 이벤트 루프에서는
+defer()로 전용 스레드에 넘겨 순서대로 실행한다. 읽기(집계)는 WAL에서 쓰기에
+막히지 않으므로 별도 연결로 바로 조회한다.
+"""
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = Path(__file__).parent / "shared_state.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS clients (
+    worker_id  TEXT NOT NULL,
+    client_key TEXT NOT NULL,
+    remote     TEXT,
+    connected_at REAL NOT NULL,
+    PRIMARY KEY (worker_id, client_key)
+);
+CREATE TABLE IF NOT EXISTS queue (
+    message_id TEXT PRIMARY KEY,
+    worker_id  TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+
+class SharedState:
+    """워커 간 공유되는 클라이언트 레지스트리 및 메시지 큐
+
+    각 워커는 자신의 worker_id로 행을 기록하고, 전체 집계(클라이언트 수,
+    큐 길이)는 모든 워커의 행을 합산하여 계산한다.
+    """
+
+    def __init__(self, worker_id: str, db_path: Path | str = DEFAULT_DB_PATH) -> None:
+        """공유 상태 DB에 연결한다.
+
+        Args:
+            worker_id: 이 프로세스를 식별하는 워커 ID.
+            db_path: SQLite 파일 경로.
+        """
+        self.worker_id = worker_id
+        self._db_path = Path(db_path)
+        # 쓰기 연결 — 호출 스레드와 defer() 전용 스레드가 함께 쓰므로 잠금으로 직렬화
+        self._conn = sqlite3.connect(
+            str(self._db_path), timeout=5.0, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        # 읽기 연결 — 생성한 스레드(이벤트 루프)에서만 사용
+        self._reader = sqlite3.connect(str(self._db_path), timeout=5.0, isolation_level=None)
+        self._writer: ThreadPoolExecutor | None = None
+
+    def close(self) -> None:
+        """미처리 쓰기를 마치고 이 워커의 행을 정리한 뒤 연결을 닫는다."""
+        if self._writer is not None:
+            self._writer.shutdown(wait=True)
+        try:
+            self.purge_worker(self.worker_id)
+        finally:
+            self._conn.close()
+            self._reader.close()
+
+    def defer(self, method: str, *args) -> asyncio.Future:
+        """쓰기 메서드를 전용 스레드에서 호출 순서대로 실행한다.
+
+        이벤트 루프를 막지 않으며, 기다리지 않아도 순서는 유지된다
+        (enqueue 뒤의 complete가 먼저 실행되지 않음). 실패는 로그만 남긴다.
+
+        Args:
+            method: 쓰기 메서드 이름 (register_client, enqueue 등).
+            *args: 메서드 인자.
+        """
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"shared-{self.worker_id}")
+        call = getattr(self, method)
+
+        def _run() -> None:
+            try:
+                call(*args)
+            except sqlite3.Error as exc:
+                logger.error("공유 상태 쓰기 실패 (%s): %s", method, exc)
+
+        return asyncio.get_running_loop().run_in_executor(self._writer, _run)
+
+    def _write(self, sql: str, params: tuple = ()) -> None:
+        with self._lock:
+            self._conn.execute(sql, params)
+
+    # ------------------------------------------------------------------
+    # 클라이언트 레지스트리
+    # ------------------------------------------------------------------
+
+    def register_client(self, client_key: str, remote: str = "") -> None:
+        """연결된 클라이언트를 등록한다."""
+        self._write(
+            "INSERT OR REPLACE INTO clients VALUES (?, ?, ?, ?)",
+            (self.worker_id, client_key, remote, time.time()),
+        )
+
+    def unregister_client(self, client_key: str) -> None:
+        """연결 종료된 클라이언트를 제거한다."""
+        self._write(
+            "DELETE FROM clients WHERE worker_id = ? AND client_key = ?",
+            (self.worker_id, client_key),
+        )
+
+    def client_count(self) -> int:
+        """모든 워커에 연결된 클라이언트 수를 반환한다."""
+        (count,) = self._reader.execute("SELECT COUNT(*) FROM clients").fetchone()
+        return count
+
+    # ------------------------------------------------------------------
+    # 메시지 큐
+    # ------------------------------------------------------------------
+
+    def enqueue(self, message_id: str) -> None:
+        """inbox에 작성된 메시지를 이 워커 소유로 기록한다."""
+        self._write(
+            "INSERT OR REPLACE INTO queue VALUES (?, ?, ?)",
+            (message_id, self.worker_id, time.time()),
+        )
+
+    def complete(self, message_id: str) -> None:
+        """응답 수신(또는 타임아웃)된 메시지를 큐에서 제거한다."""
+        self._write("DELETE FROM queue WHERE message_id = ?", (message_id,))
+
+    def queue_depth(self) -> int:
+        """모든 워커에서 응답 대기 중인 메시지 수를 반환한다."""
+        (count,) = self._reader.execute("SELECT COUNT(*) FROM queue").fetchone()
+        return count
+
+    def reset(self) -> None:
+        """모든 워커의 행을 제거한다 (supervisor 시작 시 사용)."""
+        self._write("DELETE FROM clients")
+        self._write("DELETE FROM queue")
+
+    def purge_worker(self, worker_id: str) -> None:
+        """종료(또는 비정상 종료)된 워커의 행을 모두 제거한다."""
+        self._write("DELETE FROM clients WHERE worker_id = ?", (worker_id,))
+        self._write("DELETE FROM queue WHERE worker_id = ?", (worker_id,))
+        logger.info("워커 상태 정리: %s", worker_id)
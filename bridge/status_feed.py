@@ -0,0 +1,126 @@
+"""상태 구독(push) 모듈
+
+클라이언트가 subscribe_status를 보내면 현재 상태 스냅샷을 한 번 받고,
+이후에는 값이 바뀐 필드만 담은 delta 이벤트를 받는다.
+
+- 변경 알림(mark_dirty)은 즉시 보내지 않고 모아서, 구독자별로 직전에
+  보낸 값과 비교한 변경분만 보낸다 (coalescing).
+- 전송은 MIN_INTERVAL에 한 번으로 제한되어, 연결이 몰려도 구독자에게
+  delta가 쏟아지지 않는다 (rate limit).
+- 이벤트가 없는 변화(Kiro 워커 상태 등)는 TICK_INTERVAL마다 한 번 확인한다.
+- 모든 구독자에게 같은 필드(common)는 flush마다 한 번만 계산하여 나눠 쓰고,
+  구독자별 필드(collect)만 구독자마다 계산한다.
+- 간격 측정과 대기는 주입된 Clock으로 한다 (서버의 시계를 받음).
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+from bridge.clock import REAL_CLOCK, Clock
+
+logger = logging.getLogger(__name__)
+
+MIN_INTERVAL = 1.0  # delta 전송 최소 간격 (초)
+TICK_INTERVAL = 5.0  # 이벤트 없이 상태를 다시 확인하는 간격 (초)
+
+Collect = Callable[[object], dict]
+Common = Callable[[], dict]
+SendDelta = Callable[[object, dict], Awaitable[None]]
+
+
+class StatusFeed:
+    """상태 구독자 관리와 delta 전송"""
+
+    def __init__(
+        self,
+        collect: Collect,
+        send_delta: SendDelta,
+        min_interval: float = MIN_INTERVAL,
+        tick_interval: float = TICK_INTERVAL,
+        clock: Clock | None = None,
+        common: Common | None = None,
+    ) -> None:
+        """
+        Args:
+            collect: 구독자 하나에만 해당하는 현재 상태를 만드는 함수 (필드 → 값).
+            send_delta: 구독자에게 변경분을 보내는 코루틴.
+            min_interval: delta 전송 최소 간격 (초).
+            tick_interval: 이벤트 없이 상태를 다시 확인하는 간격 (초).
+            clock: 전송 간격·확인 주기에 쓸 시계. None이면 실제 시계.
+            common: 모든 구독자에게 같은 현재 상태를 만드는 함수 (flush마다 한 번 호출).
+        """
+        self._collect = collect
+        self._common = common
+        self._send_delta = send_delta
+        self._min_interval = min_interval
+        self._tick_interval = tick_interval
+        self._clock = clock or REAL_CLOCK
+        self._last: dict[object, dict] = {}
+        self._dirty = False
+        self._last_flush = float("-inf")
+        self._flush_task: asyncio.Task | None = None
+        self._tick_task: asyncio.Task | None = None
+
+    def __contains__(self, subscriber: object) -> bool:
+        return subscriber in self._last
+
+    def start(self) -> None:
+        """주기적 상태 확인을 시작한다."""
+        self._tick_task = asyncio.create_task(self._tick_loop())
+
+    def close(self) -> None:
+        """백그라운드 태스크를 중단한다."""
+        for task in (self._flush_task, self._tick_task):
+            if task is not None:
+                task.cancel()
+
+    def subscribe(self, subscriber: object) -> dict:
+        """구독을 등록하고 스냅샷(현재 상태 전체)을 반환한다."""
+        state = self._state(subscriber, self._common() if self._common is not None else {})
+        self._last[subscriber] = dict(state)
+        return state
+
+    def unsubscribe(self, subscriber: object) -> None:
+        self._last.pop(subscriber, None)
+
+    def mark_dirty(self) -> None:
+        """상태가 바뀌었음을 알린다. 전송은 모아서 MIN_INTERVAL마다 한 번."""
+        if not self._last:
+            return
+        self._dirty = True
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def flush(self) -> None:
+        """구독자별 변경분을 계산하여 전송한다."""
+        if not self._last:
+            return
+        common = self._common() if self._common is not None else {}
+        for subscriber, last in list(self._last.items()):
+            current = self._state(subscriber, common)
+            delta = {key: value for key, value in current.items() if last.get(key) != value}
+            if not delta:
+                continue
+            last.update(delta)
+            try:
+                await self._send_delta(subscriber, delta)
+            except Exception as exc:
+                logger.debug("상태 delta 전송 실패: %s", exc)
+
+    def _state(self, subscriber: object, common: dict) -> dict:
+        return {**common, **self._collect(subscriber)}
+
+    async def _flush_loop(self) -> None:
+        while self._dirty:
+            delay = self._last_flush + self._min_interval - self._clock.monotonic()
+            if delay > 0:
+                await self._clock.sleep(delay)
+            self._dirty = False
+            self._last_flush = self._clock.monotonic()
+            await self.flush()
+
+    async def _tick_loop(self) -> None:
+        while True:
+            await self._clock.sleep(self._tick_interval)
+            self.mark_dirty()
@@ -40,6 +40,13 @@ class TestConfigFile:
                 auth = Authenticator()
                 assert auth.validate('file-tok') is True
 
+    def test_uses_parsed_config_without_reading_file(self, monkeypatch):
+        monkeypatch.delenv('OKXUS_AUTH_TOKEN', raising=False)
+        with patch('builtins.open') as mock_file:
+            auth = Authenticator(config={'auth_token': 'cfg-tok'})
+        mock_file.assert_not_called()
+        assert auth.validate('cfg-tok') is True
+
 
 class TestNoToken:
     def test_raises_no_config(self, monkeypatch):
@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from bridge.automation import KiroAutomation
+from bridge.input_pipeline import FakeBackend
 
 
 class TestIsKiroRunning:
@@ -45,7 +46,7 @@ class TestActivateKiroWindow:
     def test_returns_false_when_no_window_found(self):
         """Kiro 창이 없으면 False 반환"""
         automation = KiroAutomation()
-        with patch("bridge.automation.pyautogui.getWindowsWithTitle", return_value=[]):
+        with patch("bridge.input_pipeline.pyautogui.getWindowsWithTitle", return_value=[]):
             assert automation.activate_kiro_window() is False
 
     def test_returns_true_when_window_found_and_activated(self):
@@ -54,10 +55,10 @@ class TestActivateKiroWindow:
         mock_window = MagicMock()
         mock_window.isMinimized = False
         with patch(
-            "bridge.automation.pyautogui.getWindowsWithTitle",
+            "bridge.input_pipeline.pyautogui.getWindowsWithTitle",
             return_value=[mock_window],
         ):
-            with patch("bridge.automation.time.sleep"):
+            with patch("bridge.input_pipeline.time.sleep"):
                 assert automation.activate_kiro_window() is True
                 mock_window.activate.assert_called_once()
 
@@ -67,10 +68,10 @@ class TestActivateKiroWindow:
         mock_window = MagicMock()
         mock_window.isMinimized = True
         with patch(
-            "bridge.automation.pyautogui.getWindowsWithTitle",
+            "bridge.input_pipeline.pyautogui.getWindowsWithTitle",
             return_value=[mock_window],
         ):
-            with patch("bridge.automation.time.sleep"):
+            with patch("bridge.input_pipeline.time.sleep"):
                 assert automation.activate_kiro_window() is True
                 mock_window.restore.assert_called_once()
                 mock_window.activate.assert_called_once()
@@ -79,7 +80,7 @@ class TestActivateKiroWindow:
         """예외 발생 시 False 반환"""
         automation = KiroAutomation()
         with patch(
-            "bridge.automation.pyautogui.getWindowsWithTitle",
+            "bridge.input_pipeline.pyautogui.getWindowsWithTitle",
             side_effect=Exception("fail"),
         ):
             assert automation.activate_kiro_window() is False
@@ -88,10 +89,10 @@ class TestActivateKiroWindow:
 class TestSendMessage:
     """send_message() 메서드 테스트"""
 
-    @patch("bridge.automation.time.sleep")
-    @patch("bridge.automation.pyautogui.press")
-    @patch("bridge.automation.pyautogui.hotkey")
-    @patch("bridge.automation.pyperclip.copy")
+    @patch("bridge.input_pipeline.time.sleep")
+    @patch("bridge.input_pipeline.pyautogui.press")
+    @patch("bridge.input_pipeline.pyautogui.hotkey")
+    @patch("bridge.input_pipeline.pyperclip.copy")
     def test_sends_message_successfully(self, mock_copy, mock_hotkey, mock_press, _sleep):
         """메시지 전송 성공 시 True 반환, 클립보드 복사 → Ctrl+V → Enter 순서 확인"""
         automation = KiroAutomation()
@@ -109,10 +110,59 @@ class TestSendMessage:
         with patch.object(automation, "activate_kiro_window", return_value=False):
             assert automation.send_message("test") is False
 
-    @patch("bridge.automation.time.sleep")
-    @patch("bridge.automation.pyperclip.copy", side_effect=Exception("clipboard error"))
+    @patch("bridge.input_pipeline.time.sleep")
+    @patch("bridge.input_pipeline.pyperclip.copy", side_effect=Exception("clipboard error"))
     def test_returns_false_on_clipboard_error(self, _copy, _sleep):
         """클립보드 복사 실패 시 False 반환"""
         automation = KiroAutomation()
         with patch.object(automation, "activate_kiro_window", return_value=True):
             assert automation.send_message("test") is False
+
+
+class TestInputPipeline:
+    """FakeBackend로 입력 파이프라인 실행 (디스플레이 불필요)"""
+
+    def _send(self, automation, backend, message):
+        lost = len(backend.lost)
+        assert automation.send_message(message) is True
+        automation.record_outcome(len(backend.lost) == lost)
+
+    def test_skips_activation_when_already_focused(self):
+        backend = FakeBackend()
+        backend.focused = "Kiro"
+        automation = KiroAutomation(backend=backend)
+        assert automation.send_message("hello") is True
+        assert backend.sent == ["hello"]
+        # 활성화 없이 붙여넣기 대기만 — 기존 고정 대기(0.5 + 0.3 + PAUSE)보다 짧다
+        assert backend.now() < 0.5
+
+    def test_activation_waits_only_until_window_is_active(self):
+        backend = FakeBackend(activation_latency=0.05)
+        automation = KiroAutomation(backend=backend)
+        assert automation.send_message("hello") is True
+        assert backend.sent == ["hello"]
+        assert automation.stats()["steps"]["focus"]["p50_ms"] < 200
+
+    def test_missing_window_fails(self):
+        backend = FakeBackend(title="Other")
+        assert KiroAutomation(backend=backend).send_message("hello") is False
+
+    def test_learns_minimal_safe_paste_delay(self):
+        backend = FakeBackend(paste_latency=0.04)
+        automation = KiroAutomation(backend=backend)
+        for i in range(100):
+            self._send(automation, backend, f"prompt {i}")
+        delays = automation.stats()["delays"]
+        assert 40 <= delays["paste"]["delay_ms"] < 300
+        # 학습 후 최근 전송은 모두 성공
+        sent_before = len(backend.sent)
+        for i in range(10):
+            self._send(automation, backend, f"after {i}")
+        assert len(backend.sent) == sent_before + 10
+
+    def test_failure_grows_delay(self):
+        backend = FakeBackend(paste_latency=0.5)
+        automation = KiroAutomation(backend=backend)
+        self._send(automation, backend, "slow")
+        assert backend.lost == ["slow"]
+        assert automation.stats()["delays"]["paste"]["delay_ms"] > 300
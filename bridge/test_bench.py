@@ -0,0 +1,70 @@
+"""마이크로벤치마크 기준값/비교 테스트"""
+
+import pytest
+
+from bridge import bench
+from bridge.bench import BenchResult, compare, load_baseline, run_all, save_baseline
+
+
+def _result(name, ns):
+    return BenchResult(name, ns, ns, 100, 3)
+
+
+class TestCompare:
+    def test_regression_past_threshold_fails(self):
+        baseline = {"results": {"a": {"ns_per_op": 1000.0}, "b": {"ns_per_op": 1000.0}}}
+        rows, regressed = compare([_result("a", 1300.0), _result("b", 1100.0)], baseline, threshold=0.25)
+        assert regressed
+        assert [row["status"] for row in rows] == ["regressed", "ok"]
+
+    def test_improvement_and_new_benchmark(self):
+        baseline = {"results": {"a": {"ns_per_op": 1000.0}}}
+        rows, regressed = compare([_result("a", 500.0), _result("c", 10.0)], baseline)
+        assert not regressed
+        assert [row["status"] for row in rows] == ["improved", "new"]
+
+    def test_tiny_absolute_difference_is_noise(self):
+        baseline = {"results": {"a": {"ns_per_op": 20.0}}}
+        rows, regressed = compare([_result("a", 40.0)], baseline)
+        assert not regressed and rows[0]["status"] == "ok"
+
+
+class TestBaselines:
+    def test_save_and_load_latest(self, tmp_path, monkeypatch):
+        times = iter([2000.0, 1000.0])
+        monkeypatch.setattr(bench.time, "time", lambda: next(times))
+        # 이름 순서가 아니라 생성 시각으로 최신을 고른다
+        save_baseline([_result("a", 1.0)], "1.0.0", tmp_path)
+        save_baseline([_result("a", 2.0)], "1.1.0", tmp_path)
+        assert load_baseline(directory=tmp_path)["label"] == "1.0.0"
+        assert load_baseline("1.0.0", tmp_path)["results"]["a"]["ns_per_op"] == 1.0
+
+    def test_missing_baseline(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_baseline(directory=tmp_path)
+
+    def test_cli_compare_exit_code(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(bench, "BASELINE_DIR", tmp_path)
+        monkeypatch.setattr(bench, "run_all", lambda pattern, rounds: [_result("auth.validate", 5000.0)])
+        save_baseline([_result("auth.validate", 1000.0)], "1.0.0", tmp_path)
+        assert bench.main(["compare", "--baseline", str(tmp_path / "1.0.0.json")]) == 1
+        assert bench.main(["compare", "--baseline", str(tmp_path / "1.0.0.json"), "--threshold", "10"]) == 0
+
+
+def test_all_benchmarks_run():
+    """모든 벤치마크가 오프라인에서 실행된다 (짧게 한 라운드)."""
+    results = run_all(rounds=1, round_target=0.001)
+    assert {r.name for r in results} == set(bench.BENCHMARKS)
+    assert all(r.ns_per_op > 0 for r in results)
+
+
+def test_server_benchmarks_use_temp_dirs(tmp_path, monkeypatch):
+    """서버 벤치마크는 실제 bridge/inbox, bridge/outbox를 만들지 않는다."""
+    from bridge import file_io
+
+    inbox, outbox = tmp_path / "inbox", tmp_path / "outbox"
+    monkeypatch.setattr(file_io, "INBOX_DIR", inbox)
+    monkeypatch.setattr(file_io, "OUTBOX_DIR", outbox)
+    run_all("server", rounds=1, round_target=0.001)
+    assert not inbox.exists() and not outbox.exists()
+    assert (file_io.INBOX_DIR, file_io.OUTBOX_DIR) == (inbox, outbox)
@@ -0,0 +1,160 @@
+"""응답 본문 지연 전송 테스트"""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from bridge.body_store import BODY_TTL, BodyStore
+from bridge.client import ClientError
+from bridge.conftest import frame, next_frame
+from bridge.history import HistoryStore
+from bridge.kiro_pool import KiroPool
+from bridge.server import BridgeServer
+
+TEST_TOKEN = "body-token"
+TEST_PORT = 9886
+
+
+@pytest.fixture
+def store(tmp_path):
+    return BodyStore(tmp_path / "bodies", preview_chars=10, min_bytes=32)
+
+
+class TestBodyStore:
+    def test_short_body_is_sent_inline(self, store):
+        assert store.describe("짧은 응답") is None
+
+    def test_describe_and_dedupe(self, store, tmp_path):
+        text = "가나다라마바사" * 20
+        first = store.describe(text)
+        second = store.describe(text)
+        assert first == second
+        assert first["preview"] == text[:10]
+        assert first["body_size"] == len(text.encode("utf-8"))
+        assert len(list((tmp_path / "bodies").glob("*/*"))) == 1
+
+    def test_ranges_reassemble_on_char_boundaries(self, store):
+        text = "a한글b" * 50 + "끝"
+        digest, size = store.put(text)
+        parts, offset = [], 0
+        while offset < size:
+            content, start, end, total = store.read(digest, offset, 7)
+            assert start == offset and total == size and end > start
+            parts.append(content)
+            offset = end
+        assert "".join(parts) == text
+
+    def test_unaligned_offset_snaps_forward(self, store):
+        digest, _ = store.put("한" * 40)
+        content, start, end, _ = store.read(digest, 1, 6)
+        assert (content, start, end) == ("한", 3, 6)
+
+    def test_tiny_length_still_progresses(self, store):
+        digest, _ = store.put("한" * 40)
+        assert store.read(digest, 0, 1)[:3] == ("한", 0, 3)
+
+    def test_invalid_and_missing_hash(self, store):
+        with pytest.raises(ValueError):
+            store.read("../../etc/passwd")
+        with pytest.raises(FileNotFoundError):
+            store.read("0" * 64)
+
+    def test_owner_required_when_given(self, store):
+        digest, _ = store.put("x" * 100, owner="token-a")
+        store.put("x" * 100, owner="token-b")  # 같은 본문을 다른 토큰도 받음
+        assert store.read(digest, owner="token-a")[0] == "x" * 100
+        assert store.read(digest, owner="token-b")[0] == "x" * 100
+        with pytest.raises(FileNotFoundError):
+            store.read(digest, owner="token-c")
+
+    def test_prune_old_bodies(self, store, tmp_path):
+        digest, _ = store.put("x" * 100)
+        path = tmp_path / "bodies" / digest[:2] / digest
+        old = time.time() - 3600
+        os.utime(path, (old, old))
+        assert store.prune(max_age=60) == 1
+        assert not path.exists()
+
+
+@pytest.fixture
+def server_options(worker, tmp_path, monkeypatch):
+    monkeypatch.setattr(BridgeServer, "BODY_PRUNE_INTERVAL", 0.05)
+    history = HistoryStore(tmp_path / "history.db")
+    yield {
+        "kiro_pool": KiroPool([worker]),
+        "bodies": BodyStore(tmp_path / "bodies", preview_chars=10, min_bytes=32),
+        "history": history,
+    }
+    history.close()
+
+
+class TestServerLazyBodies:
+    @pytest.mark.asyncio
+    async def test_preview_then_fetch(self, server, kiro, open_client):
+        frames = []
+        client = await open_client(fetch_bodies=False, on_event=frames.append)
+        prompt = "긴 답변을 주세요 " * 10
+        reply = await client.ask(prompt, timeout=5)
+        assert reply.content == ("ok:" + prompt)[:10]
+        response = next(f["payload"] for f in frames if f["type"] == "kiro_response")
+        assert "content" not in response
+        assert response["truncated"] is True
+        assert response["preview"] == reply.content
+
+        assert await client.fetch_body(response["body_hash"]) == "ok:" + prompt
+        with pytest.raises(ClientError):
+            await client.fetch_body("f" * 64)
+
+    @pytest.mark.asyncio
+    async def test_body_ranges_end_on_char_boundaries(self, server, kiro, open_client, connect):
+        """fetch_body 구간은 글자 경계에서 끝나고, end를 다음 offset으로 쓰면 본문이 이어진다."""
+        frames = []
+        client = await open_client(fetch_bodies=False, on_event=frames.append)
+        prompt = "긴 답변을 주세요 " * 10
+        await client.ask(prompt, timeout=5)
+        response = next(f["payload"] for f in frames if f["type"] == "kiro_response")
+
+        ws, _ = await connect()
+        parts, offset = [], 0
+        while offset < response["body_size"]:
+            await ws.send(frame("fetch_body", hash=response["body_hash"], offset=offset, length=40))
+            body = (await next_frame(ws, "body"))["payload"]
+            parts.append(body["content"])
+            offset = body["end"]
+        assert "".join(parts) == "ok:" + prompt
+
+    @pytest.mark.asyncio
+    async def test_bodies_pruned_periodically(self, server, tmp_path):
+        await asyncio.sleep(0.1)  # 시작 시 정리가 끝난 뒤에 오래된 본문이 생긴다
+        digest, _ = server._bodies.put("x" * 100)
+        path = tmp_path / "bodies" / digest[:2] / digest
+        old = time.time() - BODY_TTL - 60
+        os.utime(path, (old, old))
+        for _ in range(100):
+            if not path.exists():
+                break
+            await asyncio.sleep(0.02)
+        assert not path.exists()
+
+    @pytest.mark.asyncio
+    async def test_history_page_sends_previews(self, server, kiro, client, connect):
+        long_reply = (await client.ask("긴 답변을 주세요 " * 10, timeout=5)).content
+        await client.ask("짧게", timeout=5)
+        ws, _ = await connect()
+        await ws.send(frame("history_page"))
+        short, long = (await next_frame(ws, "history_page"))["payload"]["items"]
+        assert short["response"] == "ok:짧게" and "body_hash" not in short
+        assert long["response"] == long_reply[:10] and long["truncated"] is True
+        content, _, _, size = server._bodies.read(long["body_hash"])
+        assert content == long_reply and size == long["body_size"]
+
+    @pytest.mark.asyncio
+    async def test_other_tokens_body_not_served(self, server, connect):
+        """다른 토큰으로 저장된 본문은 해시를 알아도 받을 수 없다."""
+        digest, _ = server._bodies.put("다른 사용자의 응답 " * 10, owner="other-token")
+        ws, _ = await connect()
+        await ws.send(frame("fetch_body", hash=digest))
+        error = (await next_frame(ws, "error"))["payload"]
+        assert error == {"error": "본문이 없거나 만료되었습니다", "hash": digest}
@@ -0,0 +1,142 @@
+"""논리 채널 다중화 테스트"""
+
+import asyncio
+
+import pytest
+
+from bridge.channels import DEFAULT_CHANNEL, DEFAULT_WINDOW, MAX_CHANNELS, ChannelError, ChannelMux
+from bridge.client import ClientError
+from bridge.conftest import frame, kiro_reply, next_frame, wait_ack
+
+TEST_TOKEN = "test-secret-token"
+TEST_PORT = 9879
+
+
+class TestChannelMux:
+    @pytest.mark.asyncio
+    async def test_default_channel_open(self):
+        async def handler(channel, msg):
+            pass
+
+        mux = ChannelMux(handler)
+        assert DEFAULT_CHANNEL in mux
+        mux.close_all()
+
+    @pytest.mark.asyncio
+    async def test_in_order_within_channel(self):
+        """같은 채널의 메시지는 순서대로 하나씩 처리된다."""
+        seen: list[int] = []
+
+        async def handler(channel, msg):
+            await asyncio.sleep(0.01 * (3 - msg["n"]))
+            seen.append(msg["n"])
+
+        mux = ChannelMux(handler)
+        for n in range(3):
+            mux.submit(DEFAULT_CHANNEL, {"n": n})
+        await asyncio.sleep(0.1)
+        assert seen == [0, 1, 2]
+        mux.close_all()
+
+    @pytest.mark.asyncio
+    async def test_channels_independent(self):
+        """한 채널이 막혀 있어도 다른 채널은 처리된다."""
+        gate = asyncio.Event()
+        seen: list[str] = []
+
+        async def handler(channel, msg):
+            if channel == "slow":
+                await gate.wait()
+            seen.append(channel)
+
+        mux = ChannelMux(handler)
+        mux.open("slow")
+        mux.open("fast")
+        mux.submit("slow", {})
+        mux.submit("fast", {})
+        await asyncio.sleep(0.01)
+        assert seen == ["fast"]
+        gate.set()
+        await asyncio.sleep(0.01)
+        assert seen == ["fast", "slow"]
+        mux.close_all()
+
+    @pytest.mark.asyncio
+    async def test_window_limits_outstanding(self):
+        """window를 넘는 제출은 ChannelError."""
+        gate = asyncio.Event()
+
+        async def handler(channel, msg):
+            await gate.wait()
+
+        mux = ChannelMux(handler)
+        mux.open("a", window=2)
+        mux.submit("a", {})
+        mux.submit("a", {})
+        with pytest.raises(ChannelError):
+            mux.submit("a", {})
+        assert mux.get("a").credits == 0
+        gate.set()
+        mux.close_all()
+
+    @pytest.mark.asyncio
+    async def test_close_drops_queued(self):
+        gate = asyncio.Event()
+
+        async def handler(channel, msg):
+            await gate.wait()
+
+        mux = ChannelMux(handler)
+        mux.open("a")
+        for _ in range(3):
+            mux.submit("a", {})
+        await asyncio.sleep(0)
+        assert mux.close("a") == 2
+        with pytest.raises(ChannelError):
+            mux.submit("a", {})
+        mux.close_all()
+
+    @pytest.mark.asyncio
+    async def test_channel_limit(self):
+        async def handler(channel, msg):
+            pass
+
+        mux = ChannelMux(handler)
+        for i in range(MAX_CHANNELS - 1):
+            mux.open(f"c{i}")
+        with pytest.raises(ChannelError):
+            mux.open("one-too-many")
+        mux.close_all()
+
+
+class TestServerChannels:
+    @pytest.mark.asyncio
+    async def test_open_and_close(self, server, connect):
+        ws, _ = await connect()
+        await ws.send(frame("channel_open", "b", window=2))
+        resp = await next_frame(ws)
+        assert resp["type"] == "channel_opened"
+        assert resp["channel"] == "b"
+        assert resp["payload"]["window"] == 2
+
+        await ws.send(frame("channel_close", "b"))
+        resp = await next_frame(ws)
+        assert resp["type"] == "channel_closed"
+        assert resp["channel"] == "b"
+
+    @pytest.mark.asyncio
+    async def test_unknown_channel_rejected(self, client):
+        with pytest.raises(ClientError):
+            await client.ask("hi", "nope", timeout=5)
+
+    @pytest.mark.asyncio
+    async def test_parallel_channels_on_one_socket(self, client):
+        """채널 A가 응답을 기다리는 동안 채널 B의 응답이 먼저 도착한다."""
+        assert await client.open_channel("b") == DEFAULT_WINDOW
+        slow = await client.submit("slow question")
+        fast = await client.submit("fast question", "b")
+
+        kiro_reply(await wait_ack(fast), "B")
+        reply = await asyncio.wait_for(fast.result(), timeout=5)
+        assert (reply.channel, reply.content) == ("b", "B")
+        assert slow.message_id and not slow.done()
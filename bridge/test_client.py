@@ -0,0 +1,225 @@
+"""Bridge 비동기 클라이언트 SDK와 CLI 테스트"""
+
+import asyncio
+import json
+
+import pytest
+import pytest_asyncio
+
+from bridge import kiro_pool
+from bridge.auth import Authenticator
+from bridge.body_store import BodyStore
+from bridge.client import AuthError, BridgeClient, ClientError
+from bridge.client.__main__ import main as client_main
+from bridge.kiro_pool import KiroPool, KiroWorker
+from bridge.server import BridgeServer
+from bridge.test_kiro_pool import fake_kiro
+
+TEST_TOKEN = "client-token"
+TEST_HOST = "127.0.0.1"
+TEST_PORT = 9894
+URL = f"ws://{TEST_HOST}:{TEST_PORT}"
+
+
+@pytest.fixture
+def worker(tmp_path, monkeypatch):
+    monkeypatch.setattr(kiro_pool, "POLL_INTERVAL", 0.01)
+    return KiroWorker("kiro", tmp_path / "kiro")
+
+
+@pytest_asyncio.fixture
+async def server(worker, tmp_path):
+    srv = BridgeServer(
+        authenticator=Authenticator(token=TEST_TOKEN),
+        kiro_pool=KiroPool([worker]),
+        bodies=BodyStore(tmp_path / "bodies", preview_chars=10, min_bytes=64),
+    )
+    await srv.start(TEST_HOST, TEST_PORT)
+    yield srv
+    await srv.stop()
+
+
+@pytest_asyncio.fixture
+async def kiro(worker):
+    task = asyncio.create_task(fake_kiro(worker))
+    yield task
+    task.cancel()
+
+
+def _lose_first(client: BridgeClient, frame_type: str) -> list[dict]:
+    """frame_type의 첫 프레임을 유실시키고, 받은 해당 프레임 payload를 모두 기록한다."""
+    seen: list[dict] = []
+    on_frame = client._on_frame
+
+    def intercept(frame: dict, notify: bool = True) -> None:
+        if frame.get("type") == frame_type:
+            seen.append(frame["payload"])
+            if len(seen) == 1:
+                return
+        on_frame(frame, notify)
+
+    client._on_frame = intercept
+    return seen
+
+
+class TestBridgeClient:
+    @pytest.mark.asyncio
+    async def test_ask_and_status(self, server, kiro):
+        async with BridgeClient(URL, TEST_TOKEN) as client:
+            reply = await client.ask("안녕", timeout=5)
+            assert reply.content == "ok:안녕" and reply.message_id.startswith("msg-")
+            status = await client.status()
+            assert status["connected_clients"] == 1
+
+    @pytest.mark.asyncio
+    async def test_pipelining_beyond_window(self, server, kiro):
+        async with BridgeClient(URL, TEST_TOKEN) as client:
+            requests = [await client.submit(f"p{i}") for i in range(10)]
+            replies = await asyncio.wait_for(asyncio.gather(*(r.result() for r in requests)), timeout=10)
+        assert [reply.content for reply in replies] == [f"ok:p{i}" for i in range(10)]
+        assert len({reply.message_id for reply in replies}) == 10
+
+    @pytest.mark.asyncio
+    async def test_rejection_is_correlated(self, server, kiro):
+        async with BridgeClient(URL, TEST_TOKEN) as client:
+            good = await client.submit("first")
+            bad = await client.submit("")
+            with pytest.raises(ClientError, match="비어있습니다"):
+                await asyncio.wait_for(bad.result(), timeout=5)
+            assert (await asyncio.wait_for(good.result(), timeout=5)).content == "ok:first"
+
+    @pytest.mark.asyncio
+    async def test_channels_run_independently(self, server, kiro):
+        async with BridgeClient(URL, TEST_TOKEN) as client:
+            assert await client.open_channel("b", window=2) == 2
+            a, b = await client.submit("a", "0"), await client.submit("b", "b")
+            replies = await asyncio.wait_for(asyncio.gather(a.result(), b.result()), timeout=5)
+        assert [(r.channel, r.content) for r in replies] == [("0", "ok:a"), ("b", "ok:b")]
+
+    @pytest.mark.asyncio
+    async def test_lazy_body_is_fetched(self, server, kiro):
+        prompt = "긴 답변 " * 20
+        async with BridgeClient(URL, TEST_TOKEN) as client:
+            reply = await client.ask(prompt, timeout=5)
+        assert reply.content == "ok:" + prompt
+
+    @pytest.mark.asyncio
+    async def test_reconnect_receives_response(self, server, worker):
+        client = BridgeClient(URL, TEST_TOKEN, backoff_initial=0.05)
+        await client.connect()
+        try:
+            request = await client.submit("끊긴 동안")
+            while not request.message_id:
+                await asyncio.sleep(0.01)
+            client_id = client.client_id
+            client._ws.transport.abort()  # 망 끊김
+            kiro = asyncio.create_task(fake_kiro(worker))
+            try:
+                reply = await asyncio.wait_for(request.result(), timeout=5)
+            finally:
+                kiro.cancel()
+            assert reply.content == "ok:끊긴 동안"
+            assert client.reconnects == 1 and client.client_id == client_id
+            assert server._undelivered_bytes.total == 0 and server._waiting_bytes.total == 0
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_unacked_prompt_is_resent(self, server, kiro):
+        client = BridgeClient(URL, TEST_TOKEN, backoff_initial=0.05)
+        await client.connect()
+        try:
+            client._ws.transport.abort()
+            while client.connected:
+                await asyncio.sleep(0)
+            request = await client.submit("재전송")  # 끊긴 사이 — 재연결 후 전송
+            reply = await asyncio.wait_for(request.result(), timeout=5)
+            assert reply.content == "ok:재전송" and request.attempts == 1
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_lost_ack_is_not_run_twice(self, server, worker):
+        client = BridgeClient(URL, TEST_TOKEN, backoff_initial=0.05)
+        acks = _lose_first(client, "message_ack")
+        await client.connect()
+        try:
+            request = await client.submit("한 번만")
+            while not acks:
+                await asyncio.sleep(0.01)
+            client._ws.transport.abort()  # ACK를 받지 못한 채 끊김 — 재연결 후 재전송
+            while len(acks) < 2:
+                await asyncio.sleep(0.01)
+            assert acks[1]["duplicate"] and not acks[1]["done"]
+            assert acks[1]["message_id"] == acks[0]["message_id"]
+            assert len(list(worker.inbox_dir.rglob("*.json"))) == 1
+            kiro = asyncio.create_task(fake_kiro(worker))
+            try:
+                reply = await asyncio.wait_for(request.result(), timeout=5)
+            finally:
+                kiro.cancel()
+            assert reply.content == "ok:한 번만" and request.attempts == 2
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_response_before_duplicate_ack(self, server, worker):
+        client = BridgeClient(URL, TEST_TOKEN, backoff_initial=0.5, backoff_max=0.5)
+        acks = _lose_first(client, "message_ack")
+        await client.connect()
+        try:
+            request = await client.submit("먼저 도착")
+            while not acks:
+                await asyncio.sleep(0.01)
+            client._ws.transport.abort()
+            while server._client_ids:
+                await asyncio.sleep(0.01)
+            kiro = asyncio.create_task(fake_kiro(worker))  # 응답이 미전달 버퍼에 쌓인다
+            try:
+                reply = await asyncio.wait_for(request.result(), timeout=5)
+            finally:
+                kiro.cancel()
+            assert reply.content == "ok:먼저 도착" and acks[1]["done"]
+            assert not client._unmatched
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_lost_response_fails_as_ambiguous(self, server, kiro):
+        client = BridgeClient(URL, TEST_TOKEN, backoff_initial=0.05)
+        acks = _lose_first(client, "message_ack")
+        responses = _lose_first(client, "kiro_response")
+        await client.connect()
+        try:
+            request = await client.submit("유실")
+            while not responses:
+                await asyncio.sleep(0.01)
+            client._ws.transport.abort()  # 서버는 응답을 보냈지만 클라이언트는 받지 못함
+            with pytest.raises(ClientError, match="유실"):
+                await asyncio.wait_for(request.result(), timeout=5)
+            assert acks[1]["done"] and len(responses) == 1
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_invalid_token(self, server):
+        with pytest.raises(AuthError):
+            await BridgeClient(URL, "wrong").connect()
+
+    @pytest.mark.asyncio
+    async def test_close_fails_outstanding(self, server):
+        client = BridgeClient(URL, TEST_TOKEN)
+        await client.connect()
+        request = await client.submit("응답 없음")
+        await client.close()
+        with pytest.raises(ClientError):
+            await request.result()
+
+
+@pytest.mark.asyncio
+async def test_cli_streams_json_lines(server, kiro, capsys):
+    argv = ["--url", URL, "--token", TEST_TOKEN, "send", "--json", "하나", "둘"]
+    assert await asyncio.to_thread(client_main, argv) == 0
+    # 같은 프로세스의 서버 로그([Bridge] ...)는 건너뛴다
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines() if line.startswith("{")]
+    assert sorted((line["index"], line["content"]) for line in lines) == [(1, "ok:하나"), (2, "ok:둘")]
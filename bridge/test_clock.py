@@ -0,0 +1,241 @@
+"""가상 시계와 시간 기반 구성 요소 테스트"""
+
+import asyncio
+import json
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+import websockets
+
+from bridge import file_io, watcher
+from bridge.auth import Authenticator
+from bridge.clock import VirtualClock
+from bridge import kiro_pool
+from bridge.kiro_pool import KiroPool, KiroWorker
+from bridge.monitor import ResponseMonitor
+from bridge.server import BridgeServer
+
+TEST_TOKEN = "clock-token"
+TEST_HOST = "127.0.0.1"
+TEST_PORT = 9895
+
+
+class _InlineActor:
+    """UI 액터 대신 현재 스레드에서 바로 실행 (가상 시간 흐름을 끊지 않음)"""
+
+    async def call(self, fn, *args, **kwargs):
+        return fn(*args, **kwargs)
+
+
+class TestVirtualClock:
+    @pytest.mark.asyncio
+    async def test_advance_wakes_in_deadline_order(self):
+        clock = VirtualClock()
+        woke: list[tuple[str, float]] = []
+
+        async def sleeper(name, seconds):
+            await clock.sleep(seconds)
+            woke.append((name, clock.monotonic()))
+
+        tasks = [asyncio.create_task(sleeper(n, s)) for n, s in (("b", 20), ("a", 10), ("c", 90))]
+        await clock.advance(30)
+        assert woke == [("a", 10), ("b", 20)] and clock.monotonic() == 30
+        await clock.advance(60)
+        assert woke[-1] == ("c", 90)
+        await asyncio.gather(*tasks)
+
+    @pytest.mark.asyncio
+    async def test_run_skips_idle_time(self):
+        clock = VirtualClock()
+
+        async def hours():
+            for _ in range(3600):
+                await clock.sleep(5)
+            return clock.monotonic()
+
+        started = time.monotonic()
+        assert await clock.run(hours()) == 18000
+        assert time.monotonic() - started < 5
+
+    @pytest.mark.asyncio
+    async def test_run_limit(self):
+        clock = VirtualClock()
+        with pytest.raises(TimeoutError):
+            await clock.run(clock.sleep(100), limit=10)
+        assert clock.monotonic() == 10 and clock.sleepers == 0
+
+    def test_sleep_blocking_advances(self):
+        clock = VirtualClock(epoch=1000.0)
+        clock.sleep_blocking(2.5)
+        assert clock.monotonic() == 2.5 and clock.time() == 1002.5
+
+
+class TestResponseMonitorClock:
+    @pytest.mark.asyncio
+    async def test_stable_detection_in_virtual_time(self):
+        clock = VirtualClock()
+        monitor = ResponseMonitor(actor=_InlineActor(), clock=clock)
+
+        def reading():
+            # 40초 동안 생성 중, 이후 고정
+            return "partial" * int(min(clock.monotonic(), 40) // 2 + 1)
+
+        with patch.object(monitor, "_read_chat_text", side_effect=reading):
+            text = await clock.run(monitor.wait_for_response(timeout=600))
+        assert text == "partial" * 21
+        # 마지막 변화(40초) + STABLE_THRESHOLD 이후 첫 폴링
+        assert clock.monotonic() == 40 + monitor.STABLE_THRESHOLD
+
+    @pytest.mark.asyncio
+    async def test_timeout_in_virtual_time(self):
+        clock = VirtualClock()
+        monitor = ResponseMonitor(actor=_InlineActor(), clock=clock)
+        with patch.object(monitor, "_read_chat_text", side_effect=lambda: str(clock.monotonic())):
+            with pytest.raises(TimeoutError):
+                await clock.run(monitor.wait_for_response(timeout=900))
+        assert clock.monotonic() == 900
+
+
+class TestWaitForResponseClock:
+    @pytest.mark.asyncio
+    async def test_response_after_virtual_delay(self, tmp_path):
+        clock = VirtualClock()
+
+        async def kiro():
+            await clock.sleep(42)
+            (tmp_path / "msg-1.json").write_text(json.dumps({"content": "done"}), encoding="utf-8")
+
+        writer = asyncio.create_task(kiro())
+        result = await clock.run(file_io.wait_for_response("msg-1", timeout=120, outbox_dir=tmp_path, clock=clock))
+        await writer
+        assert result == "done" and clock.monotonic() == 42
+
+    @pytest.mark.asyncio
+    async def test_timeout(self, tmp_path):
+        clock = VirtualClock()
+        with pytest.raises(TimeoutError):
+            await clock.run(file_io.wait_for_response("missing", timeout=120, outbox_dir=tmp_path, clock=clock))
+        assert clock.monotonic() == 120
+
+
+def test_watcher_cooldown_in_virtual_time(tmp_path, monkeypatch):
+    clock = VirtualClock()
+    triggered: list[float] = []
+    monkeypatch.setattr(watcher, "INBOX_DIR", tmp_path / "inbox")
+    monkeypatch.setattr(watcher, "HEARTBEAT_PATH", tmp_path / "heartbeat")
+    monkeypatch.setattr(watcher, "_triggered", {})
+    monkeypatch.setattr(watcher, "send_to_kiro", lambda message, title: triggered.append(clock.monotonic()) or True)
+    (tmp_path / "inbox").mkdir()
+    (tmp_path / "inbox" / "msg-1.json").write_text(json.dumps({"content": "hi"}), encoding="utf-8")
+
+    # 100회 × 3초 = 가상 300초 — COOLDOWN(120초)마다 한 번씩 다시 알림
+    watcher.poll_inbox(clock=clock, polls=100)
+    assert triggered == [0, 120, 240]
+    assert clock.monotonic() == 100 * watcher.POLL_INTERVAL
+
+
+@pytest_asyncio.fixture
+async def virtual_server(tmp_path):
+    clock = VirtualClock()
+    srv = BridgeServer(
+        authenticator=Authenticator(token=TEST_TOKEN),
+        kiro_pool=KiroPool([KiroWorker("kiro", tmp_path / "kiro")]),
+        clock=clock,
+    )
+    await srv.start(TEST_HOST, TEST_PORT)
+    yield srv, clock
+    await srv.stop()
+
+
+@pytest.mark.asyncio
+async def test_server_heartbeat_on_virtual_clock(virtual_server):
+    server, clock = virtual_server
+    async with websockets.connect(f"ws://{TEST_HOST}:{TEST_PORT}") as ws:
+        await ws.send(json.dumps({"type": "auth", "payload": {"token": TEST_TOKEN}, "timestamp": time.time()}))
+        await ws.recv()
+        while clock.sleepers == 0:  # heartbeat 태스크가 잠들 때까지
+            await asyncio.sleep(0.01)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(ws.recv(), timeout=0.05)
+        await clock.advance(server.HEARTBEAT_INTERVAL)
+        frame = json.loads(await asyncio.wait_for(ws.recv(), timeout=5))
+        assert frame["type"] == "heartbeat"
+
+
+@pytest.mark.asyncio
+async def test_kiro_timeout_on_virtual_clock(virtual_server):
+    """응답 없는 Kiro — progress와 타임아웃 ERROR까지 가상 시간으로 진행한다."""
+    server, clock = virtual_server
+    async with websockets.connect(f"ws://{TEST_HOST}:{TEST_PORT}") as ws:
+        await ws.send(json.dumps({"type": "auth", "payload": {"token": TEST_TOKEN}, "timestamp": time.time()}))
+        await ws.recv()
+        await ws.send(json.dumps({"type": "message", "payload": {"content": "응답 없음"}, "timestamp": time.time()}))
+        ack = json.loads(await asyncio.wait_for(ws.recv(), timeout=5))
+        assert ack["type"] == "message_ack" and ack["payload"]["deadline"] == server.KIRO_RESPONSE_TIMEOUT
+
+        started = time.monotonic()
+        await clock.advance(ack["payload"]["deadline"])
+        progress: list[float] = []
+        while True:
+            frame = json.loads(await asyncio.wait_for(ws.recv(), timeout=5))
+            if frame["type"] == "progress":
+                progress.append(frame["payload"]["elapsed"])
+            elif frame["type"] == "error":
+                break
+        assert frame["payload"] == {"error": "Kiro 응답 대기 시간 초과", "message_id": ack["payload"]["message_id"]}
+        assert progress[:3] == [10, 20, 30] and progress[-1] <= server.KIRO_RESPONSE_TIMEOUT
+        assert time.monotonic() - started < 5  # 실제로 5분을 기다리지 않음
+        assert not server._pending
+
+
+class TestKiroPoolClock:
+    def test_retry_after_in_virtual_time(self, tmp_path):
+        clock = VirtualClock()
+        worker = KiroWorker("kiro", tmp_path / "kiro")
+        pool = KiroPool([worker], clock=clock)
+        for _ in range(kiro_pool.MAX_FAILURES):
+            worker.record_failure()
+        assert not pool.running()
+        clock.sleep_blocking(kiro_pool.RETRY_AFTER)
+        assert pool.running() and pool.select() is worker
+
+    def test_heartbeat_stale_in_virtual_time(self, tmp_path):
+        clock = VirtualClock()
+        worker = KiroWorker("kiro", tmp_path / "kiro", heartbeat=True, clock=clock)
+        worker.inbox_dir.mkdir(parents=True)
+        worker.heartbeat_path.touch()
+        os.utime(worker.heartbeat_path, (clock.time(), clock.time()))
+        assert worker.healthy()
+        clock.sleep_blocking(kiro_pool.HEARTBEAT_STALE)
+        assert not worker.healthy()
+
+
+@pytest.mark.asyncio
+async def test_parked_prompt_dispatched_after_retry_on_virtual_clock(tmp_path):
+    """Kiro 실패로 보관된 프롬프트가 가상 시간 RETRY_AFTER 뒤 배정된다."""
+    clock = VirtualClock()
+    worker = KiroWorker("kiro", tmp_path / "kiro")
+    server = BridgeServer(authenticator=Authenticator(token=TEST_TOKEN), kiro_pool=KiroPool([worker]), clock=clock)
+    await server.start(TEST_HOST, TEST_PORT)
+    try:
+        for _ in range(kiro_pool.MAX_FAILURES):
+            worker.record_failure()  # 서버의 시계로 실패 시각이 기록된다
+        async with websockets.connect(f"ws://{TEST_HOST}:{TEST_PORT}") as ws:
+            await ws.send(json.dumps({"type": "auth", "payload": {"token": TEST_TOKEN}, "timestamp": time.time()}))
+            await ws.recv()
+            await ws.send(json.dumps({"type": "message", "payload": {"content": "보관"}, "timestamp": time.time()}))
+            ack = json.loads(await asyncio.wait_for(ws.recv(), timeout=5))
+            assert ack["payload"]["parked"] is True
+
+            await clock.advance(kiro_pool.RETRY_AFTER + server.PARKING_CHECK_INTERVAL)
+            while True:
+                frame = json.loads(await asyncio.wait_for(ws.recv(), timeout=5))
+                if frame["type"] == "unparked":
+                    break
+        assert frame["payload"]["message_id"] == ack["payload"]["message_id"]
+        assert (worker.inbox_dir / f"{ack['payload']['message_id']}.json").exists()
+    finally:
+        await server.stop()
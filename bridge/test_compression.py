@@ -0,0 +1,115 @@
+"""메시지 압축 정책 테스트"""
+
+import json
+import os
+import time
+import zlib
+
+import pytest
+import pytest_asyncio
+import websockets
+from websockets.frames import TEXT, Frame
+
+from bridge import compression
+from bridge.auth import Authenticator
+from bridge.compression import AdaptiveDeflate, CompressionPolicy, CompressionStats, extension_of
+from bridge.server import BridgeServer
+
+TEST_TOKEN = "deflate-token"
+TEST_HOST = "127.0.0.1"
+TEST_PORT = 9889
+
+
+def _extension(min_size: int = 64) -> AdaptiveDeflate:
+    return AdaptiveDeflate(False, False, 15, 15, {"level": 6}, min_size=min_size)
+
+
+def _inflate(data: bytes) -> bytes:
+    return zlib.decompressobj(-15).decompress(data + b"\x00\x00\xff\xff")
+
+
+class TestAdaptiveDeflate:
+    def test_small_frames_skip_compression(self):
+        ext = _extension()
+        frame = Frame(TEXT, b'{"type":"ack"}')
+        assert ext.encode(frame) is frame
+        assert (ext.stats.skipped, ext.stats.compressed) == (1, 0)
+
+    def test_large_frames_compress_and_count_bytes(self):
+        ext = _extension()
+        data = json.dumps({"content": "빌드 결과 " * 100}).encode()
+        encoded = ext.encode(Frame(TEXT, data))
+        assert encoded.rsv1
+        assert _inflate(encoded.data) == data
+        summary = ext.stats.summary()
+        assert summary["raw_out"] == len(data) and summary["wire_out"] == len(encoded.data)
+        assert summary["saved_out"] > 0.5
+
+    def test_configure_applies_to_next_message(self):
+        ext = _extension()
+        ext.encode(Frame(TEXT, b"a" * 200))
+        ext.configure(level=1, min_size=1000, window_bits=10)
+        assert ext.encode(Frame(TEXT, b"b" * 200)).rsv1 is False
+        data = os.urandom(100) * 20
+        encoded = ext.encode(Frame(TEXT, data))
+        assert ext.local_max_window_bits == 10
+        # 작은 창으로 압축해도 협상된 창(15)으로 풀린다
+        assert _inflate(encoded.data) == data
+
+    def test_incompressible_connection_disables_itself(self, monkeypatch):
+        monkeypatch.setattr(compression, "ADAPT_AFTER", 4)
+        ext = _extension()
+        for _ in range(4):
+            ext.encode(Frame(TEXT, os.urandom(512)))
+        assert ext.disabled
+        assert ext.encode(Frame(TEXT, b"x" * 512)).rsv1 is False
+
+    def test_stats_add(self):
+        total = CompressionStats()
+        total.add(CompressionStats(raw_out=100, wire_out=40))
+        total.add(CompressionStats(raw_out=100, wire_out=60))
+        assert total.summary()["saved_out"] == 0.5
+
+
+@pytest_asyncio.fixture
+async def server():
+    srv = BridgeServer(
+        authenticator=Authenticator(token=TEST_TOKEN),
+        compression=CompressionPolicy(min_size=128),
+    )
+    await srv.start(TEST_HOST, TEST_PORT)
+    yield srv
+    await srv.stop()
+
+
+class TestServerCompression:
+    @pytest.mark.asyncio
+    async def test_link_profile_and_status_bytes(self, server):
+        async with websockets.connect(f"ws://{TEST_HOST}:{TEST_PORT}") as ws:
+            await ws.send(
+                json.dumps({"type": "auth", "payload": {"token": TEST_TOKEN, "link": "lan"}, "timestamp": time.time()})
+            )
+            assert json.loads(await ws.recv())["payload"]["success"] is True
+            (server_ws,) = server._clients
+            ext = extension_of(server_ws)
+            assert ext.min_size == 4096 and ext.local_max_window_bits == 12
+
+            ext.configure(min_size=64)
+            # 상태 응답의 통계는 그 응답 자신을 보내기 전 값 — 두 번째 응답이 첫 번째를 보고한다
+            for _ in range(2):
+                await ws.send(json.dumps({"type": "status_request", "payload": {}, "timestamp": time.time()}))
+                status = json.loads(await ws.recv())["payload"]["status"]
+        stats = status["compression"]
+        assert stats["compressed"] >= 1
+        assert stats["raw_out"] > stats["wire_out"]
+        assert stats["raw_in"] > 0
+
+    @pytest.mark.asyncio
+    async def test_disabled_policy_negotiates_nothing(self):
+        srv = BridgeServer(authenticator=Authenticator(token=TEST_TOKEN), compression=CompressionPolicy(enabled=False))
+        await srv.start(TEST_HOST, TEST_PORT + 100)
+        try:
+            async with websockets.connect(f"ws://{TEST_HOST}:{TEST_PORT + 100}") as ws:
+                assert ws.protocol.extensions == []
+        finally:
+            await srv.stop()
@@ -0,0 +1,70 @@
+"""GUI 모듈 지연 로드 테스트"""
+
+import subprocess
+import sys
+from types import ModuleType
+
+import pytest
+
+from bridge.gui import LazyModule, lazy_import
+
+
+class TestLazyModule:
+    def test_loads_on_first_access(self):
+        configured = []
+        lazy = lazy_import("json", on_load=configured.append)
+        assert not lazy.loaded
+        assert lazy.dumps([1]) == "[1]"
+        assert lazy.loaded
+        assert len(configured) == 1
+        lazy.loads("1")
+        assert len(configured) == 1
+
+    def test_setattr_delegates_to_module(self):
+        fake = ModuleType("fake_gui_mod")
+        sys.modules["fake_gui_mod"] = fake
+        try:
+            lazy = LazyModule("fake_gui_mod")
+            lazy.PAUSE = 0.1
+            assert fake.PAUSE == 0.1
+            del lazy.PAUSE
+            assert not hasattr(fake, "PAUSE")
+        finally:
+            del sys.modules["fake_gui_mod"]
+
+    def test_missing_module_raises_import_error(self):
+        lazy = lazy_import("no_such_module_for_bridge")
+        with pytest.raises(ImportError):
+            lazy.anything
+
+    def test_init_failure_becomes_import_error(self):
+        def broken(module):
+            raise KeyError("DISPLAY")
+
+        lazy = lazy_import("json", on_load=broken)
+        with pytest.raises(ImportError):
+            lazy.dumps
+
+
+def test_server_modules_do_not_import_gui():
+    """서버/모니터 모듈 import만으로는 pyautogui/pyperclip을 로드하지 않는다."""
+    code = (
+        "import sys, bridge.main, bridge.monitor, bridge.automation;"
+        "print('pyautogui' in sys.modules, 'pyperclip' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False False"
+
+
+def test_main_import_is_config_and_logging_only():
+    """bridge.main import만으로는 서버/저장소 모듈(websockets, sqlite3, zlib)을 로드하지 않는다."""
+    code = (
+        "import sys, bridge.main;"
+        "print(sorted(m for m in ('websockets', 'sqlite3', 'zlib', 'bridge.server') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,112 @@
+"""무중단 재시작(핸드오프) 테스트"""
+
+import asyncio
+
+import pytest
+
+from bridge import file_io
+from bridge.auth import Authenticator
+from bridge.client import ClientError
+from bridge.client import core as client_core
+from bridge.conftest import TEST_HOST, kiro_reply, wait_ack
+from bridge.handoff import (
+    HandoffListener,
+    load_pending,
+    request_takeover,
+    save_pending,
+    supports_handoff,
+)
+from bridge.server import BridgeServer
+
+TEST_TOKEN = "test-secret-token"
+TEST_PORT = 9878
+
+
+class TestPendingFile:
+    def test_roundtrip_and_delete(self, tmp_path):
+        """저장한 스냅샷을 읽으면 파일이 삭제된다."""
+        path = tmp_path / "pending.json"
+        snapshot = {"pending": [{"message_id": "msg-1"}], "undelivered": {}}
+        save_pending(snapshot, path)
+        assert load_pending(path) == snapshot
+        assert not path.exists()
+
+    def test_missing_file_returns_empty(self, tmp_path):
+        assert load_pending(tmp_path / "none.json") == {"pending": [], "undelivered": {}}
+
+
+class TestDrainAndAdopt:
+    @pytest.mark.asyncio
+    async def test_adopted_response_delivered_on_resume(self, io_dirs, open_client, monkeypatch):
+        """드레인된 요청을 새 서버가 인수하고, 같은 client_id로 재연결하면 응답을 전달한다."""
+        # 1012 직후의 즉시 재연결은 종료 중인 이전 서버에 붙어 인증 응답을 못 받는다 — 빨리 포기시킨다
+        monkeypatch.setattr(client_core, "AUTH_TIMEOUT", 0.5)
+        old = BridgeServer(authenticator=Authenticator(token=TEST_TOKEN))
+        await old.start(TEST_HOST, TEST_PORT)
+        client = await open_client(backoff_initial=0.05, backoff_max=0.2)
+        client_id = client.client_id
+        request = await client.submit("hi")
+        message_id = await wait_ack(request)
+
+        snapshot = old.drain()
+        assert [p["message_id"] for p in snapshot["pending"]] == [message_id]
+        await old.close_for_restart()
+        # inbox 파일은 새 프로세스를 위해 남아있다
+        assert (file_io.INBOX_DIR / f"{message_id}.json").exists()
+
+        new = BridgeServer(authenticator=Authenticator(token=TEST_TOKEN))
+        new.adopt(snapshot)
+        kiro_reply(message_id, "answer")
+        while client_id not in new._undelivered:  # 클라이언트가 없는 동안 응답 도착 → 보관
+            await asyncio.sleep(0.05)
+        await new.start(TEST_HOST, TEST_PORT)
+        try:
+            reply = await asyncio.wait_for(request.result(), timeout=5)
+            assert (reply.message_id, reply.content) == (message_id, "answer")
+            assert client.client_id == client_id and client.reconnects == 1
+        finally:
+            await new.stop()
+
+    @pytest.mark.asyncio
+    async def test_queued_prompts_rejected_before_close(self, io_dirs, open_client):
+        """채널 대기열에서 처리 전이던 프롬프트는 request_id가 담긴 ERROR를 받고 닫힌다."""
+        old = BridgeServer(authenticator=Authenticator(token=TEST_TOKEN))
+        await old.start(TEST_HOST, TEST_PORT)
+        client = await open_client(backoff_initial=0.05)
+        first, second, third = [await client.submit(content) for content in ("first", "second", "third")]
+        await wait_ack(first)
+
+        snapshot = old.drain()
+        assert len(snapshot["pending"]) == 1
+        await old.close_for_restart()
+        for request in (second, third):
+            with pytest.raises(ClientError, match="재시작"):
+                await asyncio.wait_for(request.result(), timeout=5)
+        assert not first.done()
+
+
+@pytest.mark.skipif(not supports_handoff(), reason="SCM_RIGHTS 미지원")
+class TestSocketHandoff:
+    @pytest.mark.asyncio
+    async def test_listener_socket_passed(self, tmp_path):
+        """인수 요청 시 리스닝 소켓 fd가 새 프로세스 측으로 전달된다."""
+        import socket
+
+        listener = socket.create_server((TEST_HOST, 0))
+        port = listener.getsockname()[1]
+        handed = asyncio.Event()
+
+        async def on_takeover():
+            return listener
+
+        handoff = HandoffListener(on_takeover, on_handed_off=handed.set, path=tmp_path / "h.sock")
+        handoff.start()
+        try:
+            received = await asyncio.to_thread(request_takeover, tmp_path / "h.sock", 5)
+            await asyncio.wait_for(handed.wait(), timeout=5)
+            assert handoff.handed_off is True
+            assert received.getsockname()[1] == port
+            received.close()
+        finally:
+            await handoff.close()
+            listener.close()
@@ -0,0 +1,139 @@
+"""대화 기록 저장소 테스트"""
+
+import sqlite3
+import threading
+
+import pytest
+
+from bridge.conftest import frame, next_frame
+from bridge.history import HistoryStore
+from bridge.kiro_pool import KiroPool
+
+TEST_TOKEN = "history-token"
+TEST_PORT = 9885
+
+
+@pytest.fixture
+def store(tmp_path):
+    history = HistoryStore(tmp_path / "history.db")
+    yield history
+    history.close()
+
+
+def _fill(store: HistoryStore, count: int, token_id: str = "t1") -> None:
+    for i in range(count):
+        store.record_prompt(f"m{i}", token_id, f"prompt {i}")
+        store.record_response(f"m{i}", f"answer {i}")
+
+
+class TestPage:
+    def test_cursor_pages_newest_first(self, store):
+        _fill(store, 5)
+        items, cursor = store.page("t1", limit=2)
+        assert [item["message_id"] for item in items] == ["m4", "m3"]
+        items, cursor = store.page("t1", before=cursor, limit=2)
+        assert [item["message_id"] for item in items] == ["m2", "m1"]
+        items, cursor = store.page("t1", before=cursor, limit=2)
+        assert [item["message_id"] for item in items] == ["m0"]
+        assert cursor is None
+
+    def test_tokens_are_isolated(self, store):
+        _fill(store, 2, token_id="t1")
+        store.record_prompt("other", "t2", "secret")
+        assert [item["message_id"] for item in store.page("t2")[0]] == ["other"]
+        assert len(store.page("t1")[0]) == 2
+
+    def test_status_transitions(self, store):
+        store.record_prompt("m1", "t1", "hi")
+        assert store.page("t1")[0][0]["status"] == "pending"
+        store.record_error("m1", "timeout")
+        item = store.page("t1")[0][0]
+        assert (item["status"], item["response"]) == ("error", "timeout")
+
+
+class TestSearch:
+    def test_prefix_match_on_prompt_and_response(self, store):
+        store.record_prompt("m1", "t1", "이 코드를 리팩터링해줘")
+        store.record_response("m1", "함수를 분리했습니다")
+        store.record_prompt("m2", "t1", "테스트 추가")
+
+        assert [i["message_id"] for i in store.search("t1", "코드")[0]] == ["m1"]
+        assert [i["message_id"] for i in store.search("t1", "분리")[0]] == ["m1"]
+        assert store.search("t1", "코드 테스트")[0] == []  # AND
+        assert "[" in store.search("t1", "코드")[0][0]["snippet"]
+
+    def test_response_update_is_indexed(self, store):
+        store.record_prompt("m1", "t1", "질문")
+        assert store.search("t1", "websocket")[0] == []
+        store.record_response("m1", "websocket 서버를 수정했습니다")
+        assert len(store.search("t1", "websocket")[0]) == 1
+
+    def test_search_paginates_and_isolates(self, store):
+        _fill(store, 5)
+        store.record_prompt("x", "t2", "prompt hidden")
+        items, cursor = store.search("t1", "prompt", limit=3)
+        assert len(items) == 3 and cursor is not None
+        items, cursor = store.search("t1", "prompt", before=cursor, limit=3)
+        assert len(items) == 2 and cursor is None
+
+    def test_quotes_do_not_break_query(self, store):
+        store.record_prompt("m1", "t1", 'say "hello"')
+        assert len(store.search("t1", '"hello')[0]) == 1
+        assert store.search("t1", "   ") == ([], None)
+
+    def test_like_fallback(self, store):
+        store.fts = False
+        store.record_prompt("m1", "t1", "100%_done")
+        store.record_prompt("m2", "t1", "100 done")
+        assert [i["message_id"] for i in store.search("t1", "%_")[0]] == ["m1"]
+
+
+class TestDefer:
+    @pytest.mark.asyncio
+    async def test_runs_in_order_off_the_loop(self, store, monkeypatch):
+        threads = []
+        record = store.record_prompt
+
+        def spy(*args):
+            threads.append(threading.current_thread())
+            record(*args)
+
+        monkeypatch.setattr(store, "record_prompt", spy)
+        store.defer("record_prompt", "m1", "t1", "hi")  # 기다리지 않아도 뒤의 조회보다 먼저 실행
+        items, _ = await store.defer("page", "t1")
+        assert [item["message_id"] for item in items] == ["m1"]
+        assert threads[0] is not threading.current_thread()
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_the_future(self, store):
+        store._conn.execute("DROP TABLE history")
+        with pytest.raises(sqlite3.OperationalError):
+            await store.defer("page", "t1")
+
+
+@pytest.fixture
+def server_options(worker, tmp_path):
+    history = HistoryStore(tmp_path / "history.db")
+    yield {"kiro_pool": KiroPool([worker]), "history": history}
+    history.close()
+
+
+class TestServerHistory:
+    @pytest.mark.asyncio
+    async def test_history_page_and_search(self, client, kiro, connect):
+        reply = await client.ask("빌드 고쳐줘", timeout=5)
+        ws, _ = await connect()
+
+        await ws.send(frame("history_page", limit=10))
+        page = await next_frame(ws, "history_page")
+        (item,) = page["payload"]["items"]
+        assert item["message_id"] == reply.message_id
+        assert (item["prompt"], item["response"], item["status"]) == ("빌드 고쳐줘", "ok:빌드 고쳐줘", "done")
+        assert page["payload"]["next_cursor"] is None
+
+        await ws.send(frame("history_search", query="빌드"))
+        found = await next_frame(ws, "history_search")
+        assert [i["message_id"] for i in found["payload"]["items"]] == [reply.message_id]
+
+        await ws.send(frame("history_page", limit="x"))
+        assert (await next_frame(ws, "error"))["payload"]["error"]
@@ -0,0 +1,162 @@
+"""Kiro 워커 풀 테스트 (가짜 워커 사용)"""
+
+import asyncio
+import json
+import os
+import time
+
+import pytest
+
+from bridge import kiro_pool, watcher
+from bridge.clock import VirtualClock
+from bridge.kiro_pool import KiroPool, KiroUnavailable, KiroWorker
+
+
+@pytest.fixture(autouse=True)
+def fast_poll(monkeypatch):
+    monkeypatch.setattr(kiro_pool, "POLL_INTERVAL", 0.01)
+
+
+async def fake_kiro(worker: KiroWorker, reply: str = "ok") -> None:
+    """inbox의 프롬프트를 읽어 reply_to 경로에 응답을 쓰는 가짜 Kiro."""
+    while True:
+        for path in list(worker.inbox_dir.rglob("*.json")):
+            data = json.loads(path.read_text(encoding="utf-8"))
+            out = worker.inbox_dir.parent / data["reply_to"]
+            out.parent.mkdir(parents=True, exist_ok=True)
+            out.write_text(json.dumps({"content": f"{reply}:{data['content']}"}), encoding="utf-8")
+            path.unlink()
+        await asyncio.sleep(0.01)
+
+
+def _workers(tmp_path, *names, heartbeat=False):
+    return [KiroWorker(name, tmp_path / name, heartbeat=heartbeat) for name in names]
+
+
+def _beat(worker: KiroWorker) -> None:
+    worker.heartbeat_path.parent.mkdir(parents=True, exist_ok=True)
+    worker.heartbeat_path.touch()
+
+
+def _stale_heartbeat(worker: KiroWorker) -> None:
+    _beat(worker)
+    old = time.time() - kiro_pool.HEARTBEAT_STALE - 5
+    os.utime(worker.heartbeat_path, (old, old))
+
+
+class TestSelect:
+    def test_least_loaded(self, tmp_path):
+        pool = KiroPool(_workers(tmp_path, "a", "b"))
+        first = pool.submit("m1", "x")
+        second = pool.submit("m2", "y")
+        assert {first.name, second.name} == {"a", "b"}
+        pool.release("m1")
+        assert pool.select().name == first.name
+
+    def test_sticky_per_conversation(self, tmp_path):
+        pool = KiroPool(_workers(tmp_path, "a", "b", "c"), policy="sticky")
+        chosen = {pool.submit(f"m{i}", "x", conversation="s/0").name for i in range(5)}
+        assert len(chosen) == 1
+
+    def test_sticky_repins_when_unhealthy(self, tmp_path):
+        workers = _workers(tmp_path, "a", "b", heartbeat=True)
+        for worker in workers:
+            _beat(worker)
+        pool = KiroPool(workers, policy="sticky")
+        pinned = pool.select("s/0")
+        _stale_heartbeat(pinned)
+        assert pool.select("s/0") is not pinned
+
+    def test_no_healthy_worker(self, tmp_path):
+        (worker,) = _workers(tmp_path, "a", heartbeat=True)
+        _stale_heartbeat(worker)
+        with pytest.raises(KiroUnavailable):
+            KiroPool([worker]).select()
+
+    def test_missing_heartbeat_is_unhealthy(self, tmp_path):
+        (worker,) = _workers(tmp_path, "a", heartbeat=True)
+        assert not worker.healthy()
+        _beat(worker)
+        assert worker.healthy()
+
+    def test_unknown_policy(self, tmp_path):
+        with pytest.raises(ValueError):
+            KiroPool(_workers(tmp_path, "a"), policy="random")
+
+    def test_from_config(self, tmp_path):
+        pool = KiroPool.from_config(
+            {"kiro_workers": [{"name": "k1", "dir": "one"}, {"name": "k2"}], "kiro_policy": "sticky"},
+            base_dir=tmp_path,
+        )
+        assert [w.base_dir for w in pool.workers()] == [tmp_path / "one", tmp_path / "k2"]
+        assert pool.policy == "sticky"
+        assert [w.name for w in KiroPool.from_config({}).workers()] == ["default"]
+
+
+class TestWait:
+    @pytest.mark.asyncio
+    async def test_parallel_workers_answer(self, tmp_path):
+        workers = _workers(tmp_path, "a", "b")
+        pool = KiroPool(workers)
+        tasks = [asyncio.create_task(fake_kiro(w, w.name)) for w in workers]
+        try:
+            pool.submit("m1", "p1")
+            pool.submit("m2", "p2")
+            results = await asyncio.gather(pool.wait("m1", 5), pool.wait("m2", 5))
+        finally:
+            for task in tasks:
+                task.cancel()
+        assert sorted(r.split(":")[0] for r in results) == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_failover_moves_prompt(self, tmp_path):
+        dead, alive = _workers(tmp_path, "dead", "alive", heartbeat=True)
+        pool = KiroPool([dead, alive])
+        pool.attach("m1", "dead", "hello")
+        dead.write("m1", "hello")
+        _stale_heartbeat(dead)
+        _beat(alive)
+        task = asyncio.create_task(fake_kiro(alive))
+        try:
+            result = await pool.wait("m1", 5)
+        finally:
+            task.cancel()
+        assert result == "ok:hello"
+        assert pool.worker_of("m1") == "alive"
+        assert not (dead.inbox_dir / "m1.json").exists()
+        assert dead.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_timeouts_mark_worker_unhealthy(self, tmp_path):
+        (worker,) = _workers(tmp_path, "a")
+        pool = KiroPool([worker])
+        for i in range(kiro_pool.MAX_FAILURES):
+            pool.submit(f"m{i}", "x")
+            with pytest.raises(TimeoutError):
+                await pool.wait(f"m{i}", 0.05)
+            pool.release(f"m{i}")
+        assert not worker.healthy()
+        assert worker.in_flight == 0
+
+
+class TestWatcher:
+    def test_worker_watcher_keeps_worker_healthy(self, tmp_path, monkeypatch):
+        """워커 디렉토리를 감시하는 watcher가 그 워커의 inbox를 읽고 heartbeat를 갱신한다."""
+        config = {"kiro_workers": [{"name": "k1", "dir": "one", "heartbeat": True}]}
+        (worker,) = KiroPool.from_config(config, base_dir=tmp_path).workers()
+        assert not worker.healthy()
+        sent: list[str] = []
+        monkeypatch.setattr(watcher, "_triggered", {})
+        monkeypatch.setattr(watcher, "send_to_kiro", lambda message, title: sent.append(title) or True)
+        worker.write("m1", "hello")
+
+        watcher.poll_inbox(clock=VirtualClock(), polls=1, base_dir=worker.base_dir, title="Kiro one")
+        assert worker.healthy()
+        assert sent == ["Kiro one"]
+
+    def test_resolve_worker_dir(self, tmp_path):
+        config = {"kiro_workers": [{"name": "k1", "dir": "one"}, {"name": "k2"}]}
+        assert watcher.resolve_worker_dir("k2", config).name == "k2"
+        assert watcher.resolve_worker_dir("default", {}) is None
+        with pytest.raises(ValueError):
+            watcher.resolve_worker_dir("k3", config)
@@ -0,0 +1,83 @@
+"""LatencyTracker 및 적응형 타임아웃 테스트"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from bridge.conftest import wait_ack
+from bridge.latency import MAX_TIMEOUT, MIN_SAMPLES, MIN_TIMEOUT, LatencyTracker, classify
+
+TEST_TOKEN = "test-secret-token"
+TEST_PORT = 9881
+
+
+class TestClassify:
+    def test_text_vs_code(self):
+        assert classify("hello")[0] == "text"
+        assert classify("```py\nprint(1)\n```")[0] == "code"
+
+    def test_size_buckets(self):
+        assert classify("a")[1] == 0
+        assert classify("a" * 300)[1] == 1
+        assert classify("a" * 5000)[1] == 3
+
+
+class TestLatencyTracker:
+    def test_default_until_enough_samples(self):
+        tracker = LatencyTracker(default_timeout=300)
+        for _ in range(MIN_SAMPLES - 1):
+            tracker.record("hi", 5.0)
+        assert tracker.deadline("hi") == 300
+        assert tracker.estimate("hi") is None
+
+    def test_deadline_from_p95(self):
+        """충분한 표본이 쌓이면 p95 × factor, 하한 적용."""
+        tracker = LatencyTracker(default_timeout=300)
+        for _ in range(10):
+            tracker.record("hi", 5.0)
+        assert tracker.estimate("hi") == 5.0
+        assert tracker.deadline("hi") == MIN_TIMEOUT
+
+        for _ in range(10):
+            tracker.record("hi", 100.0)
+        assert tracker.deadline("hi") == 200.0
+
+    def test_falls_back_to_global_samples(self):
+        """해당 구간 표본이 부족하면 전체 표본을 사용한다."""
+        tracker = LatencyTracker(default_timeout=300)
+        for _ in range(10):
+            tracker.record("short", 40.0)
+        assert tracker.estimate("```code```") == 40.0
+
+    def test_timeout_raises_future_deadline(self):
+        tracker = LatencyTracker(default_timeout=300)
+        for _ in range(10):
+            tracker.record("hi", 40.0)
+        before = tracker.deadline("hi")
+        tracker.record_timeout("hi", before)
+        assert tracker.deadline("hi") > before
+        assert tracker.deadline("hi") <= MAX_TIMEOUT
+
+
+class TestServerAdaptiveTimeout:
+    @pytest.mark.asyncio
+    async def test_ack_has_eta_and_progress_sent(self, server, open_client):
+        """ACK에 eta/deadline이 있고, 대기 중 progress 프레임이 온다."""
+        for _ in range(MIN_SAMPLES):
+            server._latency.record("question", 12.0)
+
+        frames = []
+        with patch.object(server, "PROGRESS_INTERVAL", 0.05):
+            client = await open_client(on_event=frames.append)
+            request = await client.submit("question")
+            message_id = await wait_ack(request)
+            assert request.eta == 12.0
+            while not any(f["type"] == "progress" for f in frames):
+                await asyncio.sleep(0.01)
+
+        ack = next(f for f in frames if f["type"] == "message_ack")
+        assert ack["payload"]["deadline"] == MIN_TIMEOUT
+        progress = next(f for f in frames if f["type"] == "progress")
+        assert progress["payload"]["message_id"] == message_id
+        assert progress["payload"]["eta"] == 12.0
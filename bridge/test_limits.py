@@ -0,0 +1,125 @@
+"""연결별 메모리 계정과 상한 테스트"""
+
+import asyncio
+
+import pytest
+import websockets
+
+from bridge.channels import Channel
+from bridge.client import ClientError
+from bridge.conftest import frame, wait_ack
+from bridge.kiro_pool import KiroPool
+from bridge.limits import SHED_CLOSE_CODE, ByteTally, MemoryAccountant, MemoryLimits
+
+TEST_TOKEN = "limits-token"
+TEST_PORT = 9892
+
+
+class _FakeTransport:
+    def __init__(self, buffered: int = 0) -> None:
+        self.buffered = buffered
+
+    def get_write_buffer_size(self) -> int:
+        return self.buffered
+
+
+class _FakeSocket:
+    def __init__(self, buffered: int = 0) -> None:
+        self.transport = _FakeTransport(buffered)
+        self.closed_with: int | None = None
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        self.closed_with = code
+
+
+class TestMemoryLimits:
+    def test_from_config_keeps_defaults(self):
+        limits = MemoryLimits.from_config({"limits": {"max_pending": 2048}})
+        assert limits.max_pending == 2048
+        assert limits.max_frame == MemoryLimits().max_frame
+        assert limits.serve_options() == {"max_size": limits.max_frame, "max_queue": limits.max_queue}
+
+
+def test_byte_tally_keeps_totals():
+    tally = ByteTally()
+    tally.add("a", 10)
+    tally.add("b", 5)
+    tally.add("a", 3)
+    assert (tally.total, tally.of("a"), tally.of("b")) == (18, 13, 5)
+    tally.remove("a", 13)
+    assert (tally.total, tally.of("a")) == (5, 0)
+
+
+class TestAccountant:
+    @pytest.mark.asyncio
+    async def test_slow_connection_is_shed(self):
+        memory = MemoryAccountant(MemoryLimits(max_outbound=1000))
+        slow = _FakeSocket(buffered=900)
+        memory.open(slow)
+        assert memory.admit_outbound(slow, 50)
+        assert not memory.admit_outbound(slow, 200)
+        await asyncio.sleep(0)
+        assert slow.closed_with == SHED_CLOSE_CODE
+        assert memory.shed == 1 and memory.usage(slow) is None
+
+    @pytest.mark.asyncio
+    async def test_budget_sheds_heaviest(self):
+        memory = MemoryAccountant(MemoryLimits(max_outbound=10_000, budget=1000))
+        light, heavy = _FakeSocket(buffered=10), _FakeSocket(buffered=5000)
+        for ws in (light, heavy):
+            memory.open(ws)
+        memory.add_outbound(light, 600)
+        assert memory.admit_outbound(light, 500)  # 끊긴 쪽은 heavy
+        await asyncio.sleep(0)
+        assert heavy.closed_with == SHED_CLOSE_CODE and light.closed_with is None
+        memory.add_outbound(light, -600)
+        assert memory.buffered == 0
+
+    def test_unknown_connection_is_admitted(self):
+        assert MemoryAccountant().admit_outbound(_FakeSocket(buffered=1 << 30), 1)
+
+
+@pytest.mark.asyncio
+async def test_channel_tracks_queued_bytes():
+    release = asyncio.Event()
+
+    async def handler(channel_id, msg):
+        await release.wait()
+
+    channel = Channel("main", window=4, handler=handler)
+    channel.submit({"payload": {"content": "가나"}})
+    channel.submit({"payload": {"content": "abc"}})
+    assert channel.queued_bytes == 9
+    await asyncio.sleep(0.01)  # 첫 메시지 처리 시작 — 대기열에서 빠짐
+    assert channel.queued_bytes == 3
+    release.set()
+    await asyncio.sleep(0.01)
+    assert channel.queued_bytes == 0
+    channel.close()
+
+
+@pytest.fixture
+def server_options(worker):
+    # 응답하는 Kiro가 없으므로 보낸 프롬프트는 응답 대기로 남는다
+    return {"kiro_pool": KiroPool([worker]), "limits": MemoryLimits(max_frame=4096, max_pending=100)}
+
+
+class TestServerLimits:
+    @pytest.mark.asyncio
+    async def test_pending_limit_rejects_prompt(self, server, client):
+        await wait_ack(await client.submit("a" * 60))
+        with pytest.raises(ClientError, match="상한"):
+            await client.ask("b" * 60, timeout=5)
+
+        memory = (await client.status())["memory"]
+        assert memory["max_pending"] == 100
+        assert [c["pending"] for c in memory["connections"]] == [60]
+        assert server._memory_total() >= 60 and server._waiting_bytes.total == 60
+
+    @pytest.mark.asyncio
+    async def test_oversized_frame_closes_connection(self, server, connect):
+        ws, _ = await connect()
+        await ws.send(frame("message", content="x" * 8192))
+        with pytest.raises(websockets.ConnectionClosed):
+            await asyncio.wait_for(ws.recv(), timeout=5)
+        assert ws.close_code == 1009
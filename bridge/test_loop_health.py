@@ -0,0 +1,102 @@
+"""이벤트 루프 lag 측정과 블로킹 호출 탐지 테스트"""
+
+import asyncio
+import json
+import logging
+import time
+import traceback
+
+import pytest
+import pytest_asyncio
+import websockets
+
+from bridge.auth import Authenticator
+from bridge.loop_health import LoopMonitor, attribute
+from bridge.server import BridgeServer
+
+TEST_TOKEN = "loop-token"
+TEST_HOST = "127.0.0.1"
+TEST_PORT = 9893
+
+
+def _blocking_disk_write(seconds: float) -> None:
+    time.sleep(seconds)  # 루프 위의 동기 호출 흉내
+
+
+class TestLoopMonitor:
+    def test_histogram_and_percentiles(self):
+        monitor = LoopMonitor(stall_threshold=1.0)
+        for lag in (0.0005, 0.0005, 0.003, 0.2):
+            monitor.record(lag)
+        summary = monitor.summary()
+        assert summary["samples"] == 4
+        assert summary["histogram"] == {"<1ms": 2, "<5ms": 1, "<500ms": 1}
+        assert summary["max_ms"] == 200.0 and summary["stalls"] == 0
+
+    def test_attribute_prefers_bridge_frame(self):
+        stack = traceback.StackSummary.from_list(
+            [
+                ("/root/package/bridge/file_io.py", 42, "write_message", None),
+                ("/usr/lib/python3.11/pathlib.py", 1000, "write_text", None),
+            ]
+        )
+        assert attribute(stack).endswith("bridge/file_io.py:42 (write_message)")
+
+    def test_from_config(self):
+        monitor = LoopMonitor.from_config({"loop_monitor": {"enabled": False, "stall_threshold": 0.25}})
+        assert not monitor.enabled and monitor.stall_threshold == 0.25
+
+    @pytest.mark.asyncio
+    async def test_stall_is_attributed_to_blocking_call(self, caplog):
+        caplog.set_level(logging.WARNING, logger="bridge.loop_health")
+        monitor = LoopMonitor(interval=0.02, stall_threshold=0.05)
+        monitor.start()
+        try:
+            await asyncio.sleep(0.05)
+            _blocking_disk_write(0.3)
+            await asyncio.sleep(0.05)
+        finally:
+            monitor.stop()
+        summary = monitor.summary()
+        assert summary["stalls"] == 1
+        top = summary["top"][0]
+        assert "test_loop_health.py" in top["location"] and "_blocking_disk_write" in top["location"]
+        assert top["max_ms"] >= 250
+        # 스택은 로그에만 — 상태 응답에는 위치만 보낸다
+        assert "stack" not in summary["recent"][0]
+        assert "_blocking_disk_write" in caplog.text and "File " in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_disabled_monitor_does_not_run(self):
+        monitor = LoopMonitor(enabled=False)
+        monitor.start()
+        await asyncio.sleep(0.01)
+        assert not monitor.summary()["running"]
+        monitor.stop()
+
+
+@pytest_asyncio.fixture
+async def server():
+    srv = BridgeServer(
+        authenticator=Authenticator(token=TEST_TOKEN),
+        loop_monitor=LoopMonitor(interval=0.01),
+    )
+    await srv.start(TEST_HOST, TEST_PORT)
+    yield srv
+    await srv.stop()
+
+
+@pytest.mark.asyncio
+async def test_status_reports_loop_health(server):
+    async with websockets.connect(f"ws://{TEST_HOST}:{TEST_PORT}") as ws:
+        await ws.send(json.dumps({"type": "auth", "payload": {"token": TEST_TOKEN}, "timestamp": time.time()}))
+        await ws.recv()
+        await asyncio.sleep(0.05)
+        await ws.send(json.dumps({"type": "status_request", "payload": {}, "timestamp": time.time()}))
+        while True:
+            frame = json.loads(await asyncio.wait_for(ws.recv(), timeout=5))
+            if frame["type"] == "status":
+                break
+    loop = frame["payload"]["status"]["loop"]
+    assert loop["running"] and loop["samples"] > 0
+    assert "p99_ms" in loop and "histogram" in loop
@@ -7,7 +7,15 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from bridge.main import load_config, setup_logging, start_ngrok, CONFIG_PATH
+from bridge.main import (
+    CONFIG_PATH,
+    StartupProfile,
+    load_config,
+    parse_args,
+    run,
+    setup_logging,
+    start_ngrok,
+)
 
 
 class TestLoadConfig:
@@ -89,3 +97,61 @@ class TestStartNgrok:
         with patch.dict("sys.modules", {"ngrok": mock_ngrok}):
             result = await start_ngrok(8765, {"authtoken": "test-token"})
             assert result == "https://abc123.ngrok.io"
+
+
+class TestParseArgs:
+    """명령행 인자 파싱 테스트"""
+
+    def test_defaults_are_none(self):
+        """인자를 주지 않으면 config.json 값을 쓰도록 None."""
+        args = parse_args([])
+        assert args.workers is None
+        assert args.uvloop is None
+
+    def test_workers_and_uvloop(self):
+        args = parse_args(["--workers", "4", "--uvloop"])
+        assert args.workers == 4
+        assert args.uvloop is True
+
+    def test_startup_profile_flag(self):
+        assert parse_args([]).startup_profile is False
+        assert parse_args(["--startup-profile"]).startup_profile is True
+
+
+class TestRunWorkers:
+    """run()의 워커 수 결정 테스트"""
+
+    @pytest.mark.parametrize(
+        "config, expected",
+        [
+            ({}, 0),  # 세션·티켓·핸드오프 기본값 켜짐 → 단일 프로세스
+            ({"sessions": False, "resume_tickets": False, "handoff": False}, 1),
+        ],
+    )
+    def test_per_process_features_force_single_worker(self, config, expected):
+        with patch("bridge.main.load_config", return_value=config), \
+                patch("bridge.workers.resolve_worker_count", return_value=4), \
+                patch("bridge.workers.run_workers") as run_workers, \
+                patch("bridge.main.main", new=MagicMock()), \
+                patch("bridge.main.asyncio.run"), \
+                patch("bridge.file_io.ensure_dirs"):
+            run(["--workers", "4"])
+        assert run_workers.call_count == expected
+
+class TestStartupProfile:
+    """시작 프로파일 테스트"""
+
+    def test_records_steps(self, capsys):
+        profile = StartupProfile(enabled=True)
+        with profile.step("load config"):
+            pass
+        profile.report()
+        assert [label for label, _ in profile.steps] == ["load config"]
+        assert "load config" in capsys.readouterr().out
+
+    def test_disabled_prints_nothing(self, capsys):
+        profile = StartupProfile()
+        with profile.step("bind"):
+            pass
+        profile.report()
+        assert capsys.readouterr().out == ""
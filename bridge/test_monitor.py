@@ -7,7 +7,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from bridge.models import ResponseType, ServerMessage
-from bridge.monitor import ResponseMonitor
+from bridge.monitor import ResponseMonitor, extract_new_reply
 
 
 class TestIsResponding:
@@ -192,3 +192,85 @@ class TestReadChatText:
         monitor = ResponseMonitor()
         result = monitor._read_chat_text()
         assert result is None
+
+
+class TestSendAndWait:
+    """send_and_wait() 메서드 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_send_and_first_snapshot_batched(self):
+        """전송과 첫 스냅샷 읽기가 함께 실행되고 안정된 텍스트를 반환"""
+        monitor = ResponseMonitor()
+        automation = MagicMock()
+        automation.send_message.return_value = True
+
+        reads = iter(["history\n", "history\nhi\nanswer"])
+
+        def fake_read():
+            return next(reads, "history\nhi\nanswer")
+
+        with patch.object(monitor, "_read_chat_text", side_effect=fake_read):
+            with patch.object(monitor, "POLL_INTERVAL", 0.01):
+                with patch.object(monitor, "STABLE_THRESHOLD", 0.05):
+                    result = await monitor.send_and_wait(automation, "hi", timeout=5)
+
+        automation.send_message.assert_called_once_with("hi")
+        assert result == "answer"
+
+    @pytest.mark.asyncio
+    async def test_send_failure_raises(self):
+        """전송 실패 시 RuntimeError"""
+        monitor = ResponseMonitor()
+        automation = MagicMock()
+        automation.send_message.return_value = False
+
+        with patch.object(monitor, "_read_chat_text", return_value="x"):
+            with pytest.raises(RuntimeError, match="메시지 전송 실패"):
+                await monitor.send_and_wait(automation, "hi", timeout=5)
+
+
+class TestExtractNewReply:
+    """extract_new_reply() 테스트"""
+
+    def test_appended_reply(self):
+        baseline = "user: a\nkiro: b\n"
+        current = baseline + "user: hi\nkiro: hello there\n"
+        assert extract_new_reply(baseline, current) == "user: hi\nkiro: hello there"
+
+    def test_strips_echoed_prompt(self):
+        baseline = "old conversation\n"
+        current = baseline + "what is 1+1?\n\n2 입니다.\n"
+        assert extract_new_reply(baseline, current, prompt="what is 1+1?") == "2 입니다."
+
+    def test_front_trimmed_history(self):
+        """앞부분이 잘려도 앵커로 새 응답을 찾는다."""
+        baseline = "x" * 5000 + "END-OF-BASELINE"
+        current = baseline[3000:] + "\nnew reply"
+        assert extract_new_reply(baseline, current) == "new reply"
+
+    def test_anchor_missing_returns_none(self):
+        assert extract_new_reply("completely different", "other text") is None
+
+    def test_empty_baseline_returns_all(self):
+        assert extract_new_reply("", "  reply  ") == "reply"
+
+    @pytest.mark.asyncio
+    async def test_wait_for_response_returns_only_reply(self):
+        """baseline이 주어지면 새 응답 부분만 반환"""
+        monitor = ResponseMonitor()
+        baseline = "history " * 1000
+        with patch.object(monitor, "_read_chat_text", return_value=baseline + "\nnew answer"):
+            with patch.object(monitor, "POLL_INTERVAL", 0.01):
+                with patch.object(monitor, "STABLE_THRESHOLD", 0.05):
+                    result = await monitor.wait_for_response(timeout=5, baseline=baseline)
+        assert result == "new answer"
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_full_text(self):
+        """앵커를 찾지 못하면 전체 텍스트 반환"""
+        monitor = ResponseMonitor()
+        with patch.object(monitor, "_read_chat_text", return_value="cleared chat"):
+            with patch.object(monitor, "POLL_INTERVAL", 0.01):
+                with patch.object(monitor, "STABLE_THRESHOLD", 0.05):
+                    result = await monitor.wait_for_response(timeout=5, baseline="gone history")
+        assert result == "cleared chat"
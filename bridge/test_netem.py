@@ -0,0 +1,162 @@
+"""네트워크 조건 에뮬레이터 테스트"""
+
+import asyncio
+import json
+import time
+
+import pytest
+import pytest_asyncio
+import websockets
+
+from bridge import netem
+from bridge.auth import Authenticator
+from bridge.netem import PROFILES, LinkProfile, NetemProxy
+from bridge.server import BridgeServer
+
+TEST_TOKEN = "netem-token"
+TEST_HOST = "127.0.0.1"
+TEST_PORT = 9890
+
+
+async def _start_source(payload: bytes):
+    """접속하면 payload를 보내고 닫는 TCP 서버 (대역폭 측정용)."""
+
+    async def handle(reader, writer):
+        writer.write(payload)
+        await writer.drain()
+        writer.close()
+
+    return await asyncio.start_server(handle, TEST_HOST, 0)
+
+
+async def _proxied(profile: LinkProfile, target_port: int, seed: int = 1) -> NetemProxy:
+    proxy = NetemProxy(profile, seed=seed)
+    await proxy.start(TEST_HOST, 0, TEST_HOST, target_port)
+    return proxy
+
+
+async def _download(port: int) -> tuple[bytes, float]:
+    started = time.monotonic()
+    reader, writer = await asyncio.open_connection(TEST_HOST, port)
+    data = await asyncio.wait_for(reader.read(), timeout=10)
+    writer.close()
+    return data, time.monotonic() - started
+
+
+class TestLinkShaping:
+    @pytest.mark.asyncio
+    async def test_bandwidth_cap(self):
+        payload = bytes(range(256)) * 200  # 51,200 바이트
+        source = await _start_source(payload)
+        proxy = await _proxied(LinkProfile(down_kbps=1600), source.sockets[0].getsockname()[1])
+        try:
+            data, elapsed = await _download(proxy.port)
+        finally:
+            await proxy.stop()
+            source.close()
+        assert data == payload
+        # 51,200 B × 8 / 1.6 Mbit/s ≈ 0.256초
+        assert elapsed >= 0.22
+        assert proxy.stats.bytes_down == len(payload)
+
+    @pytest.mark.asyncio
+    async def test_slow_link_holds_one_bdp(self):
+        """느린 링크는 BDP만큼만 읽어 두고 나머지는 보내는 쪽 소켓에 남긴다."""
+        payload = b"y" * (256 * 1024)
+        source = await _start_source(payload)
+        proxy = await _proxied(LinkProfile(latency=0.01, down_kbps=3200), source.sockets[0].getsockname()[1])
+        try:
+            data, _ = await _download(proxy.port)
+        finally:
+            await proxy.stop()
+            source.close()
+        assert data == payload
+        limit = proxy.in_flight_limit("down")
+        assert limit is not None and proxy.stats.peak_in_flight <= limit + netem.CHUNK
+        assert proxy.in_flight_limit("up") is None  # 대역폭 무제한 방향은 제한 없음
+
+    @pytest.mark.asyncio
+    async def test_stalls_delay_chunks(self):
+        source = await _start_source(b"x" * 100)
+        proxy = await _proxied(LinkProfile(loss=1.0, stall=0.15), source.sockets[0].getsockname()[1])
+        try:
+            data, elapsed = await _download(proxy.port)
+        finally:
+            await proxy.stop()
+            source.close()
+        assert data == b"x" * 100
+        assert elapsed >= 0.15 and proxy.stats.stalls >= 1
+
+    @pytest.mark.asyncio
+    async def test_jitter_preserves_order(self):
+        async def handle(reader, writer):
+            for i in range(200):
+                writer.write(f"{i:04d}".encode())
+                await writer.drain()
+                await asyncio.sleep(0)
+            writer.close()
+
+        source = await asyncio.start_server(handle, TEST_HOST, 0)
+        proxy = await _proxied(LinkProfile(latency=0.02, jitter=0.02), source.sockets[0].getsockname()[1])
+        try:
+            data, _ = await _download(proxy.port)
+        finally:
+            await proxy.stop()
+            source.close()
+        assert data == b"".join(f"{i:04d}".encode() for i in range(200))
+
+
+@pytest_asyncio.fixture
+async def server():
+    srv = BridgeServer(authenticator=Authenticator(token=TEST_TOKEN))
+    await srv.start(TEST_HOST, TEST_PORT)
+    yield srv
+    await srv.stop()
+
+
+async def _heartbeat_rtt(port: int) -> float:
+    async with websockets.connect(f"ws://{TEST_HOST}:{port}") as ws:
+        await ws.send(json.dumps({"type": "auth", "payload": {"token": TEST_TOKEN}, "timestamp": time.time()}))
+        await ws.recv()
+        started = time.monotonic()
+        await ws.send(json.dumps({"type": "heartbeat", "payload": {}, "timestamp": time.time()}))
+        await ws.recv()
+        return time.monotonic() - started
+
+
+class TestBridgeThroughProxy:
+    @pytest.mark.asyncio
+    async def test_latency_adds_round_trip(self, server):
+        proxy = await _proxied(LinkProfile(latency=0.05), TEST_PORT)
+        try:
+            assert await _heartbeat_rtt(proxy.port) >= 0.1
+            proxy.update(latency=0.0)
+            assert await _heartbeat_rtt(proxy.port) < 0.1
+        finally:
+            await proxy.stop()
+        assert proxy.stats.bytes_up > 0 and proxy.stats.bytes_down > 0
+
+    @pytest.mark.asyncio
+    async def test_disconnect_all_closes_client(self, server):
+        proxy = await _proxied(PROFILES["loopback"], TEST_PORT)
+        try:
+            ws = await websockets.connect(f"ws://{TEST_HOST}:{proxy.port}")
+            await ws.send(json.dumps({"type": "auth", "payload": {"token": TEST_TOKEN}, "timestamp": time.time()}))
+            await ws.recv()
+            assert proxy.disconnect_all() == 1
+            with pytest.raises(websockets.ConnectionClosed):
+                await asyncio.wait_for(ws.recv(), timeout=5)
+        finally:
+            await proxy.stop()
+        assert proxy.stats.disconnects == 1
+
+    @pytest.mark.asyncio
+    async def test_periodic_disconnect(self, server):
+        proxy = await _proxied(LinkProfile(disconnect_every=0.2), TEST_PORT)
+        try:
+            ws = await websockets.connect(f"ws://{TEST_HOST}:{proxy.port}")
+            with pytest.raises(websockets.ConnectionClosed):
+                await asyncio.wait_for(ws.recv(), timeout=5)
+        finally:
+            await proxy.stop()
+        assert proxy.stats.disconnects == 1
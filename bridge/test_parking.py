@@ -0,0 +1,143 @@
+"""Kiro 중단 시 프롬프트 보관 테스트"""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from bridge import kiro_pool
+from bridge.conftest import frame, next_frame, wait_ack
+from bridge.kiro_pool import KiroPool, KiroWorker
+from bridge.models import PendingRequest
+from bridge.parking import ParkingLot
+from bridge.server import BridgeServer
+from bridge.test_kiro_pool import fake_kiro
+
+TEST_TOKEN = "parking-token"
+TEST_PORT = 9884
+
+
+def _pending(message_id: str, token_id: str = "", client_id: str = "cli-a") -> PendingRequest:
+    return PendingRequest(message_id=message_id, client_id=client_id, content="x", created_at=0.0, token_id=token_id)
+
+
+class TestParkingLot:
+    def test_fifo_and_positions(self):
+        lot = ParkingLot()
+        assert lot.park(_pending("m1", client_id="a")) == 1
+        assert lot.park(_pending("m2", client_id="b")) == 2
+        assert lot.position_of("b") == 2
+        assert lot.payload_bytes() == 2 and lot.payload_bytes("a") == 1
+        assert lot.pop().message_id == "m1"
+        assert lot.position_of("b") == 1
+        assert lot.position_of("a") == 0
+        assert lot.payload_bytes() == 1 and lot.payload_bytes("a") == 0
+
+    def test_persists_across_restart(self, tmp_path):
+        path = tmp_path / "parking.json"
+        lot = ParkingLot(path)
+        lot.park(_pending("m1", token_id="t1"))
+        lot.park(_pending("m2", token_id="t1"))
+
+        restored = ParkingLot(path)
+        assert len(restored) == 2
+        assert restored.peek().message_id == "m1"
+        assert restored.count_for("t1") == 2
+        assert restored.payload_bytes() == 2
+
+        restored.pop()
+        restored.pop()
+        assert not path.exists()
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        path = tmp_path / "parking.json"
+        path.write_text("{broken", encoding="utf-8")
+        assert len(ParkingLot(path)) == 0
+
+
+def _set_heartbeat(worker: KiroWorker, age: float) -> None:
+    worker.heartbeat_path.parent.mkdir(parents=True, exist_ok=True)
+    worker.heartbeat_path.touch()
+    beat = time.time() - age
+    os.utime(worker.heartbeat_path, (beat, beat))
+
+
+@pytest.fixture
+def worker(tmp_path, monkeypatch):
+    monkeypatch.setattr(kiro_pool, "POLL_INTERVAL", 0.01)
+    monkeypatch.setattr(BridgeServer, "PARKING_CHECK_INTERVAL", 0.05)
+    monkeypatch.setattr(BridgeServer, "PARKING_DRAIN_INTERVAL", 0.05)
+    kiro = KiroWorker("kiro", tmp_path / "kiro", heartbeat=True)
+    _set_heartbeat(kiro, kiro_pool.HEARTBEAT_STALE + 5)
+    return kiro
+
+
+@pytest.fixture
+def server_options(worker, tmp_path):
+    return {"kiro_pool": KiroPool([worker]), "parking": ParkingLot(tmp_path / "parking.json")}
+
+
+def _payloads(frames: list[dict], frame_type: str) -> list[dict]:
+    return [f["payload"] for f in frames if f["type"] == frame_type]
+
+
+class TestServerParking:
+    @pytest.mark.asyncio
+    async def test_park_then_drain_in_order(self, server, worker, tmp_path, open_client):
+        frames = []
+        client = await open_client(on_event=frames.append)
+        requests = [await client.submit(content) for content in ("first", "second")]
+        for request in requests:
+            await wait_ack(request)
+        acks = _payloads(frames, "message_ack")
+        assert [request.parked for request in requests] == [True, True]
+        assert [ack["position"] for ack in acks] == [1, 2]
+        assert "deadline" not in acks[0]
+        assert not list(worker.inbox_dir.rglob("*.json"))
+        assert (tmp_path / "parking.json").exists()
+
+        # Kiro 복구 → 보관 순서대로 배정 후 응답
+        _set_heartbeat(worker, 0)
+        kiro = asyncio.create_task(fake_kiro(worker))
+        try:
+            replies = await asyncio.wait_for(asyncio.gather(*(r.result() for r in requests)), timeout=5)
+        finally:
+            kiro.cancel()
+        assert [reply.content for reply in replies] == ["ok:first", "ok:second"]
+        assert all(unparked["deadline"] > 0 for unparked in _payloads(frames, "unparked"))
+        assert len(server._parking) == 0
+        assert not (tmp_path / "parking.json").exists()
+
+    @pytest.mark.asyncio
+    async def test_new_prompt_queues_behind_parked(self, server, worker, open_client):
+        frames = []
+        client = await open_client(on_event=frames.append)
+        server._parking_task.cancel()  # 배정 루프 정지 — 순번만 확인
+        server._parking.park(_pending("msg-early"))
+
+        # 워커가 정상이어도 앞서 보관된 프롬프트가 있으면 그 뒤에 보관
+        _set_heartbeat(worker, 0)
+        request = await client.submit("late")
+        await wait_ack(request)
+        assert request.parked is True
+        assert _payloads(frames, "message_ack")[0]["position"] == 2
+        assert not list(worker.inbox_dir.rglob("*.json"))
+
+    @pytest.mark.asyncio
+    async def test_status_reports_dead_kiro(self, server, worker, client, connect):
+        """STATUS와 상태 delta의 kiro_running이 같은 워커 상태를 보고한다."""
+        assert (await client.status())["kiro_running"] is False
+        ws, _ = await connect()
+        await ws.send(frame("subscribe_status"))
+        assert (await next_frame(ws, "status_snapshot"))["payload"]["status"]["kiro_running"] is False
+
+        _set_heartbeat(worker, 0)
+        assert (await client.status())["kiro_running"] is True
+
+
+def test_heartbeat_on_by_default(tmp_path):
+    (default,) = KiroPool.from_config({}).workers()
+    assert default.heartbeat and not KiroPool.from_config({"kiro_heartbeat": False}).workers()[0].heartbeat
+    pool = KiroPool.from_config({"kiro_workers": [{"name": "a"}, {"name": "b", "heartbeat": False}]}, base_dir=tmp_path)
+    assert [w.heartbeat for w in pool.workers()] == [True, False]
@@ -0,0 +1,105 @@
+"""공유 세션 팬아웃 테스트"""
+
+import asyncio
+import json
+
+import pytest
+
+from bridge.conftest import frame, kiro_reply, next_frame, wait_ack
+from bridge.sessions import SessionHub, default_session
+from bridge.tokens import TokenEntry, hash_token
+
+TEST_TOKEN = "test-secret-token"
+TEST_PORT = 9880
+
+
+class TestSessionHub:
+    def test_default_session_hides_token(self):
+        entry = TokenEntry.from_hash(hash_token("secret"), "phone")
+        assert entry.session == default_session(entry.token_id)
+        assert entry.session.startswith("tok-")
+        assert "secret" not in entry.session
+
+    def test_publish_encodes_once_with_seq(self):
+        """발행 프레임에 session/seq가 붙고 모든 구독자가 같은 데이터를 받는다."""
+        hub = SessionHub()
+        hub.subscribe("s", "phone")
+        hub.subscribe("s", "tablet")
+        data, targets = hub.publish("s", {"type": "kiro_response", "payload": {}})
+        assert targets == {"phone", "tablet"}
+        published = json.loads(data)
+        assert published["session"] == "s"
+        assert published["seq"] == 1
+
+    def test_publish_excludes_sender(self):
+        hub = SessionHub()
+        hub.subscribe("s", "phone")
+        hub.subscribe("s", "tablet")
+        _, targets = hub.publish("s", {"type": "session_prompt"}, exclude="phone")
+        assert targets == {"tablet"}
+
+    def test_replay_since(self):
+        """since 이후 이벤트만, 보관 범위 내에서 재전송한다."""
+        hub = SessionHub(replay_size=3)
+        for i in range(5):
+            hub.publish("s", {"n": i})
+        replayed = [json.loads(d)["n"] for d in hub.replay("s", 3)]
+        assert replayed == [3, 4]
+        assert [json.loads(d)["seq"] for d in hub.replay("s", 0)] == [3, 4, 5]
+
+    def test_unsubscribe_all(self):
+        hub = SessionHub()
+        hub.subscribe("a", "phone")
+        hub.subscribe("b", "phone")
+        hub.unsubscribe_all("phone")
+        assert hub.subscribers("a") == set()
+        assert hub.sessions_of("phone") == set()
+
+
+class TestFanOut:
+    @pytest.mark.asyncio
+    async def test_response_reaches_all_devices(self, server, open_client):
+        """폰에서 보낸 프롬프트와 응답이 태블릿에도 전달된다."""
+        phone = await open_client()
+        tablet_frames = []
+        tablet = await open_client(on_event=tablet_frames.append)
+        assert phone.session == tablet.session == default_session(hash_token(TEST_TOKEN)[:12])
+
+        request = await phone.submit("hi")
+        kiro_reply(await wait_ack(request), "answer")
+        reply = await asyncio.wait_for(request.result(), timeout=5)
+        assert reply.content == "answer"
+
+        while len(tablet_frames) < 2:
+            await asyncio.sleep(0.01)
+        shared_prompt, shared_reply = tablet_frames
+        assert shared_prompt["type"] == "session_prompt"
+        assert shared_prompt["payload"]["content"] == "hi"
+        assert shared_reply["type"] == "kiro_response"
+        assert shared_reply["payload"] == {"content": "answer", "message_id": request.message_id}
+
+    @pytest.mark.asyncio
+    async def test_late_joiner_replay(self, server, client, connect):
+        """늦게 들어온 기기는 subscribe(since)로 놓친 이벤트를 받는다."""
+        request = await client.submit("hi")
+        kiro_reply(await wait_ack(request), "answer")
+        await asyncio.wait_for(request.result(), timeout=5)
+
+        tablet, auth = await connect()
+        assert auth["payload"]["seq"] == 2
+        await tablet.send(frame("subscribe", since=0))
+        assert (await next_frame(tablet))["type"] == "subscribed"
+        replay = [await next_frame(tablet), await next_frame(tablet)]
+        assert [r["type"] for r in replay] == ["session_prompt", "kiro_response"]
+        assert [r["seq"] for r in replay] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_unsubscribed_device_still_gets_own_response(self, server, connect):
+        phone, _ = await connect()
+        await phone.send(frame("unsubscribe"))
+        assert (await next_frame(phone))["type"] == "unsubscribed"
+        await phone.send(frame("message", content="hi"))
+        kiro_reply((await next_frame(phone, "message_ack"))["payload"]["message_id"], "answer")
+        resp = await next_frame(phone)
+        assert resp["type"] == "kiro_response"
+        assert "seq" not in resp
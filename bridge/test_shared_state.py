@@ -0,0 +1,80 @@
+"""SharedState 단위 테스트"""
+
+import pytest
+
+from bridge.shared_state import SharedState
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "shared.db"
+
+
+class TestClientRegistry:
+    def test_counts_clients_across_workers(self, db_path):
+        """여러 워커의 클라이언트 수를 합산한다."""
+        w1 = SharedState("w1", db_path)
+        w2 = SharedState("w2", db_path)
+        w1.register_client("a", "127.0.0.1")
+        w1.register_client("b")
+        w2.register_client("a")
+        assert w1.client_count() == 3
+        assert w2.client_count() == 3
+
+        w1.unregister_client("a")
+        assert w2.client_count() == 2
+
+    def test_close_purges_own_rows(self, db_path):
+        """워커 종료 시 자신의 행만 제거한다."""
+        w1 = SharedState("w1", db_path)
+        w2 = SharedState("w2", db_path)
+        w1.register_client("a")
+        w2.register_client("b")
+        w1.close()
+        assert w2.client_count() == 1
+
+
+class TestQueue:
+    def test_enqueue_and_complete(self, db_path):
+        """큐 길이를 모든 워커에 걸쳐 추적한다."""
+        w1 = SharedState("w1", db_path)
+        w2 = SharedState("w2", db_path)
+        w1.enqueue("msg-1")
+        w2.enqueue("msg-2")
+        assert w1.queue_depth() == 2
+
+        w1.complete("msg-1")
+        assert w2.queue_depth() == 1
+        w2.purge_worker("w2")
+        assert w1.queue_depth() == 0
+
+    def test_reset_clears_all(self, db_path):
+        """reset은 모든 워커의 행을 제거한다."""
+        w1 = SharedState("w1", db_path)
+        w1.register_client("a")
+        w1.enqueue("msg-1")
+        SharedState("supervisor", db_path).reset()
+        assert w1.client_count() == 0
+        assert w1.queue_depth() == 0
+
+
+class TestDefer:
+    @pytest.mark.asyncio
+    async def test_writes_run_in_order_off_loop(self, db_path):
+        """defer한 쓰기는 기다리지 않아도 호출 순서대로 반영된다."""
+        w1 = SharedState("w1", db_path)
+        w1.defer("enqueue", "msg-1")
+        w1.defer("complete", "msg-1")
+        await w1.defer("enqueue", "msg-2")
+        assert w1.queue_depth() == 1
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending_writes(self, db_path):
+        w1 = SharedState("w1", db_path)
+        w2 = SharedState("w2", db_path)
+        w1.defer("register_client", "a")
+        await w1.defer("register_client", "b")
+        assert w2.client_count() == 2
+        w1.defer("register_client", "c")
+        w1.close()  # 남은 쓰기를 마친 뒤 자기 행을 정리
+        assert w2.client_count() == 0
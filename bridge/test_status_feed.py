@@ -0,0 +1,154 @@
+"""상태 구독(push) 테스트"""
+
+import asyncio
+
+import pytest
+
+from bridge.clock import VirtualClock
+from bridge.conftest import frame, next_frame
+from bridge.server import BridgeServer
+from bridge.status_feed import StatusFeed
+
+TEST_TOKEN = "status-token"
+TEST_PORT = 9883
+
+
+class TestStatusFeed:
+    @pytest.mark.asyncio
+    async def test_snapshot_then_delta_only(self):
+        state = {"clients": 1, "kiro": True}
+        sent = []
+
+        async def send(sub, delta):
+            sent.append((sub, delta))
+
+        feed = StatusFeed(lambda sub: dict(state), send, min_interval=0.01)
+        assert feed.subscribe("phone") == {"clients": 1, "kiro": True}
+        state["clients"] = 2
+        feed.mark_dirty()
+        await asyncio.sleep(0.05)
+        assert sent == [("phone", {"clients": 2})]
+
+    @pytest.mark.asyncio
+    async def test_burst_is_coalesced(self):
+        state = {"clients": 0}
+        sent = []
+
+        async def send(sub, delta):
+            sent.append(delta)
+
+        feed = StatusFeed(lambda sub: dict(state), send, min_interval=0.1)
+        feed.subscribe("phone")
+        for i in range(1, 50):
+            state["clients"] = i
+            feed.mark_dirty()
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.3)
+        # 첫 flush(즉시) + 간격 후 한 번 — 49번이 아니라 최대 2번
+        assert 1 <= len(sent) <= 2
+        assert sent[-1] == {"clients": 49}
+
+    @pytest.mark.asyncio
+    async def test_common_fields_computed_once_per_flush(self):
+        state = {"clients": 1}
+        calls = []
+        sent = []
+
+        def common():
+            calls.append(1)
+            return dict(state)
+
+        async def send(sub, delta):
+            sent.append((sub, delta))
+
+        feed = StatusFeed(lambda sub: {"position": len(sub)}, send, min_interval=0.01, common=common)
+        for sub in ("a", "bb", "ccc"):
+            assert feed.subscribe(sub) == {"clients": 1, "position": len(sub)}
+        calls.clear()
+        state["clients"] = 2
+        feed.mark_dirty()
+        await asyncio.sleep(0.05)
+        assert len(calls) == 1
+        assert sorted(sent) == [(sub, {"clients": 2}) for sub in ("a", "bb", "ccc")]
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_on_virtual_clock(self):
+        """전송 간격과 주기 확인은 주입된 시계를 따른다."""
+        clock = VirtualClock()
+        state = {"clients": 1}
+        sent = []
+
+        async def send(sub, delta):
+            sent.append(delta)
+
+        feed = StatusFeed(lambda sub: dict(state), send, min_interval=60, tick_interval=600, clock=clock)
+        feed.start()
+        feed.subscribe("phone")
+        state["clients"] = 2
+        feed.mark_dirty()
+        await clock.advance(0)
+        state["clients"] = 3
+        feed.mark_dirty()
+        await clock.advance(59)
+        assert sent == [{"clients": 2}]
+        await clock.advance(1)
+        assert sent == [{"clients": 2}, {"clients": 3}]
+        state["clients"] = 4  # 이벤트 없는 변화 — tick에서 확인
+        await clock.advance(600)
+        assert sent[-1] == {"clients": 4}
+        feed.close()
+
+    @pytest.mark.asyncio
+    async def test_no_change_no_send(self):
+        sent = []
+
+        async def send(sub, delta):
+            sent.append(delta)
+
+        feed = StatusFeed(lambda sub: {"a": 1}, send, min_interval=0.01)
+        feed.subscribe("phone")
+        feed.mark_dirty()
+        await asyncio.sleep(0.05)
+        assert sent == []
+
+    @pytest.mark.asyncio
+    async def test_per_subscriber_fields(self):
+        sent = {}
+
+        async def send(sub, delta):
+            sent[sub] = delta
+
+        positions = {"a": 0, "b": 0}
+        feed = StatusFeed(lambda sub: {"position": positions[sub]}, send, min_interval=0.01)
+        feed.subscribe("a")
+        feed.subscribe("b")
+        positions["b"] = 3
+        feed.mark_dirty()
+        await asyncio.sleep(0.05)
+        assert sent == {"b": {"position": 3}}
+
+
+@pytest.fixture
+def server_options(monkeypatch):
+    monkeypatch.setattr(BridgeServer, "STATUS_MIN_INTERVAL", 0.05)
+    return {}
+
+
+class TestSubscribeStatus:
+    @pytest.mark.asyncio
+    async def test_snapshot_and_deltas(self, server, connect, open_client):
+        watcher, _ = await connect()
+        await watcher.send(frame("subscribe_status"))
+        snapshot = await next_frame(watcher, "status_snapshot")
+        assert snapshot["payload"]["status"]["connected_clients"] == 1
+        assert snapshot["payload"]["status"]["queue_depth"] == 0
+
+        await open_client()
+        delta = await next_frame(watcher, "status_delta")
+        assert delta["payload"]["changes"] == {"connected_clients": 2}
+
+        await watcher.send(frame("message", content="hi"))
+        delta = await next_frame(watcher, "status_delta")
+        assert delta["payload"]["changes"]["queue_depth"] == 1
+        assert delta["payload"]["changes"]["queue_position"] == 1
+        assert delta["payload"]["changes"]["in_flight"] == 1
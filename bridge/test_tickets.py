@@ -0,0 +1,118 @@
+"""재개 티켓 및 핸드셰이크 인증 테스트"""
+
+import json
+import time
+
+import pytest
+import pytest_asyncio
+import websockets
+
+from bridge.auth import Authenticator
+from bridge.server import BridgeServer
+from bridge.tickets import TicketSigner
+
+TEST_TOKEN = "ticket-test-token"
+TEST_HOST = "127.0.0.1"
+TEST_PORT = 9881
+URL = f"ws://{TEST_HOST}:{TEST_PORT}"
+
+
+class TestTicketSigner:
+    def test_roundtrip(self):
+        signer = TicketSigner(b"k" * 32)
+        ticket, expires_at = signer.issue("cli-1", "tok-abc", now=1000)
+        resumed = signer.verify(ticket, now=1001)
+        assert resumed is not None
+        assert (resumed.client_id, resumed.session) == ("cli-1", "tok-abc")
+        assert resumed.expires_at == expires_at
+
+    def test_expired(self):
+        signer = TicketSigner(b"k" * 32, ttl=10)
+        ticket, _ = signer.issue("cli-1", "s", now=1000)
+        assert signer.verify(ticket, now=1011) is None
+
+    def test_tampered_body_rejected(self):
+        signer = TicketSigner(b"k" * 32)
+        ticket, _ = signer.issue("cli-1", "s")
+        other, _ = signer.issue("cli-2", "s")
+        forged = other.split(".")[0] + "." + ticket.split(".")[1]
+        assert signer.verify(forged) is None
+        assert signer.verify("garbage") is None
+
+    def test_other_key_rejected(self):
+        ticket, _ = TicketSigner(b"a" * 32).issue("cli-1", "s")
+        assert TicketSigner(b"b" * 32).verify(ticket) is None
+
+    def test_key_bound_to_token(self):
+        a = Authenticator(token="one").derive_key("resume-ticket")
+        b = Authenticator(token="two").derive_key("resume-ticket")
+        assert a != b
+
+
+@pytest_asyncio.fixture
+async def server():
+    srv = BridgeServer(authenticator=Authenticator(token=TEST_TOKEN))
+    await srv.start(TEST_HOST, TEST_PORT)
+    yield srv
+    await srv.stop()
+
+
+async def _auth(ws):
+    await ws.send(json.dumps({"type": "auth", "payload": {"token": TEST_TOKEN}, "timestamp": time.time()}))
+    return json.loads(await ws.recv())["payload"]
+
+
+class TestHandshakeAuth:
+    @pytest.mark.asyncio
+    async def test_auth_result_includes_ticket(self, server):
+        async with websockets.connect(URL) as ws:
+            payload = await _auth(ws)
+        assert payload["resume_ticket"]
+        assert payload["ticket_expires"] > time.time()
+        assert payload["resumed"] is False
+
+    @pytest.mark.asyncio
+    async def test_resume_with_ticket_in_query(self, server):
+        async with websockets.connect(URL) as ws:
+            first = await _auth(ws)
+
+        async with websockets.connect(f"{URL}/?ticket={first['resume_ticket']}") as ws:
+            # auth 메시지 없이 서버가 먼저 AUTH_RESULT를 보낸다
+            resumed = json.loads(await ws.recv())["payload"]
+            assert resumed["success"] is True
+            assert resumed["resumed"] is True
+            assert resumed["client_id"] == first["client_id"]
+            assert resumed["session"] == first["session"]
+            await ws.send(json.dumps({"type": "heartbeat", "payload": {}, "timestamp": time.time()}))
+            assert json.loads(await ws.recv())["type"] == "heartbeat"
+
+    @pytest.mark.asyncio
+    async def test_resume_with_ticket_header(self, server):
+        async with websockets.connect(URL) as ws:
+            first = await _auth(ws)
+        headers = {"X-Resume-Ticket": first["resume_ticket"]}
+        async with websockets.connect(URL, additional_headers=headers) as ws:
+            assert json.loads(await ws.recv())["payload"]["client_id"] == first["client_id"]
+
+    @pytest.mark.asyncio
+    async def test_invalid_ticket_falls_back_to_auth_message(self, server):
+        async with websockets.connect(f"{URL}/?ticket=bogus.ticket") as ws:
+            rejected = json.loads(await ws.recv())["payload"]
+            assert rejected["success"] is False
+            assert rejected["fallback"] == "auth"
+            payload = await _auth(ws)
+            assert payload["success"] is True
+
+    @pytest.mark.asyncio
+    async def test_bearer_token_header(self, server):
+        headers = {"Authorization": f"Bearer {TEST_TOKEN}"}
+        async with websockets.connect(URL, additional_headers=headers) as ws:
+            assert json.loads(await ws.recv())["payload"]["success"] is True
+
+    @pytest.mark.asyncio
+    async def test_bad_bearer_token_closes(self, server):
+        headers = {"Authorization": "Bearer wrong"}
+        async with websockets.connect(URL, additional_headers=headers) as ws:
+            assert json.loads(await ws.recv())["payload"]["success"] is False
+            with pytest.raises(websockets.ConnectionClosed):
+                await ws.recv()
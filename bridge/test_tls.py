@@ -0,0 +1,110 @@
+"""TLS 리스너 테스트 (openssl CLI로 자체 서명 인증서 생성)"""
+
+import json
+import shutil
+import ssl
+import subprocess
+import time
+
+import pytest
+import pytest_asyncio
+import websockets
+
+from bridge.auth import Authenticator
+from bridge.server import BridgeServer
+from bridge.tls import build_ssl_context, tls_endpoint
+
+TEST_TOKEN = "tls-token"
+TEST_HOST = "127.0.0.1"
+TEST_PORT = 9887
+TEST_TLS_PORT = 9888
+
+pytestmark = pytest.mark.skipif(shutil.which("openssl") is None, reason="openssl CLI 필요")
+
+
+@pytest.fixture
+def tls_config(tmp_path):
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+            "-subj", "/CN=localhost",
+            "-keyout", str(tmp_path / "bridge.key"),
+            "-out", str(tmp_path / "bridge.crt"),
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return {"enabled": True, "port": TEST_TLS_PORT, "certfile": "bridge.crt", "keyfile": "bridge.key"}
+
+
+def _client_context() -> ssl.SSLContext:
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+def _handshake(server_ctx, client_ctx, session=None) -> ssl.SSLObject:
+    """메모리 BIO로 핸드셰이크와 데이터 한 번 교환 (세션 티켓 수신 포함)."""
+    c_in, c_out, s_in, s_out = (ssl.MemoryBIO() for _ in range(4))
+    client = client_ctx.wrap_bio(c_in, c_out, server_hostname="localhost", session=session)
+    server = server_ctx.wrap_bio(s_in, s_out, server_side=True)
+    for _ in range(10):
+        for side in (client, server):
+            try:
+                side.do_handshake()
+            except ssl.SSLWantReadError:
+                pass
+        s_in.write(c_out.read())
+        c_in.write(s_out.read())
+    server.write(b"ping")
+    c_in.write(s_out.read())
+    assert client.read(4) == b"ping"
+    return client
+
+
+class TestContext:
+    def test_requires_certfile(self, tmp_path):
+        with pytest.raises(ValueError):
+            build_ssl_context({"enabled": True}, tmp_path)
+
+    def test_session_resumption(self, tls_config, tmp_path):
+        server_ctx = build_ssl_context(tls_config, tmp_path)
+        client_ctx = _client_context()
+        first = _handshake(server_ctx, client_ctx)
+        assert first.version() in ("TLSv1.3", "TLSv1.2")
+        second = _handshake(server_ctx, client_ctx, session=first.session)
+        assert second.session_reused
+
+    def test_endpoint_uses_advertise_host(self):
+        assert tls_endpoint({"port": 8766, "advertise_host": "10.0.0.5"}) == "wss://10.0.0.5:8766"
+
+
+@pytest_asyncio.fixture
+async def server(tls_config, tmp_path):
+    srv = BridgeServer(authenticator=Authenticator(token=TEST_TOKEN))
+    await srv.start(TEST_HOST, TEST_PORT)
+    await srv.start_tls(build_ssl_context(tls_config, tmp_path), TEST_HOST, TEST_TLS_PORT)
+    srv.advertise("lan", f"wss://{TEST_HOST}:{TEST_TLS_PORT}")
+    srv.advertise("ngrok", "wss://example.ngrok.app")
+    yield srv
+    await srv.stop()
+
+
+class TestTlsListener:
+    @pytest.mark.asyncio
+    async def test_wss_auth_advertises_endpoints(self, server):
+        async with websockets.connect(f"wss://{TEST_HOST}:{TEST_TLS_PORT}", ssl=_client_context()) as ws:
+            await ws.send(json.dumps({"type": "auth", "payload": {"token": TEST_TOKEN}, "timestamp": time.time()}))
+            result = json.loads(await ws.recv())
+        assert result["payload"]["success"] is True
+        assert result["payload"]["endpoints"] == [
+            {"kind": "lan", "url": f"wss://{TEST_HOST}:{TEST_TLS_PORT}"},
+            {"kind": "ngrok", "url": "wss://example.ngrok.app"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_plain_listener_still_serves(self, server):
+        async with websockets.connect(f"ws://{TEST_HOST}:{TEST_PORT}") as ws:
+            await ws.send(json.dumps({"type": "auth", "payload": {"token": TEST_TOKEN}, "timestamp": time.time()}))
+            assert json.loads(await ws.recv())["payload"]["success"] is True
@@ -0,0 +1,232 @@
+"""다중 토큰 레지스트리 테스트"""
+
+import asyncio
+import json
+import os
+import time
+
+import pytest
+import pytest_asyncio
+import websockets
+
+from bridge import file_io
+from bridge.auth import Authenticator
+from bridge.server import BridgeServer
+from bridge.tickets import TicketSigner
+from bridge.tokens import TokenRegistry, add_token, hash_token
+
+TEST_HOST = "127.0.0.1"
+TEST_PORT = 9882
+URL = f"ws://{TEST_HOST}:{TEST_PORT}"
+
+
+def _write(path, *items):
+    path.write_text(json.dumps({"tokens": list(items)}), encoding="utf-8")
+    # 같은 mtime/크기로 변경이 묻히지 않도록 시각을 앞으로 민다
+    stamp = time.time() + len(items)
+    os.utime(path, (stamp, stamp))
+
+
+def _item(token, label, **options):
+    return {"label": label, "sha256": hash_token(token), **options}
+
+
+class TestTokenRegistry:
+    def test_lookup(self, tmp_path):
+        path = tmp_path / "tokens.json"
+        _write(path, _item("alice-tok", "alice", namespace="alice", max_pending=2))
+        registry = TokenRegistry(path)
+        entry = registry.lookup("alice-tok")
+        assert entry.label == "alice"
+        assert entry.namespace == "alice"
+        assert entry.max_pending == 2
+        assert registry.get(entry.token_id) is entry
+        assert registry.lookup("nope") is None
+
+    def test_missing_file_is_empty(self, tmp_path):
+        assert len(TokenRegistry(tmp_path / "none.json")) == 0
+
+    def test_reload_reports_removed(self, tmp_path):
+        path = tmp_path / "tokens.json"
+        _write(path, _item("a", "a"), _item("b", "b"))
+        registry = TokenRegistry(path)
+        assert registry.reload_if_changed() is None
+
+        _write(path, _item("b", "b"))
+        removed = registry.reload_if_changed()
+        assert removed == {hash_token("a")[:12]}
+        assert registry.lookup("a") is None
+        assert registry.lookup("b") is not None
+
+    def test_bad_file_keeps_previous_tokens(self, tmp_path):
+        path = tmp_path / "tokens.json"
+        _write(path, _item("a", "a"))
+        registry = TokenRegistry(path)
+        path.write_text("{broken", encoding="utf-8")
+        assert registry.reload_if_changed() is None
+        assert registry.lookup("a") is not None
+
+    def test_rejects_path_namespace(self, tmp_path):
+        path = tmp_path / "tokens.json"
+        _write(path, _item("a", "a", namespace="../etc"))
+        assert len(TokenRegistry(path)) == 0
+
+    def test_add_token_stores_only_hash(self, tmp_path):
+        path = tmp_path / "tokens.json"
+        token = add_token("kim", namespace="kim", path=path)
+        assert token not in path.read_text(encoding="utf-8")
+        assert TokenRegistry(path).lookup(token).label == "kim"
+
+
+class TestAuthenticatorRegistry:
+    def test_primary_and_registry(self, tmp_path):
+        path = tmp_path / "tokens.json"
+        _write(path, _item("team", "team"))
+        auth = Authenticator(token="primary", registry=TokenRegistry(path))
+        assert auth.identify("primary").label == Authenticator.PRIMARY_LABEL
+        assert auth.identify("team").label == "team"
+        assert auth.validate("other") is False
+
+    def test_registry_only(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("OKXUS_AUTH_TOKEN", raising=False)
+        path = tmp_path / "tokens.json"
+        _write(path, _item("team", "team"))
+        auth = Authenticator(config={}, registry=TokenRegistry(path))
+        assert auth.validate("team") is True
+
+    def test_registry_only_tickets_shared_across_instances(self, tmp_path, monkeypatch):
+        """레지스트리만 쓰는 워커/재시작 프로세스끼리 같은 티켓 키를 쓴다."""
+        monkeypatch.delenv("OKXUS_AUTH_TOKEN", raising=False)
+        path = tmp_path / "tokens.json"
+        _write(path, _item("team", "team"))
+        issuer = TicketSigner(Authenticator(config={}, registry=TokenRegistry(path)).derive_key("resume-ticket"))
+        verifier = TicketSigner(Authenticator(config={}, registry=TokenRegistry(path)).derive_key("resume-ticket"))
+        ticket, _ = issuer.issue("cli-1", "tok-abc", token_id="abc")
+        assert verifier.verify(ticket).client_id == "cli-1"
+        key = tmp_path / "ticket.key"
+        assert key.stat().st_mode & 0o777 == 0o600
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_no_tokens_raises(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("OKXUS_AUTH_TOKEN", raising=False)
+        with pytest.raises(ValueError):
+            Authenticator(config={}, registry=TokenRegistry(tmp_path / "none.json"))
+
+
+@pytest.fixture
+def io_dirs(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_io, "INBOX_DIR", tmp_path / "inbox")
+    monkeypatch.setattr(file_io, "OUTBOX_DIR", tmp_path / "outbox")
+    file_io.ensure_dirs()
+    return tmp_path
+
+
+@pytest_asyncio.fixture
+async def server(io_dirs, monkeypatch):
+    path = io_dirs / "tokens.json"
+    _write(path, _item("alice-tok", "alice", namespace="alice", max_pending=1, max_connections=1))
+    monkeypatch.setattr(BridgeServer, "TOKEN_RELOAD_INTERVAL", 0.05)
+    srv = BridgeServer(authenticator=Authenticator(token="owner-tok", registry=TokenRegistry(path)))
+    await srv.start(TEST_HOST, TEST_PORT)
+    yield srv, path
+    await srv.stop()
+
+
+async def _connect(token):
+    ws = await websockets.connect(URL)
+    await ws.send(json.dumps({"type": "auth", "payload": {"token": token}, "timestamp": time.time()}))
+    return ws, json.loads(await asyncio.wait_for(ws.recv(), timeout=5))
+
+
+async def _send(ws, content):
+    await ws.send(json.dumps({"type": "message", "payload": {"content": content}, "timestamp": time.time()}))
+    return json.loads(await asyncio.wait_for(ws.recv(), timeout=5))
+
+
+class TestServerRegistry:
+    @pytest.mark.asyncio
+    async def test_namespace_inbox_outbox(self, server):
+        ws, auth = await _connect("alice-tok")
+        assert auth["payload"]["success"] is True
+        ack = await _send(ws, "hi")
+        message_id = ack["payload"]["message_id"]
+
+        inbox_file = file_io.INBOX_DIR / "alice" / f"{message_id}.json"
+        assert json.loads(inbox_file.read_text(encoding="utf-8"))["reply_to"] == f"outbox/alice/{message_id}.json"
+        (file_io.OUTBOX_DIR / "alice" / f"{message_id}.json").write_text(
+            json.dumps({"content": "answer"}), encoding="utf-8"
+        )
+        resp = json.loads(await asyncio.wait_for(ws.recv(), timeout=5))
+        assert resp["payload"]["content"] == "answer"
+        await ws.close()
+
+    @pytest.mark.asyncio
+    async def test_pending_quota(self, server):
+        ws, _ = await _connect("alice-tok")
+        await ws.send(json.dumps({"type": "channel_open", "payload": {}, "channel": "b", "timestamp": time.time()}))
+        assert json.loads(await ws.recv())["type"] == "channel_opened"
+        assert (await _send(ws, "first"))["type"] == "message_ack"
+        await ws.send(json.dumps({"type": "message", "payload": {"content": "second"}, "channel": "b", "timestamp": time.time()}))
+        resp = json.loads(await asyncio.wait_for(ws.recv(), timeout=5))
+        assert resp["type"] == "error"
+        assert "상한" in resp["payload"]["error"]
+        await ws.close()
+
+    @pytest.mark.asyncio
+    async def test_connection_quota(self, server):
+        first, _ = await _connect("alice-tok")
+        second, auth = await _connect("alice-tok")
+        assert auth["payload"]["success"] is False
+        await first.close()
+        await second.close()
+
+    @pytest.mark.asyncio
+    async def test_hot_reload_add_and_revoke(self, server):
+        srv, path = server
+        owner, _ = await _connect("owner-tok")
+        alice, _ = await _connect("alice-tok")
+
+        _write(path, _item("bob-tok", "bob"))
+        await asyncio.sleep(0.3)
+
+        # 삭제된 토큰의 연결만 닫힌다
+        with pytest.raises(websockets.ConnectionClosed):
+            await asyncio.wait_for(alice.recv(), timeout=5)
+        assert alice.close_code == BridgeServer.REVOKED_CLOSE_CODE
+        await owner.send(json.dumps({"type": "heartbeat", "payload": {}, "timestamp": time.time()}))
+        assert json.loads(await owner.recv())["type"] == "heartbeat"
+
+        bob, auth = await _connect("bob-tok")
+        assert auth["payload"]["success"] is True
+        await bob.close()
+        await owner.close()
+
+    @pytest.mark.asyncio
+    async def test_client_id_bound_to_token(self, server):
+        """다른 토큰은 client_id를 이어받아 미전달 응답을 가져갈 수 없다."""
+        srv, _ = server
+        owner, auth = await _connect("owner-tok")
+        client_id = auth["payload"]["client_id"]
+        message_id = (await _send(owner, "secret"))["payload"]["message_id"]
+        await owner.close()
+        (file_io.OUTBOX_DIR / f"{message_id}.json").write_text(json.dumps({"content": "private"}), encoding="utf-8")
+        while client_id not in srv._undelivered:
+            await asyncio.sleep(0.05)
+
+        thief = await websockets.connect(URL)
+        await thief.send(json.dumps({
+            "type": "auth", "payload": {"token": "alice-tok", "client_id": client_id}, "timestamp": time.time()
+        }))
+        auth = json.loads(await asyncio.wait_for(thief.recv(), timeout=5))
+        assert auth["payload"]["success"] is True and auth["payload"]["client_id"] != client_id
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(thief.recv(), timeout=0.3)
+        await thief.close()
+
+        owner = await websockets.connect(URL)
+        await owner.send(json.dumps({
+            "type": "auth", "payload": {"token": "owner-tok", "client_id": client_id}, "timestamp": time.time()
+        }))
+        assert json.loads(await owner.recv())["payload"]["client_id"] == client_id
+        assert json.loads(await asyncio.wait_for(owner.recv(), timeout=5))["payload"]["content"] == "private"
+        await owner.close()
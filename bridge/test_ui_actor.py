@@ -0,0 +1,83 @@
+"""UIActor 단위 테스트"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from bridge.ui_actor import UIActor, get_actor
+
+
+@pytest.fixture
+def actor():
+    a = UIActor()
+    yield a
+    a.stop(timeout=1)
+
+
+class TestUIActor:
+    @pytest.mark.asyncio
+    async def test_runs_on_worker_thread(self, actor):
+        thread_name = await actor.call(lambda: threading.current_thread().name)
+        assert thread_name == "ui-actor"
+
+    @pytest.mark.asyncio
+    async def test_event_loop_not_blocked(self, actor):
+        """블로킹 조작 중에도 이벤트 루프가 다른 작업을 처리한다."""
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        await actor.call(time.sleep, 0.2)
+        task.cancel()
+        assert ticks >= 5
+
+    @pytest.mark.asyncio
+    async def test_calls_are_serialized(self, actor):
+        """동시에 요청한 조작이 겹치지 않고 하나씩 실행된다."""
+        active = 0
+        max_active = 0
+        lock = threading.Lock()
+
+        def op():
+            nonlocal active, max_active
+            with lock:
+                active += 1
+                max_active = max(max_active, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+
+        await asyncio.gather(*(actor.call(op) for _ in range(5)))
+        assert max_active == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_is_contiguous(self, actor):
+        """batch 내부 조작 사이에 다른 명령이 끼어들지 않는다."""
+        log: list[str] = []
+        gate = threading.Event()
+        blocker = actor.call(gate.wait)
+        batch = actor.batch(lambda: log.append("b1"), lambda: log.append("b2"))
+        other = actor.call(log.append, "other")
+        gate.set()
+        await asyncio.gather(blocker, batch, other)
+        assert log == ["b1", "b2", "other"]
+
+    @pytest.mark.asyncio
+    async def test_exception_propagates(self, actor):
+        def boom():
+            raise ValueError("clipboard busy")
+
+        with pytest.raises(ValueError, match="clipboard busy"):
+            await actor.call(boom)
+        # 예외 후에도 액터는 계속 동작한다
+        assert await actor.call(lambda: 1) == 1
+
+    def test_shared_actor_singleton(self):
+        assert get_actor() is get_actor()
@@ -0,0 +1,123 @@
+"""bridge/workers.py 단위 테스트"""
+
+import json
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import websockets
+
+from bridge.auth import Authenticator
+from bridge.server import BridgeServer
+from bridge.shared_state import SharedState
+from bridge import workers
+from bridge.workers import create_reuseport_socket, resolve_worker_count, supports_reuseport, worker_id_of
+
+
+TEST_TOKEN = "test-secret-token"
+TEST_HOST = "127.0.0.1"
+TEST_PORT = 9877
+
+
+class TestResolveWorkerCount:
+    def test_zero_means_cpu_count(self):
+        """0 이하이면 CPU 코어 수를 사용한다."""
+        with patch("bridge.workers.supports_reuseport", return_value=True):
+            with patch("bridge.workers.os.cpu_count", return_value=8):
+                assert resolve_worker_count(0) == 8
+
+    def test_explicit_count(self):
+        with patch("bridge.workers.supports_reuseport", return_value=True):
+            assert resolve_worker_count(3) == 3
+
+    def test_no_reuseport_forces_single(self):
+        """SO_REUSEPORT 미지원 플랫폼에서는 항상 1."""
+        with patch("bridge.workers.supports_reuseport", return_value=False):
+            assert resolve_worker_count(4) == 1
+
+
+def test_per_process_features_block_workers():
+    """프로세스 로컬 상태를 쓰는 기능이 켜져 있으면 멀티 워커를 막는다 (기본값은 모두 켜짐)."""
+    assert workers.per_process_features({}) == ["sessions", "resume_tickets", "handoff"]
+    assert workers.per_process_features({"sessions": False, "resume_tickets": False, "handoff": False}) == []
+
+
+@pytest.mark.asyncio
+async def test_stateless_server_does_not_resume():
+    """세션·티켓을 끈 서버는 client_id를 이어받지 않고 티켓도 발급하지 않는다."""
+    srv = BridgeServer(authenticator=Authenticator(token=TEST_TOKEN), sessions=False, resume_tickets=False)
+    await srv.start(TEST_HOST, TEST_PORT)
+    try:
+        async with websockets.connect(f"ws://{TEST_HOST}:{TEST_PORT}") as ws:
+            payload = {"token": TEST_TOKEN, "client_id": "cli-previous"}
+            await ws.send(json.dumps({"type": "auth", "payload": payload, "timestamp": time.time()}))
+            auth = json.loads(await ws.recv())["payload"]
+            assert auth["success"] and auth["client_id"] != "cli-previous"
+            assert auth["session"] == "" and "resume_ticket" not in auth
+            await ws.send(json.dumps({"type": "subscribe", "payload": {}, "timestamp": time.time()}))
+            assert json.loads(await ws.recv())["type"] == "error"
+    finally:
+        await srv.stop()
+
+
+@pytest.mark.skipif(not supports_reuseport(), reason="SO_REUSEPORT 미지원")
+class TestReusePort:
+    def test_two_sockets_share_port(self):
+        """두 소켓이 같은 포트에 동시에 바인딩된다."""
+        s1 = create_reuseport_socket(TEST_HOST, TEST_PORT)
+        s2 = create_reuseport_socket(TEST_HOST, TEST_PORT)
+        try:
+            assert s1.getsockname() == s2.getsockname()
+        finally:
+            s1.close()
+            s2.close()
+
+    @pytest.mark.asyncio
+    async def test_status_uses_shared_client_count(self, tmp_path):
+        """공유 상태가 있으면 다른 워커의 클라이언트도 집계한다."""
+        db = tmp_path / "shared.db"
+        other = SharedState("other", db)
+        other.register_client("remote-client")
+
+        srv = BridgeServer(
+            authenticator=Authenticator(token=TEST_TOKEN),
+            shared_state=SharedState("self", db),
+        )
+        await srv.start(TEST_HOST, TEST_PORT, sock=create_reuseport_socket(TEST_HOST, TEST_PORT))
+        try:
+            async with websockets.connect(f"ws://{TEST_HOST}:{TEST_PORT}") as ws:
+                await ws.send(json.dumps({"type": "auth", "payload": {"token": TEST_TOKEN}, "timestamp": time.time()}))
+                await ws.recv()
+                await ws.send(json.dumps({"type": "status_request", "payload": {}, "timestamp": time.time()}))
+                resp = json.loads(await ws.recv())
+                assert resp["payload"]["status"]["connected_clients"] == 2
+        finally:
+            await srv.stop()
+
+
+def _crashing_worker(config: dict, worker_index: int, use_uvloop: bool) -> None:
+    """첫 실행은 행을 남긴 채 비정상 종료, 재시작 후에는 정상 종료하는 워커."""
+    runs = Path(config["runs"])
+    with runs.open("a") as f:
+        f.write(f"{worker_index}\n")
+    shared = SharedState(worker_id_of(worker_index, os.getpid()), config["db"])
+    shared.register_client("client")
+    if len(runs.read_text().splitlines()) == 1:
+        os._exit(1)
+    shared.close()
+
+
+def test_supervisor_purges_and_restarts_crashed_worker(tmp_path, monkeypatch):
+    db = tmp_path / "shared.db"
+    runs = tmp_path / "runs"
+    monkeypatch.setattr("bridge.shared_state.DEFAULT_DB_PATH", db)
+    monkeypatch.setattr(workers, "_worker_entry", _crashing_worker)
+    monkeypatch.setattr(workers, "WORKER_RESTART_DELAY", 0)
+    monkeypatch.setattr(workers.signal, "signal", lambda *args: None)
+
+    workers.run_workers({"db": str(db), "runs": str(runs)}, 1)
+
+    assert runs.read_text().splitlines() == ["0", "0"]
+    assert SharedState("check", db).client_count() == 0
@@ -0,0 +1,96 @@
+"""세션 재개(resume) 티켓 모듈
+
+인증에 성공하면 AUTH_RESULT에 짧은 수명의 HMAC 서명 티켓을 담아 보낸다.
+티켓에는 client_id, 공유 세션, 만료 시각이 들어 있으며, 클라이언트는
+재연결 시 WebSocket 핸드셰이크(쿼리 ?ticket= 또는 X-Resume-Ticket 헤더)에
+티켓을 실어 auth 메시지 왕복 없이 인증되고 이전 세션 상태를 이어받는다.
+
+서명 키는 인증 토큰(레지스트리만 쓰면 tokens.json 옆의 ticket.key)에서 파생하므로
+(Authenticator.derive_key) 멀티 워커와 무중단 재시작 후에도 같은 티켓이 유효하고,
+토큰(또는 키 파일)을 바꾸면 모든 티켓이 무효가 된다.
+
+형식: base64url(JSON 본문) + "." + base64url(HMAC-SHA256)
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import time
+from dataclasses import dataclass
+
+TICKET_TTL = 900  # 티켓 유효 시간 (초)
+
+
+@dataclass(frozen=True)
+class ResumeTicket:
+    """검증된 티켓 내용"""
+    client_id: str
+    session: str
+    expires_at: float
+    token_id: str = ""
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+class TicketSigner:
+    """재개 티켓 발급·검증"""
+
+    def __init__(self, key: bytes, ttl: float = TICKET_TTL) -> None:
+        """
+        Args:
+            key: HMAC 서명 키.
+            ttl: 발급 티켓의 유효 시간 (초).
+        """
+        self._key = key
+        self._ttl = ttl
+
+    def issue(
+        self, client_id: str, session: str, token_id: str = "", now: float | None = None
+    ) -> tuple[str, float]:
+        """티켓을 발급한다.
+
+        token_id를 함께 서명하여, 토큰이 레지스트리에서 삭제되면
+        그 토큰으로 받은 티켓도 쓸 수 없게 한다.
+
+        Returns:
+            (티켓 문자열, 만료 시각 epoch 초).
+        """
+        expires_at = (time.time() if now is None else now) + self._ttl
+        body = _b64encode(
+            json.dumps(
+                {"cid": client_id, "ses": session, "tid": token_id, "exp": int(expires_at)},
+                separators=(",", ":"),
+            ).encode("utf-8")
+        )
+        return f"{body}.{self._sign(body)}", int(expires_at)
+
+    def verify(self, ticket: str, now: float | None = None) -> ResumeTicket | None:
+        """티켓 서명과 만료를 검증한다 (서명 비교는 상수 시간).
+
+        Returns:
+            유효하면 티켓 내용, 위조·손상·만료된 티켓이면 None.
+        """
+        body, sep, signature = ticket.partition(".")
+        if not sep or not hmac.compare_digest(signature, self._sign(body)):
+            return None
+        try:
+            data = json.loads(_b64decode(body))
+            client_id, session, expires_at = str(data["cid"]), str(data["ses"]), float(data["exp"])
+            token_id = str(data.get("tid", ""))
+        except (ValueError, KeyError, TypeError):
+            return None
+        if expires_at <= (time.time() if now is None else now):
+            return None
+        return ResumeTicket(
+            client_id=client_id, session=session, expires_at=expires_at, token_id=token_id
+        )
+
+    def _sign(self, body: str) -> str:
+        return _b64encode(hmac.new(self._key, body.encode("ascii"), hashlib.sha256).digest())
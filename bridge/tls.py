@@ -0,0 +1,78 @@
+"""TLS 리스너 모듈 (LAN/VPN 직접 접속용)
+
+같은 Wi-Fi나 VPN에 있는 폰이 ngrok 엣지를 거치지 않고 Bridge에 직접
+wss://로 접속할 수 있도록, 평문 ws:// 리스너와 별도로 TLS 리스너를 연다.
+ngrok 터널과 함께 동작하며, 서버는 인증 응답에서 두 엔드포인트를 모두 알린다.
+
+설정 (config.json):
+    "tls": {
+        "enabled": true,
+        "port": 8766,
+        "certfile": "certs/bridge.crt",
+        "keyfile": "certs/bridge.key",
+        "advertise_host": "192.168.0.10"
+    }
+
+- TLS 1.2 이상만 허용하며, TLS 1.3 세션 티켓(num_tickets)으로 재연결 시
+  전체 핸드셰이크 대신 재개(resumption)한다. 티켓 키는 프로세스마다 새로
+  만들어지므로 재시작이나 다른 워커로의 재연결은 전체 핸드셰이크가 된다.
+- advertise_host가 없으면 기본 경로의 로컬 IP를 알린다.
+- 인증서는 mkcert 등으로 만든 LAN용 인증서를 사용한다 (폰에 루트 인증서 설치).
+"""
+
+import logging
+import socket
+import ssl
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TLS_PORT = 8766
+SESSION_TICKETS = 2  # TLS 1.3 핸드셰이크마다 발급할 세션 티켓 수
+
+
+def build_ssl_context(tls_config: dict, base_dir: Path) -> ssl.SSLContext:
+    """TLS 서버 컨텍스트를 만든다.
+
+    Args:
+        tls_config: config.json의 "tls" 항목.
+        base_dir: 상대 경로 certfile/keyfile의 기준 디렉토리.
+
+    Raises:
+        ValueError: certfile이 설정되지 않은 경우.
+        OSError / ssl.SSLError: 인증서/키를 읽을 수 없는 경우.
+    """
+    certfile = tls_config.get("certfile")
+    if not certfile:
+        raise ValueError("tls.certfile이 설정되지 않았습니다")
+    keyfile = tls_config.get("keyfile")
+
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.minimum_version = ssl.TLSVersion.TLSv1_2
+    context.load_cert_chain(
+        base_dir / certfile,
+        base_dir / keyfile if keyfile else None,
+    )
+    # 세션 재개: TLS 1.3 티켓 발급 (TLS 1.2는 OpenSSL 기본 티켓 사용)
+    context.num_tickets = SESSION_TICKETS
+    return context
+
+
+def lan_address() -> str:
+    """기본 경로(default route)의 로컬 IP 주소를 반환한다.
+
+    UDP 소켓의 connect는 패킷을 보내지 않고 라우팅만 결정한다.
+    확인할 수 없으면 127.0.0.1.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as probe:
+        try:
+            probe.connect(("10.255.255.255", 1))
+            return probe.getsockname()[0]
+        except OSError:
+            return "127.0.0.1"
+
+
+def tls_endpoint(tls_config: dict) -> str:
+    """클라이언트에 알릴 TLS 엔드포인트 URL."""
+    host = tls_config.get("advertise_host") or lan_address()
+    return f"wss://{host}:{tls_config.get('port', DEFAULT_TLS_PORT)}"
@@ -0,0 +1,230 @@
+"""다중 토큰 레지스트리 모듈
+
+여러 사용자가 하나의 Bridge 프로세스를 공유할 수 있도록 토큰 파일
+(bridge/tokens.json)에 SHA-256 해시로 토큰을 등록한다. 토큰 원문은
+파일에 저장하지 않으며, 인증 시 해시 딕셔너리로 O(1) 조회한다.
+
+    {
+      "tokens": [
+        {"label": "kim", "sha256": "<hex>", "namespace": "kim",
+         "max_pending": 4, "max_connections": 3}
+      ]
+    }
+
+- label: 로그/상태 표시용 이름.
+- namespace: inbox/outbox 하위 디렉토리 (빈 값이면 최상위).
+- max_pending: 동시에 응답 대기 중인 요청 상한 (0 = 무제한).
+- max_connections: 동시 연결 수 상한 (0 = 무제한).
+
+파일이 바뀌면 reload_if_changed()가 다시 읽는다. 서버는 주기적으로 이를
+호출하여 재시작 없이 토큰을 추가/삭제하며, 삭제된 토큰의 연결만 닫는다.
+
+단일 토큰(auth_token) 없이 레지스트리만 쓸 때는 토큰 파일 옆의 ticket.key(0600)가
+재개 티켓 서명 키의 원천이 된다. 처음 필요할 때 만들어지며, 모든 워커와
+재시작된 프로세스가 같은 파일을 읽는다.
+
+토큰 추가:
+    python -m bridge.tokens add kim --namespace kim
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import re
+import secrets
+from dataclasses import dataclass
+from pathlib import Path
+
+from bridge.sessions import default_session
+
+logger = logging.getLogger(__name__)
+
+TOKENS_PATH = Path(__file__).parent / "tokens.json"
+TICKET_KEY_NAME = "ticket.key"  # 토큰 파일과 같은 디렉토리
+TICKET_KEY_BYTES = 32
+
+_NAMESPACE_RE = re.compile(r"^[A-Za-z0-9_-]{0,64}$")
+
+
+def hash_token(token: str) -> str:
+    """토큰의 SHA-256 해시 (hex)."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class TokenEntry:
+    """등록된 토큰 하나의 설정"""
+    token_id: str  # 해시 앞 12자 — 로그/티켓/세션에서 토큰을 가리키는 ID
+    label: str
+    namespace: str = ""
+    max_pending: int = 0
+    max_connections: int = 0
+
+    @property
+    def session(self) -> str:
+        """토큰의 기본 공유 세션 ID."""
+        return default_session(self.token_id)
+
+    @classmethod
+    def from_hash(cls, token_hash: str, label: str, **options) -> "TokenEntry":
+        return cls(token_id=token_hash[:12], label=label, **options)
+
+
+class TokenRegistry:
+    """해시된 토큰 → TokenEntry 조회 테이블 (파일 변경 시 재적재)"""
+
+    def __init__(self, path: Path = TOKENS_PATH) -> None:
+        """
+        Args:
+            path: 토큰 파일 경로. 없으면 빈 레지스트리로 시작한다.
+        """
+        self._path = path
+        self._by_hash: dict[str, TokenEntry] = {}
+        self._by_id: dict[str, TokenEntry] = {}
+        self._signature: tuple[int, int] | None = None
+        self.reload_if_changed()
+
+    def __len__(self) -> int:
+        return len(self._by_hash)
+
+    def lookup(self, token: str) -> TokenEntry | None:
+        """토큰 원문으로 항목을 찾는다."""
+        return self._by_hash.get(hash_token(token))
+
+    def lookup_hash(self, token_hash: str) -> TokenEntry | None:
+        """토큰 해시로 항목을 찾는다."""
+        return self._by_hash.get(token_hash)
+
+    def get(self, token_id: str) -> TokenEntry | None:
+        """token_id로 항목을 찾는다 (재개 티켓 검증, 쿼터 조회용)."""
+        return self._by_id.get(token_id)
+
+    def reload_if_changed(self) -> set[str] | None:
+        """파일이 바뀌었으면 다시 읽는다.
+
+        읽기/파싱에 실패하면 기존 테이블을 유지한다.
+
+        Returns:
+            바뀌지 않았으면 None, 다시 읽었으면 삭제된 token_id 집합.
+        """
+        try:
+            stat = self._path.stat()
+            signature = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            signature = None
+        if signature == self._signature:
+            return None
+
+        try:
+            by_hash = self._load() if signature is not None else {}
+        except (OSError, ValueError) as e:
+            logger.error("토큰 파일 읽기 실패 — 기존 토큰 유지: %s", e)
+            return None
+
+        removed = set(self._by_id) - {entry.token_id for entry in by_hash.values()}
+        self._by_hash = by_hash
+        self._by_id = {entry.token_id: entry for entry in by_hash.values()}
+        self._signature = signature
+        logger.info("토큰 레지스트리 적재: %d개 (삭제 %d개)", len(by_hash), len(removed))
+        return removed
+
+    def ticket_secret(self) -> bytes:
+        """재개 티켓 서명 키의 원천 — 토큰 파일 옆 ticket.key (없으면 만든다).
+
+        여러 워커가 동시에 시작해도 같은 키를 쓰도록, 임시 파일을 링크하는
+        방식으로 한 번만 만든다 (이미 있으면 그 파일을 읽음).
+
+        Raises:
+            OSError: 키 파일을 읽거나 만들 수 없는 경우.
+        """
+        key_path = self._path.with_name(TICKET_KEY_NAME)
+        try:
+            return key_path.read_bytes()
+        except FileNotFoundError:
+            pass
+        key_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = key_path.with_name(f"{TICKET_KEY_NAME}.{os.getpid()}.tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(secrets.token_bytes(TICKET_KEY_BYTES))
+            try:
+                os.link(tmp, key_path)
+                logger.info("재개 티켓 키 생성: %s", key_path)
+            except FileExistsError:
+                pass  # 다른 워커가 먼저 만듦
+        finally:
+            tmp.unlink(missing_ok=True)
+        return key_path.read_bytes()
+
+    def _load(self) -> dict[str, TokenEntry]:
+        data = json.loads(self._path.read_text(encoding="utf-8"))
+        by_hash: dict[str, TokenEntry] = {}
+        for item in data.get("tokens", []):
+            token_hash = str(item["sha256"]).lower()
+            namespace = str(item.get("namespace", ""))
+            if len(token_hash) != 64 or not _NAMESPACE_RE.match(namespace):
+                raise ValueError(f"잘못된 토큰 항목: {item.get('label', '?')}")
+            by_hash[token_hash] = TokenEntry.from_hash(
+                token_hash,
+                label=str(item.get("label", token_hash[:12])),
+                namespace=namespace,
+                max_pending=int(item.get("max_pending", 0)),
+                max_connections=int(item.get("max_connections", 0)),
+            )
+        return by_hash
+
+
+def add_token(
+    label: str,
+    namespace: str = "",
+    max_pending: int = 0,
+    max_connections: int = 0,
+    path: Path = TOKENS_PATH,
+) -> str:
+    """새 토큰을 생성하여 토큰 파일에 해시로 추가한다.
+
+    Returns:
+        생성된 토큰 원문 (파일에는 저장되지 않으므로 한 번만 표시).
+
+    Raises:
+        ValueError: 잘못된 namespace.
+    """
+    if not _NAMESPACE_RE.match(namespace):
+        raise ValueError(f"잘못된 namespace: {namespace}")
+    data = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {"tokens": []}
+    token = secrets.token_urlsafe(32)
+    data.setdefault("tokens", []).append(
+        {
+            "label": label,
+            "sha256": hash_token(token),
+            "namespace": namespace,
+            "max_pending": max_pending,
+            "max_connections": max_connections,
+        }
+    )
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(tmp, path)
+    return token
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m bridge.tokens", description="Bridge 토큰 관리")
+    sub = parser.add_subparsers(dest="command", required=True)
+    add = sub.add_parser("add", help="새 토큰 생성")
+    add.add_argument("label")
+    add.add_argument("--namespace", default="")
+    add.add_argument("--max-pending", type=int, default=0)
+    add.add_argument("--max-connections", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    token = add_token(args.label, args.namespace, args.max_pending, args.max_connections)
+    print(f"[Bridge] 토큰 추가: {args.label} (실행 중인 Bridge에 자동 반영)")
+    print(token)
+
+
+if __name__ == "__main__":
+    main()
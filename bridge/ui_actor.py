@@ -0,0 +1,83 @@
+"""UI 자동화 액터 모듈
+
+pyautogui/pyperclip 호출은 블로킹(키 입력마다 pyautogui.PAUSE, 클립보드 대기)이고
+키보드·클립보드는 PC 전체에서 하나뿐인 자원이다. 이 모듈은 전용 워커 스레드
+하나가 명령 큐를 순서대로 실행하도록 하여:
+
+- asyncio 이벤트 루프가 UI 조작 동안 멈추지 않고 (await actor.call(...)),
+- 여러 모니터/자동화 호출이 서로의 클립보드를 덮어쓰지 않으며,
+- 연속 조작(전송 + 첫 스냅샷 읽기 등)을 batch로 묶어 끼어들기 없이 실행한다.
+
+프로세스 전체에서 get_actor()로 같은 액터를 공유한다.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import queue
+import threading
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class UIActor:
+    """키보드·클립보드를 소유하는 단일 워커 스레드"""
+
+    def __init__(self, name: str = "ui-actor") -> None:
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> concurrent.futures.Future:
+        """함수를 워커 스레드 큐에 넣고 Future를 반환한다."""
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        self._queue.put((fn, args, kwargs, future))
+        return future
+
+    async def call(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """함수를 워커 스레드에서 실행하고 결과를 await한다."""
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    async def batch(self, *fns: Callable[[], Any]) -> list[Any]:
+        """여러 조작을 다른 명령이 끼어들지 않게 연속 실행한다.
+
+        Returns:
+            각 함수의 반환값 목록 (순서 동일). 중간에 예외가 나면 그 예외를 발생시킨다.
+        """
+        return await self.call(lambda: [fn() for fn in fns])
+
+    def stop(self, timeout: float | None = None) -> None:
+        """큐에 남은 명령을 처리한 뒤 워커 스레드를 종료한다."""
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            fn, args, kwargs, future = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as exc:  # 호출자에게 그대로 전달
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+
+_actor: UIActor | None = None
+_actor_lock = threading.Lock()
+
+
+def get_actor() -> UIActor:
+    """프로세스 공용 UI 액터를 반환한다 (최초 호출 시 생성)."""
+    global _actor
+    with _actor_lock:
+        if _actor is None:
+            _actor = UIActor()
+        return _actor
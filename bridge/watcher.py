@@ -4,15 +4,33 @@ inbox/에 새 .json 파일이 생기면 감지하여
 Kiro IDE 채팅에 "inbox 확인" 메시지를 자동 입력한다.
 promptSubmit hook이 트리거되어 Kiro가 inbox를 처리.
 
+워커 디렉토리의 heartbeat 파일을 매 폴링마다 갱신하므로, Bridge는 watcher가
+멈춘 Kiro 워커에 프롬프트를 배정하지 않는다.
+
 사용법:
     python okxus/bridge/watcher.py
+    또는
+    python -m bridge.watcher
+
+    # config.json kiro_workers의 워커마다 하나씩 (각 Kiro 창 제목으로 구분)
+    python -m bridge.watcher --worker kiro-1 --window ".*Kiro.*project-a.*"
+    python -m bridge.watcher --dir bridge/kiro2
 """
 
+import argparse
+import itertools
 import json
 import logging
+import sys
 import time
 from pathlib import Path
 
+if not __package__:
+    # 파일 경로로 직접 실행한 경우에도 bridge 패키지를 import할 수 있도록
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bridge.clock import REAL_CLOCK, Clock
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [watcher] %(message)s",
@@ -21,6 +39,8 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 INBOX_DIR = Path(__file__).parent / "inbox"
+HEARTBEAT_PATH = INBOX_DIR.parent / "heartbeat"
+KIRO_WINDOW_TITLE = ".*Kiro.*"  # 알림을 보낼 Kiro 창 제목 (정규식)
 POLL_INTERVAL = 3  # 초
 KIRO_INPUT_DELAY = 0.5  # Kiro 포커스 후 입력 대기 (초)
 COOLDOWN = 120  # 같은 메시지 재전송 방지 (초) — Kiro 처리 시간 고려
@@ -29,13 +49,17 @@ COOLDOWN = 120  # 같은 메시지 재전송 방지 (초) — Kiro 처리 시간
 _triggered: dict[str, float] = {}
 
 
-def ensure_dirs() -> None:
-    INBOX_DIR.mkdir(exist_ok=True)
+def ensure_dirs(inbox_dir: Path | None = None) -> None:
+    (inbox_dir or INBOX_DIR).mkdir(parents=True, exist_ok=True)
 
 
-def send_to_kiro(message: str) -> bool:
+def send_to_kiro(message: str, title: str = KIRO_WINDOW_TITLE) -> bool:
     """Kiro IDE 채팅에 메시지를 자동 입력하고 Enter를 친다.
 
+    Args:
+        message: 입력할 메시지.
+        title: Kiro 창 제목 정규식 (Kiro 여러 개를 띄운 경우 구분용).
+
     Returns:
         성공 시 True, 실패 시 False.
     """
@@ -44,7 +68,7 @@ def send_to_kiro(message: str) -> bool:
 
         desktop = Desktop(backend="uia")
         kiro = desktop.window(
-            title_re=".*Kiro.*", class_name="Chrome_WidgetWin_1"
+            title_re=title, class_name="Chrome_WidgetWin_1"
         )
 
         # Kiro 창 포커스
@@ -68,20 +92,43 @@ def send_to_kiro(message: str) -> bool:
         return False
 
 
-def poll_inbox() -> None:
-    """inbox를 주기적으로 확인하고 Kiro에 알린다."""
-    ensure_dirs()
-    logger.info("inbox 감시 시작: %s", INBOX_DIR)
-    print(f"[Watcher] inbox 감시 중... (매 {POLL_INTERVAL}초)")
+def poll_inbox(
+    clock: Clock | None = None,
+    polls: int | None = None,
+    base_dir: Path | None = None,
+    title: str = KIRO_WINDOW_TITLE,
+) -> None:
+    """inbox를 주기적으로 확인하고 Kiro에 알린다.
+
+    Args:
+        clock: 폴링 간격·쿨다운에 쓸 시계. None이면 실제 시계.
+        polls: 폴링 횟수. None이면 종료하지 않는다.
+        base_dir: Kiro 워커 디렉토리 (inbox/, heartbeat). None이면
+            기본 bridge/inbox, bridge/heartbeat.
+        title: 알림을 보낼 Kiro 창 제목 정규식.
+    """
+    clock = clock or REAL_CLOCK
+    inbox_dir = base_dir / "inbox" if base_dir is not None else INBOX_DIR
+    heartbeat_path = base_dir / "heartbeat" if base_dir is not None else HEARTBEAT_PATH
+    ensure_dirs(inbox_dir)
+    logger.info("inbox 감시 시작: %s", inbox_dir)
+    print(f"[Watcher] inbox 감시 중... {inbox_dir} (매 {POLL_INTERVAL}초)")
+
+    for _ in itertools.count() if polls is None else range(polls):
+        # Bridge의 Kiro 워커 풀 상태 확인용 heartbeat
+        try:
+            heartbeat_path.touch()
+        except OSError as e:
+            logger.warning("heartbeat 갱신 실패: %s", e)
 
-    while True:
         try:
-            for f in INBOX_DIR.glob("*.json"):
+            # 토큰별 namespace 하위 디렉토리 포함
+            for f in inbox_dir.rglob("*.json"):
                 if f.name == ".gitkeep":
                     continue
 
                 msg_id = f.stem
-                now = time.time()
+                now = clock.time()
 
                 # 쿨다운 체크 — 같은 메시지를 반복 트리거하지 않음
                 if msg_id in _triggered:
@@ -98,7 +145,7 @@ def poll_inbox() -> None:
 
                 # Kiro에 알림
                 print(f"[Watcher] Kiro에 알림 전송: {msg_id}")
-                if send_to_kiro("inbox 확인"):
+                if send_to_kiro("inbox 확인", title):
                     _triggered[msg_id] = now
                     print(f"[Watcher] 전송 완료: {msg_id}")
                 else:
@@ -107,11 +154,44 @@ def poll_inbox() -> None:
         except Exception as e:
             logger.error("폴링 오류: %s", e)
 
-        time.sleep(POLL_INTERVAL)
+        clock.sleep_blocking(POLL_INTERVAL)
 
 
-if __name__ == "__main__":
+def resolve_worker_dir(name: str, config: dict) -> Path | None:
+    """config.json kiro_workers에서 워커 이름의 디렉토리를 찾는다.
+
+    Raises:
+        ValueError: 설정에 없는 워커 이름.
+    """
+    from bridge.kiro_pool import KiroPool
+
+    for worker in KiroPool.from_config(config).workers():
+        if worker.name == name:
+            return worker.base_dir
+    raise ValueError(f"config.json에 없는 Kiro 워커: {name}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m bridge.watcher", description="inbox 감시 → Kiro 알림")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--worker", help="config.json kiro_workers의 워커 이름")
+    target.add_argument("--dir", type=Path, help="Kiro 워커 디렉토리 (inbox/, heartbeat)")
+    parser.add_argument("--window", default=KIRO_WINDOW_TITLE, help="Kiro 창 제목 정규식")
+    args = parser.parse_args(argv)
+
+    base_dir = args.dir
+    if args.worker:
+        from bridge.main import load_config
+
+        try:
+            base_dir = resolve_worker_dir(args.worker, load_config())
+        except ValueError as e:
+            parser.error(str(e))
     try:
-        poll_inbox()
+        poll_inbox(base_dir=base_dir, title=args.window)
     except KeyboardInterrupt:
         print("\n[Watcher] 종료.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""멀티 워커 실행 모듈
+
+N개의 Bridge 워커 프로세스가 SO_REUSEPORT로 같은 포트를 공유하고,
+커널이 새 연결을 워커에 분산한다. 워커 간에는 상태 집계(클라이언트 수, 메시지 큐)만
+bridge.shared_state.SharedState(SQLite)로 공유한다.
+
+client_id별 상태(미전달 응답, 응답 대기 요청, 세션 팬아웃, 재개 티켓, 보관 순서)는
+각 워커 프로세스 메모리에 있어, 재연결이 다른 워커로 가면 이어지지 않는다.
+그래서 이 상태를 쓰는 기능(PER_PROCESS_FEATURES)이 하나라도 켜져 있으면 워커 1개로 실행한다.
+
+SO_REUSEPORT를 지원하지 않는 플랫폼(Windows 등)에서는 단일 워커로 동작한다.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import multiprocessing.connection
+import os
+import signal
+import socket
+import time
+
+logger = logging.getLogger(__name__)
+
+# 켜져 있으면 멀티 워커로 실행할 수 없는 config 항목 (기본값 모두 true)
+PER_PROCESS_FEATURES = ("sessions", "resume_tickets", "handoff")
+WORKER_RESTART_DELAY = 1.0  # 비정상 종료된 워커를 다시 시작하기 전 대기 (초) — 연속 크래시 시 과부하 방지
+
+
+def supports_reuseport() -> bool:
+    """현재 플랫폼이 SO_REUSEPORT를 지원하는지 확인한다."""
+    return hasattr(socket, "SO_REUSEPORT")
+
+
+def resolve_worker_count(requested: int) -> int:
+    """요청된 워커 수를 실제 실행할 워커 수로 변환한다.
+
+    Args:
+        requested: 요청 워커 수. 0 이하이면 CPU 코어 수를 사용한다.
+
+    Returns:
+        1 이상의 워커 수. SO_REUSEPORT 미지원 시 항상 1.
+    """
+    if not supports_reuseport():
+        return 1
+    if requested <= 0:
+        return os.cpu_count() or 1
+    return requested
+
+
+def per_process_features(config: dict) -> list[str]:
+    """켜져 있는 프로세스 로컬 기능 — 비어 있어야 멀티 워커로 실행한다."""
+    return [name for name in PER_PROCESS_FEATURES if config.get(name, True)]
+
+
+def create_reuseport_socket(host: str, port: int) -> socket.socket:
+    """SO_REUSEPORT가 설정된 리스닝 소켓을 생성한다.
+
+    Args:
+        host: 바인딩할 호스트 주소.
+        port: 바인딩할 포트 번호.
+
+    Returns:
+        listen 상태의 논블로킹 소켓.
+    """
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if supports_reuseport():
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    sock.listen(socket.SOMAXCONN)
+    sock.setblocking(False)
+    return sock
+
+
+def install_uvloop() -> bool:
+    """uvloop이 설치되어 있으면 기본 이벤트 루프 정책으로 설정한다.
+
+    Returns:
+        uvloop 적용 시 True, 미설치 시 False.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        logger.warning("uvloop 패키지 미설치 — 기본 asyncio 루프 사용")
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def worker_id_of(worker_index: int, pid: int) -> str:
+    """공유 상태에 기록하는 워커 ID (supervisor가 종료된 워커의 행을 정리할 때도 사용)."""
+    return f"w{worker_index}-{pid}"
+
+
+async def serve_worker(config: dict, worker_index: int) -> None:
+    """워커 프로세스 하나에서 BridgeServer를 실행한다.
+
+    Args:
+        config: load_config()로 파싱된 설정 딕셔너리.
+        worker_index: 워커 번호 (0부터 시작).
+    """
+    from bridge.main import DEFAULT_HOST, DEFAULT_PORT, build_server, start_tls_listener, wait_for_shutdown
+    from bridge.shared_state import SharedState
+
+    host = config.get("host", DEFAULT_HOST)
+    port = config.get("port", DEFAULT_PORT)
+    worker_id = worker_id_of(worker_index, os.getpid())
+
+    shared = SharedState(worker_id)
+    server = build_server(config, worker_index=worker_index, shared_state=shared)
+    sock = create_reuseport_socket(host, port)
+    await server.start(host, port, sock=sock)
+    # TLS 리스너도 SO_REUSEPORT로 워커끼리 공유
+    await start_tls_listener(server, config, host)
+    print(f"[Bridge] 워커 {worker_id} 준비 완료")
+
+    try:
+        await wait_for_shutdown()
+    finally:
+        await server.stop()
+        shared.close()
+
+
+def _worker_entry(config: dict, worker_index: int, use_uvloop: bool) -> None:
+    """multiprocessing 자식 프로세스 진입점."""
+    from bridge.main import setup_logging
+
+    setup_logging(config.get("log_level", "INFO"))
+    if use_uvloop:
+        install_uvloop()
+    try:
+        asyncio.run(serve_worker(config, worker_index))
+    except KeyboardInterrupt:
+        pass
+
+
+def _spawn(config: dict, worker_index: int, use_uvloop: bool) -> multiprocessing.Process:
+    """워커 프로세스 하나를 시작한다."""
+    proc = multiprocessing.Process(
+        target=_worker_entry,
+        args=(config, worker_index, use_uvloop),
+        name=f"bridge-worker-{worker_index}",
+    )
+    proc.start()
+    return proc
+
+
+def run_workers(config: dict, workers: int, use_uvloop: bool = False) -> None:
+    """N개의 워커 프로세스를 시작하고 종료 신호까지 대기한다.
+
+    끝난 워커의 공유 상태 행(클라이언트, 메시지 큐)을 정리하고,
+    비정상 종료(exit code ≠ 0)였으면 같은 번호로 다시 시작한다.
+
+    Args:
+        config: load_config()로 파싱된 설정 딕셔너리.
+        workers: 실행할 워커 수 (resolve_worker_count 적용 후 값).
+        use_uvloop: 각 워커에서 uvloop 사용 여부.
+    """
+    from bridge.shared_state import DEFAULT_DB_PATH, SharedState
+
+    # 이전 실행에서 남은 행 정리 — 연결은 fork 전에 닫는다
+    supervisor = SharedState("supervisor", DEFAULT_DB_PATH)
+    supervisor.reset()
+    supervisor.close()
+
+    procs = {i: _spawn(config, i, use_uvloop) for i in range(workers)}
+    print(f"[Bridge] 워커 {workers}개 시작 (SO_REUSEPORT, port {config.get('port')})")
+    stopping = False
+
+    def _terminate(signum, _frame) -> None:
+        nonlocal stopping
+        stopping = True
+        print("\n[Bridge] 종료 신호 수신 — 워커 종료 중...")
+        for proc in procs.values():
+            if proc.is_alive():
+                proc.terminate()
+
+    signal.signal(signal.SIGINT, _terminate)
+    signal.signal(signal.SIGTERM, _terminate)
+
+    while procs:
+        multiprocessing.connection.wait([proc.sentinel for proc in procs.values()])
+        for index, proc in list(procs.items()):
+            if proc.is_alive():
+                continue
+            proc.join()
+            # 비정상 종료 시 워커가 스스로 지우지 못한 행 정리
+            supervisor = SharedState("supervisor", DEFAULT_DB_PATH)
+            supervisor.purge_worker(worker_id_of(index, proc.pid))
+            supervisor.close()
+            del procs[index]
+            if stopping or proc.exitcode == 0:  # 종료 신호로 정상 종료
+                continue
+            logger.warning("워커 %d 종료 (exit %s) — 재시작", index, proc.exitcode)
+            print(f"[Bridge] 워커 {index} 종료 (exit {proc.exitcode}) — {WORKER_RESTART_DELAY}초 후 재시작")
+            time.sleep(WORKER_RESTART_DELAY)
+            if not stopping:
+                procs[index] = _spawn(config, index, use_uvloop)
+    print("[Bridge] 모든 워커 종료 완료.")
@@ -1,73 +1,257 @@
-"""OKXUS 앱 아이콘 PNG 생성"""
-from PIL import Image, ImageDraw, ImageFont
-import numpy as np
+"""OKXUS 앱 아이콘 PNG 생성
+
+마스터 아이콘을 변형(rounded/round/square/adaptive)별로 가장 큰 해상도
+(MASTER_SIZE × SUPERSAMPLE)에서 한 번만 그려 캐시(data/.icon_cache/)에 두고,
+모든 크기는 마스터를 LANCZOS로 축소해 만든다. 크기별 출력은 여러 프로세스에서
+병렬로 만들며, 출력 디렉토리의 icon-manifest.json에 입력 키(디자인 해시 + 변형 + 크기)와
+출력 해시를 기록하여 바뀌지 않은 출력은 건너뛴다.
+
+출력 (기본 mobile/assets):
+    icon.png, adaptive-icon.png, splash-icon.png, favicon.png   (Expo)
+    android/mipmap-*/ic_launcher{,_round,_foreground}.png, android/playstore-icon.png
+    ios/AppIcon.appiconset/*.png + Contents.json
+
+사용법:
+    python data/gen_icon.py
+    python data/gen_icon.py --out build/icons --jobs 4
+    python data/gen_icon.py --force          # 매니페스트 무시하고 전부 다시 생성
+"""
+import argparse
+import hashlib
+import json
 import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 
-def find_content_bounds(img):
-    """이미지에서 실제 콘텐츠(투명 아닌 부분)의 바운딩 박스를 찾는다."""
-    arr = np.array(img)
-    alpha = arr[:, :, 3] if arr.shape[2] == 4 else np.ones(arr.shape[:2]) * 255
-    rows = np.where(alpha.any(axis=1))[0]
-    cols = np.where(alpha.any(axis=0))[0]
-    if len(rows) == 0:
-        return 0, 0, img.width, img.height
-    return cols[0], rows[0], cols[-1] + 1, rows[-1] + 1
-
-def create_icon(size, output_path, is_adaptive=False):
-    bg_color = (13, 17, 23, 255)
-    text_color = (204, 255, 0, 255)
-
-    font_size = int(size * 0.18) if is_adaptive else int(size * 0.25)
-    try:
-        font = ImageFont.truetype("segoeuib.ttf", font_size)
-    except:
+from PIL import Image, ImageDraw, ImageFont
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_OUT = ROOT / "mobile" / "assets"
+CACHE_DIR = Path(__file__).resolve().parent / ".icon_cache"
+MANIFEST_NAME = "icon-manifest.json"
+
+MASTER_SIZE = 1024  # 가장 큰 출력 크기
+SUPERSAMPLE = 2  # 마스터는 이 배율로 그린 뒤 축소 (모서리 안티에일리어싱)
+RENDER_VERSION = 2  # 그리기 코드가 바뀌면 올린다 (캐시/매니페스트 무효화)
+
+DESIGN = {
+    "text": "OKXUS",
+    "bg_color": (13, 17, 23, 255),
+    "text_color": (204, 255, 0, 255),
+    "font_ratio": 0.25,  # 아이콘 크기 대비 글자 크기
+    "adaptive_font_ratio": 0.18,  # Android 적응형 아이콘은 안전 영역에 맞게 작게
+    "stretch": 1.35,  # 세로 늘리기 배율
+    "corner_ratio": 0.21,
+    "fonts": ["segoeuib.ttf", "arialbd.ttf", "DejaVuSans-Bold.ttf"],
+}
+
+# (상대 경로, 크기, 변형)
+EXPO_ICONS = [
+    ("icon.png", 1024, "rounded"),
+    ("adaptive-icon.png", 1024, "adaptive"),
+    ("splash-icon.png", 512, "rounded"),
+    ("favicon.png", 192, "rounded"),
+]
+ANDROID_DENSITIES = {"mdpi": 1, "hdpi": 1.5, "xhdpi": 2, "xxhdpi": 3, "xxxhdpi": 4}
+# iOS AppIcon: (idiom, pt 크기, 배율)
+IOS_ICONS = [
+    ("iphone", 20, 2), ("iphone", 20, 3), ("iphone", 29, 2), ("iphone", 29, 3),
+    ("iphone", 40, 2), ("iphone", 40, 3), ("iphone", 60, 2), ("iphone", 60, 3),
+    ("ipad", 20, 1), ("ipad", 20, 2), ("ipad", 29, 1), ("ipad", 29, 2),
+    ("ipad", 40, 1), ("ipad", 40, 2), ("ipad", 76, 1), ("ipad", 76, 2), ("ipad", 83.5, 2),
+    ("ios-marketing", 1024, 1),
+]
+
+
+def ios_filename(idiom, points, scale):
+    return f"icon-{idiom}-{points:g}@{scale}x.png"
+
+
+def icon_targets():
+    """생성할 전체 아이콘 목록 [(상대 경로, 크기, 변형)]."""
+    targets = list(EXPO_ICONS)
+    for density, factor in ANDROID_DENSITIES.items():
+        folder = f"android/mipmap-{density}"
+        targets.append((f"{folder}/ic_launcher.png", round(48 * factor), "rounded"))
+        targets.append((f"{folder}/ic_launcher_round.png", round(48 * factor), "round"))
+        targets.append((f"{folder}/ic_launcher_foreground.png", round(108 * factor), "adaptive"))
+    targets.append(("android/playstore-icon.png", 512, "rounded"))
+    for idiom, points, scale in IOS_ICONS:
+        # iOS는 알파 채널을 허용하지 않고 모서리는 시스템이 깎는다
+        targets.append((f"ios/AppIcon.appiconset/{ios_filename(idiom, points, scale)}", round(points * scale), "square"))
+    return targets
+
+
+def load_font(size):
+    """DESIGN의 글꼴을 순서대로 찾는다. (글꼴, 경로 또는 None)"""
+    for name in DESIGN["fonts"]:
         try:
-            font = ImageFont.truetype("arialbd.ttf", font_size)
-        except:
-            font = ImageFont.load_default()
-
-    text = "OKXUS"
-
-    # 큰 캔버스에 텍스트 그리기
-    big = Image.new('RGBA', (size * 2, size * 2), (0, 0, 0, 0))
-    big_draw = ImageDraw.Draw(big)
-    big_draw.text((size // 2, size // 2), text, fill=text_color, font=font)
-
-    # 실제 텍스트 영역 크롭
-    x1, y1, x2, y2 = find_content_bounds(big)
-    text_cropped = big.crop((x1, y1, x2, y2))
-
-    # 세로 1.35배 늘리기
-    tw, th = text_cropped.size
-    new_h = int(th * 1.35)
-    text_stretched = text_cropped.resize((tw, new_h), Image.LANCZOS)
-
-    # 배경 이미지
-    img = Image.new('RGBA', (size, size), bg_color)
-
-    # 정중앙 배치
-    px = (size - text_stretched.width) // 2
-    py = (size - text_stretched.height) // 2
-    img.paste(text_stretched, (px, py), text_stretched)
-
-    if not is_adaptive:
-        r = int(size * 0.21)
-        mask = Image.new('L', (size, size), 0)
-        md = ImageDraw.Draw(mask)
-        md.rounded_rectangle([0, 0, size - 1, size - 1], radius=r, fill=255)
-        result = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-        result.paste(img, mask=mask)
-        result.save(output_path)
+            font = ImageFont.truetype(name, size)
+            return font, getattr(font, "path", name)
+        except OSError:
+            continue
+    try:
+        return ImageFont.load_default(size), None
+    except TypeError:  # Pillow < 10.1
+        return ImageFont.load_default(), None
+
+
+def design_hash():
+    """디자인 설정 + 글꼴 파일 + 렌더 버전의 해시 (입력이 바뀌었는지 판단)."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps([DESIGN, MASTER_SIZE, SUPERSAMPLE, RENDER_VERSION]).encode())
+    _, font_path = load_font(16)
+    if font_path and os.path.exists(font_path):
+        digest.update(Path(font_path).read_bytes())
     else:
-        img.save(output_path)
+        digest.update(b"default-font")
+    return digest.hexdigest()[:16]
+
+
+def render_glyph(px):
+    """px 크기 아이콘에 들어갈 글자 이미지 (여백 없이 자르고 세로로 늘림)."""
+    font, _ = load_font(int(px * DESIGN["font_ratio"]))
+    canvas = Image.new("RGBA", (px * 2, px * 2), (0, 0, 0, 0))
+    ImageDraw.Draw(canvas).text((px // 2, px // 2), DESIGN["text"], fill=DESIGN["text_color"], font=font)
+    glyph = canvas.crop(canvas.getchannel("A").getbbox() or (0, 0, px, px))
+    return glyph.resize((glyph.width, int(glyph.height * DESIGN["stretch"])), Image.LANCZOS)
+
+
+def render_master(variant, glyph):
+    """변형별 마스터 아이콘 (MASTER_SIZE × SUPERSAMPLE)."""
+    px = MASTER_SIZE * SUPERSAMPLE
+    if variant == "adaptive":
+        scale = DESIGN["adaptive_font_ratio"] / DESIGN["font_ratio"]
+        glyph = glyph.resize((round(glyph.width * scale), round(glyph.height * scale)), Image.LANCZOS)
+    img = Image.new("RGBA", (px, px), DESIGN["bg_color"])
+    img.paste(glyph, ((px - glyph.width) // 2, (px - glyph.height) // 2), glyph)
+
+    if variant in ("adaptive", "square"):
+        return img.convert("RGB") if variant == "square" else img
+    mask = Image.new("L", (px, px), 0)
+    draw = ImageDraw.Draw(mask)
+    if variant == "round":
+        draw.ellipse([0, 0, px - 1, px - 1], fill=255)
+    else:
+        draw.rounded_rectangle([0, 0, px - 1, px - 1], radius=int(px * DESIGN["corner_ratio"]), fill=255)
+    result = Image.new("RGBA", (px, px), (0, 0, 0, 0))
+    result.paste(img, mask=mask)
+    return result
+
+
+def master_paths(variants, design):
+    """필요한 변형의 마스터를 캐시에서 찾거나 한 번 그려 저장한다."""
+    CACHE_DIR.mkdir(exist_ok=True)
+    paths = {}
+    glyph = None
+    for variant in sorted(variants):
+        path = CACHE_DIR / f"master-{design}-{variant}.png"
+        if not path.exists():
+            if glyph is None:
+                glyph = render_glyph(MASTER_SIZE * SUPERSAMPLE)
+            _atomic_save(render_master(variant, glyph), path)
+            print(f"  master {variant} ({MASTER_SIZE * SUPERSAMPLE}px)")
+        paths[variant] = path
+    return paths
+
+
+def derive(master_path, size, output_path):
+    """마스터를 size로 축소해 저장하고 출력 해시를 반환한다 (워커 프로세스에서 실행)."""
+    with Image.open(master_path) as master:
+        icon = master.resize((size, size), Image.LANCZOS)
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    _atomic_save(icon, output_path)
+    return file_hash(output_path)
+
+
+def file_hash(path):
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def _atomic_save(image, path):
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    image.save(tmp, format="PNG")
+    os.replace(tmp, path)
+
+
+def load_manifest(out_dir):
+    try:
+        return json.loads((out_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {"outputs": {}}
+
+
+def is_fresh(out_dir, entry, key):
+    """매니페스트 항목의 입력 키가 같고 출력 파일이 그대로인지."""
+    if not entry or entry.get("input") != key:
+        return False
+    path = out_dir / entry["path"]
+    return path.exists() and file_hash(path) == entry.get("sha256")
+
+
+def write_ios_contents(out_dir):
+    images = [
+        {
+            "idiom": idiom,
+            "size": f"{points:g}x{points:g}",
+            "scale": f"{scale}x",
+            "filename": ios_filename(idiom, points, scale),
+        }
+        for idiom, points, scale in IOS_ICONS
+    ]
+    path = out_dir / "ios" / "AppIcon.appiconset" / "Contents.json"
+    content = json.dumps({"images": images, "info": {"version": 1, "author": "gen_icon"}}, indent=2) + "\n"
+    if not path.exists() or path.read_text(encoding="utf-8") != content:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+
+
+def generate(out_dir=DEFAULT_OUT, jobs=None, force=False):
+    """전체 아이콘 세트를 생성한다.
+
+    Returns:
+        (생성한 출력 수, 건너뛴 출력 수)
+    """
+    out_dir = Path(out_dir)
+    design = design_hash()
+    manifest = load_manifest(out_dir)
+    previous = manifest.get("outputs", {})
+
+    pending, outputs = [], {}
+    for rel, size, variant in icon_targets():
+        key = f"{design}:{variant}:{size}"
+        entry = previous.get(rel)
+        if not force and is_fresh(out_dir, entry, key):
+            outputs[rel] = entry
+        else:
+            pending.append((rel, size, variant, key))
+
+    if pending:
+        masters = master_paths({variant for _, _, variant, _ in pending}, design)
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {
+                rel: (pool.submit(derive, masters[variant], size, out_dir / rel), key, size)
+                for rel, size, variant, key in pending
+            }
+            for rel, (future, key, size) in futures.items():
+                outputs[rel] = {"path": rel, "input": key, "sha256": future.result()}
+                print(f"  {rel} ({size}x{size})")
+
+    write_ios_contents(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest = {"design": design, "outputs": dict(sorted(outputs.items()))}
+    (out_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    return len(pending), len(outputs) - len(pending)
 
-    print(f"  {output_path} ({size}x{size})")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="OKXUS 앱 아이콘 생성")
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT, help="출력 디렉토리 (기본 mobile/assets)")
+    parser.add_argument("--jobs", type=int, default=None, help="병렬 프로세스 수 (기본 CPU 수)")
+    parser.add_argument("--force", action="store_true", help="매니페스트를 무시하고 전부 다시 생성")
+    args = parser.parse_args()
+
     print("Generating icons...")
-    os.makedirs("okxus/mobile/assets", exist_ok=True)
-    create_icon(1024, "okxus/mobile/assets/icon.png")
-    create_icon(1024, "okxus/mobile/assets/adaptive-icon.png", is_adaptive=True)
-    create_icon(512, "okxus/mobile/assets/splash-icon.png")
-    create_icon(192, "okxus/mobile/assets/favicon.png")
-    print("Done!")
+    generated, skipped = generate(args.out, args.jobs, args.force)
+    print(f"Done! ({generated} generated, {skipped} unchanged)")
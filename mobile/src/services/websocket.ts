@@ -3,7 +3,7 @@
  */
 
 import { ConnectionStatus } from '../types';
-import { ClientMessage, ServerMessage } from '../types/message';
+import { ClientMessage, Endpoint, LinkType, ServerMessage } from '../types/message';
 
 export type MessageCallback = (message: ServerMessage) => void;
 export type StatusCallback = (status: ConnectionStatus) => void;
@@ -11,17 +11,41 @@ export type StatusCallback = (status: ConnectionStatus) => void;
 const MAX_RECONNECT_ATTEMPTS = 3;
 const HEARTBEAT_INTERVAL = 30_000; // 30초
 const RECONNECT_DELAY = 2_000; // 2초
+const TICKET_MARGIN = 10; // 만료 직전 티켓은 사용하지 않음 (초)
 
 export class WebSocketService {
   private ws: WebSocket | null = null;
   private url = '';
   private token = '';
+  /** 재연결 시 미전달 응답을 이어받기 위한 Bridge 발급 ID */
+  private clientId = '';
+  /** 마지막으로 받은 공유 세션 이벤트 seq (재연결 시 놓친 이벤트 요청) */
+  private lastSeq = 0;
+  /** 재연결 시 auth 왕복 없이 인증받기 위한 서명 티켓 */
+  private resumeTicket = '';
+  private ticketExpires = 0;
+  /** Bridge가 알린 접속 엔드포인트 (LAN TLS, ngrok) */
+  private endpoints: Endpoint[] = [];
+  /** 링크 종류 — 서버가 연결별 압축 설정을 고른다 */
+  private link: LinkType | null = null;
+  /** 상태 구독 중이면 재연결 후 다시 구독 */
+  private statusSubscribed = false;
   private status: ConnectionStatus = 'disconnected';
   private reconnectCount = 0;
   private heartbeatTimer: ReturnType<typeof setInterval> | null = null;
   private messageCallbacks: MessageCallback[] = [];
   private statusCallbacks: StatusCallback[] = [];
 
+  /** Bridge가 알린 접속 엔드포인트 — 설정 화면에서 LAN 주소 선택에 사용 */
+  getEndpoints(): Endpoint[] {
+    return this.endpoints;
+  }
+
+  /** 현재 네트워크 종류 설정 (다음 연결/재연결부터 적용) */
+  setLink(link: LinkType | null): void {
+    this.link = link;
+  }
+
   /** 현재 연결 상태 */
   getStatus(): ConnectionStatus {
     return this.status;
@@ -29,6 +53,12 @@ export class WebSocketService {
 
   /** Bridge 서버에 연결 (Req 1.1, 6.4) */
   async connect(url: string, token: string): Promise<void> {
+    if (url !== this.url || token !== this.token) {
+      this.clientId = '';
+      this.lastSeq = 0;
+      this.resumeTicket = '';
+      this.ticketExpires = 0;
+    }
     this.url = url;
     this.token = token;
     this.reconnectCount = 0;
@@ -45,13 +75,38 @@ export class WebSocketService {
     this._setStatus('disconnected');
   }
 
-  /** 메시지 전송 (Req 2.1) */
-  sendMessage(content: string): void {
+  /** 메시지 전송 (Req 2.1). channel 생략 시 기본 채널 */
+  sendMessage(content: string, channel?: string): void {
     if (!this.ws || this.status !== 'connected') return;
     const msg: ClientMessage = {
       type: 'message',
       payload: { content },
       timestamp: Date.now(),
+      ...(channel ? { channel } : {}),
+    };
+    this.ws.send(JSON.stringify(msg));
+  }
+
+  /** 같은 연결 안에 논리 채널(별도 대화) 열기 */
+  openChannel(channel: string, window?: number): void {
+    if (!this.ws || this.status !== 'connected') return;
+    const msg: ClientMessage = {
+      type: 'channel_open',
+      payload: window ? { window } : {},
+      timestamp: Date.now(),
+      channel,
+    };
+    this.ws.send(JSON.stringify(msg));
+  }
+
+  /** 논리 채널 닫기 */
+  closeChannel(channel: string): void {
+    if (!this.ws || this.status !== 'connected') return;
+    const msg: ClientMessage = {
+      type: 'channel_close',
+      payload: {},
+      timestamp: Date.now(),
+      channel,
     };
     this.ws.send(JSON.stringify(msg));
   }
@@ -67,6 +122,53 @@ export class WebSocketService {
     this.ws.send(JSON.stringify(msg));
   }
 
+  /** 상태 push 구독 — status_snapshot 후 바뀐 필드만 status_delta로 수신 */
+  subscribeStatus(): void {
+    this.statusSubscribed = true;
+    if (!this.ws || this.status !== 'connected') return;
+    this._send('subscribe_status');
+  }
+
+  /** 상태 push 구독 해제 */
+  unsubscribeStatus(): void {
+    this.statusSubscribed = false;
+    if (!this.ws || this.status !== 'connected') return;
+    this._send('unsubscribe_status');
+  }
+
+  /** 대화 기록 한 페이지 요청 — 응답은 history_page (next_cursor를 before로 넘겨 이어서 요청) */
+  requestHistory(before?: number, limit?: number): void {
+    if (!this.ws || this.status !== 'connected') return;
+    const msg: ClientMessage = {
+      type: 'history_page',
+      payload: { before, limit },
+      timestamp: Date.now(),
+    };
+    this.ws.send(JSON.stringify(msg));
+  }
+
+  /** Bridge에서 대화 기록 검색 — 응답은 history_search */
+  searchHistory(query: string, before?: number, limit?: number): void {
+    if (!this.ws || this.status !== 'connected') return;
+    const msg: ClientMessage = {
+      type: 'history_search',
+      payload: { query, before, limit },
+      timestamp: Date.now(),
+    };
+    this.ws.send(JSON.stringify(msg));
+  }
+
+  /** 미리보기로 받은 응답의 본문 구간 요청 — 응답은 body */
+  fetchBody(hash: string, offset = 0, length?: number): void {
+    if (!this.ws || this.status !== 'connected') return;
+    const msg: ClientMessage = {
+      type: 'fetch_body',
+      payload: { hash, offset, length },
+      timestamp: Date.now(),
+    };
+    this.ws.send(JSON.stringify(msg));
+  }
+
   /** 메시지 수신 콜백 등록 */
   onMessage(callback: MessageCallback): () => void {
     this.messageCallbacks.push(callback);
@@ -88,9 +190,19 @@ export class WebSocketService {
   private async _connect(): Promise<void> {
     this._setStatus('connecting');
 
+    // 유효한 재개 티켓이 있으면 핸드셰이크에 실어 auth 메시지를 생략
+    const useTicket =
+      this.resumeTicket !== '' && this.ticketExpires - TICKET_MARGIN > Date.now() / 1000;
+    let url = useTicket
+      ? `${this.url}${this.url.includes('?') ? '&' : '?'}ticket=${encodeURIComponent(this.resumeTicket)}`
+      : this.url;
+    if (useTicket && this.link) {
+      url += `&link=${this.link}`;
+    }
+
     return new Promise((resolve, reject) => {
       try {
-        this.ws = new WebSocket(this.url);
+        this.ws = new WebSocket(url);
       } catch {
         this._handleDisconnect();
         reject(new Error('WebSocket 생성 실패'));
@@ -98,13 +210,8 @@ export class WebSocketService {
       }
 
       this.ws.onopen = () => {
-        // 인증 메시지 전송 (Req 6.1)
-        const authMsg: ClientMessage = {
-          type: 'auth',
-          payload: { token: this.token },
-          timestamp: Date.now(),
-        };
-        this.ws!.send(JSON.stringify(authMsg));
+        // 티켓으로 연결했으면 서버가 먼저 auth_result를 보낸다
+        if (!useTicket) this._sendAuth();
       };
 
       this.ws.onmessage = (event) => {
@@ -112,10 +219,23 @@ export class WebSocketService {
           const msg: ServerMessage = JSON.parse(event.data as string);
           if (msg.type === 'auth_result') {
             if (msg.payload.success) {
+              if (msg.payload.client_id) this.clientId = msg.payload.client_id;
+              if (msg.payload.endpoints) this.endpoints = msg.payload.endpoints;
+              if (msg.payload.resume_ticket) {
+                this.resumeTicket = msg.payload.resume_ticket;
+                this.ticketExpires = msg.payload.ticket_expires ?? 0;
+              }
               this._setStatus('connected');
               this.reconnectCount = 0;
               this._startHeartbeat();
+              if (this.lastSeq > 0) this._resubscribe();
+              if (this.statusSubscribed) this._send('subscribe_status');
               resolve();
+            } else if (msg.payload.fallback === 'auth') {
+              // 티켓 만료/무효 — 같은 연결에서 토큰으로 재인증
+              this.resumeTicket = '';
+              this.ticketExpires = 0;
+              this._sendAuth();
             } else {
               this._setStatus('error');
               reject(new Error(msg.payload.error || '인증 실패'));
@@ -124,6 +244,11 @@ export class WebSocketService {
           }
           // heartbeat는 무시
           if (msg.type === 'heartbeat') return;
+          if (msg.seq !== undefined) {
+            // 재전송과 실시간 수신이 겹치면 이미 본 이벤트는 건너뜀
+            if (msg.seq <= this.lastSeq) return;
+            this.lastSeq = msg.seq;
+          }
           // 나머지 메시지 콜백 전달
           this.messageCallbacks.forEach(cb => cb(msg));
         } catch {
@@ -144,6 +269,20 @@ export class WebSocketService {
     });
   }
 
+  /** 인증 메시지 전송 (Req 6.1) */
+  private _sendAuth(): void {
+    const authMsg: ClientMessage = {
+      type: 'auth',
+      payload: {
+        token: this.token,
+        ...(this.clientId ? { client_id: this.clientId } : {}),
+        ...(this.link ? { link: this.link } : {}),
+      },
+      timestamp: Date.now(),
+    };
+    this.ws?.send(JSON.stringify(authMsg));
+  }
+
   /** 재연결 로직 (Req 1.3, 1.4) */
   private _handleDisconnect(): void {
     this._clearHeartbeat();
@@ -156,6 +295,21 @@ export class WebSocketService {
     }
   }
 
+  /** 재연결 후 공유 세션에서 놓친 이벤트 요청 */
+  private _send(type: ClientMessage['type']): void {
+    const msg: ClientMessage = { type, payload: {}, timestamp: Date.now() };
+    this.ws?.send(JSON.stringify(msg));
+  }
+
+  private _resubscribe(): void {
+    const msg: ClientMessage = {
+      type: 'subscribe',
+      payload: { since: this.lastSeq },
+      timestamp: Date.now(),
+    };
+    this.ws?.send(JSON.stringify(msg));
+  }
+
   private _startHeartbeat(): void {
     this._clearHeartbeat();
     this.heartbeatTimer = setInterval(() => {
@@ -4,12 +4,43 @@
 
 /** 클라이언트 → 서버 메시지 */
 export interface ClientMessage {
-  type: 'auth' | 'message' | 'status_request' | 'heartbeat';
+  type:
+    | 'auth'
+    | 'message'
+    | 'status_request'
+    | 'heartbeat'
+    | 'channel_open'
+    | 'channel_close'
+    | 'subscribe'
+    | 'unsubscribe'
+    | 'subscribe_status'
+    | 'unsubscribe_status'
+    | 'history_page'
+    | 'history_search'
+    | 'fetch_body';
   payload: {
     token?: string;
     content?: string;
+    /** message: 응답 대응용 ID — message_ack/error에 그대로 돌아온다 */
+    request_id?: string;
+    client_id?: string;
+    /** auth: 네트워크 종류 (압축 설정 선택) */
+    link?: LinkType;
+    window?: number;
+    since?: number;
+    /** history_*: 이전 응답의 next_cursor (생략 시 최신부터) */
+    before?: number;
+    limit?: number;
+    /** history_search 검색어 */
+    query?: string;
+    /** fetch_body: 본문 해시와 구간 (UTF-8 바이트) */
+    hash?: string;
+    offset?: number;
+    length?: number;
   };
   timestamp: number;
+  /** 논리 채널 ID (생략 시 기본 채널 "0") */
+  channel?: string;
 }
 
 /** 서버 → 클라이언트 메시지 */
@@ -20,14 +51,103 @@ export interface ServerMessage {
     | 'kiro_response'
     | 'status'
     | 'error'
-    | 'heartbeat';
+    | 'heartbeat'
+    | 'channel_opened'
+    | 'channel_closed'
+    | 'subscribed'
+    | 'unsubscribed'
+    | 'session_prompt'
+    | 'progress'
+    | 'status_snapshot'
+    | 'status_delta'
+    | 'unparked'
+    | 'history_page'
+    | 'history_search'
+    | 'body';
   payload: {
     success?: boolean;
     content?: string;
-    status?: BridgeStatus;
+    /** status: BridgeStatus, status_snapshot: LiveStatus */
+    status?: BridgeStatus | LiveStatus;
+    /** status_delta: 바뀐 필드만 포함 */
+    changes?: Partial<LiveStatus>;
+    uptime?: number;
     error?: string;
+    client_id?: string;
+    /** 재연결 핸드셰이크용 재개 티켓 (?ticket=) */
+    resume_ticket?: string;
+    /** 재개 티켓 만료 시각 (epoch 초) */
+    ticket_expires?: number;
+    /** 재개 티켓으로 인증되었는지 */
+    resumed?: boolean;
+    /** 'auth'이면 같은 연결에서 auth 메시지로 다시 인증 */
+    fallback?: string;
+    message_id?: string;
+    /** message_ack/error: 프롬프트에 붙여 보낸 request_id */
+    request_id?: string;
+    window?: number;
+    credits?: number;
+    dropped?: number;
+    session?: string;
+    seq?: number;
+    /** 예상 완료 시간 (초, 통계 부족 시 null) */
+    eta?: number | null;
+    /** 이 요청의 응답 대기 마감 (초) */
+    deadline?: number;
+    elapsed?: number;
+    /** Kiro 중단 중이라 프롬프트가 보관됨 (응답 대기 타이머 없음) */
+    parked?: boolean;
+    /** 보관 대기 순번 (1부터) */
+    position?: number;
+    /** unparked: 아직 보관 중인 프롬프트 수 */
+    remaining?: number;
+    /** history_page / history_search 결과 (최신순) */
+    items?: HistoryItem[];
+    /** 다음(더 오래된) 페이지 요청의 before 값 — 없으면 null */
+    next_cursor?: number | null;
+    query?: string;
+    /** lazy_bodies: kiro_response에 content 대신 미리보기와 본문 해시/크기 */
+    preview?: string;
+    body_hash?: string;
+    body_size?: number;
+    truncated?: boolean;
+    /** auth_result / status: Bridge 접속 엔드포인트 (LAN TLS, ngrok) */
+    endpoints?: Endpoint[];
+    /** body: 받은 구간 — end < size이면 end를 offset으로 다시 요청 */
+    hash?: string;
+    offset?: number;
+    end?: number;
+    size?: number;
   };
   timestamp: number;
+  /** 채널 단위 프레임(ACK, 응답, 채널 오류)에만 포함 */
+  channel?: string;
+  /** 공유 세션 팬아웃 프레임에만 포함 (같은 토큰의 모든 기기에 전달) */
+  session?: string;
+  seq?: number;
+}
+
+/** Bridge가 알리는 접속 엔드포인트 — 같은 네트워크에서는 lan이 더 빠르다 */
+export interface Endpoint {
+  kind: 'lan' | 'ngrok' | string;
+  url: string;
+}
+
+/** 앱이 알리는 네트워크 종류 — 셀룰러는 강하게, LAN은 가볍게 압축 */
+export type LinkType = 'cellular' | 'wifi' | 'lan';
+
+/** Bridge에 저장된 대화 기록 한 건 (프롬프트 + 응답) */
+export interface HistoryItem {
+  id: number;
+  message_id: string;
+  channel: string;
+  prompt: string;
+  response: string | null;
+  status: 'pending' | 'done' | 'error';
+  created_at: number;
+  completed_at: number | null;
+  /** history_search: 일치 부분을 [ ]로 표시한 발췌 */
+  snippet?: string;
 }
 
 /** Bridge 상태 정보 */
@@ -37,6 +157,20 @@ export interface BridgeStatus {
   uptime: number;
 }
 
+/** 상태 구독(subscribe_status)으로 push되는 실시간 상태 */
+export interface LiveStatus {
+  connected_clients: number;
+  kiro_running: boolean;
+  /** 응답 대기 중인 전체 요청 수 */
+  queue_depth: number;
+  /** Kiro 워커가 처리 중인 요청 수 */
+  in_flight: number;
+  /** 내 가장 오래된 대기 요청의 순번 (없으면 0) */
+  queue_position: number;
+  /** Kiro 복구를 기다리며 보관 중인 프롬프트 수 */
+  parked: number;
+}
+
 /** 오류 코드 */
 export enum ErrorCode {
   AUTH_FAILED = 'AUTH_FAILED',